@@ -0,0 +1,274 @@
+"""
+Per-user admission control for Reddit-backed operations.
+
+All users share one Reddit quota, so Reddit work is admitted through a
+fixed number of slots. Each user may hold only a few of them at once, and
+waiting requests are served by start-time fair queuing: a request's tag
+is the later of the system's virtual time and the finish tag of that
+user's previous request. Its finish tag adds cost / weight. Slots go to
+the lowest tag whose user is under their concurrency limit.
+A user firing a burst therefore waits behind their own requests, not
+everyone else's. Users with a full queue, or whose request cannot be
+admitted in time, are rejected with a retry-after estimate instead of
+queueing without limit.
+
+The ADMISSION_* limits are deployment-wide. A multi-worker server gives
+each worker its share (at least one slot and one queue place per user), so
+the workers together stay within the configured totals.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from fastmcp.server.dependencies import get_access_token
+
+from .serve import worker_count
+
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "8"))     # Reddit operations at once, all users
+ADMISSION_USER_CONCURRENCY = int(os.getenv("ADMISSION_USER_CONCURRENCY", "2"))   # Per user
+ADMISSION_USER_QUEUE = int(os.getenv("ADMISSION_USER_QUEUE", "8"))               # Waiting requests per user
+ADMISSION_MAX_WAIT_SECONDS = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "10"))
+ANONYMOUS_USER = "anonymous"
+SERVICE_TIME_SMOOTHING = 0.2   # EWMA weight of the newest service time (for retry-after estimates)
+
+
+def parse_user_weights(value: str) -> Dict[str, float]:
+    """Weights from ``client_a=2,client_b=0.5`` (invalid entries are ignored)."""
+    weights: Dict[str, float] = {}
+    for item in value.split(","):
+        user, _, weight = item.partition("=")
+        try:
+            if user.strip() and float(weight) > 0:
+                weights[user.strip()] = float(weight)
+        except ValueError:
+            continue
+    return weights
+
+
+ADMISSION_USER_WEIGHTS = parse_user_weights(os.getenv("ADMISSION_USER_WEIGHTS", ""))
+
+
+class AdmissionRejected(Exception):
+    """A request was not admitted; retry after ``retry_after`` seconds."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Waiter:
+    start_tag: float
+    seq: int
+    user: str = field(compare=False)
+    future: "asyncio.Future" = field(compare=False)
+
+
+class AdmissionController:
+    """
+    Global and per-user concurrency limits with fair queuing between users.
+
+    Usage:
+        async with controller.admit(user, cost=2, timeout=5):
+            ...  # Reddit work
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = ADMISSION_MAX_CONCURRENCY,
+        user_concurrency: int = ADMISSION_USER_CONCURRENCY,
+        user_queue: int = ADMISSION_USER_QUEUE,
+        max_wait_seconds: float = ADMISSION_MAX_WAIT_SECONDS,
+        user_weights: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_concurrency: Operations admitted at once across all users
+            user_concurrency: Operations admitted at once per user
+            user_queue: Requests a user may have waiting before new ones are rejected
+            max_wait_seconds: Longest a request waits for a slot
+            user_weights: Relative shares per client_id (default 1)
+            clock: Monotonic clock, injectable for tests
+        """
+        self.max_concurrency = max_concurrency
+        self.user_concurrency = user_concurrency
+        self.user_queue = user_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.user_weights = ADMISSION_USER_WEIGHTS if user_weights is None else user_weights
+        self._clock = clock
+
+        self._heap: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._finish_tags: Dict[str, float] = {}
+        self._running: Dict[str, int] = {}
+        self._queued: Dict[str, int] = {}
+        self._active = 0
+        self._service_time = 1.0
+        self.admitted = 0
+        self.rejected = 0
+
+    def weight(self, user: str) -> float:
+        return self.user_weights.get(user, 1.0)
+
+    def retry_after(self, user: str) -> int:
+        """Seconds until a new request from ``user`` would likely be admitted."""
+        backlog = self._queued.get(user, 0) + self._running.get(user, 0)
+        return max(1, math.ceil(self._service_time * backlog / self.user_concurrency))
+
+    @asynccontextmanager
+    async def admit(self, user: str, cost: float = 1.0, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected: If the user's queue is full or no slot frees up in time
+        """
+        await self.acquire(user, cost, timeout)
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.release(user, self._clock() - started)
+
+    async def acquire(self, user: str, cost: float = 1.0, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a slot in fair-queuing order.
+
+        Raises:
+            AdmissionRejected: If the user's queue is full or no slot frees up in time
+        """
+        if self._queued.get(user, 0) >= self.user_queue:
+            self.rejected += 1
+            raise AdmissionRejected(
+                f"Too many queued requests for this user ({self.user_queue} waiting)",
+                self.retry_after(user)
+            )
+
+        start_tag = max(self._virtual_time, self._finish_tags.get(user, 0.0))
+        self._finish_tags[user] = start_tag + cost / self.weight(user)
+        waiter = _Waiter(start_tag, next(self._seq), user, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._heap, waiter)
+        self._queued[user] = self._queued.get(user, 0) + 1
+        self._dispatch()
+
+        wait = self.max_wait_seconds if timeout is None else min(timeout, self.max_wait_seconds)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=max(0.0, wait))
+        except asyncio.TimeoutError:
+            if self._withdraw(waiter):
+                self.rejected += 1
+                raise AdmissionRejected(
+                    f"No Reddit capacity for this user within {wait:g}s",
+                    self.retry_after(user)
+                )
+        except asyncio.CancelledError:
+            if not self._withdraw(waiter):
+                # Admitted just as the caller gave up - hand the slot back
+                self.release(user, 0.0)
+            raise
+        self.admitted += 1
+
+    def release(self, user: str, service_time: float) -> None:
+        """Return a slot and admit the next waiters."""
+        self._active -= 1
+        self._running[user] -= 1
+        if not self._running[user]:
+            del self._running[user]
+        if service_time > 0:
+            self._service_time += SERVICE_TIME_SMOOTHING * (service_time - self._service_time)
+        self._dispatch()
+        self._forget_if_idle(user)
+
+    def stats(self) -> Dict[str, int]:
+        """Current load and counters."""
+        return {
+            "active": self._active,
+            "queued": sum(self._queued.values()),
+            "users_active": len(self._running),
+            "admitted": self.admitted,
+            "rejected": self.rejected
+        }
+
+    def _withdraw(self, waiter: _Waiter) -> bool:
+        """Drop a waiter that gave up; False if it had already been admitted."""
+        if waiter.future.done():
+            return False
+        waiter.future.cancel()   # Skipped lazily by _dispatch
+        self._dequeue(waiter.user)
+        self._forget_if_idle(waiter.user)
+        return True
+
+    def _forget_if_idle(self, user: str) -> None:
+        """Drop an idle user's finish tag once virtual time has passed it."""
+        if user in self._running or user in self._queued:
+            return
+        if self._finish_tags.get(user, 0.0) <= self._virtual_time:
+            self._finish_tags.pop(user, None)
+
+    def _dequeue(self, user: str) -> None:
+        self._queued[user] -= 1
+        if not self._queued[user]:
+            del self._queued[user]
+
+    def _dispatch(self) -> None:
+        """Admit waiters in tag order while slots are free, skipping users at their limit."""
+        deferred = []
+        while self._heap and self._active < self.max_concurrency:
+            waiter = heapq.heappop(self._heap)
+            if waiter.future.done():
+                continue
+            if self._running.get(waiter.user, 0) >= self.user_concurrency:
+                deferred.append(waiter)
+                continue
+            self._active += 1
+            self._running[waiter.user] = self._running.get(waiter.user, 0) + 1
+            self._dequeue(waiter.user)
+            self._virtual_time = max(self._virtual_time, waiter.start_tag)
+            waiter.future.set_result(None)
+        for waiter in deferred:
+            heapq.heappush(self._heap, waiter)
+
+
+def admission_user() -> str:
+    """Admission key for the caller: the authenticated client_id."""
+    try:
+        access_token = get_access_token()
+    except Exception:
+        access_token = None
+    return getattr(access_token, "client_id", None) or ANONYMOUS_USER
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def per_worker_limit(limit: int, workers: int) -> int:
+    """One worker's share of a deployment-wide limit (never below 1)."""
+    return max(1, limit // max(1, workers))
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller (sized for this worker), creating it on first use."""
+    global _admission_controller
+    if _admission_controller is None:
+        workers = worker_count()
+        _admission_controller = AdmissionController(
+            max_concurrency=per_worker_limit(ADMISSION_MAX_CONCURRENCY, workers),
+            user_concurrency=per_worker_limit(ADMISSION_USER_CONCURRENCY, workers),
+            user_queue=per_worker_limit(ADMISSION_USER_QUEUE, workers)
+        )
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """Drop the admission controller (for tests)."""
+    global _admission_controller
+    _admission_controller = None
@@ -0,0 +1,217 @@
+"""Kid-indexed JWKS key store with background refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+from authlib.jose import JsonWebKey
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+JWKS_REFRESH_SECONDS = float(os.getenv("JWKS_REFRESH_SECONDS", "3600"))
+JWKS_REFRESH_AHEAD = 0.8            # Refresh in the background at this share of the interval
+JWKS_MIN_REFRESH_INTERVAL = float(os.getenv("JWKS_MIN_REFRESH_INTERVAL", "30"))  # Unknown-kid refetch limit
+JWKS_RETRY_SECONDS = 30             # Retry delay after a failed background refresh
+JWKS_FETCH_TIMEOUT = 10.0
+DEFAULT_KID = "_default"            # Slot for keys published without a kid
+
+
+def token_kid(token: str) -> str | None:
+    """Read the ``kid`` header of a compact JWT without verifying it."""
+    try:
+        segment = token.split(".", 1)[0]
+        header = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except (ValueError, TypeError):
+        return None
+    kid = header.get("kid") if isinstance(header, dict) else None
+    return kid if isinstance(kid, str) else None
+
+
+class JWKSKeyStore:
+    """
+    Public signing keys from a JWKS endpoint, indexed by kid.
+
+    Known kids are served from memory with no network call, even once the
+    refresh interval has passed; ``start()`` pre-fetches the key set and
+    keeps it fresh from a background task. A token with an unknown kid
+    (e.g. just after rotation) triggers at most one refetch at a time, and
+    no more than one per ``min_refresh_interval``, however many requests
+    carry it concurrently.
+
+    Usage:
+        store = JWKSKeyStore("https://example.com/.well-known/jwks.json")
+        await store.start()
+        key = await store.get_key(token_kid(token))
+    """
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        refresh_seconds: float = JWKS_REFRESH_SECONDS,
+        min_refresh_interval: float = JWKS_MIN_REFRESH_INTERVAL,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            jwks_uri: URI of the JSON Web Key Set
+            refresh_seconds: How long a fetched key set is considered current
+            min_refresh_interval: Minimum spacing of unknown-kid refetches
+            fetch: Async callable returning the JWKS document, injectable for tests
+            clock: Monotonic clock, injectable for tests
+        """
+        self.jwks_uri = jwks_uri
+        self.refresh_seconds = refresh_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self._fetch = fetch or self._fetch_jwks
+        self._clock = clock
+        self._keys: dict[str, Any] = {}
+        self._thumbprints: dict[str, str] = {}
+        self._fetched_at: float | None = None
+        self._last_attempt: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._pending_refresh: asyncio.Task | None = None   # Request-triggered refresh
+        self.version = 0            # Bumped whenever the key set changes
+        self.refreshes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the key set is missing or past its refresh interval."""
+        return self._fetched_at is None or self._clock() - self._fetched_at >= self.refresh_seconds
+
+    def has_key(self, kid: str | None) -> bool:
+        """Whether a key is currently published for this kid."""
+        return self._lookup(kid) is not None
+
+    async def get_key(self, kid: str | None) -> Any:
+        """
+        Return the public key for a kid, refetching only for unknown kids.
+
+        Args:
+            kid: Key ID from the token header (None for tokens without one)
+
+        Returns:
+            Public key usable for signature verification
+
+        Raises:
+            ValueError: If no key is published for the kid
+        """
+        key = self._lookup(kid)
+        if key is not None:
+            pending = self._pending_refresh
+            if self.stale and not self.running and (pending is None or pending.done()):
+                # Nobody is refreshing in the background; refresh without blocking this request
+                self._pending_refresh = asyncio.get_running_loop().create_task(self.refresh(force=False))
+            return key
+
+        await self.refresh(force=False)
+        key = self._lookup(kid)
+        if key is None:
+            raise ValueError(f"Key ID '{kid}' not found in JWKS")
+        return key
+
+    async def refresh(self, force: bool = True) -> bool:
+        """
+        Refetch the key set, one caller at a time.
+
+        Args:
+            force: Skip the minimum-interval rate limit (scheduled refreshes)
+
+        Returns:
+            True if a fetch succeeded, False if skipped or failed
+        """
+        attempt_seen = self._last_attempt
+        async with self._lock:
+            # Another caller refreshed while we waited for the lock
+            if self._last_attempt != attempt_seen:
+                return False
+            now = self._clock()
+            if (
+                not force
+                and self._last_attempt is not None
+                and now - self._last_attempt < self.min_refresh_interval
+            ):
+                return False
+            self._last_attempt = now
+            try:
+                document = await self._fetch(self.jwks_uri)
+                keys, thumbprints = self._parse_keys(document)
+            except Exception as e:
+                logger.warning("JWKS refresh from %s failed: %s", self.jwks_uri, e)
+                return False
+
+            if thumbprints != self._thumbprints:
+                self.version += 1
+            self._keys = keys
+            self._thumbprints = thumbprints
+            self._fetched_at = self._clock()
+            self.refreshes += 1
+            return True
+
+    async def start(self) -> None:
+        """Pre-fetch the key set and keep it fresh in a background task."""
+        if self.running:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh task and wait for it to finish."""
+        for task in (self._task, self._pending_refresh):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._pending_refresh = None
+
+    async def _loop(self) -> None:
+        while True:
+            now = self._clock()
+            due = now
+            if self._fetched_at is not None:
+                due = self._fetched_at + self.refresh_seconds * JWKS_REFRESH_AHEAD
+            retry_at = (self._last_attempt or now) + JWKS_RETRY_SECONDS
+            await asyncio.sleep(max(due, retry_at) - now)
+            await self.refresh()
+
+    def _lookup(self, kid: str | None) -> Any:
+        if kid:
+            return self._keys.get(kid)
+        if len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(DEFAULT_KID)
+
+    @staticmethod
+    def _parse_keys(document: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+        keys = {}
+        thumbprints = {}
+        for key_data in document.get("keys", []):
+            if key_data.get("use", "sig") != "sig":
+                continue
+            kid = key_data.get("kid") or DEFAULT_KID
+            jwk = JsonWebKey.import_key(key_data)
+            keys[kid] = jwk.get_public_key()
+            thumbprints[kid] = jwk.thumbprint()
+        return keys, thumbprints
+
+    @staticmethod
+    async def _fetch_jwks(jwks_uri: str) -> dict[str, Any]:
+        async with httpx.AsyncClient(timeout=JWKS_FETCH_TIMEOUT) as client:
+            response = await client.get(jwks_uri)
+            response.raise_for_status()
+            return response.json()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import time
 from typing import Any
 
@@ -11,8 +12,17 @@ from fastmcp.server.auth import AccessToken
 from fastmcp.server.auth.providers.jwt import JWTVerifier
 from fastmcp.utilities.logging import get_logger
 
+from src.auth.jwks import JWKSKeyStore, token_kid
+from src.cache import TTLCache
+
 logger = get_logger(__name__)
 
+# Verified-token cache
+TOKEN_CACHE_MAX_ENTRIES = 4096
+TOKEN_CACHE_EXPIRY_MARGIN = 10      # Drop cached tokens this many seconds before exp
+TOKEN_CACHE_MAX_TTL = 3600          # Cap for tokens with a far-off (or no) exp
+TOKEN_CACHE_REJECTION_TTL = 60      # Cache issuer/audience/scope rejections this long
+
 
 class MultiIssuerJWTVerifier(JWTVerifier):
     """
@@ -70,6 +80,31 @@ class MultiIssuerJWTVerifier(JWTVerifier):
         # Store all valid issuers for our custom validation
         self.valid_issuers = set(issuers)
 
+        # Kid-indexed signing keys, pre-fetched and refreshed in the background
+        self.key_store = JWKSKeyStore(jwks_uri)
+
+        # Verification results keyed by token hash, so a reused bearer token
+        # skips key lookup and signature verification
+        self._token_cache = TTLCache(
+            max_entries=TOKEN_CACHE_MAX_ENTRIES, ttl_seconds=TOKEN_CACHE_MAX_TTL
+        )
+        self._token_cache_key_version = self.key_store.version
+
+    async def start(self) -> None:
+        """Pre-fetch the JWKS and start refreshing it in the background."""
+        if not self.public_key:
+            await self.key_store.start()
+
+    async def stop(self) -> None:
+        """Stop the background JWKS refresh."""
+        await self.key_store.stop()
+
+    async def _get_verification_key(self, token: str) -> Any:
+        """Look up the signing key for a token in the kid-indexed key store."""
+        if self.public_key:
+            return self.public_key
+        return await self.key_store.get_key(token_kid(token))
+
     async def load_access_token(self, token: str) -> AccessToken | None:
         """
         Validate JWT token, accepting any of the configured issuers.
@@ -83,8 +118,15 @@ class MultiIssuerJWTVerifier(JWTVerifier):
         Returns:
             AccessToken object if valid, None if invalid or expired
         """
+        cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+        self._evict_on_key_rotation()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None and self._key_published(cached["kid"]):
+            return cached["access_token"]
+
         try:
             # Get verification key (from JWKS)
+            kid = token_kid(token)
             verification_key = await self._get_verification_key(token)
 
             # Decode and verify the JWT token signature
@@ -101,70 +143,9 @@ class MultiIssuerJWTVerifier(JWTVerifier):
                 )
                 return None
 
-            # Multi-issuer validation (our custom logic)
-            token_issuer = claims.get("iss")
-            if token_issuer not in self.valid_issuers:
-                logger.debug(
-                    "Token validation failed: issuer mismatch for client %s. "
-                    "Token issuer: %s, Valid issuers: %s",
-                    client_id,
-                    token_issuer,
-                    self.valid_issuers,
-                )
-                return None
-
-            # Validate audience if configured AND token has an audience claim
-            # Note: Descope session tokens may not include 'aud' claim, so we skip
-            # audience validation for tokens without it. OAuth tokens typically include it.
-            aud = claims.get("aud")
-            if self.audience and aud is not None:
-                audience_valid = False
-
-                if isinstance(self.audience, list):
-                    if isinstance(aud, list):
-                        audience_valid = any(
-                            expected in aud for expected in self.audience
-                        )
-                    else:
-                        audience_valid = aud in self.audience
-                else:
-                    if isinstance(aud, list):
-                        audience_valid = self.audience in aud
-                    else:
-                        audience_valid = aud == self.audience
-
-                if not audience_valid:
-                    logger.debug(
-                        "Token validation failed: audience mismatch for client %s. "
-                        "Token audience: %s, Expected: %s",
-                        client_id,
-                        aud,
-                        self.audience,
-                    )
-                    return None
-
-            # Extract scopes using parent's helper method
-            scopes = self._extract_scopes(claims)
-
-            # Check required scopes if configured
-            if self.required_scopes:
-                token_scopes = set(scopes)
-                required_scopes = set(self.required_scopes)
-                if not required_scopes.issubset(token_scopes):
-                    logger.debug(
-                        "Token missing required scopes. Has: %s, Required: %s",
-                        token_scopes,
-                        required_scopes,
-                    )
-                    return None
-
-            return AccessToken(
-                token=token,
-                client_id=str(client_id),
-                scopes=scopes,
-                expires_at=int(exp) if exp else None,
-                claims=claims,
-            )
+            access_token = self._check_claims(token, claims, client_id)
+            self._cache_result(cache_key, access_token, kid, exp)
+            return access_token
 
         except JoseError:
             logger.debug("Token validation failed: JWT signature/format invalid")
@@ -173,6 +154,115 @@ class MultiIssuerJWTVerifier(JWTVerifier):
             logger.debug("Token validation failed: %s", str(e))
             return None
 
+    def _check_claims(self, token: str, claims: dict[str, Any], client_id: Any) -> AccessToken | None:
+        """Apply issuer, audience and scope rules to verified claims."""
+        # Multi-issuer validation (our custom logic)
+        token_issuer = claims.get("iss")
+        if token_issuer not in self.valid_issuers:
+            logger.debug(
+                "Token validation failed: issuer mismatch for client %s. "
+                "Token issuer: %s, Valid issuers: %s",
+                client_id,
+                token_issuer,
+                self.valid_issuers,
+            )
+            return None
+
+        # Validate audience if configured AND token has an audience claim
+        # Note: Descope session tokens may not include 'aud' claim, so we skip
+        # audience validation for tokens without it. OAuth tokens typically include it.
+        aud = claims.get("aud")
+        if self.audience and aud is not None:
+            audience_valid = False
+
+            if isinstance(self.audience, list):
+                if isinstance(aud, list):
+                    audience_valid = any(
+                        expected in aud for expected in self.audience
+                    )
+                else:
+                    audience_valid = aud in self.audience
+            else:
+                if isinstance(aud, list):
+                    audience_valid = self.audience in aud
+                else:
+                    audience_valid = aud == self.audience
+
+            if not audience_valid:
+                logger.debug(
+                    "Token validation failed: audience mismatch for client %s. "
+                    "Token audience: %s, Expected: %s",
+                    client_id,
+                    aud,
+                    self.audience,
+                )
+                return None
+
+        # Extract scopes using parent's helper method
+        scopes = self._extract_scopes(claims)
+
+        # Check required scopes if configured
+        if self.required_scopes:
+            token_scopes = set(scopes)
+            required_scopes = set(self.required_scopes)
+            if not required_scopes.issubset(token_scopes):
+                logger.debug(
+                    "Token missing required scopes. Has: %s, Required: %s",
+                    token_scopes,
+                    required_scopes,
+                )
+                return None
+
+        exp = claims.get("exp")
+        return AccessToken(
+            token=token,
+            client_id=str(client_id),
+            scopes=scopes,
+            expires_at=int(exp) if exp else None,
+            claims=claims,
+        )
+
+    def _cache_result(
+        self,
+        cache_key: bytes,
+        access_token: AccessToken | None,
+        kid: str | None,
+        exp: Any,
+    ) -> None:
+        """
+        Cache a verification decision until shortly before the token expires.
+
+        Accepted tokens are kept until ``exp`` minus a margin; issuer,
+        audience and scope rejections (of correctly signed tokens) for a
+        shorter time.
+        """
+        ttl = float(TOKEN_CACHE_MAX_TTL)
+        if exp:
+            ttl = min(ttl, float(exp) - time.time() - TOKEN_CACHE_EXPIRY_MARGIN)
+        if access_token is None:
+            ttl = min(ttl, TOKEN_CACHE_REJECTION_TTL)
+        if ttl <= 0:
+            return
+        self._token_cache.set(
+            cache_key, {"access_token": access_token, "kid": kid}, ttl_seconds=ttl
+        )
+
+    def _key_published(self, kid: str | None) -> bool:
+        """Whether a cached decision's signing key is still in the key set."""
+        if self.public_key:
+            return True
+        return self.key_store.has_key(kid)
+
+    def _evict_on_key_rotation(self) -> None:
+        """After the key set changes, drop cached tokens signed by keys no longer published."""
+        version = self.key_store.version
+        if version == self._token_cache_key_version:
+            return
+        self._token_cache_key_version = version
+        for cache_key, entry in self._token_cache.items():
+            if not self._key_published(entry["kid"]):
+                self._token_cache.delete(cache_key)
+
     async def verify_token(self, token: str) -> AccessToken | None:
         """
         Verify a bearer token and return access info if valid.
@@ -0,0 +1,346 @@
+"""
+Multi-operation batch execution with step references.
+
+A batch is a list of steps, each running one operation. Parameter values
+(at any depth) may be references to an earlier step's output:
+
+    {"$ref": "discover.subreddits[*].name", "limit": 5}
+
+The first path segment is a step id; the rest walks that step's data.
+``key`` selects a dict key, ``[n]`` an index, ``[a:b]`` a slice, and
+``[*]`` or a bare ``*`` segment fans out over every list item / dict value
+(results are flattened into one list). ``limit`` truncates the resolved list.
+
+Steps that reference (or list in ``depends_on``) other steps wait for them;
+independent steps run concurrently. A step with ``for_each`` runs its
+operation once per value of one parameter (at most BATCH_MAX_FOR_EACH; the
+step result says when values were left out). Failed or skipped dependencies
+skip the dependent step instead of failing the whole batch.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+BATCH_MAX_STEPS = 20
+BATCH_MAX_CONCURRENCY = 4
+BATCH_MAX_FOR_EACH = 25
+
+_SEGMENT = re.compile(r"^(?P<key>[^\[\]]*)(?P<indexes>(?:\[[^\]]*\])*)$")
+_INDEX = re.compile(r"\[([^\]]*)\]")
+
+# run_step(operation_id, parameters) -> execute_operation-style envelope
+StepRunner = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class BatchError(ValueError):
+    """Invalid batch definition (caught before any step runs)."""
+
+
+class _Spread(list):
+    """Marks a list produced by a wildcard, whose later segments apply per item."""
+
+
+def resolve_path(data: Any, path: str) -> Any:
+    """
+    Walk a reference path (without the step id) through a step's data.
+
+    Raises:
+        KeyError: If a key, index or segment does not exist, or a slice is malformed
+    """
+    value = data
+    for segment in _split_path(path):
+        match = _SEGMENT.match(segment)
+        if not match:
+            raise KeyError(f"Invalid path segment '{segment}'")
+        key = match.group("key")
+        if key == "*":
+            value = _map(value, _all_values)
+        elif key:
+            value = _map(value, lambda item, key=key: _get_key(item, key))
+        for index in _INDEX.findall(match.group("indexes")):
+            value = _apply_index(value, index.strip())
+    return list(value) if isinstance(value, _Spread) else value
+
+
+def _split_path(path: str) -> List[str]:
+    return [segment for segment in path.split(".") if segment] if path else []
+
+
+def _map(value: Any, fn: Callable[[Any], Any]) -> Any:
+    if isinstance(value, _Spread):
+        mapped = _Spread()
+        for item in value:
+            result = fn(item)
+            if isinstance(result, _Spread):
+                mapped.extend(result)
+            else:
+                mapped.append(result)
+        return mapped
+    return fn(value)
+
+
+def _all_values(value: Any) -> "_Spread":
+    if isinstance(value, dict):
+        return _Spread(value.values())
+    if isinstance(value, list):
+        return _Spread(value)
+    raise KeyError("Wildcard applied to a value that is not a list or object")
+
+
+def _get_key(value: Any, key: str) -> Any:
+    if isinstance(value, dict) and key in value:
+        return value[key]
+    raise KeyError(f"Key '{key}' not found")
+
+
+def _apply_index(value: Any, index: str) -> Any:
+    if index == "*":
+        return _map(value, _all_values)
+    if isinstance(value, _Spread):
+        # Indexes after a wildcard select from the flattened list
+        value = list(value)
+        spread = True
+    else:
+        spread = False
+    if not isinstance(value, list):
+        raise KeyError(f"Index [{index}] applied to a value that is not a list")
+    if ":" in index:
+        start, _, stop = index.partition(":")
+        try:
+            result = value[int(start) if start else None:int(stop) if stop else None]
+        except ValueError:
+            raise KeyError(f"Invalid slice [{index}]")
+        return _Spread(result) if spread else result
+    try:
+        return value[int(index)]
+    except (ValueError, IndexError):
+        raise KeyError(f"Index [{index}] out of range")
+
+
+def _references(value: Any) -> List[Tuple[str, str]]:
+    """(step_id, path) for every reference inside a parameter value."""
+    if isinstance(value, dict):
+        if "$ref" in value:
+            step_id, _, path = str(value["$ref"]).partition(".")
+            return [(step_id, path)]
+        return [ref for item in value.values() for ref in _references(item)]
+    if isinstance(value, list):
+        return [ref for item in value for ref in _references(item)]
+    return []
+
+
+def _substitute(value: Any, outputs: Dict[str, Any]) -> Any:
+    """Replace references with the referenced step data."""
+    if isinstance(value, dict):
+        if "$ref" in value:
+            step_id, _, path = str(value["$ref"]).partition(".")
+            resolved = resolve_path(outputs[step_id], path)
+            limit = value.get("limit")
+            if limit is not None and isinstance(resolved, list):
+                try:
+                    resolved = resolved[:int(limit)]
+                except (TypeError, ValueError):
+                    raise KeyError(f"Invalid limit {limit!r} for '{value['$ref']}'")
+            return resolved
+        return {key: _substitute(item, outputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, outputs) for item in value]
+    return value
+
+
+def validate_steps(steps: List[Dict[str, Any]], known_operations: Optional[Set[str]] = None) -> Dict[str, Set[str]]:
+    """
+    Check a batch definition and return each step's dependencies.
+
+    Raises:
+        BatchError: On missing/duplicate ids, unknown operations or
+            references, or dependency cycles
+    """
+    if not isinstance(steps, list) or not steps:
+        raise BatchError("operations must be a non-empty list of steps")
+    if len(steps) > BATCH_MAX_STEPS:
+        raise BatchError(f"At most {BATCH_MAX_STEPS} steps per batch")
+
+    ids: List[str] = []
+    for position, step in enumerate(steps):
+        if not isinstance(step, dict) or not step.get("id") or not step.get("operation"):
+            raise BatchError(f"Step {position} needs an 'id' and an 'operation'")
+        if step["id"] in ids:
+            raise BatchError(f"Duplicate step id '{step['id']}'")
+        if known_operations is not None and step["operation"] not in known_operations:
+            raise BatchError(f"Step '{step['id']}': unknown operation '{step['operation']}'")
+        for_each = step.get("for_each")
+        if for_each is not None and (not isinstance(for_each, dict) or len(for_each) != 1):
+            raise BatchError(f"Step '{step['id']}': for_each must map exactly one parameter to its values")
+        ids.append(step["id"])
+
+    dependencies: Dict[str, Set[str]] = {}
+    for step in steps:
+        refs = _references(step.get("parameters", {})) + _references(step.get("for_each") or {})
+        deps = {step_id for step_id, _ in refs} | set(step.get("depends_on") or [])
+        unknown = deps - set(ids)
+        if unknown:
+            raise BatchError(f"Step '{step['id']}' references unknown steps {sorted(unknown)}")
+        if step["id"] in deps:
+            raise BatchError(f"Step '{step['id']}' references itself")
+        dependencies[step["id"]] = deps
+
+    # Cycle check (depth-first)
+    state: Dict[str, int] = {}
+
+    def visit(step_id: str, trail: List[str]) -> None:
+        if state.get(step_id) == 2:
+            return
+        if state.get(step_id) == 1:
+            raise BatchError(f"Dependency cycle: {' -> '.join(trail + [step_id])}")
+        state[step_id] = 1
+        for dep in dependencies[step_id]:
+            visit(dep, trail + [step_id])
+        state[step_id] = 2
+
+    for step_id in ids:
+        visit(step_id, [])
+    return dependencies
+
+
+async def run_batch(
+    steps: List[Dict[str, Any]],
+    run_step: StepRunner,
+    known_operations: Optional[Set[str]] = None,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Run a batch of operations, concurrently where references allow.
+
+    Args:
+        steps: Step definitions (id, operation, parameters, optional
+            depends_on, for_each and return_data)
+        run_step: Executes one operation and returns its envelope
+        known_operations: Valid operation IDs (None to skip the check)
+        max_concurrency: Maximum operations running at once
+
+    Returns:
+        Per-step results in definition order plus a summary, or an error
+        dict if the batch definition is invalid
+    """
+    try:
+        dependencies = validate_steps(steps, known_operations)
+    except BatchError as e:
+        return {
+            "error": str(e),
+            "suggestion": "Give every step a unique id; reference earlier steps as {\"$ref\": \"<step_id>.<path>\"}"
+        }
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    outputs: Dict[str, Any] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    done: Dict[str, asyncio.Event] = {step["id"]: asyncio.Event() for step in steps}
+    started = time.monotonic()
+
+    async def call(operation_id: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await run_step(operation_id, parameters)
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+    async def run(step: Dict[str, Any]) -> None:
+        step_id = step["id"]
+        try:
+            for dep in dependencies[step_id]:
+                await done[dep].wait()
+            failed = sorted(dep for dep in dependencies[step_id] if not results[dep]["success"])
+            if failed:
+                results[step_id] = {
+                    "success": False,
+                    "skipped": True,
+                    "error": f"Skipped: dependency {', '.join(failed)} did not succeed"
+                }
+                return
+
+            step_started = time.monotonic()
+            try:
+                parameters = _substitute(step.get("parameters", {}), outputs)
+                for_each = _substitute(step.get("for_each"), outputs) if step.get("for_each") else None
+            except (KeyError, ValueError, TypeError, IndexError) as e:
+                reason = e.args[0] if e.args else type(e).__name__
+                results[step_id] = {"success": False, "error": f"Could not resolve reference: {reason}"}
+                return
+
+            if for_each is None:
+                envelope = await call(step["operation"], parameters)
+                result = dict(envelope)
+                outputs[step_id] = envelope.get("data")
+            else:
+                result = await _run_for_each(step, parameters, for_each, call)
+                outputs[step_id] = result["data"]
+            result["elapsed_ms"] = round((time.monotonic() - step_started) * 1000)
+            results[step_id] = result
+        finally:
+            done[step_id].set()
+
+    await asyncio.gather(*(run(step) for step in steps))
+
+    ordered = {}
+    for step in steps:
+        result = {"operation": step["operation"], **results[step["id"]]}
+        if not step.get("return_data", True):
+            result.pop("data", None)
+            result.pop("items", None)
+        ordered[step["id"]] = result
+
+    return {
+        "results": ordered,
+        "summary": {
+            "steps": len(steps),
+            "succeeded": sum(1 for r in results.values() if r["success"]),
+            "failed": sum(1 for r in results.values() if not r["success"] and not r.get("skipped")),
+            "skipped": sum(1 for r in results.values() if r.get("skipped")),
+            "elapsed_ms": round((time.monotonic() - started) * 1000)
+        }
+    }
+
+
+async def _run_for_each(
+    step: Dict[str, Any],
+    parameters: Dict[str, Any],
+    for_each: Dict[str, Any],
+    call: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Run a step once per value; data is the list of per-value results.
+
+    Only the first BATCH_MAX_FOR_EACH values run; the result then carries
+    ``truncated`` and the original ``for_each_count``.
+    """
+    (param, values), = for_each.items()
+    if not isinstance(values, list):
+        values = [values]
+    total = len(values)
+    values = values[:BATCH_MAX_FOR_EACH]
+
+    envelopes = await asyncio.gather(*(
+        call(step["operation"], {**parameters, param: value}) for value in values
+    ))
+    items = [
+        {param: value, "success": envelope.get("success", False), "error": envelope.get("error")}
+        for value, envelope in zip(values, envelopes)
+    ]
+    for item in items:
+        if item["error"] is None:
+            del item["error"]
+    result = {
+        "success": any(envelope.get("success") for envelope in envelopes) or not values,
+        "data": [envelope.get("data") for envelope in envelopes if envelope.get("success")],
+        "items": items
+    }
+    if total > len(values):
+        result["truncated"] = True
+        result["for_each_count"] = total
+        result["warning"] = (
+            f"Ran the first {len(values)} of {total} for_each values; "
+            "add a \"limit\" to the reference or split the step"
+        )
+    return result
@@ -0,0 +1,132 @@
+"""
+Bounded in-memory TTL cache.
+
+Small LRU cache with per-entry expiry, used for server-side state that must
+not grow without limit (discovery result handles, cached API responses).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU cache with a maximum entry count and per-entry time-to-live.
+
+    Expired entries are dropped lazily on access and when the cache is full.
+    Thread-safe, since tool code also runs in worker threads.
+
+    Usage:
+        cache = TTLCache(max_entries=256, ttl_seconds=600)
+        cache.set("key", value)
+        value = cache.get("key")  # None once expired or evicted
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Maximum number of live entries (LRU eviction beyond)
+            ttl_seconds: Default time-to-live for new entries
+            clock: Monotonic clock, injectable for tests
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """
+        Get a live entry, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            count: Whether to record the hit/miss in the stats
+
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                if count:
+                    self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at <= self._clock():
+                del self._entries[key]
+                if count:
+                    self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value, evicting expired and then least-recently-used entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Override the default time-to-live for this entry
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._purge_expired()
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def items(self) -> list:
+        """Snapshot of live (key, value) pairs, oldest first."""
+        with self._lock:
+            now = self._clock()
+            return [(key, value) for key, (expires_at, value) in self._entries.items() if expires_at > now]
+
+    def stats(self) -> dict:
+        """Entry count and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _purge_expired(self) -> None:
+        """Drop expired entries (caller holds the lock)."""
+        now = self._clock()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
@@ -0,0 +1,242 @@
+"""
+Exact-name catalog of indexed subreddits.
+
+Keeps the names and core metadata of every subreddit in the vector index in
+a case-insensitive hash index, so existence checks are dictionary lookups
+instead of semantic queries that can miss an exact name outside the top-k.
+The catalog is loaded from the vector proxy in pages and refreshed
+periodically; a stale catalog keeps serving lookups while it reloads. Each
+load also rebuilds the lexical index used by hybrid discovery.
+
+Every load is published to the shared cache as a snapshot, so other workers
+(and pods on a shared backend) load the metadata from there instead of
+paging through the proxy themselves.
+"""
+
+import difflib
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .lexical import LexicalIndex
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Refresh cadence and paging for catalog loads
+CATALOG_REFRESH_SECONDS = int(os.getenv("SUBREDDIT_CATALOG_REFRESH_SECONDS", "21600"))
+CATALOG_RETRY_SECONDS = 300
+CATALOG_PAGE_SIZE = 1000
+DESCRIPTION_MAX_CHARS = 500
+
+_snapshots = SharedCache("subreddit_metadata", ttl_seconds=CATALOG_REFRESH_SECONDS)
+
+
+def normalize_subreddit_name(name: str) -> str:
+    """Strip r/ prefixes and whitespace from a subreddit name."""
+    return name.replace("/r/", "").replace("r/", "").strip()
+
+
+class SubredditCatalog:
+    """
+    Case-insensitive hash index of indexed subreddit names and metadata.
+
+    Entries are compact dicts with name, subscribers, nsfw, url and
+    description. Lookups never touch the network; ``refresh()`` rebuilds the
+    index (and its LexicalIndex) from a collection and swaps it in atomically.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: int = CATALOG_REFRESH_SECONDS,
+        retry_seconds: int = CATALOG_RETRY_SECONDS,
+        page_size: int = CATALOG_PAGE_SIZE
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.retry_seconds = retry_seconds
+        self.page_size = page_size
+
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._names_by_initial: Dict[str, List[str]] = {}
+        self.lexical: Optional[LexicalIndex] = None
+        self._loaded_at: Optional[float] = None
+        self._next_attempt_at = 0.0
+        self._lock = threading.Lock()
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the catalog has been loaded at least once."""
+        return self._loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def needs_refresh(self) -> bool:
+        """Whether a (re)load is due, honoring the retry backoff after failures."""
+        now = time.time()
+        if now < self._next_attempt_at:
+            return False
+        if self._loaded_at is None:
+            return True
+        return now - self._loaded_at >= self.refresh_seconds
+
+    def refresh(self, collection) -> bool:
+        """
+        Reload the catalog from a vector collection.
+
+        Pages through ``collection.get()`` for metadatas and documents.
+        Concurrent callers skip the reload instead of queueing behind it.
+
+        Args:
+            collection: ProxyCollection (or compatible) to read from
+
+        Returns:
+            True if the catalog was reloaded, False otherwise
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+
+        try:
+            name = getattr(collection, "name", None)
+            if isinstance(name, str) and self.load_snapshot(name):
+                return True
+
+            entries: Dict[str, Dict[str, Any]] = {}
+            offset = 0
+            while True:
+                page = collection.get(
+                    include=["metadatas", "documents"],
+                    limit=self.page_size,
+                    offset=offset
+                )
+                metadatas = page.get("metadatas") or []
+                self._index_page(entries, metadatas, page.get("documents"))
+                if len(metadatas) < self.page_size:
+                    break
+                offset += self.page_size
+
+            self.load(entries.values())
+            self.last_error = None
+            logger.info("Subreddit catalog loaded: %d subreddits", len(entries))
+            self._publish_snapshot(collection)
+            return True
+
+        except Exception as e:
+            self.last_error = str(e)
+            self._next_attempt_at = time.time() + self.retry_seconds
+            logger.warning("Subreddit catalog refresh failed: %s", e)
+            return False
+
+        finally:
+            self._lock.release()
+
+    def load_snapshot(self, collection_name: str) -> bool:
+        """
+        Load the shared snapshot of a collection's catalog, if it is newer than this one.
+
+        Snapshots come from other workers or, with a persistent cache
+        backend, from before a restart. No network calls are made.
+
+        Returns:
+            True if the snapshot was loaded
+        """
+        snapshot = _snapshots.get(collection_name)
+        if not snapshot or snapshot["loaded_at"] <= (self._loaded_at or 0):
+            return False
+        self.load(snapshot["entries"], loaded_at=snapshot["loaded_at"])
+        self.last_error = None
+        logger.info("Subreddit catalog loaded from shared cache: %d subreddits", len(self._by_name))
+        return True
+
+    def _publish_snapshot(self, collection) -> None:
+        """Share the freshly loaded catalog with other workers until its next refresh."""
+        name = getattr(collection, "name", None)
+        if isinstance(name, str):
+            _snapshots.set(
+                name,
+                {"loaded_at": self._loaded_at, "entries": list(self._by_name.values())},
+                ttl_seconds=self.refresh_seconds
+            )
+
+    def load(self, entries: Iterable[Dict[str, Any]], loaded_at: Optional[float] = None) -> None:
+        """Replace the index with the given metadata entries (loaded at ``loaded_at``, default now)."""
+        by_name: Dict[str, Dict[str, Any]] = {}
+        self._index_page(by_name, entries)
+
+        names_by_initial: Dict[str, List[str]] = {}
+        for key in by_name:
+            names_by_initial.setdefault(key[:1], []).append(key)
+
+        lexical = LexicalIndex(by_name.values())
+
+        self._by_name = by_name
+        self._names_by_initial = names_by_initial
+        self.lexical = lexical
+        self._loaded_at = time.time() if loaded_at is None else loaded_at
+        self._next_attempt_at = self._loaded_at + self.refresh_seconds
+
+    def lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Case-insensitive exact lookup.
+
+        Args:
+            name: Subreddit name, with or without r/ prefix
+
+        Returns:
+            Catalog entry, or None if not indexed
+        """
+        return self._by_name.get(normalize_subreddit_name(name).lower())
+
+    def suggest(self, name: str, n: int = 3, cutoff: float = 0.8) -> List[str]:
+        """
+        Suggest indexed names close to a (probably misspelled) name.
+
+        Candidates are limited to names sharing the first character, which
+        keeps the fuzzy match cheap over tens of thousands of entries.
+        """
+        key = normalize_subreddit_name(name).lower()
+        candidates = self._names_by_initial.get(key[:1], [])
+        matches = difflib.get_close_matches(key, candidates, n=n, cutoff=cutoff)
+        return [self._by_name[m]["name"] for m in matches]
+
+    @staticmethod
+    def _index_page(
+        target: Dict[str, Dict[str, Any]],
+        metadatas: Iterable[Dict[str, Any]],
+        documents: Optional[List[str]] = None
+    ) -> None:
+        """Add compact entries for a page of metadata dicts (and documents)."""
+        for i, metadata in enumerate(metadatas):
+            name = (metadata or {}).get("name")
+            if not name:
+                continue
+            description = metadata.get("description")
+            if description is None and documents and i < len(documents):
+                description = documents[i]
+            target[name.lower()] = {
+                "name": name,
+                "subscribers": metadata.get("subscribers", 0),
+                "nsfw": bool(metadata.get("nsfw", False)),
+                "url": metadata.get("url", f"https://reddit.com/r/{name}"),
+                "description": (description or "")[:DESCRIPTION_MAX_CHARS]
+            }
+
+
+_catalog_instance: Optional[SubredditCatalog] = None
+
+
+def get_subreddit_catalog() -> SubredditCatalog:
+    """Get the process-wide subreddit catalog (loaded lazily by callers)."""
+    global _catalog_instance
+    if _catalog_instance is None:
+        _catalog_instance = SubredditCatalog()
+    return _catalog_instance
+
+
+def reset_subreddit_catalog() -> None:
+    """Reset the catalog instance (useful for testing)."""
+    global _catalog_instance
+    _catalog_instance = None
@@ -5,37 +5,266 @@ Provides connection to ChromaDB Cloud for vector storage and retrieval.
 """
 
 import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional, List, Dict, Any
 import requests
 
+from .deadline import call_timeout
+from .resilience import CircuitBreaker, LatencyTracker
+
 
 _client_instance = None
 
 
+# Resilience settings for proxy requests
+PROXY_FAILURE_THRESHOLD = int(os.getenv('CHROMA_PROXY_FAILURE_THRESHOLD', '5'))
+PROXY_OPEN_SECONDS = float(os.getenv('CHROMA_PROXY_OPEN_SECONDS', '30'))
+PROXY_HEDGING = os.getenv('CHROMA_PROXY_HEDGING', 'false').lower() in ('1', 'true', 'yes')
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20       # Use HEDGE_DEFAULT_DELAY until this many latencies are known
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_DELAY = 0.05
+HEDGE_MAX_WORKERS = 8
+
+
+def _configured_proxy_urls() -> List[str]:
+    """Replica URLs from CHROMA_PROXY_URLS (comma-separated) or CHROMA_PROXY_URL."""
+    urls = [u.strip() for u in os.getenv('CHROMA_PROXY_URLS', '').split(',') if u.strip()]
+    if urls:
+        return urls
+    return [os.getenv('CHROMA_PROXY_URL', 'https://reddit-mcp-vector-db.onrender.com')]
+
+
+class ProxyReplica:
+    """One proxy endpoint with its own session, circuit breaker and latency stats."""
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        failure_threshold: int = PROXY_FAILURE_THRESHOLD,
+        open_seconds: float = PROXY_OPEN_SECONDS
+    ):
+        self.url = url.rstrip('/')
+        self.session = requests.Session()
+        if api_key:
+            self.session.headers['X-API-Key'] = api_key
+        self.breaker = CircuitBreaker(failure_threshold=failure_threshold, open_seconds=open_seconds)
+        self.latency = LatencyTracker()
+
+    def status(self) -> Dict[str, Any]:
+        """Breaker state and smoothed latency, for health reporting."""
+        ewma = self.latency.ewma
+        return {
+            'url': self.url,
+            'state': self.breaker.state,
+            'latency_ms': round(ewma * 1000, 1) if ewma is not None else None
+        }
+
+
 # ============= PROXY CLIENT CLASSES =============
 class ChromaProxyClient:
-    """Proxy client that mimics ChromaDB interface."""
+    """
+    Proxy client that mimics ChromaDB interface.
+
+    Requests go through a per-replica circuit breaker: while every replica's
+    circuit is open, calls fail fast with ConnectionError instead of waiting
+    out timeouts. With several replicas (CHROMA_PROXY_URLS), the faster ones
+    are preferred and failed requests move on to the next replica. With
+    hedging enabled, a read still pending after the recent p95 latency is
+    re-sent to another replica and the first answer wins.
+    """
     
-    def __init__(self, proxy_url: Optional[str] = None):
-        self.url = proxy_url or os.getenv(
-            'CHROMA_PROXY_URL', 
-            'https://reddit-mcp-vector-db.onrender.com'
-        )
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        proxy_urls: Optional[List[str]] = None,
+        hedging: Optional[bool] = None
+    ):
+        urls = proxy_urls or ([proxy_url] if proxy_url else _configured_proxy_urls())
         self.api_key = os.getenv('CHROMA_PROXY_API_KEY')
-        self.session = requests.Session()
-        
-        # Set API key in session headers if provided
-        if self.api_key:
-            self.session.headers['X-API-Key'] = self.api_key
-    
-    def query(self, query_texts: List[str], n_results: int = 10, collection_name: str = "dialog-app-prod-db") -> Dict[str, Any]:
-        """Query through proxy."""
+        self.replicas = [ProxyReplica(url, self.api_key) for url in urls]
+        self.hedging = PROXY_HEDGING if hedging is None else hedging
+        self.latency = LatencyTracker()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._random = random.Random()
+
+        # Primary endpoint, kept for callers that read these directly
+        self.url = self.replicas[0].url
+        self.session = self.replicas[0].session
+
+    def replica_status(self) -> List[Dict[str, Any]]:
+        """Per-replica breaker state and latency."""
+        return [replica.status() for replica in self.replicas]
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait before hedging: the recent p95 latency."""
+        if len(self.latency) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, self.latency.percentile(HEDGE_PERCENTILE))
+
+    def _ordered_replicas(self) -> List[ProxyReplica]:
+        """Replicas in latency-weighted random order (faster replicas first more often)."""
+        if len(self.replicas) == 1:
+            return list(self.replicas)
+
+        known = [r.latency.ewma for r in self.replicas if r.latency.ewma]
+        default = sum(known) / len(known) if known else 1.0
+        remaining = list(self.replicas)
+        ordered = []
+        while remaining:
+            weights = [1.0 / max(r.latency.ewma or default, 1e-3) for r in remaining]
+            choice = self._random.choices(range(len(remaining)), weights=weights)[0]
+            ordered.append(remaining.pop(choice))
+        return ordered
+
+    def _send(
+        self,
+        replica: ProxyReplica,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> requests.Response:
+        """Send one request to a replica, feeding its breaker and latency stats."""
+        start = time.monotonic()
         try:
-            response = self.session.post(
-                f"{self.url}/query",
-                json={"query_texts": query_texts, "n_results": n_results, "collection_name": collection_name},
-                timeout=10
+            response = replica.session.request(
+                method, f"{replica.url}{path}", json=payload, timeout=timeout
             )
+        except requests.exceptions.RequestException:
+            replica.breaker.record_failure()
+            raise
+        except BaseException:
+            # Not the replica's fault (e.g. cancelled); free a half-open probe
+            replica.breaker.release_probe()
+            raise
+
+        if response.status_code >= 500:
+            replica.breaker.record_failure()
+        else:
+            elapsed = time.monotonic() - start
+            replica.breaker.record_success()
+            replica.latency.record(elapsed)
+            self.latency.record(elapsed)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: float = 10,
+        hedge: bool = True
+    ) -> requests.Response:
+        """
+        Send a request to the first available replica, failing over on errors.
+
+        Returns:
+            The first non-5xx response (or the last 5xx if every replica failed)
+
+        Raises:
+            ConnectionError: If every replica's circuit is open
+            requests.exceptions.RequestException: If every attempt failed
+            DeadlineExceeded: If the operation's deadline passes first
+        """
+        # The deadline is checked before a replica (and its half-open probe) is claimed
+        timeout = call_timeout(timeout)
+        candidates = iter(self._ordered_replicas())
+        replica = next((r for r in candidates if r.breaker.allow_request()), None)
+        if replica is None:
+            raise ConnectionError(
+                "Vector database temporarily unavailable (circuit open). Retry shortly."
+            )
+
+        last_error: Optional[Exception] = None
+        last_response: Optional[requests.Response] = None
+        while replica is not None:
+            try:
+                if hedge and self.hedging:
+                    response = self._hedged_send(replica, candidates, method, path, payload, timeout)
+                else:
+                    response = self._send(replica, method, path, payload, timeout)
+                if response.status_code < 500:
+                    return response
+                last_response = response
+            except requests.exceptions.RequestException as e:
+                last_error = e
+            except BaseException:
+                # Failed before the replica could record a result
+                replica.breaker.release_probe()
+                raise
+            # Failover attempts stay within the operation's deadline
+            timeout = call_timeout(timeout)
+            replica = next((r for r in candidates if r.breaker.allow_request()), None)
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def _hedged_send(self, primary, candidates, method, path, payload, timeout) -> requests.Response:
+        """Send to ``primary``; if it is still pending after the hedge delay, race a backup."""
+        executor = self._get_executor()
+        pending = {executor.submit(self._send, primary, method, path, payload, timeout)}
+        done, _ = wait(pending, timeout=self.hedge_delay())
+        if not done:
+            backup = next((r for r in candidates if r.breaker.allow_request()), None)
+            if backup is None and len(self.replicas) == 1 and primary.breaker.state == CircuitBreaker.CLOSED:
+                backup = primary
+            if backup is not None:
+                pending.add(executor.submit(self._send, backup, method, path, payload, timeout))
+
+        # First non-5xx answer wins; the slower request finishes in the background
+        last_error: Optional[Exception] = None
+        last_response: Optional[requests.Response] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    last_error = error
+                elif future.result().status_code < 500:
+                    return future.result()
+                else:
+                    last_response = future.result()
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="chroma-proxy"
+                )
+            return self._executor
+    
+    def query(
+        self,
+        query_texts: List[str],
+        n_results: int = 10,
+        collection_name: str = "dialog-app-prod-db",
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Query through proxy, optionally filtering on metadata and trimming fields."""
+        payload: Dict[str, Any] = {
+            "query_texts": query_texts,
+            "n_results": n_results,
+            "collection_name": collection_name
+        }
+        if where:
+            payload["where"] = where
+        if include is not None:
+            payload["include"] = include
+
+        try:
+            response = self._request("POST", "/query", payload, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -50,6 +279,38 @@ class ChromaProxyClient:
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to query vector database: {e}")
     
+    def get(
+        self,
+        collection_name: str = "dialog-app-prod-db",
+        include: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Page through collection records without a similarity query."""
+        payload: Dict[str, Any] = {"collection_name": collection_name}
+        if include is not None:
+            payload["include"] = include
+        if limit is not None:
+            payload["limit"] = limit
+        if offset is not None:
+            payload["offset"] = offset
+
+        try:
+            response = self._request("POST", "/get", payload, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 401:
+                raise ConnectionError("Authentication failed: API key required. Set CHROMA_PROXY_API_KEY environment variable.")
+            elif e.response.status_code == 403:
+                raise ConnectionError("Authentication failed: Invalid API key provided.")
+            elif e.response.status_code == 404:
+                raise ConnectionError("Vector proxy does not support record listing (/get)")
+            else:
+                raise ConnectionError(f"Failed to list vector database records: HTTP {e.response.status_code}")
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError(f"Failed to list vector database records: {e}")
+
     def list_collections(self) -> List[Dict[str, str]]:
         """Compatibility method."""
         return [{"name": "reddit_subreddits"}]
@@ -57,7 +318,7 @@ class ChromaProxyClient:
     def count(self) -> int:
         """Get document count."""
         try:
-            response = self.session.get(f"{self.url}/stats", timeout=5)
+            response = self._request("GET", "/stats", timeout=5, hedge=False)
             if response.status_code == 200:
                 return response.json().get('total_subreddits', 20000)
             elif response.status_code == 401:
@@ -76,8 +337,24 @@ class ProxyCollection:
         self.proxy_client = proxy_client
         self.name = collection_name
 
-    def query(self, query_texts: List[str], n_results: int = 10) -> Dict[str, Any]:
-        return self.proxy_client.query(query_texts, n_results, collection_name=self.name)
+    def query(
+        self,
+        query_texts: List[str],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        return self.proxy_client.query(
+            query_texts, n_results, collection_name=self.name, where=where, include=include
+        )
+
+    def get(
+        self,
+        include: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return self.proxy_client.get(self.name, include=include, limit=limit, offset=offset)
 
     def count(self) -> int:
         return self.proxy_client.count()
@@ -157,6 +434,7 @@ def test_connection() -> dict:
         status['connected'] = True
         status['collections'] = ['reddit_subreddits']
         status['document_count'] = client.count()
+        status['replicas'] = client.replica_status()
         
     except Exception as e:
         status['error'] = str(e)
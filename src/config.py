@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
+from .deadline import DeadlineRequestor
+
 
 def enable_praw_debug_logging(level: int = logging.DEBUG):
     """
@@ -61,7 +63,8 @@ def get_reddit_client() -> praw.Reddit:
         client_secret=client_secret,
         user_agent=user_agent,
         redirect_uri="http://localhost:8080",  # Required even for read-only
-        ratelimit_seconds=300  # Auto-handle rate limits
+        ratelimit_seconds=300,  # Auto-handle rate limits
+        requestor_class=DeadlineRequestor  # Honour per-operation deadlines
     )
     
     # Explicitly enable read-only mode
@@ -0,0 +1,364 @@
+"""
+Per-session research corpus.
+
+Every post and comment a session's operations return is kept as a compact
+record, keyed by Reddit fullname (``t3_<id>`` for posts, ``t1_<id>`` for
+comments), so re-fetches update a record instead of duplicating it. The
+query_corpus operation filters, sorts and pages over these records without
+calling Reddit.
+
+Each session's corpus is capped by record count and approximate size (oldest
+records are evicted first) and expires after CORPUS_TTL_SECONDS without use.
+
+A multi-worker server hands each request to any worker with a fresh MCP
+session id, so there corpora are keyed by client alone and stored in the
+shared cache backend (in chunks, see CorpusStore) instead of in process
+memory.
+"""
+
+import logging
+import asyncio
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastmcp.server.dependencies import get_access_token
+
+from .cache import TTLCache
+from .serve import worker_count
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+CORPUS_TTL_SECONDS = float(os.getenv("CORPUS_TTL_SECONDS", "3600"))
+CORPUS_MAX_SESSIONS = int(os.getenv("CORPUS_MAX_SESSIONS", "256"))
+CORPUS_MAX_RECORDS = int(os.getenv("CORPUS_MAX_RECORDS", "5000"))           # Per session
+CORPUS_MAX_BYTES = int(os.getenv("CORPUS_MAX_BYTES", str(8 * 1024 * 1024)))  # Per session (approximate)
+CORPUS_TEXT_CHARS = 2000      # Post/comment bodies are truncated to this in records
+RECORD_OVERHEAD_BYTES = 200   # Rough per-record cost of the dict itself
+CORPUS_CHUNK_RECORDS = 250    # Records per shared-cache entry (multi-worker servers)
+
+POST_PREFIX = "t3_"
+COMMENT_PREFIX = "t1_"
+
+
+def _text(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    return value if len(value) <= CORPUS_TEXT_CHARS else value[:CORPUS_TEXT_CHARS]
+
+
+def _post_permalink(post_id: str) -> str:
+    return f"https://reddit.com/comments/{post_id}/"
+
+
+def post_record(post: Dict[str, Any], subreddit: Optional[str] = None) -> Dict[str, Any]:
+    """Compact record for a post dict as returned by any operation."""
+    return {
+        "fullname": POST_PREFIX + post["id"],
+        "kind": "post",
+        "id": post["id"],
+        "subreddit": post.get("subreddit") or subreddit,
+        "title": post.get("title"),
+        "author": post.get("author"),
+        "score": post.get("score"),
+        "num_comments": post.get("num_comments"),
+        "created_utc": post.get("created_utc"),
+        "text": _text(post.get("selftext")),
+        "url": post.get("url"),
+        "permalink": post.get("permalink") or _post_permalink(post["id"])
+    }
+
+
+def comment_record(comment: Dict[str, Any], post: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact record for a comment dict, linked to its post."""
+    return {
+        "fullname": COMMENT_PREFIX + comment["id"],
+        "kind": "comment",
+        "id": comment["id"],
+        "post_id": post["id"],
+        "subreddit": post.get("subreddit"),
+        "author": comment.get("author"),
+        "score": comment.get("score"),
+        "created_utc": comment.get("created_utc"),
+        "depth": comment.get("depth", 0),
+        "text": _text(comment.get("body")),
+        "permalink": comment.get("permalink") or f"{_post_permalink(post['id'])}_/{comment['id']}/"
+    }
+
+
+def _comment_tree(comments: List[Dict[str, Any]], post: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for comment in comments or []:
+        yield comment_record(comment, post)
+        yield from _comment_tree(comment.get("replies"), post)
+
+
+def extract_records(operation_id: str, data: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Corpus records in an operation's result data.
+
+    Operations that return no Reddit content yield nothing.
+    """
+    if not isinstance(data, dict):
+        return
+    if operation_id in ("fetch_posts", "fetch_feed_posts"):
+        for post in data.get("posts", []):
+            yield post_record(post)
+    elif operation_id == "search_subreddit":
+        for post in data.get("results", []):
+            yield post_record(post)
+    elif operation_id == "fetch_multiple":
+        for name, posts in data.get("posts_by_subreddit", {}).items():
+            for post in posts:
+                yield post_record(post, subreddit=name)
+    elif operation_id == "fetch_comments":
+        submission = data.get("submission")
+        if submission:
+            record = post_record(submission)
+            yield record
+            yield from _comment_tree(data.get("comments"), record)
+    elif operation_id == "research":
+        for post in data.get("posts", []):
+            record = post_record(post)
+            yield record
+            yield from _comment_tree(post.get("comments"), record)
+
+
+def _record_size(record: Dict[str, Any]) -> int:
+    return RECORD_OVERHEAD_BYTES + sum(len(value) for value in record.values() if isinstance(value, str))
+
+
+class SessionCorpus:
+    """
+    One session's records, oldest-updated first, within a count and size cap.
+
+    Thread-safe: records are added on the event loop while queries run in
+    worker threads.
+    """
+
+    def __init__(self, max_records: int = CORPUS_MAX_RECORDS, max_bytes: int = CORPUS_MAX_BYTES):
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.bytes = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, records: Iterator[Dict[str, Any]]) -> int:
+        """
+        Insert or update records by fullname.
+
+        Fields missing from a newer copy (e.g. a post's text, which listings
+        omit) keep their earlier values.
+
+        Returns:
+            Number of records added or updated
+        """
+        count = 0
+        with self._lock:
+            for record in records:
+                fullname = record["fullname"]
+                existing = self._records.pop(fullname, None)
+                if existing is not None:
+                    record = {**existing, **{k: v for k, v in record.items() if v is not None}}
+                    self.bytes -= self._sizes[fullname]
+                size = _record_size(record)
+                self._records[fullname] = record
+                self._sizes[fullname] = size
+                self.bytes += size
+                count += 1
+            while self._records and (len(self._records) > self.max_records or self.bytes > self.max_bytes):
+                fullname, _ = self._records.popitem(last=False)
+                self.bytes -= self._sizes.pop(fullname)
+                self.evicted += 1
+        return count
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Snapshot of all records."""
+        with self._lock:
+            return list(self._records.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Record counts and approximate size."""
+        with self._lock:
+            posts = sum(1 for fullname in self._records if fullname.startswith(POST_PREFIX))
+            return {
+                "posts": posts,
+                "comments": len(self._records) - posts,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evicted": self.evicted
+            }
+
+
+class CorpusStore:
+    """
+    Session corpora that expire after a period without use.
+
+    Corpora live in this process unless ``shared`` is given. Then each one
+    is kept in the SharedCache as chunks of up to CORPUS_CHUNK_RECORDS
+    records plus a small index entry, so every worker can read it. An
+    ingest writes only the index and the chunk(s) it appends to, and reads
+    write nothing. Shared records therefore expire CORPUS_TTL_SECONDS after
+    they were fetched rather than after last use. Later chunks override
+    earlier copies of a record, and the oldest chunks are dropped past the
+    record or size cap. Ingests for the same session from two workers at
+    once may lose one index update (the later write wins).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = CORPUS_TTL_SECONDS,
+        max_sessions: int = CORPUS_MAX_SESSIONS,
+        shared: Optional[SharedCache] = None
+    ):
+        self._sessions = TTLCache(max_entries=max_sessions, ttl_seconds=ttl_seconds)
+        self._shared = shared
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self) -> bool:
+        """Whether corpora live in the shared cache (backend I/O on every call)."""
+        return self._shared is not None
+
+    def get(self, session: str) -> Optional[SessionCorpus]:
+        """A session's corpus (extending its lifetime in process memory), or None."""
+        if self._shared is not None:
+            return self._load(session)
+        corpus = self._sessions.get(session)
+        if corpus is not None:
+            self._sessions.set(session, corpus)
+        return corpus
+
+    def ingest(self, session: str, operation_id: str, data: Any) -> int:
+        """
+        Add the posts and comments in an operation's result to a session.
+
+        Returns:
+            Number of records added or updated
+        """
+        records = list(extract_records(operation_id, data))
+        if not records:
+            return 0
+        if self._shared is not None:
+            with self._lock:
+                self._append(session, records)
+            return len(records)
+        with self._lock:
+            corpus = self.get(session)
+            if corpus is None:
+                corpus = SessionCorpus()
+                self._sessions.set(session, corpus)
+        return corpus.add(records)
+
+    def clear(self) -> None:
+        """Drop every session."""
+        self._sessions.clear()
+        if self._shared is not None:
+            self._shared.clear()
+
+    def _load(self, session: str) -> Optional[SessionCorpus]:
+        index = self._shared.get(f"{session}:index")
+        if not isinstance(index, dict):
+            return None
+        corpus = SessionCorpus()
+        for chunk_id, _, _ in index["chunks"]:
+            # Chunks the backend already dropped are skipped
+            corpus.add(self._shared.get(f"{session}:{chunk_id}") or [])
+        corpus.evicted += index.get("evicted", 0)
+        return corpus
+
+    def _append(self, session: str, records: List[Dict[str, Any]]) -> None:
+        index_key = f"{session}:index"
+        index = self._shared.get(index_key)
+        if not isinstance(index, dict):
+            index = {"chunks": [], "evicted": 0}
+        chunks = index["chunks"]
+
+        # Top up the newest chunk before starting new ones
+        if chunks and chunks[-1][1] < CORPUS_CHUNK_RECORDS:
+            chunk_id = chunks.pop()[0]
+            records = (self._shared.get(f"{session}:{chunk_id}") or []) + records
+        else:
+            chunk_id = None
+        for start in range(0, len(records), CORPUS_CHUNK_RECORDS):
+            chunk = records[start:start + CORPUS_CHUNK_RECORDS]
+            chunk_id = chunk_id or secrets.token_hex(6)
+            self._shared.set(f"{session}:{chunk_id}", chunk)
+            chunks.append([chunk_id, len(chunk), sum(_record_size(record) for record in chunk)])
+            chunk_id = None
+
+        # Oldest chunks go first; re-fetched records count once per copy, so this errs early
+        while len(chunks) > 1 and (
+            sum(count for _, count, _ in chunks) > CORPUS_MAX_RECORDS
+            or sum(size for _, _, size in chunks) > CORPUS_MAX_BYTES
+        ):
+            dropped_id, count, _ = chunks.pop(0)
+            self._shared.delete(f"{session}:{dropped_id}")
+            index["evicted"] += count
+        self._shared.set(index_key, index)
+
+
+def session_key(ctx: Any = None) -> str:
+    """
+    Corpus key for the current caller: authenticated client plus MCP session.
+
+    Falls back to a shared local key without auth or a session (stdio). A
+    multi-worker server issues a new session id per request, so there the
+    key is the client alone.
+    """
+    user = None
+    try:
+        access_token = get_access_token()
+        user = getattr(access_token, "client_id", None) if access_token else None
+    except Exception:
+        pass
+    session = None
+    if ctx is not None and worker_count() == 1:
+        try:
+            session = ctx.session_id
+        except Exception:
+            pass
+    return f"{user or 'local'}:{session or 'default'}"
+
+
+_corpus_store: Optional[CorpusStore] = None
+
+
+def get_corpus_store() -> CorpusStore:
+    """Get the process-wide corpus store (shared between workers), creating it on first use."""
+    global _corpus_store
+    if _corpus_store is None:
+        shared = SharedCache("corpus", ttl_seconds=CORPUS_TTL_SECONDS) if worker_count() > 1 else None
+        _corpus_store = CorpusStore(shared=shared)
+    return _corpus_store
+
+
+def reset_corpus_store() -> None:
+    """Drop the corpus store (for tests)."""
+    global _corpus_store
+    _corpus_store = None
+
+
+async def record_operation_result(ctx: Any, operation_id: str, data: Any) -> None:
+    """
+    Keep an operation's posts and comments in the caller's corpus (never raises).
+
+    A shared store does backend I/O and serialization, so it runs in a
+    worker thread instead of on the event loop.
+    """
+    try:
+        store = get_corpus_store()
+        key = session_key(ctx)
+        if store.shared:
+            await asyncio.to_thread(store.ingest, key, operation_id, data)
+        else:
+            store.ingest(key, operation_id, data)
+    except Exception as e:
+        logger.warning("Corpus ingest failed for %s: %s", operation_id, e)
@@ -0,0 +1,159 @@
+"""
+Per-operation deadlines shared with every outbound call.
+
+execute_operation runs each operation under a Deadline held in a context
+variable. Context variables follow the work into tasks and into
+``asyncio.to_thread`` workers, so Reddit (via DeadlineRequestor), vector
+and feed calls can read the remaining time without it being threaded
+through every signature. They clamp their timeouts to it and refuse to
+start once it has passed or the operation was cancelled. Fan-out tools stop
+waiting at the deadline (soft_deadline / wait_until) and return what
+finished as a partial result.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+import prawcore
+
+MIN_CALL_TIMEOUT = 0.5        # Never hand a client a timeout shorter than this
+DEADLINE_GRACE_SECONDS = 1.0  # Time past the deadline to assemble partial results before a hard cancel
+
+
+class DeadlineExceeded(TimeoutError):
+    """The operation's deadline passed or the operation was cancelled."""
+
+
+class Deadline:
+    """
+    Absolute deadline plus a cancellation flag for one operation.
+
+    The flag is a threading.Event so worker threads still running Reddit
+    calls see a cancellation made on the event loop.
+    """
+
+    def __init__(self, seconds: float, clock=time.monotonic):
+        self.seconds = seconds
+        self._clock = clock
+        self.expires_at = clock() + seconds
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired or cancelled)."""
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop all further calls made under this deadline."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """
+        Raises:
+            DeadlineExceeded: If the deadline passed or the operation was cancelled
+        """
+        if self._cancelled.is_set():
+            raise DeadlineExceeded("Operation cancelled")
+        if self._clock() >= self.expires_at:
+            raise DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded")
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline of the operation running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """
+    Run the enclosed code under a deadline (never later than an enclosing one).
+    """
+    parent = _current.get()
+    if parent is not None:
+        seconds = min(seconds, parent.remaining())
+    deadline = Deadline(seconds)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def check_deadline() -> None:
+    """
+    Raise if the current operation's deadline passed (no-op without one).
+
+    Raises:
+        DeadlineExceeded: If the deadline passed or the operation was cancelled
+    """
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def call_timeout(default: float) -> float:
+    """
+    Timeout for one outbound call: ``default`` clamped to the time remaining.
+
+    Raises:
+        DeadlineExceeded: If no time remains
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return default
+    deadline.check()
+    return max(MIN_CALL_TIMEOUT, min(default, deadline.remaining()))
+
+
+def soft_deadline(budget_seconds: Optional[float] = None) -> Optional[float]:
+    """
+    Monotonic time by which to stop waiting and return partial results.
+
+    The current deadline, or ``budget_seconds`` from now if that is sooner;
+    None when there is neither.
+    """
+    deadline = _current.get()
+    until = deadline.expires_at if deadline is not None else None
+    if budget_seconds is not None:
+        budget_until = time.monotonic() + budget_seconds
+        until = budget_until if until is None else min(until, budget_until)
+    return until
+
+
+async def wait_until(tasks: Iterable["asyncio.Future"], until: Optional[float]) -> None:
+    """Wait for tasks until a monotonic time (None: no limit); unfinished tasks are left to the caller."""
+    tasks = list(tasks)
+    if not tasks:
+        return
+    timeout = None if until is None else max(0.0, until - time.monotonic())
+    await asyncio.wait(tasks, timeout=timeout)
+
+
+class DeadlineRequestor(prawcore.Requestor):
+    """
+    PRAW requestor that honours the current operation's deadline.
+
+    Every Reddit HTTP request (listings, submissions, replace_more, token
+    refreshes) checks the deadline first and gets a timeout no longer than
+    the time remaining, so a cancelled or timed-out operation stops
+    spending quota at its next request.
+    """
+
+    def request(self, *args: Any, timeout: Optional[float] = None, **kwargs: Any):
+        return super().request(*args, timeout=call_timeout(timeout or self.timeout), **kwargs)
@@ -0,0 +1,151 @@
+"""
+Local lexical index over subreddit names and descriptions.
+
+Complements semantic vector search with the matches embeddings are bad at:
+exact names, name fragments ("python" -> r/learnpython) and acronyms
+("ml" -> r/MachineLearning). Combines BM25 over name and description terms
+with trigram containment over names. Built in memory from the subreddit
+catalog, so lookups need no network and keep working when the vector proxy
+is down.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field and signal weights
+NAME_TERM_WEIGHT = 3.0       # Name terms count this many times a description term
+TRIGRAM_WEIGHT = 4.0         # Score added at full trigram containment
+TRIGRAM_MIN_CONTAINMENT = 0.8
+EXACT_NAME_BONUS = 100.0     # Exact name match always ranks first
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def name_terms(name: str) -> List[str]:
+    """
+    Index terms for a subreddit name.
+
+    Includes the whole name, its CamelCase/digit parts and, for multi-part
+    names, the acronym (MachineLearning -> machinelearning, machine,
+    learning, ml).
+    """
+    terms = [name.lower()]
+    parts = [part.lower() for part in CAMEL_RE.findall(name)]
+    if len(parts) > 1:
+        terms.extend(parts)
+        terms.append("".join(part[0] for part in parts))
+    return terms
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct character trigrams of a string."""
+    return list({text[i:i + 3] for i in range(len(text) - 2)})
+
+
+class LexicalIndex:
+    """
+    In-memory BM25 + trigram index over subreddit catalog entries.
+
+    Entries are the catalog's compact dicts; ``search()`` returns them with a
+    lexical score and whether the query named the subreddit exactly.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        self.entries: List[Dict[str, Any]] = []
+        self._postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        self._trigrams: Dict[str, List[int]] = defaultdict(list)
+        self._exact: Dict[str, int] = {}
+        self._doc_lengths: List[float] = []
+
+        for doc_id, entry in enumerate(entries):
+            self.entries.append(entry)
+            name = entry["name"]
+
+            weights: Counter = Counter()
+            for term in name_terms(name):
+                weights[term] += NAME_TERM_WEIGHT
+            for term in tokenize(entry.get("description") or ""):
+                weights[term] += 1.0
+
+            for term, weight in weights.items():
+                self._postings[term].append((doc_id, weight))
+            self._doc_lengths.append(sum(weights.values()))
+
+            key = name.lower()
+            self._exact[key] = doc_id
+            for gram in trigrams(key):
+                self._trigrams[gram].append(doc_id)
+
+        self._avg_length = (
+            sum(self._doc_lengths) / len(self._doc_lengths) if self._doc_lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Rank catalog entries lexically against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+
+        Returns:
+            Hits, best first, as dicts with ``entry``, ``score`` and ``exact``
+        """
+        terms = tokenize(query)
+        if not terms or not self.entries:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        total_docs = len(self.entries)
+
+        # BM25 over name and description terms
+        for term in set(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / self._avg_length)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        # Trigram containment of the compacted query within names
+        compact = "".join(terms)
+        query_grams = trigrams(compact)
+        if query_grams:
+            hits: Counter = Counter()
+            for gram in query_grams:
+                for doc_id in self._trigrams.get(gram, ()):
+                    hits[doc_id] += 1
+            for doc_id, count in hits.items():
+                containment = count / len(query_grams)
+                if containment >= TRIGRAM_MIN_CONTAINMENT:
+                    scores[doc_id] += TRIGRAM_WEIGHT * containment
+
+        exact_id = self._exact.get(compact)
+        if exact_id is not None:
+            scores[exact_id] += EXACT_NAME_BONUS
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [
+            {
+                "entry": self.entries[doc_id],
+                "score": round(score, 3),
+                "exact": doc_id == exact_id
+            }
+            for doc_id, score in ranked
+        ]
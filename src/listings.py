@@ -0,0 +1,182 @@
+"""
+Shared cache of subreddit listings.
+
+Listings (hot/new/top/rising) are fetched once per subreddit and kept for a
+short TTL in the shared cache, so feeds and batch tools (in any worker)
+that touch the same popular subreddits share one Reddit call. Concurrent
+requests for the same listing in a process wait on a single in-flight
+fetch instead of each calling Reddit.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import praw
+from prawcore import NotFound, Forbidden, Redirect, TooManyRequests, ResponseException
+
+from .shared_cache import SharedCache
+from .deadline import DeadlineExceeded
+
+LISTING_CACHE_TTL_SECONDS = float(os.getenv("LISTING_CACHE_TTL_SECONDS", "300"))
+LISTING_FETCH_LIMIT = 25   # Minimum posts fetched per listing, so nearby limits share an entry
+LISTING_MAX_LIMIT = 100
+
+_listing_cache = SharedCache("listings", ttl_seconds=LISTING_CACHE_TTL_SECONDS)
+_inflight: Dict[Tuple, "asyncio.Future"] = {}
+
+
+def get_listing_cache() -> SharedCache:
+    """The process-wide listing cache."""
+    return _listing_cache
+
+
+def listing_key(subreddit: str, listing_type: str, time_filter: Optional[str] = None) -> Tuple:
+    """Cache key for a subreddit listing (case-insensitive name)."""
+    if listing_type == "top":
+        time_filter = time_filter or "all"
+    else:
+        time_filter = None
+    return (subreddit.lower(), listing_type, time_filter)
+
+
+def fetch_listing(
+    reddit: praw.Reddit,
+    subreddit: str,
+    listing_type: str = "hot",
+    time_filter: Optional[str] = None,
+    limit: int = LISTING_FETCH_LIMIT
+) -> List[Dict[str, Any]]:
+    """
+    Fetch a listing from Reddit (blocking).
+
+    Raises:
+        ValueError: For an unknown listing type
+        prawcore exceptions: For Reddit API errors
+    """
+    sub = reddit.subreddit(subreddit)
+    if listing_type == "hot":
+        submissions = sub.hot(limit=limit)
+    elif listing_type == "new":
+        submissions = sub.new(limit=limit)
+    elif listing_type == "rising":
+        submissions = sub.rising(limit=limit)
+    elif listing_type == "top":
+        submissions = sub.top(time_filter=time_filter or "all", limit=limit)
+    else:
+        raise ValueError(f"Invalid listing_type: {listing_type}")
+
+    return [
+        {
+            "id": submission.id,
+            "title": submission.title,
+            "author": str(submission.author) if submission.author else "[deleted]",
+            "subreddit": submission.subreddit.display_name,
+            "score": submission.score,
+            "num_comments": submission.num_comments,
+            "created_utc": submission.created_utc,
+            "url": submission.url,
+            "permalink": f"https://reddit.com{submission.permalink}",
+            "over_18": bool(getattr(submission, "over_18", False))
+        }
+        for submission in submissions
+    ]
+
+
+def store_listing(key: Tuple, posts: List[Dict[str, Any]], fetch_limit: int) -> None:
+    """Put a fetched listing in the cache."""
+    _listing_cache.set(key, {"posts": posts, "fetch_limit": fetch_limit, "fetched_at": time.time()})
+
+
+def _covers(entry: Optional[Dict[str, Any]], limit: int) -> bool:
+    """Whether a cached listing answers a request for ``limit`` posts."""
+    if not entry:
+        return False
+    # A shorter listing still answers if the subreddit simply has no more posts
+    return entry["fetch_limit"] >= limit or len(entry["posts"]) < entry["fetch_limit"]
+
+
+async def get_listing(
+    reddit: praw.Reddit,
+    subreddit: str,
+    listing_type: str = "hot",
+    time_filter: Optional[str] = None,
+    limit: int = LISTING_FETCH_LIMIT
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Get a listing from the cache, fetching it (once) on a miss.
+
+    Args:
+        reddit: Configured Reddit client
+        subreddit: Subreddit name (without r/ prefix)
+        listing_type: hot, new, top or rising
+        time_filter: Time filter for top listings
+        limit: Posts needed
+
+    Returns:
+        Tuple of (posts, served_from_cache)
+    """
+    limit = min(max(1, limit), LISTING_MAX_LIMIT)
+    key = listing_key(subreddit, listing_type, time_filter)
+
+    entry = _listing_cache.get(key)
+    if _covers(entry, limit):
+        return entry["posts"][:limit], True
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        try:
+            await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The other fetch was cancelled - fetch it ourselves
+        except DeadlineExceeded:
+            # The other caller ran out of time - fetch it under our own deadline
+            pass
+        entry = _listing_cache.get(key, count=False)
+        if _covers(entry, limit):
+            return entry["posts"][:limit], True
+
+    fetch_limit = max(limit, LISTING_FETCH_LIMIT)
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        posts = await asyncio.to_thread(fetch_listing, reddit, subreddit, listing_type, time_filter, fetch_limit)
+        store_listing(key, posts, fetch_limit)
+        future.set_result(posts)
+        return posts[:limit], False
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved so a future nobody awaited doesn't warn
+        future.exception()
+        raise
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def listing_error(error: Exception) -> Dict[str, Any]:
+    """Per-subreddit status for a failed listing fetch."""
+    if isinstance(error, DeadlineExceeded):
+        return {"status": "skipped", "error": f"Not fetched: {error}"}
+    if isinstance(error, (NotFound, Redirect)):
+        return {"status": "error", "status_code": 404, "error": "Subreddit not found"}
+    if isinstance(error, Forbidden):
+        return {"status": "error", "status_code": 403, "error": "Private, quarantined, or banned"}
+    if isinstance(error, TooManyRequests):
+        return {"status": "error", "status_code": 429, "error": "Rate limited by Reddit API"}
+    if isinstance(error, ResponseException):
+        status_code = error.response.status_code if hasattr(error, "response") else None
+        return {"status": "error", "status_code": status_code, "error": f"Reddit API error: {error}"}
+    return {"status": "error", "error": f"{type(error).__name__}: {error}"}
+
+
+def clear_listing_cache() -> None:
+    """Drop all cached listings (useful for testing)."""
+    _listing_cache.clear()
+    _inflight.clear()
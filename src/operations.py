@@ -0,0 +1,726 @@
+"""
+Operation registry for the three-layer tool interface.
+
+Built once at import. Each operation's parameter schema is derived from its
+function signature (types, defaults, required flags, Literal options), with
+docstring ``Args`` lines as fallback descriptions, then overlaid with the
+descriptions, notes and examples in ``OPERATION_DOCS``. The summaries served
+by discover_operations, the schemas served by get_operation_schema (with and
+without examples, serialized to JSON once here and sent as-is) and the
+dispatch data used by execute_operation (including each operation's default
+deadline) all come from the same entries.
+"""
+
+import copy
+import inspect
+import json
+import os
+import re
+import typing
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from .tools.comments import fetch_submission_with_comments
+from .tools.corpus import query_corpus
+from .tools.discover import discover_subreddits, related_subreddits, validate_subreddits
+from .tools.feed import (
+    create_feed,
+    delete_feed,
+    fetch_feed_posts,
+    get_feed,
+    get_feed_config,
+    list_feeds,
+    update_feed,
+)
+from .tools.posts import fetch_multiple_subreddits, fetch_subreddit_posts
+from .tools.research import RESEARCH_DEPTHS, research
+from .tools.search import search_in_subreddit
+
+# Parameters supplied by the server, never by the caller
+INJECTED_PARAMETERS = ("reddit", "ctx")
+INTERNAL_PARAMETERS = ("config",)
+
+EXAMPLE_FEED_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+# Per-operation deadlines. Callers may pass timeout_seconds with any
+# operation, up to OPERATION_MAX_TIMEOUT_SECONDS.
+TIMEOUT_PARAMETER = "timeout_seconds"
+OPERATION_TIMEOUT_SECONDS = float(os.getenv("OPERATION_TIMEOUT_SECONDS", "30"))
+OPERATION_MAX_TIMEOUT_SECONDS = float(os.getenv("OPERATION_MAX_TIMEOUT_SECONDS", "300"))
+OPERATION_TIMEOUTS: Dict[str, float] = {
+    "fetch_comments": 60,
+    "fetch_feed_posts": 45,
+    "list_feeds": 60,
+    "research": max(preset["time_budget_seconds"] for preset in RESEARCH_DEPTHS.values()) + 10,
+    "query_corpus": 10,
+}
+
+# Relative Reddit cost of an operation for fair queuing between users
+# (operations that don't call Reddit bypass admission control)
+OPERATION_REDDIT_COSTS: Dict[str, float] = {
+    "fetch_feed_posts": 3,
+    "research": 10,
+}
+
+# (operation_id, function, one-line summary for discover_operations)
+OPERATION_FUNCTIONS: List[Tuple[str, Callable, str]] = [
+    ("discover_subreddits", discover_subreddits, "Find relevant communities using semantic search"),
+    ("validate_subreddits", validate_subreddits, "Check many subreddit names against the index at once"),
+    ("related_subreddits", related_subreddits, "Find communities similar to a known subreddit (instant)"),
+    ("search_subreddit", search_in_subreddit, "Search for posts within a specific community"),
+    ("fetch_posts", fetch_subreddit_posts, "Get posts from a single subreddit"),
+    ("fetch_multiple", fetch_multiple_subreddits, "Batch fetch from multiple subreddits (70% more efficient)"),
+    ("fetch_comments", fetch_submission_with_comments, "Get complete comment tree for deep analysis"),
+    ("research", research, "Run discovery, fetching and comment reading for a topic in one call"),
+    ("query_corpus", query_corpus, "Filter and page over posts/comments already fetched this session (no Reddit calls)"),
+    ("create_feed", create_feed, "Create a new feed with analysis and subreddits"),
+    ("list_feeds", list_feeds, "List all feeds for the authenticated user"),
+    ("get_feed", get_feed, "Get a specific feed by ID"),
+    ("get_feed_config", get_feed_config, "Get feed configuration with subreddit names"),
+    ("fetch_feed_posts", fetch_feed_posts, "Fetch merged posts from every subreddit in a feed (one call)"),
+    ("update_feed", update_feed, "Update an existing feed"),
+    ("delete_feed", delete_feed, "Delete a feed"),
+]
+
+# Hand-written documentation layered over the derived schemas. Parameter
+# entries only need what the signature cannot express.
+OPERATION_DOCS: Dict[str, Dict[str, Any]] = {
+    "discover_subreddits": {
+        "description": "Find communities using semantic vector search with configurable filtering and batch discovery",
+        "parameters": {
+            "query": {
+                "required_one_of": ["query", "queries"],
+                "description": "Single topic to find communities for",
+                "validation": "2-100 characters"
+            },
+            "queries": {
+                "type": "array[string] or JSON string",
+                "required_one_of": ["query", "queries"],
+                "description": "Multiple topics for batch discovery (more efficient than individual queries)",
+                "example": '["machine learning", "deep learning", "neural networks"]',
+                "tip": "Batch mode reduces API calls and token usage by ~40%"
+            },
+            "limit": {
+                "range": [1, 50],
+                "description": "Number of communities to return per query"
+            },
+            "include_nsfw": {
+                "description": "Whether to include NSFW communities"
+            },
+            "min_confidence": {
+                "range": [0.0, 1.0],
+                "description": "Minimum confidence score threshold for results",
+                "guidance": {
+                    "0.0-0.3": "Very inclusive, includes tangentially related communities",
+                    "0.3-0.6": "Balanced, moderate relevance requirements",
+                    "0.6-0.8": "Strict, only highly relevant communities",
+                    "0.8-1.0": "Very strict, only exact semantic matches"
+                }
+            },
+            "min_subscribers": {
+                "description": "Only include communities with at least this many subscribers"
+            },
+            "max_subscribers": {
+                "description": "Only include communities with at most this many subscribers"
+            },
+            "cursor": {
+                "description": "Cursor from a previous result to get its next page (no new search; other parameters except limit are ignored)"
+            },
+            "merge": {
+                "description": "With queries: return one deduplicated ranked list (limit caps the merged list) instead of a list per query"
+            },
+            "merge_strategy": {
+                "description": "rrf rewards communities found by several queries; max_confidence ranks by best confidence"
+            }
+        },
+        "returns": {
+            "subreddits": "Array with confidence scores (0-1) and match tiers",
+            "confidence_stats": "Distribution statistics (mean, median, min, max, std_dev)",
+            "tier_distribution": "Breakdown by match quality (exact, semantic, adjacent, peripheral)",
+            "cursor": "Pass back as 'cursor' to get the next page (null when no more results, expires after 10 minutes)",
+            "quality_indicators": {
+                "good": "5+ subreddits with confidence > 0.7",
+                "moderate": "3-5 subreddits with confidence 0.5-0.7",
+                "poor": "All results below 0.5 confidence - refine search terms"
+            }
+        },
+        "notes": [
+            "Supports real-time progress reporting via context",
+            "Exact names, name fragments and acronyms are matched lexically and fused with semantic results",
+            "Lexical-only matches have distance null; match_sources shows which search found each result",
+            "Lower distances map to higher confidence scores",
+            "Generic subreddits (funny, pics, memes) are penalized unless directly searched",
+            "Batch mode returns results keyed by query for easy analysis",
+            "Batch mode with merge=true returns one list; matched_queries shows which queries found each subreddit"
+        ],
+        "examples": [
+            {"query": "machine learning", "limit": 15},
+            {"query": "python web development", "limit": 10, "min_confidence": 0.6},
+            {"query": "indie game dev", "limit": 10, "min_subscribers": 5000, "max_subscribers": 200000},
+            {"queries": ["machine learning", "deep learning", "neural networks"], "limit": 10},
+            {"queries": ["home espresso", "coffee roasting", "latte art"], "merge": True, "limit": 20},
+            {"cursor": "<cursor from previous result>", "limit": 10},
+            {"queries": "[\"web framework\", \"api design\"]", "include_nsfw": False, "min_confidence": 0.5}
+        ]
+    },
+    "validate_subreddits": {
+        "description": "Check whether subreddit names exist in the index (exact, case-insensitive)",
+        "parameters": {
+            "names": {
+                "type": "array[string] or JSON string",
+                "description": "Subreddit names to check (with or without r/ prefix)"
+            }
+        },
+        "returns": {
+            "results": "Per-name validation with canonical name, subscribers and NSFW flag",
+            "valid": "Canonical names that are indexed",
+            "invalid": "Names not found (with did_you_mean suggestions when close)"
+        },
+        "notes": [
+            "Answered from an in-memory catalog - no vector search per name",
+            "Use before fetch_multiple to fix misspelled names"
+        ],
+        "examples": [
+            {"names": ["Python", "learnpython", "machinelearning"]}
+        ]
+    },
+    "related_subreddits": {
+        "description": "Find communities similar to a known subreddit from a precomputed similarity graph",
+        "parameters": {
+            "name": {
+                "description": "Seed subreddit name (with or without r/ prefix)"
+            },
+            "k": {
+                "range": [1, 50],
+                "description": "Number of related communities to return"
+            },
+            "include_nsfw": {
+                "description": "Whether to include NSFW communities"
+            }
+        },
+        "returns": {
+            "subreddit": "Canonical name of the seed subreddit",
+            "related": "Similar communities with similarity (0-1), subscribers and URL"
+        },
+        "notes": [
+            "In-memory lookup - no search query needed",
+            "Use discover_subreddits when you only have a topic, not a subreddit"
+        ],
+        "examples": [
+            {"name": "MachineLearning", "k": 10},
+            {"name": "r/homebrewing", "k": 5}
+        ]
+    },
+    "search_subreddit": {
+        "description": "Search for posts within a specific subreddit",
+        "parameters": {
+            "subreddit_name": {
+                "description": "Exact subreddit name (without r/ prefix)",
+                "tip": "Use exact name from discover_subreddits"
+            },
+            "query": {
+                "description": "Search terms"
+            },
+            "sort": {
+                "description": "How to sort results"
+            },
+            "time_filter": {
+                "description": "Time period for results"
+            },
+            "limit": {
+                "range": [1, 100],
+                "description": "Maximum number of results"
+            }
+        },
+        "examples": [
+            {"subreddit_name": "MachineLearning", "query": "transformers", "limit": 20},
+            {"subreddit_name": "Python", "query": "async", "sort": "top", "time_filter": "month"}
+        ]
+    },
+    "fetch_posts": {
+        "description": "Get posts from a single subreddit",
+        "parameters": {
+            "subreddit_name": {
+                "description": "Exact subreddit name (without r/ prefix)"
+            },
+            "listing_type": {
+                "description": "Type of posts to fetch"
+            },
+            "time_filter": {
+                "description": "Time period (only for 'top' listing)"
+            },
+            "limit": {
+                "range": [1, 100],
+                "description": "Number of posts to fetch"
+            }
+        },
+        "examples": [
+            {"subreddit_name": "technology", "listing_type": "hot", "limit": 15},
+            {"subreddit_name": "science", "listing_type": "top", "time_filter": "week", "limit": 20}
+        ]
+    },
+    "fetch_multiple": {
+        "description": "Batch fetch from multiple subreddits efficiently",
+        "parameters": {
+            "subreddit_names": {
+                "max_items": 10,
+                "description": "List of subreddit names (without r/ prefix)",
+                "tip": "Use names from discover_subreddits"
+            },
+            "listing_type": {
+                "description": "Type of posts to fetch"
+            },
+            "time_filter": {
+                "description": "Time period (only for 'top' listing)"
+            },
+            "limit_per_subreddit": {
+                "range": [1, 25],
+                "description": "Posts per subreddit"
+            },
+            "validate_names": {
+                "description": "Check names against the index: canonical casing and did_you_mean hints (names are never skipped)"
+            }
+        },
+        "efficiency": {
+            "vs_individual": "70% fewer API calls",
+            "token_usage": "~500-1000 tokens per subreddit"
+        },
+        "examples": [
+            {"subreddit_names": ["Python", "django", "flask"], "listing_type": "hot", "limit_per_subreddit": 5},
+            {"subreddit_names": ["MachineLearning", "deeplearning"], "listing_type": "top", "time_filter": "week", "limit_per_subreddit": 10}
+        ]
+    },
+    "fetch_comments": {
+        "description": "Get complete comment tree for a post",
+        "parameters": {
+            "submission_id": {
+                "required_one_of": ["submission_id", "url"],
+                "description": "Reddit post ID (e.g., '1abc234')"
+            },
+            "url": {
+                "required_one_of": ["submission_id", "url"],
+                "description": "Full Reddit URL to the post"
+            },
+            "comment_limit": {
+                "recommendation": "50-100 for analysis",
+                "description": "Maximum comments to fetch"
+            },
+            "comment_sort": {
+                "description": "How to sort comments"
+            }
+        },
+        "examples": [
+            {"submission_id": "1abc234", "comment_limit": 100},
+            {"url": "https://reddit.com/r/Python/comments/xyz789/", "comment_limit": 50, "comment_sort": "top"}
+        ]
+    },
+    "research": {
+        "description": "Research a topic end to end inside the server: batch discovery, concurrent top-post fetches, engagement-based post selection and concurrent comment fetches, within Reddit call and time budgets",
+        "parameters": {
+            "topic": {
+                "description": "What to research (used as the main discovery query)"
+            },
+            "depth": {
+                "description": "Breadth and budgets",
+                "presets": RESEARCH_DEPTHS
+            },
+            "queries": {
+                "type": "array[string] or string",
+                "description": "Extra discovery queries (merged with the topic)"
+            },
+            "time_filter": {
+                "description": "Time window for top posts"
+            },
+            "include_nsfw": {
+                "description": "Whether to include NSFW communities and posts"
+            }
+        },
+        "returns": {
+            "subreddits": "Communities used, with confidence and fetch status",
+            "posts": "Selected posts with score, num_comments, engagement, permalink, body preview and top comments (with permalinks)",
+            "summary": "Reddit calls, cache hits, elapsed time and anything skipped to stay within budget"
+        },
+        "notes": [
+            "Replaces discover_subreddits → fetch_multiple → fetch_comments loops",
+            "Work that would exceed the depth's budgets is skipped and listed in summary.skipped",
+            "Use fetch_comments afterwards for full comment trees of specific posts"
+        ],
+        "examples": [
+            {"topic": "home espresso machines"},
+            {"topic": "remote work burnout", "depth": "deep", "queries": ["working from home", "remote team management"]},
+            {"topic": "indie game marketing", "depth": "quick", "time_filter": "month"}
+        ]
+    },
+    "query_corpus": {
+        "description": "Filter, sort and paginate over every post and comment this session's operations have returned, without calling Reddit",
+        "parameters": {
+            "subreddit": {
+                "type": "array[string] or string"
+            },
+            "since": {
+                "type": "string or float",
+                "example": "2024-05-01"
+            },
+            "until": {
+                "type": "string or float"
+            },
+            "limit": {
+                "range": [1, 100]
+            }
+        },
+        "returns": {
+            "records": "Compact post/comment records (fullname, kind, subreddit, score, created_utc, text, permalink; comments carry post_id)",
+            "total": "Number of matching records",
+            "next_offset": "Offset of the next page, or null on the last page",
+            "corpus": "Post and comment counts and approximate size of this session's corpus"
+        },
+        "notes": [
+            "Posts and comments from fetch_posts, fetch_multiple, search_subreddit, fetch_comments, fetch_feed_posts and research are kept automatically, deduplicated by fullname",
+            "Use it to filter and cite instead of re-fetching from Reddit",
+            "The corpus expires after an hour without use; the oldest records are dropped when it is full"
+        ],
+        "examples": [
+            {"keyword": "grinder", "min_score": 50},
+            {"kind": "comment", "subreddit": ["espresso", "coffee"], "sort": "score", "limit": 20},
+            {"kind": "post", "since": "2024-01-01", "sort": "new", "offset": 25}
+        ]
+    },
+    "create_feed": {
+        "description": "Create a new feed with analysis and selected subreddits",
+        "parameters": {
+            "name": {
+                "description": "Name for the feed (1-255 chars)"
+            },
+            "selected_subreddits": {
+                "type": "array[object]",
+                "min_items": 1,
+                "max_items": 50,
+                "description": "List of selected subreddits",
+                "item_properties": {
+                    "name": "Subreddit name (1-100 chars)",
+                    "description": "Subreddit description (max 1000 chars)",
+                    "subscribers": "Number of subscribers (integer >= 0)",
+                    "confidence_score": "Relevance score (0.0-1.0)"
+                }
+            },
+            "website_url": {
+                "description": "URL of the website being analyzed (optional)"
+            },
+            "analysis": {
+                "description": "Feed analysis data (optional)",
+                "properties": {
+                    "description": "Description of topic/product/interest (10-1000 chars)",
+                    "audience_personas": "Array of persona tags (1-10 items)",
+                    "keywords": "Array of relevant keywords (1-50 items)"
+                }
+            }
+        },
+        "examples": [
+            {
+                "name": "AI Research Feed",
+                "website_url": "https://example.com",
+                "analysis": {
+                    "description": "AI-powered data analysis platform for businesses",
+                    "audience_personas": ["data scientists", "business analysts", "ML engineers"],
+                    "keywords": ["machine learning", "data analysis", "business intelligence"]
+                },
+                "selected_subreddits": [
+                    {"name": "MachineLearning", "description": "ML community", "subscribers": 2500000, "confidence_score": 0.85},
+                    {"name": "datascience", "description": "Data science discussions", "subscribers": 1200000, "confidence_score": 0.78}
+                ]
+            }
+        ]
+    },
+    "list_feeds": {
+        "description": "List all feeds for the authenticated user",
+        "parameters": {
+            "limit": {
+                "range": [1, 100],
+                "description": "Maximum number of feeds to return"
+            },
+            "offset": {
+                "description": "Number of feeds to skip (for pagination)"
+            },
+            "fetch_all": {
+                "description": "Return every feed in one call (remaining pages are fetched concurrently; limit is ignored)"
+            },
+            "fields": {
+                "type": "array[string] or comma-separated string",
+                "description": "Only include these feed fields, e.g. [\"name\", \"updated_at\"] (id is always included)"
+            }
+        },
+        "examples": [
+            {"limit": 10, "offset": 0},
+            {"limit": 25, "offset": 50},
+            {"fetch_all": True, "fields": ["name", "updated_at"]}
+        ]
+    },
+    "get_feed": {
+        "description": "Get a specific feed by ID",
+        "parameters": {
+            "feed_id": {
+                "description": "UUID of the feed to retrieve"
+            }
+        },
+        "examples": [
+            {"feed_id": EXAMPLE_FEED_ID}
+        ]
+    },
+    "get_feed_config": {
+        "description": "Get configuration for a feed (subreddit names, settings)",
+        "parameters": {
+            "feed_id": {
+                "description": "UUID of the feed to get config for"
+            }
+        },
+        "returns": {
+            "profile_id": "UUID of the feed",
+            "profile_name": "Name of the feed",
+            "subreddits": "Array of subreddit names (strings)",
+            "show_nsfw": "Whether NSFW content is enabled",
+            "has_subreddits": "Whether feed has any subreddits configured"
+        },
+        "examples": [
+            {"feed_id": EXAMPLE_FEED_ID}
+        ]
+    },
+    "fetch_feed_posts": {
+        "description": "Fetch posts from every subreddit in a saved feed, merged and deduplicated",
+        "parameters": {
+            "feed_id": {
+                "description": "UUID of the feed"
+            },
+            "listing_type": {
+                "description": "Type of posts to retrieve"
+            },
+            "time_filter": {
+                "description": "Time period for 'top' listings"
+            },
+            "limit_per_subreddit": {
+                "range": [1, 100],
+                "description": "Maximum posts per subreddit"
+            }
+        },
+        "returns": {
+            "posts": "Merged posts (by score, or newest first for 'new'), duplicates removed",
+            "subreddit_status": "Per-subreddit ok/error status, post count and cache use",
+            "summary": "Counts of subreddits, posts, duplicates and NSFW posts filtered"
+        },
+        "notes": [
+            "Replaces get_feed_config + fetch_multiple; no limit on feed size",
+            "Honors the feed's show_nsfw setting",
+            "Subreddits are fetched concurrently and shared listings are cached briefly"
+        ],
+        "examples": [
+            {"feed_id": EXAMPLE_FEED_ID},
+            {"feed_id": EXAMPLE_FEED_ID, "listing_type": "new", "limit_per_subreddit": 5}
+        ]
+    },
+    "update_feed": {
+        "description": "Update an existing feed (partial update - only include fields to change)",
+        "parameters": {
+            "feed_id": {
+                "description": "UUID of the feed to update"
+            },
+            "name": {
+                "description": "New name for the feed (1-255 chars)"
+            },
+            "website_url": {
+                "description": "Updated website URL"
+            },
+            "analysis": {
+                "description": "Updated feed analysis data"
+            },
+            "selected_subreddits": {
+                "type": "array[object]",
+                "description": "Updated list of selected subreddits"
+            }
+        },
+        "examples": [
+            {"feed_id": EXAMPLE_FEED_ID, "name": "Updated Feed Name"},
+            {
+                "feed_id": EXAMPLE_FEED_ID,
+                "selected_subreddits": [
+                    {"name": "Python", "description": "Python programming", "subscribers": 1500000, "confidence_score": 0.9}
+                ]
+            }
+        ]
+    },
+    "delete_feed": {
+        "description": "Delete a feed",
+        "parameters": {
+            "feed_id": {
+                "description": "UUID of the feed to delete"
+            }
+        },
+        "examples": [
+            {"feed_id": EXAMPLE_FEED_ID}
+        ]
+    }
+}
+
+_SCALAR_TYPES = {str: "string", int: "integer", bool: "boolean", float: "float", dict: "object", list: "array"}
+
+
+def describe_type(annotation: Any) -> Dict[str, Any]:
+    """
+    Schema type fields for a parameter annotation.
+
+    Returns:
+        {"type": ...}, plus "options" for Literal annotations
+    """
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+
+    if origin is Literal:
+        return {"type": "enum", "options": list(typing.get_args(annotation))}
+    if origin is Union:
+        if len(args) == 1:
+            return describe_type(args[0])
+        return {"type": " or ".join(describe_type(arg)["type"] for arg in args)}
+    if origin in (list, List):
+        item = describe_type(args[0])["type"] if args else None
+        return {"type": f"array[{item}]" if item and item != "any" else "array"}
+    if origin in (dict, Dict):
+        return {"type": "object"}
+    return {"type": _SCALAR_TYPES.get(annotation, "any")}
+
+
+def docstring_args(func: Callable) -> Dict[str, str]:
+    """Parameter descriptions from a Google-style ``Args:`` docstring section."""
+    doc = inspect.getdoc(func) or ""
+    match = re.search(r"^Args:\n((?:[ \t]+.*\n?|\n)+)", doc, re.MULTILINE)
+    if not match:
+        return {}
+    descriptions: Dict[str, str] = {}
+    current = None
+    for line in match.group(1).splitlines():
+        entry = re.match(r"^\s{4}(\w+)(?: \([^)]*\))?:\s*(.*)$", line)
+        if entry:
+            current = entry.group(1)
+            descriptions[current] = entry.group(2).strip()
+        elif current and line.strip():
+            descriptions[current] += " " + line.strip()
+    return descriptions
+
+
+def build_parameters(func: Callable, overrides: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Caller-facing parameter schemas for an operation function.
+
+    Raises:
+        ValueError: If ``overrides`` documents a parameter the function lacks
+    """
+    hints = typing.get_type_hints(func)
+    described = docstring_args(func)
+    parameters: Dict[str, Dict[str, Any]] = {}
+
+    for name, param in inspect.signature(func).parameters.items():
+        if name in INJECTED_PARAMETERS or name in INTERNAL_PARAMETERS:
+            continue
+        schema = describe_type(hints.get(name, Any))
+        schema["required"] = param.default is inspect.Parameter.empty
+        if param.default is not inspect.Parameter.empty and param.default is not None:
+            schema["default"] = param.default
+        if name in described:
+            schema["description"] = described[name]
+        schema.update(overrides.get(name, {}))
+        if "required_one_of" in schema:
+            schema.pop("required")
+        parameters[name] = schema
+
+    unknown = set(overrides) - set(parameters)
+    if unknown:
+        raise ValueError(f"{func.__name__} has no parameters named {sorted(unknown)}")
+    return parameters
+
+
+@dataclass(frozen=True)
+class OperationSpec:
+    """One operation: dispatch data plus its precomputed schema variants."""
+    operation_id: str
+    func: Callable
+    summary: str
+    is_async: bool
+    needs_reddit: bool
+    schema: Dict[str, Any]
+    schema_without_examples: Dict[str, Any]
+    schema_json: str
+    schema_json_without_examples: str
+    timeout_seconds: float
+    reddit_cost: float
+
+    def get_schema(self, include_examples: bool = True) -> Dict[str, Any]:
+        """Copy of the prebuilt schema, safe for callers to modify."""
+        return copy.deepcopy(self.schema if include_examples else self.schema_without_examples)
+
+    def get_schema_json(self, include_examples: bool = True) -> str:
+        """Pre-serialized schema JSON (what get_operation_schema sends; no per-request work)."""
+        return self.schema_json if include_examples else self.schema_json_without_examples
+
+    def deadline_seconds(self, requested: Any = None) -> float:
+        """
+        Deadline for one run: the caller's timeout_seconds (capped) or this
+        operation's default.
+
+        Raises:
+            ValueError: If ``requested`` is not a positive number
+        """
+        if requested is None:
+            return self.timeout_seconds
+        try:
+            seconds = float(requested)
+        except (TypeError, ValueError):
+            raise ValueError(f"{TIMEOUT_PARAMETER} must be a number of seconds")
+        if seconds <= 0:
+            raise ValueError(f"{TIMEOUT_PARAMETER} must be positive")
+        return min(seconds, OPERATION_MAX_TIMEOUT_SECONDS)
+
+
+def build_operation(operation_id: str, func: Callable, summary: str) -> OperationSpec:
+    """Derive an operation's spec from its function and OPERATION_DOCS entry."""
+    docs = OPERATION_DOCS.get(operation_id, {})
+    parameters = build_parameters(func, docs.get("parameters", {}))
+    timeout = OPERATION_TIMEOUTS.get(operation_id, OPERATION_TIMEOUT_SECONDS)
+    parameters[TIMEOUT_PARAMETER] = {
+        "type": "float",
+        "required": False,
+        "default": timeout,
+        "range": [0, OPERATION_MAX_TIMEOUT_SECONDS],
+        "description": "Deadline for this operation in seconds; calls still running are cancelled and partial results are returned where possible"
+    }
+
+    schema: Dict[str, Any] = {"description": docs.get("description", summary), "parameters": parameters}
+    for key, value in docs.items():
+        if key not in ("description", "parameters", "examples"):
+            schema[key] = value
+    schema["examples"] = docs.get("examples", [])
+    without_examples = {**schema, "examples": []}
+
+    signature = inspect.signature(func)
+    return OperationSpec(
+        operation_id=operation_id,
+        func=func,
+        summary=summary,
+        is_async=inspect.iscoroutinefunction(func),
+        needs_reddit="reddit" in signature.parameters,
+        schema=schema,
+        schema_without_examples=without_examples,
+        schema_json=json.dumps(schema, separators=(",", ":")),
+        schema_json_without_examples=json.dumps(without_examples, separators=(",", ":")),
+        timeout_seconds=timeout,
+        reddit_cost=OPERATION_REDDIT_COSTS.get(operation_id, 1.0) if "reddit" in signature.parameters else 0.0,
+    )
+
+
+OPERATIONS: Dict[str, OperationSpec] = {
+    operation_id: build_operation(operation_id, func, summary)
+    for operation_id, func, summary in OPERATION_FUNCTIONS
+}
+
+OPERATION_SUMMARIES: Dict[str, str] = {spec.operation_id: spec.summary for spec in OPERATIONS.values()}
+
+
+def get_operation(operation_id: str) -> Optional[OperationSpec]:
+    """Look up an operation by ID."""
+    return OPERATIONS.get(operation_id)
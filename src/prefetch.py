@@ -0,0 +1,230 @@
+"""
+Background prefetch of listings for active feeds.
+
+Feeds opened recently register their subreddits here. When enabled, a
+scheduler periodically refreshes the hot/new listings of the union of
+those subreddits into the shared listing cache, most widely shared
+subreddits first, so opening a feed is a warm-cache hit. Each subreddit is
+fetched once per cycle however many feeds include it, and refreshes are
+paced to stay within a configurable share of the Reddit API quota.
+
+Only the primary worker runs the scheduler. With several workers, each one
+publishes the feeds opened through it to the shared cache backend, and the
+scheduler reads every worker's registrations.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import TTLCache
+from .serve import worker_count, worker_id
+from .shared_cache import SharedCache
+from .listings import (
+    LISTING_CACHE_TTL_SECONDS,
+    LISTING_FETCH_LIMIT,
+    fetch_listing,
+    get_listing_cache,
+    listing_key,
+    store_listing,
+)
+
+logger = logging.getLogger(__name__)
+
+FEED_PREFETCH_ENABLED = os.getenv("FEED_PREFETCH_ENABLED", "false").lower() in ("1", "true", "yes")
+PREFETCH_INTERVAL_SECONDS = float(os.getenv("FEED_PREFETCH_INTERVAL_SECONDS", "240"))
+PREFETCH_QUOTA_SHARE = float(os.getenv("FEED_PREFETCH_QUOTA_SHARE", "0.2"))  # Share of Reddit quota for prefetch
+PREFETCH_LISTING_TYPES = ("hot", "new")
+FEED_ACTIVE_SECONDS = float(os.getenv("FEED_ACTIVE_SECONDS", "86400"))       # Feed counts as active this long
+REDDIT_REQUESTS_PER_MINUTE = 100   # Reddit OAuth quota
+REDDIT_MIN_REMAINING = 20          # Pause prefetch when the live quota gets this low
+MAX_ACTIVE_FEEDS = 10000
+
+
+class FeedPrefetcher:
+    """
+    Keeps the listings of active feeds' subreddits warm.
+
+    ``register_feed()`` records a feed's subreddits; ``run_cycle()`` does
+    one paced refresh pass; ``start()``/``stop()`` run cycles in a
+    background task.
+
+    With a ``shared`` cache, each worker's registrations are also stored
+    under its worker id, and ``active_subreddits()`` merges every worker's
+    (the most recent registration of a feed wins, so an emptied or deleted
+    feed drops out everywhere).
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = PREFETCH_INTERVAL_SECONDS,
+        quota_share: float = PREFETCH_QUOTA_SHARE,
+        requests_per_minute: int = REDDIT_REQUESTS_PER_MINUTE,
+        active_seconds: float = FEED_ACTIVE_SECONDS,
+        listing_types: Iterable[str] = PREFETCH_LISTING_TYPES,
+        shared: Optional[SharedCache] = None
+    ):
+        self.interval_seconds = interval_seconds
+        self.active_seconds = active_seconds
+        self.listing_types = tuple(listing_types)
+        # feed_id -> (registered_at, subreddits); empty subreddits mark a removed feed
+        self._feeds = TTLCache(max_entries=MAX_ACTIVE_FEEDS, ttl_seconds=active_seconds)
+        self._shared = shared
+        self._task: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.cycles = 0
+
+        # Paced to quota_share of the per-minute quota
+        self.fetches_per_minute = max(1.0, requests_per_minute * quota_share)
+        self.fetch_spacing = 60.0 / self.fetches_per_minute
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def register_feed(self, feed_id: str, subreddits: Optional[Iterable[str]]) -> None:
+        """Mark a feed as active with its current subreddits."""
+        names = tuple(dict.fromkeys(name.strip() for name in (subreddits or []) if name and name.strip()))
+        now = time.time()
+        previous = self._feeds.get(feed_id, count=False)
+        if previous is not None and previous[1] == names and now - previous[0] < self.interval_seconds:
+            # Re-opened since the last cycle; nothing new to publish
+            return
+        self._feeds.set(feed_id, (now, names))
+        if self._shared is not None:
+            self._shared.set(
+                _registry_key(worker_id()),
+                {key: [registered_at, list(feed)] for key, (registered_at, feed) in self._feeds.items()}
+            )
+
+    def active_feeds(self) -> Dict[str, Tuple[str, ...]]:
+        """Subreddits of each active feed, across all workers when shared."""
+        latest = dict(self._feeds.items())
+        if self._shared is not None:
+            cutoff = time.time() - self.active_seconds
+            for worker in range(worker_count()):
+                for key, (registered_at, feed) in (self._shared.get(_registry_key(worker)) or {}).items():
+                    if registered_at > cutoff and (key not in latest or registered_at > latest[key][0]):
+                        latest[key] = (registered_at, tuple(feed))
+        return {key: feed for key, (_, feed) in latest.items() if feed}
+
+    def active_subreddits(self) -> List[str]:
+        """Union of active feeds' subreddits, most widely shared first."""
+        counts: Counter = Counter()
+        display = {}
+        for names in self.active_feeds().values():
+            for name in names:
+                key = name.lower()
+                counts[key] += 1
+                display.setdefault(key, name)
+        return [display[key] for key, _ in counts.most_common()]
+
+    def due_listings(self) -> List[Tuple[str, str]]:
+        """(subreddit, listing_type) pairs missing from the cache or past half their TTL."""
+        cache = get_listing_cache()
+        refresh_age = min(LISTING_CACHE_TTL_SECONDS / 2, self.interval_seconds)
+        now = time.time()
+        due = []
+        for name in self.active_subreddits():
+            for listing_type in self.listing_types:
+                entry = cache.get(listing_key(name, listing_type), count=False)
+                if entry is None or now - entry["fetched_at"] >= refresh_age:
+                    due.append((name, listing_type))
+        return due
+
+    def cycle_budget(self) -> int:
+        """Listing fetches allowed per cycle within the quota share."""
+        return max(1, int(self.fetches_per_minute * self.interval_seconds / 60))
+
+    async def run_cycle(self, reddit, sleep=asyncio.sleep) -> int:
+        """
+        Refresh due listings once, paced and capped by the quota share.
+
+        Args:
+            reddit: Configured Reddit client
+            sleep: Awaitable sleep, injectable for tests
+
+        Returns:
+            Number of listings fetched
+        """
+        fetched = 0
+        for name, listing_type in self.due_listings()[:self.cycle_budget()]:
+            if _quota_low(reddit):
+                logger.info("Feed prefetch paused: Reddit quota low")
+                break
+            if fetched:
+                await sleep(self.fetch_spacing)
+            try:
+                posts = await asyncio.to_thread(
+                    fetch_listing, reddit, name, listing_type, None, LISTING_FETCH_LIMIT
+                )
+                store_listing(listing_key(name, listing_type), posts, LISTING_FETCH_LIMIT)
+                fetched += 1
+            except Exception as e:
+                logger.warning("Feed prefetch of r/%s/%s failed: %s", name, listing_type, e)
+
+        self.fetches += fetched
+        self.cycles += 1
+        return fetched
+
+    def start(self, reddit) -> None:
+        """Run refresh cycles in a background task until stopped."""
+        if self.running or reddit is None:
+            return
+        self._task = asyncio.create_task(self._loop(reddit))
+        logger.info(
+            "Feed prefetch started (every %ss, up to %.0f fetches/min)",
+            self.interval_seconds, self.fetches_per_minute
+        )
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _loop(self, reddit) -> None:
+        while True:
+            try:
+                await self.run_cycle(reddit)
+            except Exception as e:
+                logger.warning("Feed prefetch cycle failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+
+def _registry_key(worker: int) -> str:
+    return f"worker:{worker}"
+
+
+def _quota_low(reddit) -> bool:
+    """Whether PRAW's last-seen rate limit headers show the quota nearly used."""
+    try:
+        remaining = reddit.auth.limits.get("remaining")
+    except Exception:
+        return False
+    return remaining is not None and remaining < REDDIT_MIN_REMAINING
+
+
+_prefetcher_instance: Optional[FeedPrefetcher] = None
+
+
+def get_feed_prefetcher() -> FeedPrefetcher:
+    """Get the process-wide feed prefetcher (sharing registrations between workers)."""
+    global _prefetcher_instance
+    if _prefetcher_instance is None:
+        shared = SharedCache("prefetch_feeds", ttl_seconds=FEED_ACTIVE_SECONDS) if worker_count() > 1 else None
+        _prefetcher_instance = FeedPrefetcher(shared=shared)
+    return _prefetcher_instance
+
+
+def reset_feed_prefetcher() -> None:
+    """Reset the prefetcher instance (useful for testing)."""
+    global _prefetcher_instance
+    _prefetcher_instance = None
@@ -0,0 +1,166 @@
+"""
+Throttled progress reporting for MCP tools.
+
+Every ``ctx.report_progress`` call is a protocol message to the client, so
+tools that report per item (per vector result, per comment, per subreddit)
+spend a visible share of their latency on progress chatter. ProgressReporter
+coalesces those updates: it only forwards an update once a minimum interval
+has passed AND progress has advanced by a minimum percentage, never awaits
+the client from inside the work loop, and always delivers the final update.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from fastmcp import Context
+
+logger = logging.getLogger(__name__)
+
+# Default throttling thresholds
+DEFAULT_MIN_INTERVAL = 0.1   # Seconds between forwarded updates
+DEFAULT_MIN_PERCENT = 5.0    # Minimum advance (percent of total) between updates
+
+
+class ProgressReporter:
+    """
+    Rate-limited, coalescing wrapper around ``Context.report_progress``.
+
+    ``update()`` is synchronous and never blocks: it records the latest state
+    and, if the throttle allows, hands it to a background sender task. While
+    a send is in flight, newer updates overwrite the pending one instead of
+    queueing. ``finish()`` waits for the sender and always sends the final
+    update.
+
+    Usage:
+        reporter = ProgressReporter(ctx, total=len(items))
+        for i, item in enumerate(items):
+            reporter.update(i + 1, f"Processing {item}")
+            ...
+        await reporter.finish(message="Done")
+    """
+
+    def __init__(
+        self,
+        ctx: Optional[Context],
+        total: Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        min_percent: float = DEFAULT_MIN_PERCENT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ctx: FastMCP context (reporter is a no-op when None)
+            total: Total units of work, if known
+            min_interval: Minimum seconds between forwarded updates
+            min_percent: Minimum progress advance, in percent of total, between
+                forwarded updates (ignored when total is unknown)
+            clock: Monotonic clock, injectable for tests
+        """
+        self.ctx = ctx
+        self.total = total
+        self.min_interval = min_interval
+        self.min_percent = min_percent
+        self._clock = clock
+
+        self._last_sent_at: Optional[float] = None
+        self._last_sent_progress: Optional[float] = None
+        self._latest: Optional[tuple] = None
+        self._pending: Optional[tuple] = None
+        self._sender: Optional[asyncio.Task] = None
+        self._finished = False
+        self.sent_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether updates are forwarded anywhere."""
+        return self.ctx is not None and not self._finished
+
+    def update(self, progress: float, message: Optional[str] = None) -> None:
+        """
+        Record progress and forward it if the throttle allows.
+
+        Args:
+            progress: Units of work completed so far
+            message: Optional human-readable status message
+        """
+        if not self.enabled:
+            return
+
+        self._latest = (progress, message)
+        if not self._should_send(progress):
+            return
+
+        self._last_sent_at = self._clock()
+        self._last_sent_progress = progress
+        self._pending = self._latest
+
+        if self._sender is None or self._sender.done():
+            try:
+                self._sender = asyncio.get_running_loop().create_task(self._drain())
+            except RuntimeError:
+                # No running loop (sync caller) - the final update still goes out
+                self._pending = None
+
+    async def finish(
+        self,
+        progress: Optional[float] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        """
+        Flush any in-flight update and always send the final one.
+
+        Args:
+            progress: Final progress value (defaults to total, then last update)
+            message: Final status message (defaults to the last update's message)
+        """
+        if not self.enabled:
+            return
+        self._finished = True
+
+        if self._sender is not None:
+            await asyncio.gather(self._sender, return_exceptions=True)
+            self._sender = None
+
+        last_progress, last_message = self._latest or (None, None)
+        if progress is None:
+            progress = self.total if self.total is not None else (last_progress or 0)
+        if message is None:
+            message = last_message
+
+        await self._send(progress, message)
+
+    def _should_send(self, progress: float) -> bool:
+        """Apply the interval and percent-change thresholds."""
+        if self._last_sent_at is None:
+            return True
+
+        if self._clock() - self._last_sent_at < self.min_interval:
+            return False
+
+        if self.total:
+            advanced = progress - (self._last_sent_progress or 0)
+            if advanced * 100.0 / self.total < self.min_percent:
+                return False
+
+        return True
+
+    async def _drain(self) -> None:
+        """Send pending updates until none remain, coalescing as it goes."""
+        while self._pending is not None:
+            progress, message = self._pending
+            self._pending = None
+            await self._send(progress, message)
+
+    async def _send(self, progress: float, message: Optional[str]) -> None:
+        """Forward one update; progress must never break the work it reports on."""
+        try:
+            await self.ctx.report_progress(
+                progress=progress,
+                total=self.total,
+                message=message
+            )
+            self.sent_count += 1
+        except Exception as e:
+            logger.debug("Progress report failed: %s", e)
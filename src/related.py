@@ -0,0 +1,331 @@
+"""
+Precomputed subreddit similarity graph.
+
+Holds the k nearest neighbours of every indexed subreddit (cosine
+similarity of their embeddings) in flat typed arrays, so "related
+communities" for a known subreddit is an in-memory slice with no vector
+query. The graph is built offline in batch and saved to a compact binary
+file that the server loads at startup:
+
+    pip install 'reddit-research-mcp[related]'   # numpy, for the build only
+    python -m src.related --out data/related_graph.bin --k 20
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import math
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+GRAPH_MAGIC = b"RSG1"
+DEFAULT_GRAPH_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "related_graph.bin"
+)
+RELATED_GRAPH_PATH = os.getenv("RELATED_GRAPH_PATH", DEFAULT_GRAPH_PATH)
+BUILD_PAGE_SIZE = 1000
+BUILD_BLOCK_SIZE = 512  # Rows per similarity block when numpy is available
+PURE_PYTHON_MAX_SUBREDDITS = 2000  # Largest build the CLI runs without numpy (all-pairs in the interpreter)
+
+
+class RelatedGraph:
+    """
+    k-nearest-neighbour graph over indexed subreddits.
+
+    Row ``i`` of ``neighbors``/``similarities`` (``k`` slots, padded with
+    -1) lists subreddit ``i``'s neighbours, most similar first. Subscriber
+    counts and NSFW flags are stored alongside so lookups need nothing else.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        k: int,
+        neighbors: array,
+        similarities: array,
+        subscribers: array,
+        nsfw: array,
+        built_at: Optional[float] = None
+    ):
+        self.names = names
+        self.k = k
+        self.neighbors = neighbors          # array('i'), len(names) * k
+        self.similarities = similarities    # array('f'), len(names) * k
+        self.subscribers = subscribers      # array('q'), len(names)
+        self.nsfw = nsfw                    # array('b'), len(names)
+        self.built_at = built_at
+        self._index = {name.lower(): i for i, name in enumerate(names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._index
+
+    def canonical_name(self, name: str) -> Optional[str]:
+        """Indexed spelling of a name, or None if not in the graph."""
+        row = self._index.get(name.lower())
+        return self.names[row] if row is not None else None
+
+    def related(self, name: str, k: int = 10, include_nsfw: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Nearest neighbours of a subreddit.
+
+        Args:
+            name: Subreddit name (case-insensitive, no r/ prefix)
+            k: Maximum neighbours to return (at most the graph's k)
+            include_nsfw: Whether to include NSFW neighbours
+
+        Returns:
+            Neighbours, most similar first, or None if the name is not in the graph
+        """
+        row = self._index.get(name.lower())
+        if row is None:
+            return None
+
+        results = []
+        start = row * self.k
+        for slot in range(start, start + self.k):
+            neighbor = self.neighbors[slot]
+            if neighbor < 0 or len(results) >= k:
+                break
+            if self.nsfw[neighbor] and not include_nsfw:
+                continue
+            results.append({
+                "name": self.names[neighbor],
+                "similarity": round(self.similarities[slot], 3),
+                "subscribers": self.subscribers[neighbor],
+                "nsfw": bool(self.nsfw[neighbor]),
+                "url": f"https://reddit.com/r/{self.names[neighbor]}"
+            })
+        return results
+
+    def save(self, path: str) -> None:
+        """Write the graph to a binary file (JSON header + raw arrays)."""
+        header = json.dumps({
+            "k": self.k,
+            "names": self.names,
+            "byteorder": sys.byteorder,
+            "built_at": self.built_at
+        }).encode("utf-8")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(GRAPH_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for values in (self.neighbors, self.similarities, self.subscribers, self.nsfw):
+                values.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RelatedGraph":
+        """Read a graph written by ``save()``."""
+        with open(path, "rb") as f:
+            if f.read(len(GRAPH_MAGIC)) != GRAPH_MAGIC:
+                raise ValueError(f"{path} is not a related-subreddit graph file")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+
+            names = header["names"]
+            k = header["k"]
+            count = len(names)
+            arrays = []
+            for typecode, length in (("i", count * k), ("f", count * k), ("q", count), ("b", count)):
+                values = array(typecode)
+                values.fromfile(f, length)
+                if header["byteorder"] != sys.byteorder:
+                    values.byteswap()
+                arrays.append(values)
+
+        return cls(names, k, *arrays, built_at=header.get("built_at"))
+
+
+def build_related_graph(
+    entries: Sequence[Dict[str, Any]],
+    embeddings: Sequence[Sequence[float]],
+    k: int = 20
+) -> RelatedGraph:
+    """
+    Build the kNN graph from subreddit metadata and embeddings.
+
+    Offline batch job: exact cosine similarity over all pairs. Uses numpy
+    in blocks when it is installed (the ``related`` extra), and a pure-Python
+    O(N^2 * D) scan otherwise, which is only practical for small collections.
+
+    Args:
+        entries: Metadata dicts with name, subscribers and nsfw
+        embeddings: One embedding per entry
+        k: Neighbours kept per subreddit
+
+    Returns:
+        RelatedGraph ready to save
+    """
+    count = len(entries)
+    k = max(1, min(k, count - 1)) if count > 1 else 1
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    neighbors = array("i", [-1] * (count * k))
+    similarities = array("f", [0.0] * (count * k))
+
+    if np is not None and count:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        for start in range(0, count, BUILD_BLOCK_SIZE):
+            block = matrix[start:start + BUILD_BLOCK_SIZE] @ matrix.T
+            for offset, row in enumerate(block):
+                i = start + offset
+                row[i] = -np.inf
+                top = np.argpartition(-row, k - 1)[:k] if count > k else np.arange(count)
+                top = top[np.argsort(-row[top])]
+                for slot, j in enumerate(t for t in top if t != i):
+                    if slot >= k:
+                        break
+                    neighbors[i * k + slot] = int(j)
+                    similarities[i * k + slot] = float(row[j])
+    else:
+        if count > PURE_PYTHON_MAX_SUBREDDITS:
+            logger.warning(
+                "numpy is not installed; building the graph for %d subreddits in pure Python will be very slow "
+                "(pip install 'reddit-research-mcp[related]')", count
+            )
+        vectors = []
+        for vector in embeddings:
+            norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+            vectors.append([x / norm for x in vector])
+        for i, vector in enumerate(vectors):
+            scored = (
+                (sum(a * b for a, b in zip(vector, other)), j)
+                for j, other in enumerate(vectors) if j != i
+            )
+            for slot, (similarity, j) in enumerate(heapq.nlargest(k, scored)):
+                neighbors[i * k + slot] = j
+                similarities[i * k + slot] = similarity
+
+    return RelatedGraph(
+        names=[entry["name"] for entry in entries],
+        k=k,
+        neighbors=neighbors,
+        similarities=similarities,
+        subscribers=array("q", [int(entry.get("subscribers") or 0) for entry in entries]),
+        nsfw=array("b", [1 if entry.get("nsfw") else 0 for entry in entries]),
+        built_at=time.time()
+    )
+
+
+def fetch_embeddings(collection, page_size: int = BUILD_PAGE_SIZE):
+    """
+    Page all metadata and embeddings out of a vector collection.
+
+    Returns:
+        (entries, embeddings) with one embedding per named entry
+    """
+    entries: List[Dict[str, Any]] = []
+    embeddings: List[Sequence[float]] = []
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas", "embeddings"], limit=page_size, offset=offset)
+        metadatas = page.get("metadatas") or []
+        vectors = page.get("embeddings") or []
+        for metadata, vector in zip(metadatas, vectors):
+            if metadata and metadata.get("name") and vector is not None:
+                entries.append(metadata)
+                embeddings.append(vector)
+        if len(metadatas) < page_size:
+            break
+        offset += page_size
+    return entries, embeddings
+
+
+_graph_instance: Optional[RelatedGraph] = None
+_graph_load_attempted = False
+_graph_lock = threading.Lock()
+
+
+def get_related_graph(path: Optional[str] = None) -> Optional[RelatedGraph]:
+    """
+    Get the process-wide graph, loading it on first use.
+
+    Returns:
+        RelatedGraph, or None if no graph file is available
+    """
+    global _graph_instance, _graph_load_attempted
+    if _graph_load_attempted:
+        return _graph_instance
+
+    with _graph_lock:
+        if not _graph_load_attempted:
+            graph_path = path or RELATED_GRAPH_PATH
+            try:
+                _graph_instance = RelatedGraph.load(graph_path)
+                logger.info("Related-subreddit graph loaded: %d subreddits", len(_graph_instance))
+            except FileNotFoundError:
+                logger.info("No related-subreddit graph at %s", graph_path)
+            except Exception as e:
+                logger.warning("Failed to load related-subreddit graph: %s", e)
+            _graph_load_attempted = True
+    return _graph_instance
+
+
+def reset_related_graph() -> None:
+    """Reset the graph instance (useful for testing)."""
+    global _graph_instance, _graph_load_attempted
+    _graph_instance = None
+    _graph_load_attempted = False
+
+
+def numpy_available() -> bool:
+    """Whether the vectorized build path can be used."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    """Build the graph from the vector proxy and save it."""
+    parser = argparse.ArgumentParser(description="Build the related-subreddit kNN graph")
+    parser.add_argument("--out", default=RELATED_GRAPH_PATH, help="Output file")
+    parser.add_argument("--k", type=int, default=20, help="Neighbours per subreddit")
+    parser.add_argument("--collection", default="dialog-app-prod-db", help="Vector collection name")
+    parser.add_argument(
+        "--allow-pure-python", action="store_true",
+        help=f"Build without numpy even for more than {PURE_PYTHON_MAX_SUBREDDITS} subreddits"
+    )
+    args = parser.parse_args(argv)
+
+    from .chroma_client import get_collection
+
+    entries, embeddings = fetch_embeddings(get_collection(args.collection))
+    print(f"Fetched {len(entries)} embeddings", flush=True)
+    if len(entries) > PURE_PYTHON_MAX_SUBREDDITS and not numpy_available() and not args.allow_pure_python:
+        print(
+            f"Refusing to build a graph for {len(entries)} subreddits without numpy: the pure-Python "
+            "all-pairs scan would take hours. Install it with pip install 'reddit-research-mcp[related]' "
+            "or pass --allow-pure-python.",
+            file=sys.stderr, flush=True
+        )
+        sys.exit(2)
+    graph = build_related_graph(entries, embeddings, k=args.k)
+    graph.save(args.out)
+    print(f"Saved graph ({len(graph)} subreddits, k={graph.k}) to {args.out}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
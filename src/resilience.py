@@ -0,0 +1,133 @@
+"""
+Resilience primitives for remote service calls.
+
+CircuitBreaker fails fast while a service is known to be down and probes
+it with a single request once a cool-down has passed. LatencyTracker keeps
+recent latencies for a smoothed average (used to weight replica selection)
+and a p95 (used to decide when to hedge a slow request).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    - closed: requests flow; consecutive failures are counted
+    - open: requests are rejected until ``open_seconds`` have passed
+    - half_open: one probe request is let through; success closes the
+      circuit, failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            open_seconds: How long the circuit stays open before probing
+            clock: Monotonic clock, injectable for tests
+        """
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state, accounting for an elapsed cool-down."""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.open_seconds:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.open_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # Half-open: exactly one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a claimed half-open probe without recording a result."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """Recent request latencies: EWMA for weighting, p95 for hedging."""
+
+    def __init__(self, window: int = 100, alpha: float = 0.2, initial: Optional[float] = None):
+        """
+        Args:
+            window: Number of recent samples kept for percentiles
+            alpha: EWMA smoothing factor
+            initial: Starting EWMA value before any samples
+        """
+        self.alpha = alpha
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.ewma = initial
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        with self._lock:
+            self._samples.append(seconds)
+            if self.ewma is None:
+                self.ewma = seconds
+            else:
+                self.ewma += self.alpha * (seconds - self.ewma)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at the given percentile (0-100), or None without samples."""
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
@@ -1,232 +1,321 @@
-"""Reddit MCP Resources - Server information endpoint."""
+"""Reddit MCP Resources - Server information endpoint.
+
+The server-info document is static apart from the Reddit rate limit status,
+so it is built and serialized once; reads splice a periodically refreshed
+rate limit snapshot into the pre-serialized text.
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Optional
 
-from typing import Dict, Any
 import praw
 
+from src.operations import OPERATION_SUMMARIES
 
-def register_resources(mcp, reddit: praw.Reddit) -> None:
-    """Register server info resource with the MCP server."""
-    
-    @mcp.resource("reddit://server-info")
-    def get_server_info() -> Dict[str, Any]:
+RATE_LIMIT_SNAPSHOT_SECONDS = float(os.getenv("RATE_LIMIT_SNAPSHOT_SECONDS", "5"))
+
+# Placeholder for the live section in the pre-serialized document
+_LIVE_RATE_LIMIT = "__live_rate_limit_status__"
+
+
+class RateLimitSnapshot:
+    """
+    Reddit rate limit status, re-read at most once per refresh interval.
+
+    Usage:
+        snapshot = RateLimitSnapshot(reddit)
+        snapshot.get_json()  # Same string until the interval passes
+    """
+
+    def __init__(
+        self,
+        reddit: Optional[praw.Reddit],
+        refresh_seconds: float = RATE_LIMIT_SNAPSHOT_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """
-        Get comprehensive information about the Reddit MCP server's capabilities.
-        
-        Returns server version, available tools, prompts, and usage examples.
+        Args:
+            reddit: Configured Reddit client (None if unavailable)
+            refresh_seconds: Maximum age of the snapshot
+            clock: Monotonic clock, injectable for tests
         """
+        self.reddit = reddit
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._taken_at: Optional[float] = None
+        self._json = ""
+        self.version = 0
+
+    def get_json(self) -> str:
+        """Serialized rate limit status, refreshed when older than the interval."""
+        now = self._clock()
+        if self._taken_at is None or now - self._taken_at >= self.refresh_seconds:
+            status = json.dumps(self._read())
+            self._taken_at = now
+            if status != self._json:
+                self._json = status
+                self.version += 1
+        return self._json
+
+    def _read(self) -> Dict[str, Any]:
         # Try to get rate limit info from Reddit
-        rate_limit_info = {}
         try:
             # Access auth to check rate limit status
-            rate_limit_info = {
-                "requests_remaining": reddit.auth.limits.get('remaining', 'unknown'),
-                "reset_timestamp": reddit.auth.limits.get('reset_timestamp', 'unknown'),
-                "used": reddit.auth.limits.get('used', 'unknown')
+            limits = self.reddit.auth.limits
+            return {
+                "requests_remaining": limits.get('remaining', 'unknown'),
+                "reset_timestamp": limits.get('reset_timestamp', 'unknown'),
+                "used": limits.get('used', 'unknown')
             }
-        except:
-            rate_limit_info = {
+        except Exception:
+            return {
                 "status": "Rate limits tracked automatically by PRAW",
                 "strategy": "Automatic retry with exponential backoff"
             }
+
+
+class ServerInfoDocument:
+    """
+    The reddit://server-info document, serialized once.
+
+    ``render()`` only re-joins the text when the rate limit snapshot changes.
+    """
+
+    def __init__(self, snapshot: RateLimitSnapshot):
+        self.snapshot = snapshot
+        text = json.dumps(build_server_info(), indent=2)
+        self._prefix, self._suffix = text.split(json.dumps(_LIVE_RATE_LIMIT))
+        self._rendered = ""
+        self._rendered_version = -1
+
+    def render(self) -> str:
+        """Full document JSON with the current rate limit status."""
+        status = self.snapshot.get_json()
+        if self.snapshot.version != self._rendered_version:
+            self._rendered = self._prefix + status + self._suffix
+            self._rendered_version = self.snapshot.version
+        return self._rendered
+
+
+def register_resources(mcp, reddit: praw.Reddit) -> None:
+    """Register server info resource with the MCP server."""
+    document = ServerInfoDocument(RateLimitSnapshot(reddit))
+
+    @mcp.resource("reddit://server-info", mime_type="application/json")
+    def get_server_info() -> str:
+        """
+        Get comprehensive information about the Reddit MCP server's capabilities.
         
-        return {
-            "name": "Reddit Research MCP Server",
-            "version": "0.4.0",
-            "description": "MCP server for comprehensive Reddit research with semantic search across 20,000+ indexed subreddits",
-            "changelog": {
-                "0.4.0": [
-                    "Added reddit_research prompt for automated comprehensive research",
-                    "Streamlined resources to focus on server-info only",
-                    "Enhanced documentation for prompt-based workflows"
-                ],
-                "0.3.0": [
-                    "Implemented three-layer architecture for clearer operation flow",
-                    "Added semantic subreddit discovery with vector search",
-                    "Enhanced workflow guidance with confidence-based recommendations",
-                    "Improved error recovery suggestions"
-                ],
-                "0.2.0": [
-                    "Added discover_subreddits with confidence scoring",
-                    "Added fetch_multiple_subreddits for batch operations",
-                    "Enhanced server-info with comprehensive documentation",
-                    "Improved error handling and rate limit management"
+        Returns server version, available tools, prompts, and usage examples.
+        """
+        return document.render()
+
+
+def build_server_info() -> Dict[str, Any]:
+    """Static part of the server-info document (live fields as placeholders)."""
+    return {
+        "name": "Reddit Research MCP Server",
+        "version": "0.4.0",
+        "description": "MCP server for comprehensive Reddit research with semantic search across 20,000+ indexed subreddits",
+        "changelog": {
+            "0.4.0": [
+                "Added reddit_research prompt for automated comprehensive research",
+                "Streamlined resources to focus on server-info only",
+                "Enhanced documentation for prompt-based workflows"
+            ],
+            "0.3.0": [
+                "Implemented three-layer architecture for clearer operation flow",
+                "Added semantic subreddit discovery with vector search",
+                "Enhanced workflow guidance with confidence-based recommendations",
+                "Improved error recovery suggestions"
+            ],
+            "0.2.0": [
+                "Added discover_subreddits with confidence scoring",
+                "Added fetch_multiple_subreddits for batch operations",
+                "Enhanced server-info with comprehensive documentation",
+                "Improved error handling and rate limit management"
+            ],
+            "0.1.0": [
+                "Initial release with search, fetch, and comment tools",
+                "Basic resources for popular subreddits and server info"
+            ]
+        },
+        "capabilities": {
+            "key_features": [
+                "Semantic search across 20,000+ indexed subreddits",
+                "Batch operations reducing API calls by 70%",
+                "Automated research workflow via prompt",
+                "Three-layer architecture for guided operations",
+                "Comprehensive citation tracking with Reddit URLs"
+            ],
+            "architecture": {
+                "type": "Three-Layer Architecture",
+                "workflow": [
+                    "Layer 1: discover_operations() - See available operations",
+                    "Layer 2: get_operation_schema(operation_id) - Get requirements",
+                    "Layer 3: execute_operation(operation_id, parameters) - Execute"
                 ],
-                "0.1.0": [
-                    "Initial release with search, fetch, and comment tools",
-                    "Basic resources for popular subreddits and server info"
-                ]
+                "description": "ALWAYS start with Layer 1, then Layer 2, then Layer 3"
             },
-            "capabilities": {
-                "key_features": [
-                    "Semantic search across 20,000+ indexed subreddits",
-                    "Batch operations reducing API calls by 70%",
-                    "Automated research workflow via prompt",
-                    "Three-layer architecture for guided operations",
-                    "Comprehensive citation tracking with Reddit URLs"
-                ],
-                "architecture": {
-                    "type": "Three-Layer Architecture",
-                    "workflow": [
-                        "Layer 1: discover_operations() - See available operations",
-                        "Layer 2: get_operation_schema(operation_id) - Get requirements",
-                        "Layer 3: execute_operation(operation_id, parameters) - Execute"
-                    ],
-                    "description": "ALWAYS start with Layer 1, then Layer 2, then Layer 3"
+            "tools": [
+                {
+                    "name": "discover_operations",
+                    "layer": 1,
+                    "description": "Discover available Reddit operations",
+                    "parameters": "NONE - Call without any parameters: discover_operations() NOT discover_operations({})",
+                    "purpose": "Shows all available operations and recommended workflows"
                 },
-                "tools": [
-                    {
-                        "name": "discover_operations",
-                        "layer": 1,
-                        "description": "Discover available Reddit operations",
-                        "parameters": "NONE - Call without any parameters: discover_operations() NOT discover_operations({})",
-                        "purpose": "Shows all available operations and recommended workflows"
+                {
+                    "name": "get_operation_schema",
+                    "layer": 2,
+                    "description": "Get parameter requirements for an operation",
+                    "parameters": {
+                        "operation_id": "The operation to get schema for (from Layer 1)",
+                        "include_examples": "Whether to include examples (optional, default: true)"
                     },
-                    {
-                        "name": "get_operation_schema",
-                        "layer": 2,
-                        "description": "Get parameter requirements for an operation",
-                        "parameters": {
-                            "operation_id": "The operation to get schema for (from Layer 1)",
-                            "include_examples": "Whether to include examples (optional, default: true)"
-                        },
-                        "purpose": "Provides parameter schemas, validation rules, and examples"
-                    },
-                    {
-                        "name": "execute_operation",
-                        "layer": 3,
-                        "description": "Execute a Reddit operation",
-                        "parameters": {
-                            "operation_id": "The operation to execute",
-                            "parameters": "Parameters matching the schema from Layer 2"
-                        },
-                        "purpose": "Actually performs the Reddit API calls"
-                    }
-                ],
-                "prompts": [
-                    {
-                        "name": "reddit_research",
-                        "description": "Conduct comprehensive Reddit research on any topic or question",
-                        "parameters": {
-                            "research_request": "Natural language description of what to research (e.g., 'How do people feel about remote work?')"
-                        },
-                        "returns": "Structured workflow guiding complete research process",
-                        "output": "Comprehensive markdown report with citations and metrics",
-                        "usage": "Select prompt, provide research question, receive guided workflow"
-                    }
-                ],
-                "available_operations": {
-                    "discover_subreddits": "Find communities using semantic vector search (20,000+ indexed)",
-                    "search_subreddit": "Search within a specific community",
-                    "fetch_posts": "Get posts from one subreddit",
-                    "fetch_multiple": "Batch fetch from multiple subreddits (70% more efficient)",
-                    "fetch_comments": "Get complete comment tree for deep analysis"
+                    "purpose": "Provides parameter schemas, validation rules, and examples"
                 },
-                "advanced_configuration": {
-                    "description": "Fine-tune search behavior with SearchConfig for power users",
-                    "searchconfig_parameters": {
-                        "min_confidence": "Filter results by confidence threshold (0.0-1.0). Higher values return only highly relevant communities",
-                        "EXACT_DISTANCE_THRESHOLD": "Distance threshold for 'exact' match tier (default: 0.2)",
-                        "SEMANTIC_DISTANCE_THRESHOLD": "Distance threshold for 'semantic' match tier (default: 0.35)",
-                        "GENERIC_PENALTY_MULTIPLIER": "Penalty applied to generic subreddits like 'funny', 'pics', 'memes' (default: 0.3)",
-                        "LARGE_SUB_THRESHOLD": "Subscriber count above which to apply boost (default: 1,000,000)",
-                        "LARGE_SUB_BOOST_MULTIPLIER": "Confidence boost for large subreddits (default: 1.1)",
-                        "CONFIDENCE_DISTANCE_BREAKPOINTS": "Custom distance-to-confidence mapping for advanced tuning"
+                {
+                    "name": "execute_operation",
+                    "layer": 3,
+                    "description": "Execute a Reddit operation",
+                    "parameters": {
+                        "operation_id": "The operation to execute",
+                        "parameters": "Parameters matching the schema from Layer 2"
                     },
-                    "usage": "Import SearchConfig from src.tools for programmatic customization",
-                    "example": "custom_config = SearchConfig(GENERIC_PENALTY_MULTIPLIER=0.1, min_confidence=0.6)",
-                    "typical_use_cases": [
-                        "Stricter filtering: Increase min_confidence to 0.7+ for only highly relevant communities",
-                        "Broader search: Decrease GENERIC_PENALTY_MULTIPLIER to find more generic community overlaps",
-                        "Niche communities: Increase SMALL_SUB_PENALTY_MULTIPLIER to 1.0 to weight niche subs equally",
-                        "Semantic tuning: Adjust CONFIDENCE_DISTANCE_BREAKPOINTS for different distance distributions"
-                    ]
+                    "purpose": "Actually performs the Reddit API calls"
                 },
-                "resources": [
-                    {
-                        "uri": "reddit://server-info",
-                        "description": "Comprehensive server capabilities, version, and usage information",
-                        "cacheable": False,
-                        "always_current": True
-                    }
-                ],
-                "statistics": {
-                    "total_tools": 3,
-                    "total_prompts": 1,
-                    "total_operations": 5,
-                    "total_resources": 1,
-                    "indexed_subreddits": "20,000+"
+                {
+                    "name": "execute_operations",
+                    "layer": 3,
+                    "description": "Execute several operations in one call",
+                    "parameters": {
+                        "operations": "Steps with id, operation and parameters; values may be {\"$ref\": \"<step_id>.<path>\"} to reuse an earlier step's output"
+                    },
+                    "purpose": "Runs multi-step pipelines (independent steps concurrently) in one tool call"
                 }
-            },
-            "usage_examples": {
-                "automated_research": {
-                    "description": "Use the reddit_research prompt for complete automated workflow",
-                    "steps": [
-                        "1. Select the 'reddit_research' prompt in your MCP client",
-                        "2. Provide your research question: 'What are the best practices for React development?'",
-                        "3. The prompt guides the LLM through discovery, gathering, analysis, and reporting",
-                        "4. Receive comprehensive markdown report with citations"
-                    ]
-                },
-                "manual_workflow": {
-                    "description": "Step-by-step manual research using the three-layer architecture",
-                    "steps": [
-                        "1. discover_operations() - See what's available",
-                        "2. get_operation_schema('discover_subreddits') - Get requirements",
-                        "3. execute_operation('discover_subreddits', {'query': 'machine learning', 'limit': 15})",
-                        "4. get_operation_schema('fetch_multiple') - Get batch fetch requirements",
-                        "5. execute_operation('fetch_multiple', {'subreddit_names': [...], 'limit_per_subreddit': 10})",
-                        "6. get_operation_schema('fetch_comments') - Get comment requirements",
-                        "7. execute_operation('fetch_comments', {'submission_id': 'abc123', 'comment_limit': 100})"
-                    ]
-                },
-                "targeted_search": {
-                    "description": "Find specific content in known communities",
-                    "steps": [
-                        "1. discover_operations()",
-                        "2. get_operation_schema('search_subreddit')",
-                        "3. execute_operation('search_subreddit', {'subreddit_name': 'Python', 'query': 'async', 'limit': 20})"
-                    ]
+            ],
+            "prompts": [
+                {
+                    "name": "reddit_research",
+                    "description": "Conduct comprehensive Reddit research on any topic or question",
+                    "parameters": {
+                        "research_request": "Natural language description of what to research (e.g., 'How do people feel about remote work?')"
+                    },
+                    "returns": "Structured workflow guiding complete research process",
+                    "output": "Comprehensive markdown report with citations and metrics",
+                    "usage": "Select prompt, provide research question, receive guided workflow"
                 }
-            },
-            "performance_tips": [
-                "Use the reddit_research prompt for automated comprehensive research",
-                "Always follow the three-layer workflow for manual operations",
-                "Use fetch_multiple for 2+ subreddits (70% fewer API calls)",
-                "Single semantic search finds all relevant communities",
-                "Use confidence scores to guide strategy (>0.7 = high confidence)",
-                "Expect ~15-20K tokens for comprehensive research"
             ],
-            "workflow_guidance": {
-                "confidence_based_strategy": {
-                    "high_confidence": "Scores > 0.7: Focus on top 5-8 subreddits",
-                    "medium_confidence": "Scores 0.4-0.7: Cast wider net with 10-12 subreddits",
-                    "low_confidence": "Scores < 0.4: Refine search terms and retry"
+            "available_operations": dict(OPERATION_SUMMARIES),
+            "advanced_configuration": {
+                "description": "Fine-tune search behavior with SearchConfig for power users",
+                "searchconfig_parameters": {
+                    "min_confidence": "Filter results by confidence threshold (0.0-1.0). Higher values return only highly relevant communities",
+                    "EXACT_DISTANCE_THRESHOLD": "Distance threshold for 'exact' match tier (default: 0.2)",
+                    "SEMANTIC_DISTANCE_THRESHOLD": "Distance threshold for 'semantic' match tier (default: 0.35)",
+                    "GENERIC_PENALTY_MULTIPLIER": "Penalty applied to generic subreddits like 'funny', 'pics', 'memes' (default: 0.3)",
+                    "LARGE_SUB_THRESHOLD": "Subscriber count above which to apply boost (default: 1,000,000)",
+                    "LARGE_SUB_BOOST_MULTIPLIER": "Confidence boost for large subreddits (default: 1.1)",
+                    "CONFIDENCE_DISTANCE_BREAKPOINTS": "Custom distance-to-confidence mapping for advanced tuning"
                 },
-                "research_depth": {
-                    "minimum_coverage": "10+ threads, 100+ comments, 3+ subreddits",
-                    "quality_thresholds": "Posts: 5+ upvotes, Comments: 2+ upvotes",
-                    "author_credibility": "Prioritize 100+ karma for key insights"
-                },
-                "token_optimization": {
-                    "discover_subreddits": "~1-2K tokens for semantic search",
-                    "fetch_multiple": "~500-1000 tokens per subreddit",
-                    "fetch_comments": "~2-5K tokens per post with comments",
-                    "full_research": "~15-20K tokens for comprehensive analysis"
+                "usage": "Import SearchConfig from src.tools for programmatic customization",
+                "example": "custom_config = SearchConfig(GENERIC_PENALTY_MULTIPLIER=0.1, min_confidence=0.6)",
+                "typical_use_cases": [
+                    "Stricter filtering: Increase min_confidence to 0.7+ for only highly relevant communities",
+                    "Broader search: Decrease GENERIC_PENALTY_MULTIPLIER to find more generic community overlaps",
+                    "Niche communities: Increase SMALL_SUB_PENALTY_MULTIPLIER to 1.0 to weight niche subs equally",
+                    "Semantic tuning: Adjust CONFIDENCE_DISTANCE_BREAKPOINTS for different distance distributions"
+                ]
+            },
+            "resources": [
+                {
+                    "uri": "reddit://server-info",
+                    "description": "Comprehensive server capabilities, version, and usage information",
+                    "cacheable": False,
+                    "always_current": True
                 }
+            ],
+            "statistics": {
+                "total_tools": 4,
+                "total_prompts": 1,
+                "total_operations": len(OPERATION_SUMMARIES),
+                "total_resources": 1,
+                "indexed_subreddits": "20,000+"
+            }
+        },
+        "usage_examples": {
+            "automated_research": {
+                "description": "Use the reddit_research prompt for complete automated workflow",
+                "steps": [
+                    "1. Select the 'reddit_research' prompt in your MCP client",
+                    "2. Provide your research question: 'What are the best practices for React development?'",
+                    "3. The prompt guides the LLM through discovery, gathering, analysis, and reporting",
+                    "4. Receive comprehensive markdown report with citations"
+                ]
             },
-            "rate_limiting": {
-                "handler": "PRAW automatic rate limit handling",
-                "strategy": "Exponential backoff with retry",
-                "current_status": rate_limit_info
+            "manual_workflow": {
+                "description": "Step-by-step manual research using the three-layer architecture",
+                "steps": [
+                    "1. discover_operations() - See what's available",
+                    "2. get_operation_schema('discover_subreddits') - Get requirements",
+                    "3. execute_operation('discover_subreddits', {'query': 'machine learning', 'limit': 15})",
+                    "4. get_operation_schema('fetch_multiple') - Get batch fetch requirements",
+                    "5. execute_operation('fetch_multiple', {'subreddit_names': [...], 'limit_per_subreddit': 10})",
+                    "6. get_operation_schema('fetch_comments') - Get comment requirements",
+                    "7. execute_operation('fetch_comments', {'submission_id': 'abc123', 'comment_limit': 100})"
+                ]
+            },
+            "targeted_search": {
+                "description": "Find specific content in known communities",
+                "steps": [
+                    "1. discover_operations()",
+                    "2. get_operation_schema('search_subreddit')",
+                    "3. execute_operation('search_subreddit', {'subreddit_name': 'Python', 'query': 'async', 'limit': 20})"
+                ]
+            }
+        },
+        "performance_tips": [
+            "Use the reddit_research prompt for automated comprehensive research",
+            "Always follow the three-layer workflow for manual operations",
+            "Use fetch_multiple for 2+ subreddits (70% fewer API calls)",
+            "Single semantic search finds all relevant communities",
+            "Use confidence scores to guide strategy (>0.7 = high confidence)",
+            "Expect ~15-20K tokens for comprehensive research"
+        ],
+        "workflow_guidance": {
+            "confidence_based_strategy": {
+                "high_confidence": "Scores > 0.7: Focus on top 5-8 subreddits",
+                "medium_confidence": "Scores 0.4-0.7: Cast wider net with 10-12 subreddits",
+                "low_confidence": "Scores < 0.4: Refine search terms and retry"
             },
-            "authentication": {
-                "type": "Application-only OAuth",
-                "scope": "Read-only access",
-                "capabilities": "Search, browse, and read public content"
+            "research_depth": {
+                "minimum_coverage": "10+ threads, 100+ comments, 3+ subreddits",
+                "quality_thresholds": "Posts: 5+ upvotes, Comments: 2+ upvotes",
+                "author_credibility": "Prioritize 100+ karma for key insights"
             },
-            "support": {
-                "repository": "https://github.com/king-of-the-grackles/reddit-research-mcp",
-                "issues": "https://github.com/king-of-the-grackles/reddit-research-mcp/issues",
-                "documentation": "See README.md and specs/ directory for architecture details"
+            "token_optimization": {
+                "discover_subreddits": "~1-2K tokens for semantic search",
+                "fetch_multiple": "~500-1000 tokens per subreddit",
+                "fetch_comments": "~2-5K tokens per post with comments",
+                "full_research": "~15-20K tokens for comprehensive analysis"
             }
-        }
\ No newline at end of file
+        },
+        "rate_limiting": {
+            "handler": "PRAW automatic rate limit handling",
+            "strategy": "Exponential backoff with retry",
+            "current_status": _LIVE_RATE_LIMIT
+        },
+        "authentication": {
+            "type": "Application-only OAuth",
+            "scope": "Read-only access",
+            "capabilities": "Search, browse, and read public content"
+        },
+        "support": {
+            "repository": "https://github.com/king-of-the-grackles/reddit-research-mcp",
+            "issues": "https://github.com/king-of-the-grackles/reddit-research-mcp/issues",
+            "documentation": "See README.md and specs/ directory for architecture details"
+        }
+    }
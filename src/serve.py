@@ -0,0 +1,276 @@
+"""
+Transport selection and multi-worker HTTP serving.
+
+``reddit-mcp`` runs over stdio by default. ``--transport http`` (or
+``MCP_TRANSPORT=http``) serves streamable HTTP with uvicorn instead, and
+``sse`` serves the legacy SSE transport. Each setting comes from a CLI flag,
+then an environment variable, then a default.
+
+With more than one worker, the parent binds the listening socket once.
+After every import is done it freezes the heap (``gc.freeze()``), so forked
+workers share the loaded modules, operation registry and related-subreddit
+graph copy-on-write. It then pre-forks the workers. Every worker serves the
+same app (auth, health and custom routes included) on the shared socket,
+and the kernel spreads connections between them. Worker-local state
+(sessions, outbound clients) is per process, so multi-worker HTTP runs
+stateless and the SSE transport, which needs sticky sessions, is limited
+to one worker. State that must span requests is kept per client in the
+shared cache backend (research corpora), and admission limits are split
+between the workers. The parent restarts workers that crash and forwards
+SIGTERM/SIGINT for a graceful shutdown.
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("stdio", "http", "sse")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_KEEPALIVE_SECONDS = 5
+DEFAULT_BACKLOG = 2048
+WORKER_RESTART_DELAY = 1.0     # Seconds before replacing a crashed worker
+WORKER_SHUTDOWN_TIMEOUT = 30   # Seconds to wait for workers before SIGKILL
+WORKER_POLL_INTERVAL = 0.2     # Seconds between checks for exited workers
+
+# Set in each forked worker; 0 in a single-process server
+WORKER_ID = 0
+# Set before the workers are forked; 1 in a single-process server
+WORKER_COUNT = 1
+
+
+def is_primary_worker() -> bool:
+    """Whether this process should run once-per-deployment background work."""
+    return WORKER_ID == 0
+
+
+def worker_id() -> int:
+    """This process's worker index (0 in a single-process server)."""
+    return WORKER_ID
+
+
+def worker_count() -> int:
+    """Number of worker processes serving requests (any of them may get the next one)."""
+    return WORKER_COUNT
+
+
+def resolve_workers(value: str) -> int:
+    """Worker count from a number or ``auto`` (one per CPU core)."""
+    if str(value).strip().lower() == "auto":
+        return os.cpu_count() or 1
+    workers = int(value)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return workers
+
+
+def parse_args(argv: Optional[List[str]] = None, env: Optional[Dict[str, str]] = None) -> argparse.Namespace:
+    """
+    Serving options from CLI flags, falling back to environment variables.
+
+    Environment: MCP_TRANSPORT, MCP_HOST, MCP_PORT (or PORT), MCP_WORKERS,
+    MCP_KEEPALIVE_SECONDS, MCP_BACKLOG.
+    """
+    env = os.environ if env is None else env
+    parser = argparse.ArgumentParser(prog="reddit-mcp", description="Reddit Research MCP server")
+    parser.add_argument(
+        "--transport", choices=TRANSPORTS, default=env.get("MCP_TRANSPORT", "stdio"),
+        help="stdio (default), http (streamable HTTP) or sse"
+    )
+    parser.add_argument("--host", default=env.get("MCP_HOST", DEFAULT_HOST), help="Interface to bind (HTTP transports)")
+    parser.add_argument(
+        "--port", type=int, default=int(env.get("MCP_PORT") or env.get("PORT") or DEFAULT_PORT),
+        help="Port to bind (HTTP transports)"
+    )
+    parser.add_argument(
+        "--workers", type=resolve_workers, default=env.get("MCP_WORKERS", "1"),
+        help="Worker processes, or 'auto' for one per CPU core"
+    )
+    parser.add_argument(
+        "--keepalive", type=int, default=int(env.get("MCP_KEEPALIVE_SECONDS", DEFAULT_KEEPALIVE_SECONDS)),
+        help="Seconds to keep idle HTTP connections open"
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=int(env.get("MCP_BACKLOG", DEFAULT_BACKLOG)),
+        help="Pending connection queue length"
+    )
+    args = parser.parse_args(argv)
+    if isinstance(args.workers, str):
+        args.workers = resolve_workers(args.workers)
+
+    if args.transport == "sse" and args.workers > 1:
+        logger.warning("The SSE transport needs sticky sessions; serving it with one worker")
+        args.workers = 1
+    if args.workers > 1 and not hasattr(os, "fork"):
+        logger.warning("Pre-forked workers need os.fork; serving with one worker")
+        args.workers = 1
+    return args
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """Listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def warn_multi_worker_limits(workers: int) -> None:
+    """Log the per-process state that multi-worker serving cannot share."""
+    from .admission import ADMISSION_USER_CONCURRENCY, ADMISSION_USER_QUEUE
+    from .shared_cache import CACHE_BACKEND
+
+    if CACHE_BACKEND not in ("sqlite", "redis"):
+        logger.warning(
+            "CACHE_BACKEND=%s is per worker: query_corpus only sees what the same worker fetched; "
+            "use sqlite or redis with %d workers", CACHE_BACKEND, workers
+        )
+    if min(ADMISSION_USER_CONCURRENCY, ADMISSION_USER_QUEUE) < workers:
+        logger.warning(
+            "Per-user admission limits are split across %d workers and cannot go below one per worker; "
+            "a user may run up to %d Reddit operations at once", workers, workers
+        )
+
+
+def serve_http(mcp, args: argparse.Namespace) -> None:
+    """Serve the MCP app over HTTP/SSE with ``args.workers`` processes."""
+    import uvicorn
+
+    global WORKER_COUNT
+    WORKER_COUNT = args.workers
+    if args.workers > 1:
+        warn_multi_worker_limits(args.workers)
+
+    app = mcp.http_app(transport=args.transport, stateless_http=args.workers > 1 or None)
+    config = uvicorn.Config(
+        app,
+        timeout_keep_alive=args.keepalive,
+        backlog=args.backlog,
+        lifespan="on",
+        log_level=os.getenv("MCP_LOG_LEVEL", "info").lower()
+    )
+    sock = bind_socket(args.host, args.port, args.backlog)
+    print(
+        f"Serving {args.transport} on http://{args.host}:{args.port}/ with {args.workers} worker(s)",
+        flush=True
+    )
+
+    def run_worker(worker_id: int) -> None:
+        uvicorn.Server(config).run(sockets=[sock])
+
+    if args.workers == 1:
+        try:
+            run_worker(0)
+        except KeyboardInterrupt:
+            # uvicorn re-raises Ctrl-C after its graceful shutdown
+            pass
+        return
+
+    # Everything loaded so far is shared copy-on-write with the workers
+    gc.collect()
+    gc.freeze()
+    sys.exit(prefork(run_worker, args.workers))
+
+
+def prefork(target: Callable[[int], None], workers: int) -> int:
+    """
+    Fork ``workers`` processes running ``target(worker_id)`` and supervise them.
+
+    Crashed workers are replaced; workers that exit cleanly are not. SIGTERM
+    and SIGINT are forwarded to the workers, which get
+    WORKER_SHUTDOWN_TIMEOUT seconds to finish before being killed.
+
+    Returns:
+        Exit status: 0 after a clean shutdown, 1 if a crashed worker could
+        not be replaced or a worker failed (or was killed) during shutdown
+    """
+    children: Dict[int, int] = {}
+    stopping = False
+    failed = False
+
+    def spawn(worker_id: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            global WORKER_ID
+            WORKER_ID = worker_id
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                target(worker_id)
+            except BaseException as e:
+                print(f"Worker {worker_id} failed: {e}", file=sys.stderr, flush=True)
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = worker_id
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        for worker_id in range(workers):
+            spawn(worker_id)
+
+        stop_deadline = None
+        while children:
+            if stopping and stop_deadline is None:
+                stop_deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT
+            if stop_deadline is not None and time.monotonic() > stop_deadline:
+                for pid in list(children):
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                stop_deadline = float("inf")
+
+            # Never block: a blocking waitpid is retried after the signal
+            # handler runs (PEP 475) and would skip the shutdown deadline
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            if pid == 0:
+                time.sleep(WORKER_POLL_INTERVAL)
+                continue
+
+            worker_id = children.pop(pid)
+            code = os.waitstatus_to_exitcode(status)
+            if stopping:
+                # Dying from the forwarded signal counts as a clean stop
+                if code not in (0, -signal.SIGTERM, -signal.SIGINT):
+                    failed = True
+                    print(f"Worker {worker_id} (pid {pid}) exited with {code} during shutdown", file=sys.stderr, flush=True)
+                continue
+            if code == 0:
+                continue
+            print(f"Worker {worker_id} (pid {pid}) exited with {code}; restarting", file=sys.stderr, flush=True)
+            time.sleep(WORKER_RESTART_DELAY)
+            if stopping:
+                failed = True       # Shut down before the worker could be replaced
+            else:
+                spawn(worker_id)
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+    return 1 if failed else 0
@@ -1,5 +1,7 @@
 from fastmcp import FastMCP, Context
 from fastmcp.prompts import Message
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
 from fastmcp.server.auth.providers.descope import DescopeProvider
 from typing import Optional, Literal, List, Union, Dict, Any, Annotated
 
@@ -7,7 +9,9 @@ from src.auth.multi_issuer_verifier import MultiIssuerJWTVerifier
 import sys
 import os
 import json
+import asyncio
 from pathlib import Path
+from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime
 from dotenv import load_dotenv
 from starlette.responses import Response, JSONResponse
@@ -19,19 +23,24 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import get_reddit_client
-from src.tools.search import search_in_subreddit
-from src.tools.posts import fetch_subreddit_posts, fetch_multiple_subreddits
-from src.tools.comments import fetch_submission_with_comments
-from src.tools.discover import discover_subreddits
-from src.tools.feed import (
-    create_feed,
-    list_feeds,
-    get_feed,
-    get_feed_config,
-    update_feed,
-    delete_feed,
+from src.tools.feed import start_feed_client, close_feed_client
+from src.operations import (
+    OPERATIONS,
+    OPERATION_MAX_TIMEOUT_SECONDS,
+    OPERATION_SUMMARIES,
+    TIMEOUT_PARAMETER,
+    get_operation,
 )
+from src.deadline import DEADLINE_GRACE_SECONDS, deadline_scope
+from src.admission import AdmissionRejected, admission_user, get_admission_controller
+from src.batch import run_batch
+from src.corpus import record_operation_result
 from src.resources import register_resources
+from src.related import get_related_graph
+from src.prefetch import FEED_PREFETCH_ENABLED, get_feed_prefetcher
+from src.serve import is_primary_worker, parse_args, serve_http
+from src.catalog import get_subreddit_catalog
+from src.shared_cache import close_cache_backend
 
 # Configure Descope authentication with multi-issuer support
 # This allows the server to accept both:
@@ -59,8 +68,28 @@ auth = DescopeProvider(
     token_verifier=multi_issuer_verifier,  # Use our multi-issuer verifier
 )
 
+@asynccontextmanager
+async def lifespan(server):
+    """Open shared outbound clients, JWKS refresh (and the optional feed prefetcher) for the server's lifetime."""
+    await multi_issuer_verifier.start()
+    await start_feed_client()
+    prefetcher = get_feed_prefetcher()
+    if FEED_PREFETCH_ENABLED and is_primary_worker():
+        # One prefetcher per deployment, not per pre-forked worker; it reads
+        # the feeds registered in every worker from the shared cache
+        prefetcher.start(reddit)
+    try:
+        yield
+    finally:
+        await prefetcher.stop()
+        # Commit buffered writes to a persistent cache before exiting
+        close_cache_backend()
+        await close_feed_client()
+        await multi_issuer_verifier.stop()
+
+
 # Initialize MCP server with authentication
-mcp = FastMCP("Reddit MCP", auth=auth, instructions="""
+mcp = FastMCP("Reddit MCP", auth=auth, lifespan=lifespan, instructions="""
 Reddit MCP Server - Three-Layer Architecture
 
 🎯 ALWAYS FOLLOW THIS WORKFLOW:
@@ -81,6 +110,7 @@ Reddit MCP Server - Three-Layer Architecture
 • Use fetch_multiple for 2+ subreddits (70% fewer API calls)
 • Single vector search finds semantically related communities
 • Batch operations reduce token usage
+• execute_operations runs a whole discover → fetch → comments pipeline in one call
 
 Quick Start: Read reddit://server-info for complete documentation.
 """)
@@ -107,6 +137,77 @@ async def health_check(request) -> Response:
             status_code=500
         )
 
+
+# Public discovery documents are static, so they are serialized once at import
+SERVER_INFO_BODY = json.dumps({
+    "name": "Reddit MCP",
+    "version": "1.0.0",
+    "description": "Reddit research and analysis tools with semantic subreddit discovery",
+    "authentication": {
+        "required": True,
+        "type": "oauth2",
+        "provider": "descope",
+        "authorization_server": f"{server_url}/.well-known/oauth-authorization-server"
+    },
+    "capabilities": {
+        "tools": ["discover_operations", "get_operation_schema", "execute_operation", "execute_operations"],
+        "tools_count": 4,
+        "supports_resources": True,
+        "supports_prompts": True,
+        "reddit_operations": OPERATION_SUMMARIES
+    }
+}).encode("utf-8")
+
+MCP_CONFIG_BODY = json.dumps({
+    "version": "1.0",
+    "servers": [
+        {
+            "name": "Dialog MCP Server",
+            "description": "Reddit research and analysis tools with semantic subreddit discovery across 20,000+ indexed communities",
+            "endpoint": f"{server_url}/mcp",
+            "transport": "sse",
+            "capabilities": ["tools", "resources", "prompts"],
+            "authentication": {
+                "required": True,
+                "type": "oauth2",
+                "authorization_server": f"{server_url}/.well-known/oauth-authorization-server"
+            },
+            "tools": [
+                {
+                    "name": "discover_operations",
+                    "description": "Discover available Reddit operations and recommended workflows"
+                },
+                {
+                    "name": "get_operation_schema",
+                    "description": "Get detailed requirements and parameters for a Reddit operation"
+                },
+                {
+                    "name": "execute_operation",
+                    "description": "Execute a Reddit operation with validated parameters"
+                },
+                {
+                    "name": "execute_operations",
+                    "description": "Execute several Reddit operations in one call, passing results between steps"
+                }
+            ],
+            "operations": OPERATION_SUMMARIES,
+            "prompts": [
+                {
+                    "name": "reddit_research",
+                    "description": "Conduct comprehensive Reddit research on any topic or question"
+                }
+            ],
+            "resources": [
+                {
+                    "uri": "reddit://server-info",
+                    "description": "Comprehensive server capabilities, version, and usage information"
+                }
+            ]
+        }
+    ]
+}).encode("utf-8")
+
+
 # Add public server info endpoint (no auth required)
 @mcp.custom_route("/server-info", methods=["GET"])
 async def server_info(request) -> Response:
@@ -115,38 +216,8 @@ async def server_info(request) -> Response:
     Provides server metadata and capabilities to help clients understand
     what authentication and features are available.
     """
-    try:
-        print(f"Server info requested from {request.client.host if request.client else 'unknown'}", flush=True)
-        return JSONResponse({
-            "name": "Reddit MCP",
-            "version": "1.0.0",
-            "description": "Reddit research and analysis tools with semantic subreddit discovery",
-            "authentication": {
-                "required": True,
-                "type": "oauth2",
-                "provider": "descope",
-                "authorization_server": f"{os.getenv('SERVER_URL', 'http://localhost:8000')}/.well-known/oauth-authorization-server"
-            },
-            "capabilities": {
-                "tools": ["discover_operations", "get_operation_schema", "execute_operation"],
-                "tools_count": 3,
-                "supports_resources": True,
-                "supports_prompts": True,
-                "reddit_operations": {
-                    "discover_subreddits": "Semantic search for relevant communities",
-                    "search_subreddit": "Search within a specific subreddit",
-                    "fetch_posts": "Get posts from a subreddit",
-                    "fetch_multiple": "Batch fetch from multiple subreddits",
-                    "fetch_comments": "Get complete comment trees"
-                }
-            }
-        })
-    except Exception as e:
-        print(f"ERROR: Server info request failed: {e}", flush=True)
-        return JSONResponse(
-            {"status": "error", "message": str(e)},
-            status_code=500
-        )
+    print(f"Server info requested from {request.client.host if request.client else 'unknown'}", flush=True)
+    return Response(SERVER_INFO_BODY, media_type="application/json")
 
 # Add public MCP config endpoint for server discovery (no auth required)
 # This follows the emerging .well-known/mcp-config standard for MCP server discovery
@@ -159,70 +230,7 @@ async def mcp_config(request) -> Response:
     This endpoint allows automated tools to scan and understand MCP server
     capabilities without needing to authenticate first.
     """
-    try:
-        server_base_url = os.getenv('SERVER_URL', 'http://localhost:8000')
-        return JSONResponse({
-            "version": "1.0",
-            "servers": [
-                {
-                    "name": "Dialog MCP Server",
-                    "description": "Reddit research and analysis tools with semantic subreddit discovery across 20,000+ indexed communities",
-                    "endpoint": f"{server_base_url}/mcp",
-                    "transport": "sse",
-                    "capabilities": ["tools", "resources", "prompts"],
-                    "authentication": {
-                        "required": True,
-                        "type": "oauth2",
-                        "authorization_server": f"{server_base_url}/.well-known/oauth-authorization-server"
-                    },
-                    "tools": [
-                        {
-                            "name": "discover_operations",
-                            "description": "Discover available Reddit operations and recommended workflows"
-                        },
-                        {
-                            "name": "get_operation_schema",
-                            "description": "Get detailed requirements and parameters for a Reddit operation"
-                        },
-                        {
-                            "name": "execute_operation",
-                            "description": "Execute a Reddit operation with validated parameters"
-                        }
-                    ],
-                    "operations": {
-                        "discover_subreddits": "Find communities using semantic vector search",
-                        "search_subreddit": "Search within a specific subreddit",
-                        "fetch_posts": "Get posts from a subreddit",
-                        "fetch_multiple": "Batch fetch from multiple subreddits",
-                        "fetch_comments": "Get complete comment trees for analysis",
-                        "create_feed": "Create a new feed with analysis and subreddits",
-                        "list_feeds": "List all feeds for the authenticated user",
-                        "get_feed": "Get a specific feed by ID",
-                        "get_feed_config": "Get feed configuration with subreddit names",
-                        "update_feed": "Update an existing feed",
-                        "delete_feed": "Delete a feed"
-                    },
-                    "prompts": [
-                        {
-                            "name": "reddit_research",
-                            "description": "Conduct comprehensive Reddit research on any topic or question"
-                        }
-                    ],
-                    "resources": [
-                        {
-                            "uri": "reddit://server-info",
-                            "description": "Comprehensive server capabilities, version, and usage information"
-                        }
-                    ]
-                }
-            ]
-        })
-    except Exception as e:
-        print(f"ERROR: MCP config request failed: {e}", flush=True)
-        return JSONResponse(
-            {"status": "error", "message": str(e)},
-            status_code=500
-        )
+    return Response(MCP_CONFIG_BODY, media_type="application/json")
 
 
 # Initialize Reddit client (will be updated with config when available)
@@ -245,6 +253,43 @@ except Exception as e:
 
 # Three-Layer Architecture Implementation
 
+# Layer 1 response, built once from the operation registry
+DISCOVERY_RESPONSE = {
+    "operations": OPERATION_SUMMARIES,
+    "recommended_workflows": {
+        "comprehensive_research": [
+            "discover_subreddits → fetch_multiple → fetch_comments",
+            "Best for: Thorough analysis across communities"
+        ],
+        "expand_from_known": [
+            "related_subreddits → fetch_multiple",
+            "Best for: Finding communities next to one you already know"
+        ],
+        "targeted_search": [
+            "discover_subreddits → search_subreddit → fetch_comments",
+            "Best for: Finding specific content in relevant communities"
+        ],
+        "feed_workflow": [
+            "discover_subreddits → create_feed → list_feeds",
+            "Best for: Saving research results for later use"
+        ],
+        "one_call_research": [
+            "research",
+            "Best for: A citation-ready corpus (posts + top comments) in one call"
+        ],
+        "filter_and_cite": [
+            "research or fetch_multiple → fetch_comments → query_corpus",
+            "Best for: Filtering everything fetched so far by subreddit, score, date or keyword"
+        ],
+        "feed_reading": [
+            "list_feeds → fetch_feed_posts → fetch_comments",
+            "Best for: Catching up on a saved feed in one call"
+        ]
+    },
+    "next_step": "Use get_operation_schema() to understand requirements"
+}
+
+
 @mcp.tool(
     description="Discover available Reddit operations and recommended workflows",
     annotations={"readOnlyHint": True}
@@ -255,36 +300,7 @@ def discover_operations(ctx: Context) -> Dict[str, Any]:
     Start here to understand available capabilities.
     """
     # Phase 1: Accept context but don't use it yet
-    return {
-        "operations": {
-            "discover_subreddits": "Find relevant communities using semantic search",
-            "search_subreddit": "Search for posts within a specific community",
-            "fetch_posts": "Get posts from a single subreddit",
-            "fetch_multiple": "Batch fetch from multiple subreddits (70% more efficient)",
-            "fetch_comments": "Get complete comment tree for deep analysis",
-            "create_feed": "Create a new feed with analysis and subreddits",
-            "list_feeds": "List all feeds for the authenticated user",
-            "get_feed": "Get a specific feed by ID",
-            "get_feed_config": "Get feed configuration with subreddit names",
-            "update_feed": "Update an existing feed",
-            "delete_feed": "Delete a feed"
-        },
-        "recommended_workflows": {
-            "comprehensive_research": [
-                "discover_subreddits → fetch_multiple → fetch_comments",
-                "Best for: Thorough analysis across communities"
-            ],
-            "targeted_search": [
-                "discover_subreddits → search_subreddit → fetch_comments",
-                "Best for: Finding specific content in relevant communities"
-            ],
-            "feed_workflow": [
-                "discover_subreddits → create_feed → list_feeds",
-                "Best for: Saving research results for later use"
-            ]
-        },
-        "next_step": "Use get_operation_schema() to understand requirements"
-    }
+    return DISCOVERY_RESPONSE
 
 
 @mcp.tool(
@@ -295,388 +311,22 @@ def get_operation_schema(
     operation_id: Annotated[str, "Operation ID from discover_operations"],
     include_examples: Annotated[bool, "Include example parameter values"] = True,
     ctx: Context = None
-) -> Dict[str, Any]:
+) -> ToolResult:
     """
     LAYER 2: Get parameter requirements for an operation.
     Use after discover_operations to understand how to call operations.
     """
     # Phase 1: Accept context but don't use it yet
-    schemas = {
-        "discover_subreddits": {
-            "description": "Find communities using semantic vector search with configurable filtering and batch discovery",
-            "parameters": {
-                "query": {
-                    "type": "string",
-                    "required_one_of": ["query", "queries"],
-                    "description": "Single topic to find communities for",
-                    "validation": "2-100 characters"
-                },
-                "queries": {
-                    "type": "array[string] or JSON string",
-                    "required_one_of": ["query", "queries"],
-                    "description": "Multiple topics for batch discovery (more efficient than individual queries)",
-                    "example": '["machine learning", "deep learning", "neural networks"]',
-                    "tip": "Batch mode reduces API calls and token usage by ~40%"
-                },
-                "limit": {
-                    "type": "integer",
-                    "required": False,
-                    "default": 10,
-                    "range": [1, 50],
-                    "description": "Number of communities to return per query"
-                },
-                "include_nsfw": {
-                    "type": "boolean",
-                    "required": False,
-                    "default": False,
-                    "description": "Whether to include NSFW communities"
-                },
-                "min_confidence": {
-                    "type": "float",
-                    "required": False,
-                    "default": 0.0,
-                    "range": [0.0, 1.0],
-                    "description": "Minimum confidence score threshold for results",
-                    "guidance": {
-                        "0.0-0.3": "Very inclusive, includes tangentially related communities",
-                        "0.3-0.6": "Balanced, moderate relevance requirements",
-                        "0.6-0.8": "Strict, only highly relevant communities",
-                        "0.8-1.0": "Very strict, only exact semantic matches"
-                    }
-                }
-            },
-            "returns": {
-                "subreddits": "Array with confidence scores (0-1) and match tiers",
-                "confidence_stats": "Distribution statistics (mean, median, min, max, std_dev)",
-                "tier_distribution": "Breakdown by match quality (exact, semantic, adjacent, peripheral)",
-                "quality_indicators": {
-                    "good": "5+ subreddits with confidence > 0.7",
-                    "moderate": "3-5 subreddits with confidence 0.5-0.7",
-                    "poor": "All results below 0.5 confidence - refine search terms"
-                }
-            },
-            "notes": [
-                "Supports real-time progress reporting via context",
-                "Lower distances map to higher confidence scores",
-                "Generic subreddits (funny, pics, memes) are penalized unless directly searched",
-                "Batch mode returns results keyed by query for easy analysis"
-            ],
-            "examples": [] if not include_examples else [
-                {"query": "machine learning", "limit": 15},
-                {"query": "python web development", "limit": 10, "min_confidence": 0.6},
-                {"queries": ["machine learning", "deep learning", "neural networks"], "limit": 10},
-                {"queries": "[\"web framework\", \"api design\"]", "include_nsfw": False, "min_confidence": 0.5}
-            ]
-        },
-        "search_subreddit": {
-            "description": "Search for posts within a specific subreddit",
-            "parameters": {
-                "subreddit_name": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Exact subreddit name (without r/ prefix)",
-                    "tip": "Use exact name from discover_subreddits"
-                },
-                "query": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Search terms"
-                },
-                "sort": {
-                    "type": "enum",
-                    "options": ["relevance", "hot", "top", "new"],
-                    "default": "relevance",
-                    "description": "How to sort results"
-                },
-                "time_filter": {
-                    "type": "enum",
-                    "options": ["all", "year", "month", "week", "day"],
-                    "default": "all",
-                    "description": "Time period for results"
-                },
-                "limit": {
-                    "type": "integer",
-                    "default": 10,
-                    "range": [1, 100],
-                    "description": "Maximum number of results"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"subreddit_name": "MachineLearning", "query": "transformers", "limit": 20},
-                {"subreddit_name": "Python", "query": "async", "sort": "top", "time_filter": "month"}
-            ]
-        },
-        "fetch_posts": {
-            "description": "Get posts from a single subreddit",
-            "parameters": {
-                "subreddit_name": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Exact subreddit name (without r/ prefix)"
-                },
-                "listing_type": {
-                    "type": "enum",
-                    "options": ["hot", "new", "top", "rising"],
-                    "default": "hot",
-                    "description": "Type of posts to fetch"
-                },
-                "time_filter": {
-                    "type": "enum",
-                    "options": ["all", "year", "month", "week", "day"],
-                    "default": None,
-                    "description": "Time period (only for 'top' listing)"
-                },
-                "limit": {
-                    "type": "integer",
-                    "default": 10,
-                    "range": [1, 100],
-                    "description": "Number of posts to fetch"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"subreddit_name": "technology", "listing_type": "hot", "limit": 15},
-                {"subreddit_name": "science", "listing_type": "top", "time_filter": "week", "limit": 20}
-            ]
-        },
-        "fetch_multiple": {
-            "description": "Batch fetch from multiple subreddits efficiently",
-            "parameters": {
-                "subreddit_names": {
-                    "type": "array[string]",
-                    "required": True,
-                    "max_items": 10,
-                    "description": "List of subreddit names (without r/ prefix)",
-                    "tip": "Use names from discover_subreddits"
-                },
-                "listing_type": {
-                    "type": "enum",
-                    "options": ["hot", "new", "top", "rising"],
-                    "default": "hot",
-                    "description": "Type of posts to fetch"
-                },
-                "time_filter": {
-                    "type": "enum",
-                    "options": ["all", "year", "month", "week", "day"],
-                    "default": None,
-                    "description": "Time period (only for 'top' listing)"
-                },
-                "limit_per_subreddit": {
-                    "type": "integer",
-                    "default": 5,
-                    "range": [1, 25],
-                    "description": "Posts per subreddit"
-                }
-            },
-            "efficiency": {
-                "vs_individual": "70% fewer API calls",
-                "token_usage": "~500-1000 tokens per subreddit"
-            },
-            "examples": [] if not include_examples else [
-                {"subreddit_names": ["Python", "django", "flask"], "listing_type": "hot", "limit_per_subreddit": 5},
-                {"subreddit_names": ["MachineLearning", "deeplearning"], "listing_type": "top", "time_filter": "week", "limit_per_subreddit": 10}
-            ]
-        },
-        "fetch_comments": {
-            "description": "Get complete comment tree for a post",
-            "parameters": {
-                "submission_id": {
-                    "type": "string",
-                    "required_one_of": ["submission_id", "url"],
-                    "description": "Reddit post ID (e.g., '1abc234')"
-                },
-                "url": {
-                    "type": "string",
-                    "required_one_of": ["submission_id", "url"],
-                    "description": "Full Reddit URL to the post"
-                },
-                "comment_limit": {
-                    "type": "integer",
-                    "default": 100,
-                    "recommendation": "50-100 for analysis",
-                    "description": "Maximum comments to fetch"
-                },
-                "comment_sort": {
-                    "type": "enum",
-                    "options": ["best", "top", "new"],
-                    "default": "best",
-                    "description": "How to sort comments"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"submission_id": "1abc234", "comment_limit": 100},
-                {"url": "https://reddit.com/r/Python/comments/xyz789/", "comment_limit": 50, "comment_sort": "top"}
-            ]
-        },
-        "create_feed": {
-            "description": "Create a new feed with analysis and selected subreddits",
-            "parameters": {
-                "name": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Name for the feed (1-255 chars)"
-                },
-                "website_url": {
-                    "type": "string",
-                    "required": False,
-                    "description": "URL of the website being analyzed (optional)"
-                },
-                "analysis": {
-                    "type": "object",
-                    "required": False,
-                    "description": "Feed analysis data (optional)",
-                    "properties": {
-                        "description": "Description of topic/product/interest (10-1000 chars)",
-                        "audience_personas": "Array of persona tags (1-10 items)",
-                        "keywords": "Array of relevant keywords (1-50 items)"
-                    }
-                },
-                "selected_subreddits": {
-                    "type": "array[object]",
-                    "required": True,
-                    "min_items": 1,
-                    "max_items": 50,
-                    "description": "List of selected subreddits",
-                    "item_properties": {
-                        "name": "Subreddit name (1-100 chars)",
-                        "description": "Subreddit description (max 1000 chars)",
-                        "subscribers": "Number of subscribers (integer >= 0)",
-                        "confidence_score": "Relevance score (0.0-1.0)"
-                    }
-                }
-            },
-            "examples": [] if not include_examples else [
-                {
-                    "name": "AI Research Feed",
-                    "website_url": "https://example.com",
-                    "analysis": {
-                        "description": "AI-powered data analysis platform for businesses",
-                        "audience_personas": ["data scientists", "business analysts", "ML engineers"],
-                        "keywords": ["machine learning", "data analysis", "business intelligence"]
-                    },
-                    "selected_subreddits": [
-                        {"name": "MachineLearning", "description": "ML community", "subscribers": 2500000, "confidence_score": 0.85},
-                        {"name": "datascience", "description": "Data science discussions", "subscribers": 1200000, "confidence_score": 0.78}
-                    ]
-                }
-            ]
-        },
-        "list_feeds": {
-            "description": "List all feeds for the authenticated user",
-            "parameters": {
-                "limit": {
-                    "type": "integer",
-                    "required": False,
-                    "default": 50,
-                    "range": [1, 100],
-                    "description": "Maximum number of feeds to return"
-                },
-                "offset": {
-                    "type": "integer",
-                    "required": False,
-                    "default": 0,
-                    "description": "Number of feeds to skip (for pagination)"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"limit": 10, "offset": 0},
-                {"limit": 25, "offset": 50}
-            ]
-        },
-        "get_feed": {
-            "description": "Get a specific feed by ID",
-            "parameters": {
-                "feed_id": {
-                    "type": "string",
-                    "required": True,
-                    "description": "UUID of the feed to retrieve"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"feed_id": "550e8400-e29b-41d4-a716-446655440000"}
-            ]
-        },
-        "get_feed_config": {
-            "description": "Get configuration for a feed (subreddit names, settings)",
-            "parameters": {
-                "feed_id": {
-                    "type": "string",
-                    "required": True,
-                    "description": "UUID of the feed to get config for"
-                }
-            },
-            "returns": {
-                "profile_id": "UUID of the feed",
-                "profile_name": "Name of the feed",
-                "subreddits": "Array of subreddit names (strings)",
-                "show_nsfw": "Whether NSFW content is enabled",
-                "has_subreddits": "Whether feed has any subreddits configured"
-            },
-            "examples": [] if not include_examples else [
-                {"feed_id": "550e8400-e29b-41d4-a716-446655440000"}
-            ]
-        },
-        "update_feed": {
-            "description": "Update an existing feed (partial update - only include fields to change)",
-            "parameters": {
-                "feed_id": {
-                    "type": "string",
-                    "required": True,
-                    "description": "UUID of the feed to update"
-                },
-                "name": {
-                    "type": "string",
-                    "required": False,
-                    "description": "New name for the feed (1-255 chars)"
-                },
-                "website_url": {
-                    "type": "string",
-                    "required": False,
-                    "description": "Updated website URL"
-                },
-                "analysis": {
-                    "type": "object",
-                    "required": False,
-                    "description": "Updated feed analysis data"
-                },
-                "selected_subreddits": {
-                    "type": "array[object]",
-                    "required": False,
-                    "description": "Updated list of selected subreddits"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"feed_id": "550e8400-e29b-41d4-a716-446655440000", "name": "Updated Feed Name"},
-                {
-                    "feed_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "selected_subreddits": [
-                        {"name": "Python", "description": "Python programming", "subscribers": 1500000, "confidence_score": 0.9}
-                    ]
-                }
-            ]
-        },
-        "delete_feed": {
-            "description": "Delete a feed",
-            "parameters": {
-                "feed_id": {
-                    "type": "string",
-                    "required": True,
-                    "description": "UUID of the feed to delete"
-                }
-            },
-            "examples": [] if not include_examples else [
-                {"feed_id": "550e8400-e29b-41d4-a716-446655440000"}
-            ]
-        }
-    }
-    
-    if operation_id not in schemas:
-        return {
+    spec = get_operation(operation_id)
+    if spec is None:
+        return ToolResult(structured_content={
             "error": f"Unknown operation: {operation_id}",
-            "available": list(schemas.keys()),
+            "available": list(OPERATIONS),
             "hint": "Use discover_operations() first"
-        }
-    
-    return schemas[operation_id]
+        })
+
+    # Serialized once at startup; sent without building or copying a dict
+    return ToolResult(content=[TextContent(type="text", text=spec.get_schema_json(include_examples))])
 
 
 @mcp.tool(
@@ -691,84 +341,184 @@ async def execute_operation(
     """
     LAYER 3: Execute a Reddit operation.
     Only use after getting schema from get_operation_schema.
+    Every operation accepts timeout_seconds to override its default deadline.
     """
     # Phase 1: Accept context but don't use it yet
+    return await run_operation(operation_id, parameters, ctx)
 
-    # Normalize common parameter aliases
-    param_aliases = {"subreddit": "subreddit_name"}
-    for alias, canonical in param_aliases.items():
+
+@mcp.tool(
+    description="Execute several Reddit operations in one call, passing results between steps",
+    annotations={"readOnlyHint": False, "openWorldHint": True}
+)
+async def execute_operations(
+    operations: Annotated[
+        List[Dict[str, Any]],
+        "Steps: {id, operation, parameters, depends_on?, for_each?, return_data?}; "
+        "parameter values may be {\"$ref\": \"<step_id>.<path>\", \"limit\"?: n}"
+    ],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    LAYER 3 (batch): Execute a pipeline of operations in one call.
+
+    Steps run concurrently unless one references another's output, e.g.
+    discover → fetch → comments:
+
+        [
+            {"id": "discover", "operation": "discover_subreddits",
+             "parameters": {"query": "home espresso", "limit": 5}},
+            {"id": "posts", "operation": "fetch_multiple",
+             "parameters": {"subreddit_names": {"$ref": "discover.subreddits[*].name"}}},
+            {"id": "comments", "operation": "fetch_comments",
+             "for_each": {"submission_id": {"$ref": "posts.posts_by_subreddit.*[*].id", "limit": 5}},
+             "parameters": {"comment_limit": 30}}
+        ]
+
+    Paths walk the referenced step's data: key, [n], [a:b], and [*] or *
+    to fan out over lists/objects. for_each runs the operation once per value.
+    Set return_data=false on intermediate steps to keep the response small.
+    """
+    return await run_batch(
+        operations,
+        lambda operation_id, parameters: run_operation(operation_id, parameters, ctx),
+        known_operations=set(OPERATIONS) | set(OPERATION_ALIASES)
+    )
+
+
+# Operation ID aliases (map function names to operation IDs)
+OPERATION_ALIASES = {
+    "search_in_subreddit": "search_subreddit",
+    "fetch_subreddit_posts": "fetch_posts",
+    "fetch_multiple_subreddits": "fetch_multiple",
+    "fetch_submission_with_comments": "fetch_comments",
+}
+
+# Normalize common parameter aliases
+PARAM_ALIASES = {"subreddit": "subreddit_name"}
+
+
+async def run_operation(operation_id: str, parameters: Dict[str, Any], ctx: Context = None) -> Dict[str, Any]:
+    """
+    Run one registry operation under its deadline and wrap its result for the tool layer.
+
+    The deadline (the operation's default, or the caller's timeout_seconds)
+    applies to every Reddit, vector and feed call the operation makes. When
+    it passes, or the MCP request is cancelled, calls still in flight are
+    stopped at their next request. Reddit-backed operations are first
+    admitted per user (fair queuing on the shared quota), and rejected with
+    a retry-after when the user's queue is full.
+
+    Returns:
+        {"success": True, "data": ...} or {"success": False, "error": ...}
+    """
+    parameters = dict(parameters or {})
+    for alias, canonical in PARAM_ALIASES.items():
         if alias in parameters and canonical not in parameters:
             parameters[canonical] = parameters.pop(alias)
 
-    # Operation ID aliases (map function names to operation IDs)
-    operation_aliases = {
-        "search_in_subreddit": "search_subreddit",
-        "fetch_subreddit_posts": "fetch_posts",
-        "fetch_multiple_subreddits": "fetch_multiple",
-        "fetch_submission_with_comments": "fetch_comments",
-    }
-    operation_id = operation_aliases.get(operation_id, operation_id)
-
-    # Operation mapping
-    operations = {
-        "discover_subreddits": discover_subreddits,
-        "search_subreddit": search_in_subreddit,
-        "fetch_posts": fetch_subreddit_posts,
-        "fetch_multiple": fetch_multiple_subreddits,
-        "fetch_comments": fetch_submission_with_comments,
-        "create_feed": create_feed,
-        "list_feeds": list_feeds,
-        "get_feed": get_feed,
-        "get_feed_config": get_feed_config,
-        "update_feed": update_feed,
-        "delete_feed": delete_feed
-    }
+    operation_id = OPERATION_ALIASES.get(operation_id, operation_id)
 
-    if operation_id not in operations:
+    spec = get_operation(operation_id)
+    if spec is None:
         return {
             "success": False,
             "error": f"Unknown operation: {operation_id}",
-            "available_operations": list(operations.keys())
+            "available_operations": list(OPERATIONS)
         }
 
     try:
-        # Add reddit client and context to params for operations that need them
-        if operation_id in ["search_subreddit", "fetch_posts", "fetch_multiple", "fetch_comments"]:
-            params = {**parameters, "reddit": reddit, "ctx": ctx}
-        else:
-            params = {**parameters, "ctx": ctx}
-
-        # Execute operation with await for async operations
-        async_operations = [
-            "discover_subreddits", "fetch_multiple", "fetch_comments",
-            "create_feed", "list_feeds",
-            "get_feed", "get_feed_config", "update_feed", "delete_feed"
-        ]
-        if operation_id in async_operations:
-            result = await operations[operation_id](**params)
-        else:
-            result = operations[operation_id](**params)
+        seconds = spec.deadline_seconds(parameters.pop(TIMEOUT_PARAMETER, None))
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "recovery": f"Pass {TIMEOUT_PARAMETER} as seconds, at most {OPERATION_MAX_TIMEOUT_SECONDS:g}"
+        }
+
+    with deadline_scope(seconds) as deadline:
+        try:
+            # Add reddit client and context to params for operations that need them
+            if spec.needs_reddit:
+                params = {**parameters, "reddit": reddit, "ctx": ctx}
+            else:
+                params = {**parameters, "ctx": ctx}
+
+            # Reddit-backed operations wait their turn for the shared quota
+            if spec.reddit_cost:
+                admission = get_admission_controller().admit(
+                    admission_user(), spec.reddit_cost, timeout=deadline.remaining()
+                )
+            else:
+                admission = nullcontext()
+
+            # Await async operations; run blocking ones off the event loop.
+            # Operations that return partial results stop at the deadline
+            # themselves; the grace period bounds those that don't.
+            async with admission:
+                async with asyncio.timeout(deadline.remaining() + DEADLINE_GRACE_SECONDS):
+                    if spec.is_async:
+                        result = await spec.func(**params)
+                    else:
+                        result = await asyncio.to_thread(spec.func, **params)
+
+            # Check if result indicates an error (feed operations return {"error": "..."} on failure)
+            if isinstance(result, dict) and "error" in result:
+                envelope = {
+                    "success": False,
+                    "error": result.get("error"),
+                    "suggestion": result.get("suggestion", ""),
+                    "data": result
+                }
+                if deadline.expired:
+                    envelope.update(timeout_details(seconds))
+                return envelope
+
+            # Keep returned posts/comments for query_corpus
+            await record_operation_result(ctx, operation_id, result)
 
-        # Check if result indicates an error (feed operations return {"error": "..."} on failure)
-        if isinstance(result, dict) and "error" in result:
             return {
-                "success": False,
-                "error": result.get("error"),
-                "suggestion": result.get("suggestion", ""),
+                "success": True,
                 "data": result
             }
 
-        return {
-            "success": True,
-            "data": result
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "recovery": suggest_recovery(operation_id, e)
-        }
+        except AdmissionRejected as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "status_code": 429,
+                "retry_after_seconds": e.retry_after,
+                "recovery": f"Your Reddit capacity is in use - retry after {e.retry_after}s or run fewer operations at once"
+            }
+        except TimeoutError:
+            deadline.cancel()
+            return {
+                "success": False,
+                "error": f"Operation {operation_id} did not finish within {seconds:g}s",
+                **timeout_details(seconds)
+            }
+        except asyncio.CancelledError:
+            # Client cancelled the request: stop the operation's remaining calls
+            deadline.cancel()
+            raise
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "recovery": suggest_recovery(operation_id, e)
+            }
+        finally:
+            # Worker threads still running stop at their next outbound call
+            deadline.cancel()
+
+
+def timeout_details(seconds: float) -> Dict[str, Any]:
+    """Envelope fields for an operation that ran out of time."""
+    if seconds < OPERATION_MAX_TIMEOUT_SECONDS:
+        recovery = f"Retry with a larger {TIMEOUT_PARAMETER} (max {OPERATION_MAX_TIMEOUT_SECONDS:g}) or a smaller limit"
+    else:
+        recovery = "Reduce limit/depth or split the work into several operations"
+    return {"timed_out": True, "status_code": 504, "recovery": recovery}
 
 
 def suggest_recovery(operation_id: str, error: Exception) -> str:
@@ -791,6 +541,13 @@ def suggest_recovery(operation_id: str, error: Exception) -> str:
 RESEARCH_WORKFLOW_PROMPT = """
 You are conducting comprehensive Reddit research based on this request: "{research_request}"
 
+## FAST PATH:
+execute_operation("research", {{"topic": "<topic from request>", "depth": "standard"}}) runs
+phases 1-4 below inside the server and returns posts with top comments, permalinks and
+scores. Use it first; fall back to the step-by-step workflow to dig deeper.
+Everything fetched is kept for the session: execute_operation("query_corpus", {{"keyword": "...",
+"min_score": 10}}) filters it by subreddit, score, date or keyword without re-fetching.
+
 ## WORKFLOW TO FOLLOW:
 
 ### PHASE 1: DISCOVERY
@@ -927,8 +684,9 @@ def reddit_research(research_request: str) -> List[Message]:
     ]
 
 
-def main():
-    """Main entry point for the server."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the server (stdio by default; see src/serve.py for HTTP)."""
+    args = parse_args(argv)
     print("Reddit MCP Server starting...", flush=True)
     
     # Try to initialize the Reddit client with available configuration
@@ -942,8 +700,23 @@ def main():
         print("  1. Environment variables: REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT", flush=True)
         print("  2. Config file: .mcp-config.json", flush=True)
     
-    # Run with stdio transport
-    mcp.run()
+    # Load the related-subreddit graph up front so the first lookup is instant
+    graph = get_related_graph()
+    if graph is not None:
+        print(f"Related-subreddit graph loaded ({len(graph)} subreddits)", flush=True)
+
+    # With a persistent cache, the subreddit catalog loads from disk instead of the proxy
+    catalog = get_subreddit_catalog()
+    if catalog.load_snapshot("dialog-app-prod-db"):
+        print(f"Subreddit catalog loaded from cache ({len(catalog)} subreddits)", flush=True)
+    # Workers open their own cache connections
+    close_cache_backend()
+
+    if args.transport == "stdio":
+        mcp.run()
+    else:
+        # Everything above is loaded before workers are forked
+        serve_http(mcp, args)
 
 
 if __name__ == "__main__":
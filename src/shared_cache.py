@@ -0,0 +1,660 @@
+"""
+Pluggable cache backends shared across workers and pods.
+
+Response caches (listings, comment trees, discovery results, the subreddit
+metadata catalog, feed documents) go through SharedCache, a namespaced view
+over one process-wide backend chosen by CACHE_BACKEND:
+
+- ``memory``: in-process LRU bounded by bytes (the default; per worker)
+- ``sqlite``: one persistent SQLite file in WAL mode, shared by every
+  worker on a host; it survives restarts, so a redeploy starts warm
+- ``redis``: any Redis-protocol server (Redis, Valkey, KeyDB, Dragonfly),
+  shared by every worker and pod; needs ``pip install "reddit-research-mcp[redis]"``
+
+Values are stored as compact JSON, zlib-compressed above
+CACHE_COMPRESS_MIN_BYTES, behind a one-byte format tag. Every backend
+honours per-entry TTLs. The memory and SQLite backends evict least recently
+used entries past CACHE_MAX_BYTES; a Redis server evicts by its own
+``maxmemory`` policy. A failing backend (Redis down, disk full) is
+treated as a miss and skipped for CACHE_BACKEND_RETRY_SECONDS instead of
+failing the operation.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_MAX_ENTRY_BYTES = int(os.getenv("CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024)))   # Larger values are not cached
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", os.path.join(".cache", "reddit-mcp-cache.sqlite3"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", "0.5"))
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "reddit-mcp")
+CACHE_COMPRESS_MIN_BYTES = 512
+CACHE_BACKEND_RETRY_SECONDS = 30   # Skip a failing backend this long before trying again
+SQLITE_EVICT_EVERY = 100           # Writes between size checks
+CACHE_SQLITE_MMAP_BYTES = int(os.getenv("CACHE_SQLITE_MMAP_BYTES", str(256 * 1024 * 1024)))   # Memory-mapped read window
+CACHE_WRITE_FLUSH_SECONDS = float(os.getenv("CACHE_WRITE_FLUSH_SECONDS", "0.5"))   # Longest a buffered write waits
+CACHE_WRITE_BATCH_SIZE = int(os.getenv("CACHE_WRITE_BATCH_SIZE", "64"))            # Buffered writes that trigger a flush
+
+# Serialization format tags
+_RAW_JSON = b"\x00"
+_ZLIB_JSON = b"\x01"
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a JSON-compatible value to compact bytes.
+
+    Raises:
+        TypeError, ValueError: If the value is not JSON-serializable
+    """
+    data = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(data) >= CACHE_COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(data, 6)
+        if len(compressed) < len(data):
+            return _ZLIB_JSON + compressed
+    return _RAW_JSON + data
+
+
+def decode_value(data: bytes) -> Any:
+    """
+    Inverse of encode_value.
+
+    Raises:
+        ValueError: For an unknown format tag or corrupt data
+    """
+    tag, payload = data[:1], data[1:]
+    if tag == _ZLIB_JSON:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt cache entry: {e}") from e
+    elif tag != _RAW_JSON:
+        raise ValueError(f"Unknown cache entry format: {tag!r}")
+    return json.loads(payload)
+
+
+def cache_key(key: Hashable) -> str:
+    """String form of a cache key (tuples become compact JSON arrays)."""
+    if isinstance(key, str):
+        return key
+    return json.dumps(key, separators=(",", ":"), sort_keys=True, default=str)
+
+
+class CacheBackend(ABC):
+    """
+    Byte store with namespaces and per-entry TTLs.
+
+    Subclasses implement get/set/delete/clear; ``stats()`` and ``close()``
+    have defaults.
+    """
+
+    name = "base"
+    _failed_until = 0.0   # Set by SharedCache while the backend is failing
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Stored bytes, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: float) -> None:
+        """Store bytes for ``ttl_seconds``."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop one namespace, or everything."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU bounded by total bytes."""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get((namespace, key))
+            if item is None:
+                return None
+            expires_at, data = item
+            if expires_at <= self._clock():
+                self._remove((namespace, key))
+                return None
+            self._entries.move_to_end((namespace, key))
+            return data
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._remove((namespace, key))
+            self._entries[(namespace, key)] = (self._clock() + ttl_seconds, data)
+            self._bytes += len(data)
+            if self._bytes > self.max_bytes:
+                self._purge_expired()
+                while self._bytes > self.max_bytes and self._entries:
+                    self._remove(next(iter(self._entries)))
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._remove((namespace, key))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for entry_key in [k for k in self._entries if k[0] == namespace]:
+                self._remove(entry_key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+    def _remove(self, entry_key: Tuple[str, str]) -> None:
+        """Drop an entry (caller holds the lock)."""
+        item = self._entries.pop(entry_key, None)
+        if item is not None:
+            self._bytes -= len(item[1])
+
+    def _purge_expired(self) -> None:
+        """Drop expired entries (caller holds the lock)."""
+        now = self._clock()
+        for entry_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            self._remove(entry_key)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Persistent SQLite file shared by every worker process on a host.
+
+    WAL mode lets readers proceed while one process writes, and reads go
+    through a memory-mapped view of the file (PRAGMA mmap_size). Writes and
+    LRU access-time updates are buffered and committed in one transaction
+    per batch by a background writer: every CACHE_WRITE_FLUSH_SECONDS, or as
+    soon as CACHE_WRITE_BATCH_SIZE writes are waiting. Buffered writes are
+    visible to this process immediately. Deletes and clears are applied at
+    once, so invalidations reach other workers without delay; they wait for
+    a flush in progress, so a batch taken before them cannot write the
+    entry back.
+
+    Expiry is wall-clock time, so entries keep their remaining lifetime
+    across restarts. Expired entries are purged when the file is opened, and
+    the cache starts warm with everything still live. Each thread (and each
+    forked process) gets its own connection.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str = CACHE_SQLITE_PATH,
+        max_bytes: int = CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+        flush_seconds: float = CACHE_WRITE_FLUSH_SECONDS,
+        batch_size: int = CACHE_WRITE_BATCH_SIZE
+    ):
+        """
+        Args:
+            path: Database file (created with its directory if missing)
+            max_bytes: Total value size before LRU eviction
+            clock: Wall clock, injectable for tests
+            flush_seconds: Longest a buffered write waits (0: write through)
+            batch_size: Buffered writes that trigger an early flush
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: List[Tuple[int, sqlite3.Connection]] = []
+        self._writes = 0
+
+        # Buffered writes: (namespace, key) -> (value, expires_at, accessed_at); value None = access-time update only
+        self._pending: Dict[Tuple[str, str], Tuple[Optional[bytes], float, float]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at)")
+        # Entries that expired while the server was down
+        self.evict()
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (reopened after a fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(CACHE_SQLITE_MMAP_BYTES)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            self._connections.append((os.getpid(), conn))
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        now = self._clock()
+        entry_key = (namespace, key)
+        with self._pending_lock:
+            pending = self._pending.get(entry_key)
+            if pending is not None and pending[0] is not None:
+                if pending[1] <= now:
+                    del self._pending[entry_key]
+                    return None
+                self._pending[entry_key] = (pending[0], pending[1], now)
+                return pending[0]
+
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+            entry_key
+        ).fetchone()
+        if row is None or row[1] <= now:
+            # Expired rows are removed by the next eviction pass
+            return None
+        self._buffer(entry_key, (None, row[1], now))
+        return bytes(row[0])
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: float) -> None:
+        now = self._clock()
+        self._buffer((namespace, key), (data, now + ttl_seconds, now))
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._flush_lock:
+            with self._pending_lock:
+                self._pending.pop((namespace, key), None)
+            self._connection().execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._flush_lock:
+            with self._pending_lock:
+                if namespace is None:
+                    self._pending.clear()
+                else:
+                    for entry_key in [k for k in self._pending if k[0] == namespace]:
+                        del self._pending[entry_key]
+            if namespace is None:
+                self._connection().execute("DELETE FROM cache_entries")
+            else:
+                self._connection().execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    def flush(self) -> None:
+        """Commit buffered writes and access-time updates in one transaction."""
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            writes = [(ns, key, value, len(value), expires_at, accessed_at)
+                      for (ns, key), (value, expires_at, accessed_at) in batch.items() if value is not None]
+            touches = [(accessed_at, ns, key)
+                       for (ns, key), (value, _, accessed_at) in batch.items() if value is None]
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    writes
+                )
+                conn.executemany(
+                    "UPDATE cache_entries SET accessed_at = MAX(accessed_at, ?) WHERE namespace = ? AND key = ?",
+                    touches
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.warning("Dropped %d buffered cache writes: %s", len(batch), e)
+                return
+
+            previous, self._writes = self._writes, self._writes + len(writes)
+            if self._writes // SQLITE_EVICT_EVERY != previous // SQLITE_EVICT_EVERY:
+                self.evict()
+
+    def evict(self) -> None:
+        """Drop expired entries, then least recently used ones past ``max_bytes``."""
+        conn = self._connection()
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (self._clock(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        while total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT namespace, key, size FROM cache_entries ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for namespace, key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                victims.append((namespace, key))
+                total -= size
+            conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+
+    def stats(self) -> Dict[str, Any]:
+        self.flush()
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        return {"backend": self.name, "path": self.path, "entries": entries, "bytes": size, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        """Flush buffered writes, stop the writer and close this process's connections."""
+        self._stopped = True
+        self._wake.set()
+        writer = self._writer
+        if writer is not None and self._writer_pid == os.getpid() and writer is not threading.current_thread():
+            writer.join(timeout=5)
+        self.flush()
+        pid = os.getpid()
+        for owner, conn in self._connections:
+            if owner == pid:
+                conn.close()
+        self._connections = []
+        self._local = threading.local()
+
+    def _buffer(self, entry_key: Tuple[str, str], item: Tuple[Optional[bytes], float, float]) -> None:
+        """Queue a write for the next batch (or write through without batching)."""
+        with self._pending_lock:
+            current = self._pending.get(entry_key)
+            if item[0] is None and current is not None:
+                # An access-time update never replaces a buffered value
+                item = (current[0], current[1], item[2])
+            self._pending[entry_key] = item
+            waiting = len(self._pending)
+        if self.flush_seconds <= 0 or self._stopped:
+            self.flush()
+            return
+        self._ensure_writer()
+        if waiting >= self.batch_size:
+            self._wake.set()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer in this process if it isn't running."""
+        if self._writer is not None and self._writer_pid == os.getpid() and self._writer.is_alive():
+            return
+        with self._flush_lock:
+            if self._writer is not None and self._writer_pid == os.getpid() and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(target=self._write_loop, name="cache-writer", daemon=True)
+            self._writer_pid = os.getpid()
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("Cache writer failed: %s", e)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Redis-protocol server shared by every worker and pod.
+
+    Keys are ``{prefix}:{namespace}:{key}`` with native expiry; eviction
+    follows the server's ``maxmemory-policy`` (allkeys-lru recommended).
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str = CACHE_REDIS_URL, prefix: str = CACHE_KEY_PREFIX, client=None):
+        """
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError(
+                    'CACHE_BACKEND=redis needs the redis package: pip install "reddit-research-mcp[redis]"'
+                ) from e
+            client = redis.Redis.from_url(
+                url,
+                socket_timeout=CACHE_REDIS_TIMEOUT,
+                socket_connect_timeout=CACHE_REDIS_TIMEOUT
+            )
+        self.url = url
+        self.prefix = prefix
+        self._client = client
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        return self._client.get(self._key(namespace, key))
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: float) -> None:
+        self._client.set(self._key(namespace, key), data, px=max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._client.delete(self._key(namespace, key))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        pattern = f"{self.prefix}:*" if namespace is None else f"{self.prefix}:{namespace}:*"
+        batch = []
+        for key in self._client.scan_iter(match=pattern, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self._client.unlink(*batch)
+                batch = []
+        if batch:
+            self._client.unlink(*batch)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_cache_backend(kind: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    Backend for a CACHE_BACKEND value.
+
+    Falls back to the memory backend (with a warning) for unknown kinds or
+    when the chosen backend cannot be opened.
+    """
+    try:
+        if kind == "sqlite":
+            return SQLiteBackend()
+        if kind == "redis":
+            return RedisBackend()
+        if kind != "memory":
+            logger.warning("Unknown CACHE_BACKEND %r; using the memory backend", kind)
+    except Exception as e:
+        logger.warning("Cache backend %r unavailable (%s); using the memory backend", kind, e)
+    return MemoryBackend()
+
+
+class SharedCache:
+    """
+    Namespaced, TTL'd view over the process-wide cache backend.
+
+    Same get/set/delete/clear interface as TTLCache, but values must be
+    JSON-compatible and every ``get`` returns a fresh copy. Backend errors
+    count as misses.
+
+    Usage:
+        listings = SharedCache("listings", ttl_seconds=300)
+        listings.set(("python", "hot", None), {"posts": [...]})
+        entry = listings.get(("python", "hot", None))
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: float, backend: Optional[CacheBackend] = None):
+        """
+        Args:
+            namespace: Key namespace (one per cache)
+            ttl_seconds: Default time-to-live for new entries
+            backend: Fixed backend (default: the process-wide one)
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend or get_cache_backend()
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """
+        Get a live entry.
+
+        Args:
+            key: Cache key (string or tuple)
+            default: Value returned on a miss
+            count: Whether to record the hit/miss in the stats
+
+        Returns:
+            A copy of the cached value, or default if missing, expired or unreadable
+        """
+        data = self._call("get", self.namespace, cache_key(key))
+        value = default
+        if data is not None:
+            try:
+                value = decode_value(data)
+            except ValueError as e:
+                logger.warning("Dropping unreadable %s cache entry: %s", self.namespace, e)
+                self._call("delete", self.namespace, cache_key(key))
+                data = None
+        if count:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value (skipped if it is not JSON-serializable or too large).
+
+        Args:
+            key: Cache key (string or tuple)
+            value: JSON-compatible value
+            ttl_seconds: Override the default time-to-live for this entry
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        try:
+            data = encode_value(value)
+        except (TypeError, ValueError) as e:
+            logger.warning("Not caching unserializable %s entry: %s", self.namespace, e)
+            return
+        if len(data) > CACHE_MAX_ENTRY_BYTES:
+            return
+        self._call("set", self.namespace, cache_key(key), data, ttl)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        self._call("delete", self.namespace, cache_key(key))
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace."""
+        self._call("clear", self.namespace)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this namespace plus backend stats."""
+        backend_stats = self._call("stats") or {"backend": self.backend.name}
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            **backend_stats
+        }
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Run a backend method, treating failures as misses and backing off."""
+        backend = self.backend
+        if time.monotonic() < getattr(backend, "_failed_until", 0.0):
+            return None
+        try:
+            return getattr(backend, method)(*args)
+        except Exception as e:
+            self.errors += 1
+            backend._failed_until = time.monotonic() + CACHE_BACKEND_RETRY_SECONDS
+            logger.warning(
+                "%s cache backend failed (%s: %s); bypassing it for %ds",
+                backend.name, type(e).__name__, e, CACHE_BACKEND_RETRY_SECONDS
+            )
+            return None
+
+
+_cache_backend: Optional[CacheBackend] = None
+_cache_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the process-wide cache backend, creating it on first use."""
+    global _cache_backend
+    if _cache_backend is None:
+        with _cache_backend_lock:
+            if _cache_backend is None:
+                _cache_backend = create_cache_backend()
+    return _cache_backend
+
+
+def close_cache_backend() -> None:
+    """Flush and close the cache backend; it is reopened on next use (e.g. in a forked worker)."""
+    reset_cache_backend()
+
+
+def reset_cache_backend(backend: Optional[CacheBackend] = None) -> None:
+    """Close and replace the cache backend (None: recreate on next use; for tests)."""
+    global _cache_backend
+    with _cache_backend_lock:
+        if _cache_backend is not None and _cache_backend is not backend:
+            try:
+                _cache_backend.close()
+            except Exception:
+                pass
+        _cache_backend = backend
@@ -6,6 +6,8 @@ Export key classes and functions for public API.
 from .discover import (
     discover_subreddits,
     validate_subreddit,
+    validate_subreddits,
+    related_subreddits,
     SearchConfig,
     DEFAULT_SEARCH_CONFIG,
     calculate_confidence_from_distance,
@@ -16,14 +18,20 @@ from .feed import (
     create_feed,
     list_feeds,
     get_feed,
+    fetch_feed_posts,
     update_feed,
     delete_feed,
 )
 
+from .research import research
+from .corpus import query_corpus
+
 __all__ = [
     # Reddit discovery
     "discover_subreddits",
     "validate_subreddit",
+    "validate_subreddits",
+    "related_subreddits",
     "SearchConfig",
     "DEFAULT_SEARCH_CONFIG",
     "calculate_confidence_from_distance",
@@ -32,6 +40,11 @@ __all__ = [
     "create_feed",
     "list_feeds",
     "get_feed",
+    "fetch_feed_posts",
     "update_feed",
     "delete_feed",
+    # Research pipeline
+    "research",
+    # Session corpus
+    "query_corpus",
 ]
@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any, Literal, List
+import os
+from typing import Optional, Dict, Any, Literal, List, Tuple
 import praw
 from praw.models import Submission, Comment as PrawComment, MoreComments
 from prawcore import (
@@ -10,6 +11,32 @@ from prawcore import (
 )
 from fastmcp import Context
 from ..models import SubmissionWithCommentsResult, RedditPost, Comment
+from ..progress import ProgressReporter
+from ..shared_cache import SharedCache
+
+# Comment trees change quickly on active posts, so they are only shared briefly
+COMMENT_CACHE_TTL_SECONDS = float(os.getenv("COMMENT_CACHE_TTL_SECONDS", "120"))
+_comment_cache = SharedCache("comments", ttl_seconds=COMMENT_CACHE_TTL_SECONDS)
+
+
+def _comment_cache_key(
+    submission_id: Optional[str],
+    url: Optional[str],
+    comment_sort: str,
+    comment_limit: int
+) -> Optional[Tuple]:
+    """Cache key for a comment tree request, or None if the URL can't be resolved."""
+    if not submission_id:
+        try:
+            submission_id = Submission.id_from_url(url)
+        except Exception:
+            return None
+    return (submission_id, comment_sort, comment_limit)
+
+
+def clear_comment_cache() -> None:
+    """Drop all cached comment trees (useful for testing)."""
+    _comment_cache.clear()
 
 
 def parse_comment_tree(
@@ -78,6 +105,12 @@ async def fetch_submission_with_comments(
         # Validate that we have either submission_id or url
         if not submission_id and not url:
             return {"error": "Either submission_id or url must be provided"}
+
+        # Same tree fetched recently (by any worker on a shared cache backend)
+        cache_key = _comment_cache_key(submission_id, url, comment_sort, comment_limit)
+        cached = _comment_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
         
         # Get submission
         try:
@@ -151,7 +184,8 @@ async def fetch_submission_with_comments(
         # Parse comments
         comments = []
         comment_count = 0
-        
+        progress = ProgressReporter(ctx, total=comment_limit)
+
         for top_level_comment in submission.comments:
             # In tests, we might get regular Mock objects instead of PrawComment
             # Check if it has the required attributes
@@ -159,13 +193,8 @@ async def fetch_submission_with_comments(
                 if comment_count >= comment_limit:
                     break
 
-                # Report progress before processing comment
-                if ctx:
-                    await ctx.report_progress(
-                        progress=comment_count,
-                        total=comment_limit,
-                        message=f"Loading comments ({comment_count}/{comment_limit})"
-                    )
+                # Report progress before processing comment (throttled)
+                progress.update(comment_count, f"Loading comments ({comment_count}/{comment_limit})")
 
                 if isinstance(top_level_comment, PrawComment):
                     comments.append(parse_comment_tree(top_level_comment, ctx=ctx))
@@ -183,21 +212,21 @@ async def fetch_submission_with_comments(
                 # Count all comments including replies
                 comment_count += 1 + count_replies(comments[-1])
 
-        # Report final completion
-        if ctx:
-            await ctx.report_progress(
-                progress=comment_count,
-                total=comment_limit,
-                message=f"Completed: {comment_count} comments loaded"
-            )
+        # Report final completion (always sent)
+        await progress.finish(
+            progress=comment_count,
+            message=f"Completed: {comment_count} comments loaded"
+        )
 
         result = SubmissionWithCommentsResult(
             submission=submission_data,
             comments=comments,
             total_comments_fetched=comment_count
-        )
-        
-        return result.model_dump()
+        ).model_dump()
+        if cache_key:
+            _comment_cache.set(cache_key, result)
+
+        return result
         
     except TooManyRequests as e:
         return {
@@ -0,0 +1,137 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from fastmcp import Context
+
+from ..corpus import get_corpus_store, session_key
+
+QUERY_MAX_LIMIT = 100
+
+_SORT_KEYS = {
+    "score": lambda r: r.get("score") or 0,
+    "comments": lambda r: r.get("num_comments") or 0,
+    "new": lambda r: r.get("created_utc") or 0,
+    "old": lambda r: -(r.get("created_utc") or 0),
+}
+
+
+def parse_date(value: Union[str, int, float, None]) -> Optional[float]:
+    """
+    Epoch seconds for a date bound.
+
+    Accepts epoch seconds or an ISO date/datetime (naive values are UTC).
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def query_corpus(
+    kind: Optional[Literal["post", "comment"]] = None,
+    subreddit: Optional[Union[List[str], str]] = None,
+    keyword: Optional[str] = None,
+    min_score: Optional[int] = None,
+    since: Optional[Union[str, float]] = None,
+    until: Optional[Union[str, float]] = None,
+    post_id: Optional[str] = None,
+    sort: Literal["score", "new", "old", "comments"] = "score",
+    limit: int = 25,
+    offset: int = 0,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Filter, sort and page over the posts and comments this session has fetched.
+
+    Reads only the session's corpus, which every operation that returns
+    posts or comments adds to - no Reddit calls.
+
+    Args:
+        kind: Only posts or only comments
+        subreddit: Subreddit name or names (case-insensitive)
+        keyword: Words that must all appear in the title or text (case-insensitive)
+        min_score: Minimum score
+        since: Earliest creation time (ISO date/datetime or epoch seconds)
+        until: Latest creation time (ISO date/datetime or epoch seconds)
+        post_id: Only this post and its comments
+        sort: Sort order
+        limit: Records per page (max 100)
+        offset: Records to skip (use next_offset from the previous page)
+        ctx: FastMCP context (auto-injected by decorator)
+
+    Returns:
+        Dictionary with the matching records for this page, the total match
+        count, next_offset (None on the last page) and corpus statistics
+    """
+    if sort not in _SORT_KEYS:
+        return {"error": f"Unknown sort '{sort}'", "suggestion": f"Use one of: {', '.join(_SORT_KEYS)}"}
+    try:
+        since_ts = parse_date(since)
+        until_ts = parse_date(until)
+    except ValueError:
+        return {
+            "error": "since/until must be an ISO date (e.g. '2024-05-01') or epoch seconds",
+            "suggestion": "Use a date like '2024-05-01' or '2024-05-01T12:00:00Z'"
+        }
+
+    corpus = get_corpus_store().get(session_key(ctx))
+    if corpus is None:
+        return {
+            "records": [],
+            "total": 0,
+            "offset": offset,
+            "next_offset": None,
+            "corpus": {"posts": 0, "comments": 0},
+            "hint": "The corpus is empty - fetch posts or comments first (fetch_multiple, fetch_comments, research)"
+        }
+
+    subreddits = [subreddit] if isinstance(subreddit, str) else list(subreddit or [])
+    subreddits = {name.lower().replace("r/", "").strip() for name in subreddits if name}
+    words = keyword.lower().split() if keyword else []
+
+    def matches(record: Dict[str, Any]) -> bool:
+        if kind and record["kind"] != kind:
+            return False
+        if subreddits and (record.get("subreddit") or "").lower() not in subreddits:
+            return False
+        if min_score is not None and (record.get("score") or 0) < min_score:
+            return False
+        created = record.get("created_utc")
+        if since_ts is not None and (created is None or created < since_ts):
+            return False
+        if until_ts is not None and (created is None or created > until_ts):
+            return False
+        if post_id and record["id"] != post_id and record.get("post_id") != post_id:
+            return False
+        if words:
+            haystack = f"{record.get('title') or ''} {record.get('text') or ''}".lower()
+            if not all(word in haystack for word in words):
+                return False
+        return True
+
+    matched = [record for record in corpus.records() if matches(record)]
+    matched.sort(key=_SORT_KEYS[sort], reverse=True)
+
+    limit = min(max(1, limit), QUERY_MAX_LIMIT)
+    offset = max(0, offset)
+    page = matched[offset:offset + limit]
+    next_offset = offset + limit if offset + limit < len(matched) else None
+
+    return {
+        "records": page,
+        "total": len(matched),
+        "offset": offset,
+        "next_offset": next_offset,
+        "corpus": corpus.stats()
+    }
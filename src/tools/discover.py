@@ -2,11 +2,19 @@
 
 import os
 import json
+import math
+import asyncio
+import secrets
 import statistics
-from typing import Dict, List, Optional, Union, Any
+import threading
+from typing import Dict, List, Literal, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from fastmcp import Context
 from ..chroma_client import get_chroma_client, get_collection
+from ..shared_cache import SharedCache
+from ..catalog import SubredditCatalog, get_subreddit_catalog, normalize_subreddit_name
+from ..progress import ProgressReporter
+from ..related import get_related_graph
 
 
 @dataclass
@@ -36,9 +44,17 @@ class SearchConfig:
     SMALL_SUB_PENALTY_MULTIPLIER: float = 0.9  # Penalty factor for small subs
 
     # Search behavior
-    SEARCH_MULTIPLIER: int = 3                 # Fetch 3x limit for filtering
+    SEARCH_MULTIPLIER: int = 3                 # Initial over-fetch factor, before filter rates are learned
+    MIN_SEARCH_MULTIPLIER: float = 1.2         # Floor for the learned over-fetch factor
+    MAX_SEARCH_MULTIPLIER: float = 10.0        # Ceiling for the learned over-fetch factor
+    OVERFETCH_SAFETY_MARGIN: float = 1.25      # Extra headroom over the observed keep rate
     MAX_SEARCH_RESULTS: int = 100              # Hard cap on returned results
 
+    # Hybrid (lexical + semantic) fusion
+    RRF_K: int = 60                            # Reciprocal rank fusion damping constant
+    LEXICAL_EXACT_CONFIDENCE: float = 0.95     # Confidence for exact subreddit-name matches
+    LEXICAL_MAX_CONFIDENCE: float = 0.7        # Ceiling for other lexical-only matches
+
     def __post_init__(self):
         """Initialize default values for mutable fields."""
         if self.GENERIC_SUBREDDITS is None:
@@ -60,6 +76,86 @@ class SearchConfig:
 # Global default configuration
 DEFAULT_SEARCH_CONFIG = SearchConfig()
 
+# Only the fields scoring needs - documents and embeddings stay on the proxy
+VECTOR_QUERY_INCLUDE = ["metadatas", "distances"]
+
+
+class OverfetchEstimator:
+    """
+    Learns how many vector results survive client-side filtering.
+
+    Filters the proxy can apply safely (a minimum subscriber count) are
+    pushed down as ``where`` clauses; the rest (NSFW, maximum subscribers,
+    min_confidence after penalties and boosts) are applied here, so we
+    over-fetch. The factor starts at
+    SEARCH_MULTIPLIER and then tracks an exponentially weighted keep rate
+    per filter setting.
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self._keep_rates: Dict[Any, float] = {}
+
+    def factor(self, key: Any, config: SearchConfig) -> float:
+        """Over-fetch factor to use for a filter setting."""
+        keep_rate = self._keep_rates.get(key)
+        if keep_rate is None:
+            return float(config.SEARCH_MULTIPLIER)
+        factor = config.OVERFETCH_SAFETY_MARGIN / max(keep_rate, 0.01)
+        return max(config.MIN_SEARCH_MULTIPLIER, min(config.MAX_SEARCH_MULTIPLIER, factor))
+
+    def observe(self, key: Any, fetched: int, kept: int) -> None:
+        """Record how many of ``fetched`` results passed client-side filters."""
+        if fetched <= 0:
+            return
+        keep_rate = kept / fetched
+        previous = self._keep_rates.get(key)
+        if previous is None:
+            self._keep_rates[key] = keep_rate
+        else:
+            self._keep_rates[key] = previous + self.alpha * (keep_rate - previous)
+
+
+_overfetch = OverfetchEstimator()
+
+# Ranking strategies for merged batch discovery
+MERGE_STRATEGIES = ("rrf", "max_confidence")
+
+# Server-side result handles for paginated discovery (shared, so any worker can serve a cursor)
+RESULT_HANDLE_TTL_SECONDS = 600
+_result_handles = SharedCache("discovery_handles", ttl_seconds=RESULT_HANDLE_TTL_SECONDS)
+
+# Raw vector query responses; the index changes far more slowly than this
+VECTOR_CACHE_TTL_SECONDS = float(os.getenv("DISCOVERY_CACHE_TTL_SECONDS", "900"))
+_vector_results = SharedCache("discovery", ttl_seconds=VECTOR_CACHE_TTL_SECONDS)
+
+
+def build_where_clause(
+    include_nsfw: bool = False,
+    min_subscribers: Optional[int] = None,
+    max_subscribers: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a Chroma metadata filter for the filters the proxy can apply.
+
+    Chroma drops records that lack a filtered field, and records without
+    ``nsfw`` or ``subscribers`` metadata count as SFW with 0 subscribers
+    here. So only filters that already exclude such records are pushed
+    down (``min_subscribers`` above 0); the NSFW and maximum-subscriber
+    filters are applied client-side by _passes_filters.
+
+    Args:
+        include_nsfw: Whether NSFW subreddits are allowed
+        min_subscribers: Minimum subscriber count (inclusive)
+        max_subscribers: Maximum subscriber count (inclusive)
+
+    Returns:
+        Chroma ``where`` clause, or None when nothing is filtered
+    """
+    if min_subscribers is not None and min_subscribers > 0:
+        return {"subscribers": {"$gte": min_subscribers}}
+    return None
+
 
 def classify_match_tier(distance: float, config: SearchConfig = None) -> str:
     """
@@ -221,14 +317,20 @@ async def discover_subreddits(
     limit: int = 10,
     include_nsfw: bool = False,
     min_confidence: float = 0.0,
+    min_subscribers: Optional[int] = None,
+    max_subscribers: Optional[int] = None,
+    cursor: Optional[str] = None,
+    merge: bool = False,
+    merge_strategy: Literal["rrf", "max_confidence"] = "rrf",
     config: Optional[SearchConfig] = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """
-    Search for subreddits using semantic similarity search.
+    Search for subreddits using hybrid semantic and lexical search.
 
     Finds relevant subreddits based on semantic embeddings of subreddit names,
-    descriptions, and community metadata.
+    descriptions, and community metadata, fused with local exact-name,
+    name-fragment and acronym matches.
 
     Args:
         query: Single search term to find subreddits
@@ -237,6 +339,15 @@ async def discover_subreddits(
         limit: Maximum number of results per query (default 10)
         include_nsfw: Whether to include NSFW subreddits (default False)
         min_confidence: Minimum confidence score to include (0.0-1.0, default 0.0)
+        min_subscribers: Only include subreddits with at least this many subscribers
+        max_subscribers: Only include subreddits with at most this many subscribers
+        cursor: Cursor from a previous result; returns its next page from the
+                server-side result store (a vector query runs only to extend a
+                list whose stored candidates run out)
+        merge: With ``queries``, return one deduplicated ranked list instead of
+               a list per query; ``limit`` then caps the merged list
+        merge_strategy: "rrf" (reciprocal rank fusion, default) or
+                        "max_confidence" (best confidence across queries)
         config: SearchConfig instance for tuning behavior (uses defaults if None)
         ctx: FastMCP context (auto-injected by decorator)
 
@@ -246,9 +357,27 @@ async def discover_subreddits(
     if config is None:
         config = DEFAULT_SEARCH_CONFIG
 
+    # Follow-up page of an earlier search - served from memory
+    if cursor:
+        return await _discovery_page(cursor, limit, config)
+
+    if merge and merge_strategy not in MERGE_STRATEGIES:
+        return {
+            "error": f"Unknown merge_strategy '{merge_strategy}'",
+            "subreddits": [],
+            "summary": {
+                "total_found": 0,
+                "returned": 0,
+                "coverage": "error"
+            },
+            "suggestion": f"Use one of: {', '.join(MERGE_STRATEGIES)}"
+        }
+
     # Initialize ChromaDB client
     try:
         collection = _get_vector_collection("dialog-app-prod-db")
+        # Warm the catalog (and its lexical index) without delaying this search
+        _get_catalog(wait_for_load=False)
 
     except Exception as e:
         return {
@@ -281,11 +410,17 @@ async def discover_subreddits(
 
         for search_query in queries:
             result = await _search_vector_db(
-                search_query, collection, limit, include_nsfw, min_confidence, config, ctx
+                search_query, collection, limit, include_nsfw, min_confidence, config, ctx,
+                min_subscribers=min_subscribers, max_subscribers=max_subscribers, paginate=not merge
             )
             batch_results[search_query] = result
             total_api_calls += 1
 
+        if merge:
+            merged = _merge_batch_results(queries, batch_results, limit, merge_strategy, config)
+            merged["api_calls_made"] = total_api_calls
+            return merged
+
         return {
             "batch_mode": True,
             "total_queries": len(queries),
@@ -296,7 +431,10 @@ async def discover_subreddits(
 
     # Handle single query
     elif query:
-        return await _search_vector_db(query, collection, limit, include_nsfw, min_confidence, config, ctx)
+        return await _search_vector_db(
+            query, collection, limit, include_nsfw, min_confidence, config, ctx,
+            min_subscribers=min_subscribers, max_subscribers=max_subscribers
+        )
     
     else:
         return {
@@ -317,10 +455,22 @@ async def _search_vector_db(
     include_nsfw: bool,
     min_confidence: float,
     config: SearchConfig = None,
-    ctx: Context = None
+    ctx: Context = None,
+    min_subscribers: Optional[int] = None,
+    max_subscribers: Optional[int] = None,
+    paginate: bool = True
 ) -> Dict[str, Any]:
     """
-    Internal function to perform semantic search for a single query.
+    Internal function to perform hybrid search for a single query.
+
+    Runs the semantic vector query and a local lexical lookup (exact names,
+    name fragments, acronyms) concurrently, then merges both rankings with
+    reciprocal rank fusion. If the vector service fails, lexical matches are
+    returned on their own.
+
+    A minimum subscriber count is pushed down to the proxy; the over-fetch
+    for filters applied here adapts to observed keep rates, and
+    a short page is topped up with one larger query.
 
     Args:
         query: Search query string
@@ -330,6 +480,10 @@ async def _search_vector_db(
         min_confidence: Minimum confidence threshold
         config: SearchConfig with tunable parameters
         ctx: FastMCP context for progress reporting
+        min_subscribers: Minimum subscriber count (pushed down to the proxy)
+        max_subscribers: Maximum subscriber count (applied client-side)
+        paginate: Issue a cursor when there are more results than ``limit``
+            (merged batches page through the fused list instead)
 
     Returns:
         Dictionary with search results and statistics
@@ -338,16 +492,37 @@ async def _search_vector_db(
         config = DEFAULT_SEARCH_CONFIG
 
     try:
-        # Search with a larger limit to allow for filtering
-        search_limit = min(limit * config.SEARCH_MULTIPLIER, config.MAX_SEARCH_RESULTS)
-        
-        # Perform semantic search
-        results = collection.query(
-            query_texts=[query],
-            n_results=search_limit
+        # Over-fetch only for filters the proxy can't apply
+        where = build_where_clause(include_nsfw, min_subscribers, max_subscribers)
+        overfetch_key = (round(min_confidence, 1), include_nsfw, max_subscribers is not None)
+        search_limit = min(
+            math.ceil(limit * _overfetch.factor(overfetch_key, config)),
+            config.MAX_SEARCH_RESULTS
         )
-        
-        if not results or not results['metadatas'] or not results['metadatas'][0]:
+
+        # Vector query (blocking HTTP) and lexical lookup run concurrently
+        lexical_index = get_subreddit_catalog().lexical
+        vector_call = asyncio.to_thread(_query_vectors, collection, query, search_limit, where)
+        if lexical_index is not None:
+            results, lexical_hits = await asyncio.gather(
+                vector_call,
+                asyncio.to_thread(lexical_index.search, query, search_limit),
+                return_exceptions=True
+            )
+            if isinstance(lexical_hits, Exception):
+                lexical_hits = []
+        else:
+            results, lexical_hits = (await asyncio.gather(vector_call, return_exceptions=True))[0], []
+
+        vector_error = None
+        if isinstance(results, Exception):
+            if not lexical_hits:
+                raise results
+            vector_error = results
+            results = None
+
+        has_vector_results = bool(results and results['metadatas'] and results['metadatas'][0])
+        if not has_vector_results and not lexical_hits:
             return {
                 "query": query,
                 "subreddits": [],
@@ -358,79 +533,38 @@ async def _search_vector_db(
                 },
                 "next_actions": ["Try different search terms"]
             }
-        
-        # Process results
-        processed_results = []
-        nsfw_filtered = 0
-        total_results = len(results['metadatas'][0])
-
-        for i, (metadata, distance) in enumerate(zip(
-            results['metadatas'][0],
-            results['distances'][0]
-        )):
-            # Report progress
-            if ctx:
-                await ctx.report_progress(
-                    progress=i + 1,
-                    total=total_results,
-                    message=f"Analyzing r/{metadata.get('name', 'unknown')}"
-                )
 
-            # Skip NSFW if not requested
-            if metadata.get('nsfw', False) and not include_nsfw:
-                nsfw_filtered += 1
+        # Score vector results, applying any filters the proxy didn't
+        score_args = (query, include_nsfw, min_subscribers, max_subscribers, config, ctx)
+        processed_results, nsfw_filtered, fetched = await _score_vector_results(results, *score_args)
+        query_limit = search_limit
+
+        if vector_error is None:
+            kept = sum(1 for r in processed_results if r['confidence'] >= min_confidence)
+            _overfetch.observe(overfetch_key, fetched, kept)
+
+            # Top up a short page once if the index has more to give
+            if kept < limit and fetched >= search_limit and search_limit < config.MAX_SEARCH_RESULTS:
+                query_limit = min(
+                    max(math.ceil(limit * _overfetch.factor(overfetch_key, config)), search_limit * 2),
+                    config.MAX_SEARCH_RESULTS
+                )
+                results = await asyncio.to_thread(_query_vectors, collection, query, query_limit, where)
+                processed_results, nsfw_filtered, fetched = await _score_vector_results(results, *score_args)
+                kept = sum(1 for r in processed_results if r['confidence'] >= min_confidence)
+                _overfetch.observe(overfetch_key, fetched, kept)
+
+        # Fuse with lexical ranking (filtered the same way as vector results)
+        lexical_results = []
+        for hit in lexical_hits:
+            if not _passes_filters(hit['entry'], include_nsfw, min_subscribers, max_subscribers):
                 continue
-            
-            # Convert distance to confidence score using configurable model
-            confidence = calculate_confidence_from_distance(distance, config)
-
-            # Apply penalties for generic subreddits (configurable)
-            subreddit_name = metadata.get('name', '').lower()
-            if subreddit_name in config.GENERIC_SUBREDDITS and query.lower() not in subreddit_name:
-                confidence *= config.GENERIC_PENALTY_MULTIPLIER
-
-            # Apply boosts/penalties based on subscriber count
-            subscribers = metadata.get('subscribers', 0)
-            if subscribers > config.LARGE_SUB_THRESHOLD:
-                confidence = min(1.0, confidence * config.LARGE_SUB_BOOST_MULTIPLIER)
-            elif subscribers < config.SMALL_SUB_THRESHOLD:
-                confidence *= config.SMALL_SUB_PENALTY_MULTIPLIER
-            
-            # Determine match type based on distance
-            if distance < 0.3:
-                match_type = "exact_match"
-            elif distance < 0.7:
-                match_type = "strong_match"
-            elif distance < 1.0:
-                match_type = "partial_match"
-            else:
-                match_type = "weak_match"
-
-            # Classify match tier based on distance
-            match_tier = classify_match_tier(distance, config)
-
-            processed_results.append({
-                "name": metadata.get('name', 'unknown'),
-                "subscribers": metadata.get('subscribers', 0),
-                "confidence": round(confidence, 3),
-                "distance": round(distance, 3),
-                "match_tier": match_tier,
-                "url": metadata.get('url', f"https://reddit.com/r/{metadata.get('name', '')}")
-            })
-
-        # Filter by minimum confidence if specified (Phase 2a.3)
-        if min_confidence > 0.0:
-            processed_results = [
-                r for r in processed_results
-                if r['confidence'] >= min_confidence
-            ]
+            lexical_results.append(_score_lexical_hit(hit, lexical_hits[0]['score'], query, config))
+        processed_results = _rank_results(processed_results, lexical_results, min_confidence, config)
 
-        # Sort by confidence (highest first), then by subscribers
-        processed_results.sort(key=lambda x: (-x['confidence'], -(x['subscribers'] or 0)))
-        
         # Limit to requested number
         limited_results = processed_results[:limit]
-        
+
         # Calculate basic stats
         total_found = len(processed_results)
 
@@ -439,13 +573,38 @@ async def _search_vector_db(
         confidence_stats = calculate_confidence_stats(confidence_scores)
         tier_distribution = calculate_tier_distribution(limited_results)
 
+        # Keep the ranked list server-side so later pages skip the vector query;
+        # if the index may hold more, remember how to top it up when a page runs out
+        next_cursor = None
+        if paginate and total_found > len(limited_results):
+            more = None
+            if vector_error is None and fetched >= query_limit and query_limit < config.MAX_SEARCH_RESULTS:
+                more = {
+                    "include_nsfw": include_nsfw,
+                    "min_confidence": min_confidence,
+                    "min_subscribers": min_subscribers,
+                    "max_subscribers": max_subscribers
+                }
+            next_cursor = _store_result_handle(query, processed_results, len(limited_results), more)
+
         # Generate next actions (only meaningful ones)
         next_actions = []
+        if vector_error is not None:
+            next_actions.append("Semantic search unavailable - showing name/description matches only")
         if len(processed_results) > limit:
-            next_actions.append(f"{len(processed_results)} total results found, showing {limit}")
+            next_actions.append(
+                f"{len(processed_results)} total results found, showing {limit} - pass cursor for the next page"
+            )
         if nsfw_filtered > 0:
             next_actions.append(f"{nsfw_filtered} NSFW subreddits filtered")
 
+        if vector_error is not None:
+            search_mode = "lexical"
+        elif lexical_index is not None:
+            search_mode = "hybrid"
+        else:
+            search_mode = "semantic"
+
         return {
             "query": query,
             "subreddits": limited_results,
@@ -453,12 +612,14 @@ async def _search_vector_db(
                 "total_found": total_found,
                 "returned": len(limited_results),
                 "has_more": total_found > len(limited_results),
+                "search_mode": search_mode,
                 "confidence_stats": confidence_stats,
                 "tier_distribution": tier_distribution
             },
+            "cursor": next_cursor,
             "next_actions": next_actions
         }
-        
+
     except Exception as e:
         # Map error patterns to specific recovery actions
         error_str = str(e).lower()
@@ -484,6 +645,474 @@ async def _search_vector_db(
         }
 
 
+def _rank_results(
+    vector_results: List[Dict[str, Any]],
+    lexical_results: List[Dict[str, Any]],
+    min_confidence: float,
+    config: SearchConfig
+) -> List[Dict[str, Any]]:
+    """Sort scored vector results, fuse in lexical matches and drop low-confidence ones."""
+    # Semantic ranking: confidence (highest first), then subscribers
+    vector_results.sort(key=lambda x: (-x['confidence'], -(x['subscribers'] or 0)))
+    ranked = _fuse_rankings(vector_results, lexical_results, config)
+
+    # Filter by minimum confidence if specified (Phase 2a.3)
+    if min_confidence > 0.0:
+        ranked = [r for r in ranked if r['confidence'] >= min_confidence]
+    return ranked
+
+
+def _merge_batch_results(
+    queries: List[str],
+    batch_results: Dict[str, Dict[str, Any]],
+    limit: int,
+    strategy: str,
+    config: SearchConfig
+) -> Dict[str, Any]:
+    """
+    Fuse per-query discovery results into one deduplicated ranking.
+
+    Works only on the already-scored per-query lists - no extra vector
+    queries. With "rrf" each query contributes 1 / (RRF_K + rank), so
+    communities found by several queries rise; with "max_confidence" each
+    community ranks by its best confidence. Duplicates keep the fields of
+    their highest-confidence match.
+
+    Args:
+        queries: Queries in request order
+        batch_results: Per-query results from _search_vector_db
+        limit: Maximum merged results to return
+        strategy: "rrf" or "max_confidence"
+        config: SearchConfig with RRF_K
+
+    Returns:
+        Single-list discovery result with ``matched_queries`` per subreddit
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+
+    for query in queries:
+        result = batch_results[query]
+        if result.get("error"):
+            errors[query] = result["error"]
+
+        for rank, subreddit in enumerate(result.get("subreddits", []), start=1):
+            key = subreddit['name'].lower()
+            score = 1.0 / (config.RRF_K + rank) if strategy == "rrf" else subreddit['confidence']
+
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = {**subreddit, "matched_queries": [query]}
+                scores[key] = score
+                continue
+
+            if query not in existing['matched_queries']:
+                existing['matched_queries'].append(query)
+            sources = existing.get('match_sources', [])
+            sources.extend(s for s in subreddit.get('match_sources', []) if s not in sources)
+            if subreddit['confidence'] > existing['confidence']:
+                existing.update({k: v for k, v in subreddit.items() if k != 'match_sources'})
+            scores[key] = scores[key] + score if strategy == "rrf" else max(scores[key], score)
+
+    ranked = sorted(
+        merged.values(),
+        key=lambda r: (-scores[r['name'].lower()], -r['confidence'], -(r['subscribers'] or 0))
+    )
+    limited_results = ranked[:limit]
+    label = " | ".join(queries)
+
+    next_cursor = None
+    if len(ranked) > len(limited_results):
+        next_cursor = _store_result_handle(label, ranked, len(limited_results))
+
+    next_actions = []
+    multi_match = sum(1 for r in limited_results if len(r['matched_queries']) > 1)
+    if multi_match:
+        next_actions.append(f"{multi_match} subreddits matched more than one query")
+    if next_cursor:
+        next_actions.append(
+            f"{len(ranked)} unique subreddits found, showing {len(limited_results)} - pass cursor for the next page"
+        )
+    for query, error in errors.items():
+        next_actions.append(f"Query '{query}' failed: {error}")
+
+    return {
+        "batch_mode": True,
+        "merged": True,
+        "merge_strategy": strategy,
+        "queries": queries,
+        "subreddits": limited_results,
+        "summary": {
+            "total_found": len(ranked),
+            "returned": len(limited_results),
+            "has_more": next_cursor is not None,
+            "per_query_found": {
+                query: len(batch_results[query].get("subreddits", [])) for query in queries
+            },
+            "confidence_stats": calculate_confidence_stats([r['confidence'] for r in limited_results]),
+            "tier_distribution": calculate_tier_distribution(limited_results)
+        },
+        "cursor": next_cursor,
+        "next_actions": next_actions
+    }
+
+
+def _store_result_handle(
+    query: str,
+    results: List[Dict[str, Any]],
+    offset: int,
+    more: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Store a scored, sorted candidate list and return the cursor for ``offset``.
+
+    ``more`` holds the search filters when the index may have candidates
+    beyond ``results``; the list is then topped up when a page reaches its end.
+    """
+    handle = secrets.token_urlsafe(12)
+    _result_handles.set(handle, {"query": query, "results": results, "more": more})
+    return f"{handle}.{offset}"
+
+
+async def _top_up_results(stored: Dict[str, Any], config: SearchConfig) -> bool:
+    """
+    Extend a stored candidate list with one MAX_SEARCH_RESULTS query.
+
+    Already-stored results keep their positions, so pages served earlier
+    stay valid; new candidates are appended in rank order.
+
+    Returns:
+        True if the stored list was replaced
+    """
+    try:
+        collection = _get_vector_collection("dialog-app-prod-db")
+    except Exception:
+        return False
+    full = await _search_vector_db(
+        stored["query"], collection, config.MAX_SEARCH_RESULTS, config=config, paginate=False, **stored["more"]
+    )
+    if full.get("error"):
+        return False
+
+    seen = {r['name'].lower() for r in stored["results"]}
+    stored["results"] = stored["results"] + [r for r in full["subreddits"] if r['name'].lower() not in seen]
+    stored["more"] = None
+    return True
+
+
+async def _discovery_page(cursor: str, limit: int, config: SearchConfig) -> Dict[str, Any]:
+    """
+    Serve the next page of an earlier discovery from the result store.
+
+    A page that reaches the end of a list with more candidates in the index
+    first tops the list up with one larger vector query.
+
+    Args:
+        cursor: Cursor returned by a previous discovery call
+        limit: Page size
+        config: SearchConfig for the top-up query
+
+    Returns:
+        Same shape as a single-query discovery result
+    """
+    handle, _, offset_str = cursor.rpartition(".")
+    stored = _result_handles.get(handle) if handle else None
+    try:
+        offset = int(offset_str)
+    except ValueError:
+        stored = None
+
+    if stored is None or offset < 0:
+        return {
+            "error": "Cursor expired or invalid",
+            "subreddits": [],
+            "summary": {
+                "total_found": 0,
+                "returned": 0,
+                "has_more": False
+            },
+            "next_actions": ["Re-run discover_subreddits with the original query"]
+        }
+
+    limit = max(1, limit)
+    if stored.get("more") and offset + limit >= len(stored["results"]):
+        if await _top_up_results(stored, config):
+            _result_handles.set(handle, stored)
+
+    results = stored["results"]
+    page = [dict(r) for r in results[offset:offset + limit]]
+    next_offset = offset + len(page)
+    has_more = next_offset < len(results)
+
+    return {
+        "query": stored["query"],
+        "subreddits": page,
+        "summary": {
+            "total_found": len(results),
+            "returned": len(page),
+            "offset": offset,
+            "has_more": has_more,
+            "confidence_stats": calculate_confidence_stats([r['confidence'] for r in page]),
+            "tier_distribution": calculate_tier_distribution(page)
+        },
+        "cursor": f"{handle}.{next_offset}" if has_more else None,
+        "next_actions": [
+            f"Showing {offset + 1}-{next_offset} of {len(results)}"
+        ] if page else ["No more results"]
+    }
+
+
+def _query_vectors(
+    collection,
+    query: str,
+    n_results: int,
+    where: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run one vector query with pushed-down filters and trimmed fields (cached per collection)."""
+    collection_name = getattr(collection, "name", None)
+    key = (collection_name, query, n_results, where) if isinstance(collection_name, str) else None
+    if key is not None:
+        cached = _vector_results.get(key)
+        if cached is not None:
+            return cached
+
+    results = collection.query(
+        query_texts=[query],
+        n_results=n_results,
+        where=where,
+        include=VECTOR_QUERY_INCLUDE
+    )
+    if key is not None and isinstance(results, dict):
+        _vector_results.set(key, results)
+    return results
+
+
+def _passes_filters(
+    metadata: Dict[str, Any],
+    include_nsfw: bool,
+    min_subscribers: Optional[int],
+    max_subscribers: Optional[int]
+) -> bool:
+    """Client-side check of every filter (proxies may ignore where; records may lack the fields)."""
+    if metadata.get('nsfw', False) and not include_nsfw:
+        return False
+    subscribers = metadata.get('subscribers') or 0
+    if min_subscribers is not None and subscribers < min_subscribers:
+        return False
+    if max_subscribers is not None and subscribers > max_subscribers:
+        return False
+    return True
+
+
+async def _score_vector_results(
+    results: Optional[Dict[str, Any]],
+    query: str,
+    include_nsfw: bool,
+    min_subscribers: Optional[int],
+    max_subscribers: Optional[int],
+    config: SearchConfig,
+    ctx: Context = None
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    Convert a vector query response into scored result entries.
+
+    Returns:
+        Tuple of (results, NSFW results filtered, results fetched)
+    """
+    if not (results and results['metadatas'] and results['metadatas'][0]):
+        return [], 0, 0
+
+    processed_results = []
+    nsfw_filtered = 0
+    metadatas = results['metadatas'][0]
+    distances = results['distances'][0]
+    total_results = len(metadatas)
+    progress = ProgressReporter(ctx, total=total_results)
+
+    for i, (metadata, distance) in enumerate(zip(metadatas, distances)):
+        # Report progress (throttled, never blocks scoring)
+        progress.update(i + 1, f"Analyzing r/{metadata.get('name', 'unknown')}")
+
+        if not _passes_filters(metadata, include_nsfw, min_subscribers, max_subscribers):
+            if metadata.get('nsfw', False) and not include_nsfw:
+                nsfw_filtered += 1
+            continue
+
+        # Convert distance to confidence score using configurable model
+        confidence = _adjust_confidence(
+            calculate_confidence_from_distance(distance, config),
+            metadata.get('name', ''),
+            metadata.get('subscribers', 0),
+            query,
+            config
+        )
+
+        # Classify match tier based on distance
+        match_tier = classify_match_tier(distance, config)
+
+        processed_results.append({
+            "name": metadata.get('name', 'unknown'),
+            "subscribers": metadata.get('subscribers', 0),
+            "confidence": round(confidence, 3),
+            "distance": round(distance, 3),
+            "match_tier": match_tier,
+            "url": metadata.get('url', f"https://reddit.com/r/{metadata.get('name', '')}")
+        })
+
+    await progress.finish(message=f"Analyzed {total_results} subreddits")
+    return processed_results, nsfw_filtered, total_results
+
+
+def _adjust_confidence(
+    confidence: float,
+    name: str,
+    subscribers: int,
+    query: str,
+    config: SearchConfig
+) -> float:
+    """Apply generic-subreddit penalties and subscriber boosts/penalties."""
+    # Apply penalties for generic subreddits (configurable)
+    subreddit_name = name.lower()
+    if subreddit_name in config.GENERIC_SUBREDDITS and query.lower() not in subreddit_name:
+        confidence *= config.GENERIC_PENALTY_MULTIPLIER
+
+    # Apply boosts/penalties based on subscriber count
+    subscribers = subscribers or 0
+    if subscribers > config.LARGE_SUB_THRESHOLD:
+        confidence = min(1.0, confidence * config.LARGE_SUB_BOOST_MULTIPLIER)
+    elif subscribers < config.SMALL_SUB_THRESHOLD:
+        confidence *= config.SMALL_SUB_PENALTY_MULTIPLIER
+
+    return confidence
+
+
+def _score_lexical_hit(
+    hit: Dict[str, Any],
+    top_score: float,
+    query: str,
+    config: SearchConfig
+) -> Dict[str, Any]:
+    """
+    Convert a lexical hit into a result entry.
+
+    Exact name matches get LEXICAL_EXACT_CONFIDENCE; other hits scale up to
+    LEXICAL_MAX_CONFIDENCE relative to the best lexical score. Lexical-only
+    results have no embedding distance.
+    """
+    entry = hit['entry']
+    if hit['exact']:
+        confidence = config.LEXICAL_EXACT_CONFIDENCE
+    else:
+        confidence = config.LEXICAL_MAX_CONFIDENCE * hit['score'] / top_score if top_score else 0.0
+        confidence = _adjust_confidence(confidence, entry['name'], entry['subscribers'], query, config)
+
+    return {
+        "name": entry['name'],
+        "subscribers": entry['subscribers'],
+        "confidence": round(confidence, 3),
+        "distance": None,
+        "match_tier": "exact" if hit['exact'] else "adjacent",
+        "url": entry['url'],
+        "exact_name": hit['exact']
+    }
+
+
+def _fuse_rankings(
+    semantic: List[Dict[str, Any]],
+    lexical: List[Dict[str, Any]],
+    config: SearchConfig
+) -> List[Dict[str, Any]]:
+    """
+    Merge semantic and lexical rankings with reciprocal rank fusion.
+
+    Each list contributes 1 / (RRF_K + rank) per result. Results found by
+    both keep their semantic fields; an exact name match lifts confidence to
+    at least LEXICAL_EXACT_CONFIDENCE. With no lexical results, the semantic
+    order is returned unchanged.
+
+    Args:
+        semantic: Semantic results, best first
+        lexical: Lexical results, best first
+        config: SearchConfig with RRF_K
+
+    Returns:
+        Fused results, best first, each tagged with ``match_sources``
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+
+    for source, ranked in (("semantic", semantic), ("lexical", lexical)):
+        for rank, result in enumerate(ranked, start=1):
+            key = result['name'].lower()
+            scores[key] = scores.get(key, 0.0) + 1.0 / (config.RRF_K + rank)
+
+            exact_name = result.get('exact_name', False)
+            if key not in fused:
+                fused[key] = {k: v for k, v in result.items() if k != 'exact_name'}
+                fused[key]["match_sources"] = [source]
+                continue
+
+            existing = fused[key]
+            existing['match_sources'].append(source)
+            if exact_name:
+                existing['confidence'] = max(existing['confidence'], config.LEXICAL_EXACT_CONFIDENCE)
+
+    return sorted(
+        fused.values(),
+        key=lambda r: (-scores[r['name'].lower()], -r['confidence'], -(r['subscribers'] or 0))
+    )
+
+
+def _get_catalog(wait_for_load: bool = True) -> SubredditCatalog:
+    """
+    Get the subreddit catalog, loading or refreshing it when due.
+
+    The first load runs inline unless ``wait_for_load`` is False; later
+    refreshes run in a background thread while the current index keeps
+    serving lookups.
+    """
+    catalog = get_subreddit_catalog()
+    if not catalog.needs_refresh():
+        return catalog
+
+    try:
+        collection = _get_vector_collection("dialog-app-prod-db")
+    except Exception:
+        return catalog
+
+    if catalog.is_loaded or not wait_for_load:
+        threading.Thread(target=catalog.refresh, args=(collection,), daemon=True).start()
+    else:
+        catalog.refresh(collection)
+    return catalog
+
+
+def _catalog_validation(clean_name: str, catalog: SubredditCatalog) -> Dict[str, Any]:
+    """Build a validation result from a catalog lookup."""
+    entry = catalog.lookup(clean_name)
+    if entry:
+        return {
+            "valid": True,
+            "name": entry["name"],
+            "subscribers": entry["subscribers"],
+            "is_private": False,  # We only index public subreddits
+            "over_18": entry["nsfw"],
+            "indexed": True
+        }
+
+    result = {
+        "valid": False,
+        "name": clean_name,
+        "error": f"Subreddit '{clean_name}' not found",
+        "suggestion": "Use discover_subreddits to find similar communities"
+    }
+    suggestions = catalog.suggest(clean_name)
+    if suggestions:
+        result["did_you_mean"] = suggestions
+    return result
+
+
 def validate_subreddit(
     subreddit_name: str,
     ctx: Context = None
@@ -491,8 +1120,9 @@ def validate_subreddit(
     """
     Validate if a subreddit exists in the indexed database.
 
-    Checks if the subreddit exists in our semantic search index
-    and returns its metadata if found.
+    Answers from the in-memory subreddit catalog (case-insensitive exact
+    match). Falls back to a semantic search for the name when the catalog
+    cannot be loaded from the vector proxy.
 
     Args:
         subreddit_name: Name of the subreddit to validate
@@ -502,7 +1132,11 @@ def validate_subreddit(
         Dictionary with validation result and subreddit info if found
     """
     # Clean the subreddit name
-    clean_name = subreddit_name.replace("r/", "").replace("/r/", "").strip()
+    clean_name = normalize_subreddit_name(subreddit_name)
+
+    catalog = _get_catalog()
+    if catalog.is_loaded:
+        return _catalog_validation(clean_name, catalog)
 
     try:
         # Search for exact match in vector database
@@ -540,4 +1174,124 @@ def validate_subreddit(
             "name": clean_name,
             "error": f"Database error: {str(e)}",
             "suggestion": "Check database connection and retry"
-        }
\ No newline at end of file
+        }
+
+
+async def validate_subreddits(
+    names: Union[List[str], str],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Validate many subreddit names at once against the indexed database.
+
+    Answers from the in-memory subreddit catalog, so a batch of names costs
+    no vector queries once the catalog is loaded.
+
+    Args:
+        names: List of subreddit names (or a JSON array string)
+        ctx: FastMCP context (optional)
+
+    Returns:
+        Dictionary with per-name results and valid/invalid name lists
+    """
+    if isinstance(names, str):
+        try:
+            parsed = json.loads(names)
+            names = parsed if isinstance(parsed, list) else [names]
+        except (json.JSONDecodeError, ValueError):
+            names = [names]
+
+    if not names:
+        return {
+            "error": "At least one subreddit name must be provided",
+            "suggestion": "Pass names as a list, e.g. {\"names\": [\"Python\", \"django\"]}"
+        }
+
+    # First load blocks (off the event loop); later refreshes run in background
+    catalog = await asyncio.to_thread(_get_catalog)
+
+    clean_names = [normalize_subreddit_name(name) for name in names]
+    if catalog.is_loaded:
+        results = {name: _catalog_validation(name, catalog) for name in clean_names}
+        source = "catalog"
+    else:
+        # Catalog unavailable - fall back to one semantic lookup per name
+        lookups = await asyncio.gather(*[
+            asyncio.to_thread(validate_subreddit, name) for name in clean_names
+        ])
+        results = dict(zip(clean_names, lookups))
+        source = "vector_search"
+
+    valid = [r["name"] for r in results.values() if r.get("valid")]
+    invalid = [name for name, r in results.items() if not r.get("valid")]
+
+    return {
+        "results": results,
+        "valid": valid,
+        "invalid": invalid,
+        "summary": {
+            "requested": len(clean_names),
+            "valid": len(valid),
+            "invalid": len(invalid),
+            "source": source
+        }
+    }
+
+
+def related_subreddits(
+    name: str,
+    k: int = 10,
+    include_nsfw: bool = False,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Find communities similar to a known subreddit.
+
+    Reads the precomputed nearest-neighbour graph in memory - no vector
+    query. Similarity is cosine similarity of the subreddits' embeddings.
+
+    Args:
+        name: Seed subreddit name (with or without r/ prefix)
+        k: Number of related subreddits to return (default 10)
+        include_nsfw: Whether to include NSFW subreddits (default False)
+        ctx: FastMCP context (optional)
+
+    Returns:
+        Dictionary with the seed subreddit and its related communities
+    """
+    clean_name = normalize_subreddit_name(name)
+    graph = get_related_graph()
+    if graph is None:
+        return {
+            "error": "Related-subreddit graph is not available on this server",
+            "suggestion": f"Use discover_subreddits with query '{clean_name}' instead"
+        }
+
+    related = graph.related(clean_name, k=max(1, k), include_nsfw=include_nsfw)
+    if related is None:
+        result = {
+            "error": f"Subreddit '{clean_name}' not found in the similarity graph",
+            "suggestion": "Check the name with validate_subreddits or use discover_subreddits"
+        }
+        catalog = get_subreddit_catalog()
+        suggestions = catalog.suggest(clean_name) if catalog.is_loaded else []
+        if suggestions:
+            result["did_you_mean"] = suggestions
+        return result
+
+    next_actions = []
+    if k > graph.k:
+        next_actions.append(f"Graph stores at most {graph.k} neighbours per subreddit")
+    if related:
+        next_actions.append("Use fetch_multiple with these names to compare content")
+
+    return {
+        "subreddit": graph.canonical_name(clean_name),
+        "related": related,
+        "summary": {
+            "returned": len(related),
+            "graph_size": len(graph),
+            "source": "precomputed_graph"
+        },
+        "next_actions": next_actions
+    }
@@ -1,16 +1,30 @@
 """Feed API operations for MCP server.
 
 Provides CRUD operations for feeds via the frontend API,
-forwarding the user's Descope authentication token.
+forwarding the user's Descope authentication token. Feed documents and
+configs are cached per authenticated client_id and revalidated with
+conditional requests; updates and deletes write through the cache.
 """
 
 import os
+import copy
+import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Any, Literal, Optional, List, Union
 import httpx
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_headers, get_access_token
 
+from ..shared_cache import SharedCache
+from ..deadline import DeadlineExceeded, call_timeout, soft_deadline, wait_until
+from ..listings import get_listing, listing_error
+from ..prefetch import get_feed_prefetcher
+from ..progress import ProgressReporter
+
 # Configure logging for feed operations
 logger = logging.getLogger(__name__)
 
@@ -20,6 +34,168 @@ def get_api_base_url() -> str:
     return os.getenv("AUDIENCE_API_URL", "http://localhost:3001/api")
 
 
+# Connection pool for the Feed API (shared by all feed operations)
+FEED_API_MAX_CONNECTIONS = int(os.getenv("FEED_API_MAX_CONNECTIONS", "20"))
+FEED_API_MAX_KEEPALIVE = int(os.getenv("FEED_API_MAX_KEEPALIVE", "10"))
+FEED_API_KEEPALIVE_EXPIRY = float(os.getenv("FEED_API_KEEPALIVE_EXPIRY", "30"))
+FEED_API_HTTP2 = os.getenv("FEED_API_HTTP2", "false").lower() in ("1", "true", "yes")
+FEED_API_CONNECT_TIMEOUT = 5.0
+
+# Per-operation read timeouts (seconds)
+FEED_API_TIMEOUTS = {
+    "create_feed": 30.0,
+    "list_feeds": 15.0,
+    "get_feed": 10.0,
+    "get_feed_config": 10.0,
+    "update_feed": 30.0,
+    "delete_feed": 15.0,
+}
+
+_feed_client: Optional[httpx.AsyncClient] = None
+_feed_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    """Whether HTTP/2 was requested and the h2 package is installed."""
+    if not FEED_API_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("FEED_API_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+        return False
+
+
+def get_feed_client() -> httpx.AsyncClient:
+    """
+    Get the shared Feed API client, creating it on first use.
+
+    Keeps a bounded pool of keep-alive connections so feed calls reuse
+    TCP/TLS sessions. A client is bound to the event loop it was created on;
+    a new loop (e.g. a fresh test loop) gets a new client.
+    """
+    global _feed_client, _feed_client_loop
+    loop = asyncio.get_running_loop()
+    if _feed_client is None or _feed_client.is_closed or _feed_client_loop is not loop:
+        _feed_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=FEED_API_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=FEED_API_MAX_CONNECTIONS,
+                max_keepalive_connections=FEED_API_MAX_KEEPALIVE,
+                keepalive_expiry=FEED_API_KEEPALIVE_EXPIRY
+            ),
+            http2=_http2_available()
+        )
+        _feed_client_loop = loop
+    return _feed_client
+
+
+def feed_timeout(operation: str) -> httpx.Timeout:
+    """
+    Timeout for a feed operation (short connect, per-operation read), clamped
+    to the time left before the calling operation's deadline.
+    """
+    timeout = call_timeout(FEED_API_TIMEOUTS.get(operation, 30.0))
+    return httpx.Timeout(timeout, connect=min(FEED_API_CONNECT_TIMEOUT, timeout))
+
+
+# Per-user cache of feed documents and configs
+FEED_CACHE_FRESH_SECONDS = float(os.getenv("FEED_CACHE_FRESH_SECONDS", "30"))   # Served without revalidation
+FEED_CACHE_TTL_SECONDS = float(os.getenv("FEED_CACHE_TTL_SECONDS", "3600"))     # Kept for revalidation
+
+# Shared across workers, so validated_at is wall-clock time
+_feed_cache = SharedCache("feeds", ttl_seconds=FEED_CACHE_TTL_SECONDS)
+
+
+def _cache_user() -> Optional[str]:
+    """Authenticated client_id for cache isolation, or None (no caching)."""
+    try:
+        access_token = get_access_token()
+    except Exception:
+        return None
+    return getattr(access_token, "client_id", None) if access_token else None
+
+
+def _feed_cache_key(kind: str, feed_id: str) -> Optional[tuple]:
+    """Cache key scoped to the current user, or None without an authenticated user."""
+    user = _cache_user()
+    return (user, kind, feed_id) if user else None
+
+
+def _fresh_cached(entry: Optional[Dict[str, Any]]) -> bool:
+    """Whether a cache entry was validated recently enough to serve as-is."""
+    return entry is not None and time.time() - entry["validated_at"] < FEED_CACHE_FRESH_SECONDS
+
+
+def _conditional_headers(auth_headers: Dict[str, str], entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Add revalidation headers for a cached entry.
+
+    Uses If-None-Match with the entry's ETag, or If-Modified-Since from its
+    ``updated_at`` when the API sent no ETag.
+    """
+    if not entry:
+        return auth_headers
+    if entry.get("etag"):
+        return {**auth_headers, "If-None-Match": entry["etag"]}
+    if entry.get("updated_at"):
+        try:
+            updated_at = datetime.fromisoformat(str(entry["updated_at"]).replace("Z", "+00:00"))
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            return {**auth_headers, "If-Modified-Since": format_datetime(updated_at.astimezone(timezone.utc), usegmt=True)}
+        except ValueError:
+            pass
+    return auth_headers
+
+
+def _store_cached(key: Optional[tuple], data: Dict[str, Any], etag: Optional[str] = None) -> None:
+    """Cache a feed document or config with its validators."""
+    if key is None or not isinstance(data, dict):
+        return
+    _feed_cache.set(key, {
+        "data": copy.deepcopy(data),
+        "etag": etag,
+        "updated_at": data.get("updated_at"),
+        "validated_at": time.time()
+    })
+
+
+def _revalidated(key: tuple, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Mark an entry as confirmed current (304) and return a copy of its data."""
+    entry["validated_at"] = time.time()
+    _feed_cache.set(key, entry)
+    return copy.deepcopy(entry["data"])
+
+
+def invalidate_feed_cache(feed_id: str, user: Optional[str] = None) -> None:
+    """Drop a feed's cached document and config for a user (current user by default)."""
+    user = user or _cache_user()
+    if user:
+        _feed_cache.delete((user, "feed", feed_id))
+        _feed_cache.delete((user, "config", feed_id))
+
+
+def clear_feed_cache() -> None:
+    """Drop all cached feeds (useful for testing)."""
+    _feed_cache.clear()
+
+
+async def start_feed_client() -> None:
+    """Open the shared client at server startup."""
+    get_feed_client()
+    logger.info("Feed API client started (max_connections=%d)", FEED_API_MAX_CONNECTIONS)
+
+
+async def close_feed_client() -> None:
+    """Close the shared client and its pooled connections at shutdown."""
+    global _feed_client, _feed_client_loop
+    client, _feed_client, _feed_client_loop = _feed_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 def get_auth_headers() -> Dict[str, str]:
     """
     Extract authorization header for API requests.
@@ -90,57 +266,125 @@ async def create_feed(
     if analysis is not None:
         payload["analysis"] = analysis
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.info(f"🔧 create_feed: Making POST request to {base_url}/feeds")
-            response = await client.post(
-                f"{base_url}/feeds",
-                json=payload,
-                headers=auth_headers
-            )
-            logger.info(f"🔧 create_feed: Response status={response.status_code}")
-
-            if response.status_code == 201:
-                logger.info(f"🔧 create_feed: SUCCESS - Feed created")
-                return response.json()
-            elif response.status_code == 401:
-                logger.error(f"🔧 create_feed: 401 Unauthorized")
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            elif response.status_code == 422:
-                error_data = response.json()
-                logger.error(f"🔧 create_feed: 422 Validation error - {error_data}")
-                return {
-                    "error": "Validation error",
-                    "details": error_data.get("details", error_data),
-                    "suggestion": "Check that all required fields meet validation requirements"
-                }
-            else:
-                logger.error(f"🔧 create_feed: {response.status_code} - {response.text}")
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
-            logger.error(f"🔧 create_feed: TIMEOUT after 30s")
+    client = get_feed_client()
+    try:
+        logger.info(f"🔧 create_feed: Making POST request to {base_url}/feeds")
+        response = await client.post(
+            f"{base_url}/feeds",
+            json=payload,
+            headers=auth_headers,
+            timeout=feed_timeout("create_feed")
+        )
+        logger.info(f"🔧 create_feed: Response status={response.status_code}")
+
+        if response.status_code == 201:
+            logger.info(f"🔧 create_feed: SUCCESS - Feed created")
+            return response.json()
+        elif response.status_code == 401:
+            logger.error(f"🔧 create_feed: 401 Unauthorized")
+            return {
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
+            }
+        elif response.status_code == 422:
+            error_data = response.json()
+            logger.error(f"🔧 create_feed: 422 Validation error - {error_data}")
+            return {
+                "error": "Validation error",
+                "details": error_data.get("details", error_data),
+                "suggestion": "Check that all required fields meet validation requirements"
+            }
+        else:
+            logger.error(f"🔧 create_feed: {response.status_code} - {response.text}")
+            return {
+                "error": f"API error: {response.status_code}",
+                "details": response.text
+            }
+
+    except httpx.TimeoutException:
+        logger.error(f"🔧 create_feed: TIMEOUT after {FEED_API_TIMEOUTS['create_feed']}s")
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        logger.error(f"🔧 create_feed: REQUEST ERROR - {str(e)}")
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
+
+
+# Page size used when list_feeds fetches every page
+LIST_FEEDS_MAX_PAGE_SIZE = 100
+
+
+async def _list_feeds_page(
+    base_url: str,
+    auth_headers: Dict[str, str],
+    limit: int,
+    offset: int
+) -> Dict[str, Any]:
+    """Fetch one page of the user's feeds (API response or error dict)."""
+    params = {
+        "limit": str(limit),
+        "offset": str(offset)
+    }
+
+    client = get_feed_client()
+    try:
+        response = await client.get(
+            f"{base_url}/feeds",
+            params=params,
+            headers=auth_headers,
+            timeout=feed_timeout("list_feeds")
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 401:
             return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
             }
-        except httpx.RequestError as e:
-            logger.error(f"🔧 create_feed: REQUEST ERROR - {str(e)}")
+        else:
             return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+                "error": f"API error: {response.status_code}",
+                "details": response.text
             }
 
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
+
+
+def _parse_fields(fields: Optional[Union[List[str], str]]) -> Optional[List[str]]:
+    """Accept fields as a list, JSON array string or comma-separated string."""
+    if fields is None or isinstance(fields, list):
+        return fields
+    text = fields.strip()
+    if text.startswith("["):
+        try:
+            parsed = json.loads(text)
+            if isinstance(parsed, list):
+                return [str(f) for f in parsed]
+        except (json.JSONDecodeError, ValueError):
+            pass
+    return [f.strip() for f in text.strip("[]").split(",") if f.strip()]
+
 
 async def list_feeds(
     limit: int = 50,
     offset: int = 0,
+    fetch_all: bool = False,
+    fields: Optional[Union[List[str], str]] = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """
@@ -149,6 +393,9 @@ async def list_feeds(
     Args:
         limit: Maximum number of feeds to return (1-100, default 50)
         offset: Number of feeds to skip (default 0)
+        fetch_all: Return every feed from ``offset`` on: reads ``total`` from
+            the first page and fetches the remaining pages concurrently
+        fields: Only include these feed fields (``id`` is always kept)
         ctx: FastMCP context (optional)
 
     Returns:
@@ -157,42 +404,53 @@ async def list_feeds(
     base_url = get_api_base_url()
     auth_headers = get_auth_headers()
 
-    params = {
-        "limit": str(limit),
-        "offset": str(offset)
-    }
+    page_size = LIST_FEEDS_MAX_PAGE_SIZE if fetch_all else limit
+    result = await _list_feeds_page(base_url, auth_headers, page_size, offset)
+    if "error" in result:
+        return result
+
+    if fetch_all:
+        feeds = list(result.get("feeds", []))
+        total = result.get("total", len(feeds))
+        page_size = result.get("limit") or page_size
+        remaining = range(offset + len(feeds), total, page_size)
+        pages = await asyncio.gather(*[
+            _list_feeds_page(base_url, auth_headers, page_size, page_offset)
+            for page_offset in remaining
+        ])
+
+        for page in pages:
+            if "error" in page:
+                return {**page, "feeds_loaded": len(feeds), "total": total}
+            feeds.extend(page.get("feeds", []))
+
+        # Feeds created or deleted mid-listing can shift pages; keep each once
+        unique = []
+        seen_ids = set()
+        for feed in feeds:
+            feed_id = feed.get("id")
+            if feed_id is not None:
+                if feed_id in seen_ids:
+                    continue
+                seen_ids.add(feed_id)
+            unique.append(feed)
+        result = {
+            "feeds": unique,
+            "total": total,
+            "limit": len(unique),
+            "offset": offset,
+            "pages_fetched": len(pages) + 1
+        }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/feeds",
-                params=params,
-                headers=auth_headers
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
-            return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
-            }
-        except httpx.RequestError as e:
-            return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
-            }
+    projection = _parse_fields(fields)
+    if projection:
+        keep = ["id"] + [f for f in projection if f != "id"]
+        result["feeds"] = [
+            {key: feed[key] for key in keep if key in feed}
+            for feed in result.get("feeds", [])
+        ]
+
+    return result
 
 
 async def get_feed(
@@ -202,6 +460,9 @@ async def get_feed(
     """
     Get a specific feed by ID.
 
+    Served from the user's cache when validated within the last
+    FEED_CACHE_FRESH_SECONDS; otherwise revalidated with a conditional GET.
+
     Args:
         feed_id: UUID of the feed to retrieve
         ctx: FastMCP context (optional)
@@ -212,41 +473,53 @@ async def get_feed(
     base_url = get_api_base_url()
     auth_headers = get_auth_headers()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/feeds/{feed_id}",
-                headers=auth_headers
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            elif response.status_code == 404:
-                return {
-                    "error": f"Feed not found: {feed_id}",
-                    "suggestion": "Use list_feeds to see available feeds"
-                }
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
+    # Recently validated copy for this user - no round trip
+    cache_key = _feed_cache_key("feed", feed_id)
+    cached = _feed_cache.get(cache_key) if cache_key else None
+    if _fresh_cached(cached):
+        return copy.deepcopy(cached["data"])
+
+    client = get_feed_client()
+    try:
+        response = await client.get(
+            f"{base_url}/feeds/{feed_id}",
+            headers=_conditional_headers(auth_headers, cached),
+            timeout=feed_timeout("get_feed")
+        )
+
+        if response.status_code == 304 and cached:
+            return _revalidated(cache_key, cached)
+        elif response.status_code == 200:
+            data = response.json()
+            _store_cached(cache_key, data, response.headers.get("etag"))
+            return data
+        elif response.status_code == 401:
             return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
             }
-        except httpx.RequestError as e:
+        elif response.status_code == 404:
+            invalidate_feed_cache(feed_id)
             return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+                "error": f"Feed not found: {feed_id}",
+                "suggestion": "Use list_feeds to see available feeds"
             }
+        else:
+            return {
+                "error": f"API error: {response.status_code}",
+                "details": response.text
+            }
+
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
 
 
 async def update_feed(
@@ -291,50 +564,55 @@ async def update_feed(
             "suggestion": "Provide at least one field to update: name, website_url, analysis, or selected_subreddits"
         }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.put(
-                f"{base_url}/feeds/{feed_id}",
-                json=payload,
-                headers=auth_headers
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            elif response.status_code == 404:
-                return {
-                    "error": f"Feed not found: {feed_id}",
-                    "suggestion": "Use list_feeds to see available feeds"
-                }
-            elif response.status_code == 422:
-                error_data = response.json()
-                return {
-                    "error": "Validation error",
-                    "details": error_data.get("details", error_data),
-                    "suggestion": "Check that all fields meet validation requirements"
-                }
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
+    client = get_feed_client()
+    try:
+        response = await client.put(
+            f"{base_url}/feeds/{feed_id}",
+            json=payload,
+            headers=auth_headers,
+            timeout=feed_timeout("update_feed")
+        )
+
+        if response.status_code == 200:
+            # Write through the new document; the derived config is refetched
+            data = response.json()
+            invalidate_feed_cache(feed_id)
+            _store_cached(_feed_cache_key("feed", feed_id), data, response.headers.get("etag"))
+            return data
+        elif response.status_code == 401:
+            return {
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
+            }
+        elif response.status_code == 404:
+            return {
+                "error": f"Feed not found: {feed_id}",
+                "suggestion": "Use list_feeds to see available feeds"
+            }
+        elif response.status_code == 422:
+            error_data = response.json()
             return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
+                "error": "Validation error",
+                "details": error_data.get("details", error_data),
+                "suggestion": "Check that all fields meet validation requirements"
             }
-        except httpx.RequestError as e:
+        else:
             return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+                "error": f"API error: {response.status_code}",
+                "details": response.text
             }
 
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
+
 
 async def delete_feed(
     feed_id: str,
@@ -353,41 +631,45 @@ async def delete_feed(
     base_url = get_api_base_url()
     auth_headers = get_auth_headers()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.delete(
-                f"{base_url}/feeds/{feed_id}",
-                headers=auth_headers
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            elif response.status_code == 404:
-                return {
-                    "error": f"Feed not found: {feed_id}",
-                    "suggestion": "Use list_feeds to see available feeds"
-                }
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
+    client = get_feed_client()
+    try:
+        response = await client.delete(
+            f"{base_url}/feeds/{feed_id}",
+            headers=auth_headers,
+            timeout=feed_timeout("delete_feed")
+        )
+
+        if response.status_code in (200, 404):
+            invalidate_feed_cache(feed_id)
+
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 401:
             return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
             }
-        except httpx.RequestError as e:
+        elif response.status_code == 404:
             return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+                "error": f"Feed not found: {feed_id}",
+                "suggestion": "Use list_feeds to see available feeds"
             }
+        else:
+            return {
+                "error": f"API error: {response.status_code}",
+                "details": response.text
+            }
+
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
 
 
 async def get_feed_config(
@@ -397,6 +679,9 @@ async def get_feed_config(
     """
     Get configuration for a feed.
 
+    Cached per user like get_feed, and dropped when the feed is updated or
+    deleted.
+
     Args:
         feed_id: UUID of the feed to get config for
         ctx: FastMCP context (optional)
@@ -407,38 +692,193 @@ async def get_feed_config(
     base_url = get_api_base_url()
     auth_headers = get_auth_headers()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/feeds/{feed_id}/config",
-                headers=auth_headers
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {
-                    "error": "Authentication required",
-                    "suggestion": "Ensure you are authenticated with valid Descope credentials"
-                }
-            elif response.status_code == 404:
-                return {
-                    "error": f"Feed not found: {feed_id}",
-                    "suggestion": "Use list_feeds to see available feeds"
-                }
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text
-                }
-
-        except httpx.TimeoutException:
+    # Recently validated copy for this user - no round trip
+    cache_key = _feed_cache_key("config", feed_id)
+    cached = _feed_cache.get(cache_key) if cache_key else None
+    if _fresh_cached(cached):
+        return copy.deepcopy(cached["data"])
+
+    client = get_feed_client()
+    try:
+        response = await client.get(
+            f"{base_url}/feeds/{feed_id}/config",
+            headers=_conditional_headers(auth_headers, cached),
+            timeout=feed_timeout("get_feed_config")
+        )
+
+        if response.status_code == 304 and cached:
+            data = _revalidated(cache_key, cached)
+            get_feed_prefetcher().register_feed(feed_id, data.get("subreddits"))
+            return data
+        elif response.status_code == 200:
+            data = response.json()
+            _store_cached(cache_key, data, response.headers.get("etag"))
+            # Mark the feed active so its subreddits stay warm in the listing cache
+            get_feed_prefetcher().register_feed(feed_id, data.get("subreddits"))
+            return data
+        elif response.status_code == 401:
             return {
-                "error": "Request timeout",
-                "suggestion": "The API server may be unavailable. Try again later."
+                "error": "Authentication required",
+                "suggestion": "Ensure you are authenticated with valid Descope credentials"
             }
-        except httpx.RequestError as e:
+        elif response.status_code == 404:
+            invalidate_feed_cache(feed_id)
+            get_feed_prefetcher().register_feed(feed_id, None)
             return {
-                "error": f"Request failed: {str(e)}",
-                "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+                "error": f"Feed not found: {feed_id}",
+                "suggestion": "Use list_feeds to see available feeds"
             }
+        else:
+            return {
+                "error": f"API error: {response.status_code}",
+                "details": response.text
+            }
+
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timeout",
+            "suggestion": "The API server may be unavailable. Try again later."
+        }
+    except httpx.RequestError as e:
+        return {
+            "error": f"Request failed: {str(e)}",
+            "suggestion": "Check that AUDIENCE_API_URL is correctly configured"
+        }
+
+
+# Concurrent Reddit fetches per fetch_feed_posts call
+FEED_FETCH_CONCURRENCY = int(os.getenv("FEED_FETCH_CONCURRENCY", "8"))
+
+
+async def fetch_feed_posts(
+    feed_id: str,
+    reddit,
+    listing_type: Literal["hot", "new", "top", "rising"] = "hot",
+    time_filter: Optional[Literal["all", "year", "month", "week", "day"]] = None,
+    limit_per_subreddit: int = 10,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Fetch posts from every subreddit in a saved feed.
+
+    Resolves the feed's subreddits from its config, fetches all of them
+    concurrently through the shared listing cache, honors the feed's
+    show_nsfw setting and merges the posts with duplicates removed.
+
+    Args:
+        feed_id: UUID of the feed
+        reddit: Configured Reddit client
+        listing_type: hot, new, top or rising (default hot)
+        time_filter: Time filter for top posts
+        limit_per_subreddit: Maximum posts per subreddit (1-100, default 10)
+        ctx: FastMCP context (optional)
+
+    Returns:
+        Merged posts plus a status entry for each subreddit
+    """
+    if listing_type not in ("hot", "new", "top", "rising"):
+        return {
+            "error": f"Invalid listing_type: {listing_type}",
+            "suggestion": "Use one of: hot, new, top, rising"
+        }
+    limit_per_subreddit = min(max(1, limit_per_subreddit), 100)
+
+    config = await get_feed_config(feed_id, ctx=ctx)
+    if "error" in config:
+        return config
+
+    subreddits = list(dict.fromkeys(config.get("subreddits") or []))
+    if not subreddits:
+        return {
+            "error": f"Feed {feed_id} has no subreddits",
+            "suggestion": "Use update_feed to add subreddits to this feed"
+        }
+    show_nsfw = bool(config.get("show_nsfw", False))
+
+    semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+    progress = ProgressReporter(ctx, total=len(subreddits))
+    completed = 0
+
+    async def fetch_one(name: str):
+        nonlocal completed
+        async with semaphore:
+            try:
+                result = await get_listing(reddit, name, listing_type, time_filter, limit_per_subreddit)
+            except Exception as e:
+                result = e
+        completed += 1
+        progress.update(completed, f"Fetched r/{name}")
+        return result
+
+    # Stop waiting at the operation deadline; unfinished subreddits are reported as skipped
+    tasks = [asyncio.create_task(fetch_one(name)) for name in subreddits]
+    await wait_until(tasks, soft_deadline())
+    outcomes = []
+    for task in tasks:
+        if task.done():
+            outcomes.append(task.result())
+        else:
+            task.cancel()
+            outcomes.append(DeadlineExceeded("Deadline reached before this subreddit was fetched"))
+    await progress.finish(message=f"Fetched {len(subreddits)} subreddits")
+
+    posts: List[Dict[str, Any]] = []
+    subreddit_status: Dict[str, Dict[str, Any]] = {}
+    seen_ids = set()
+    seen_urls = set()
+    duplicates = 0
+    nsfw_filtered = 0
+    cache_hits = 0
+
+    for name, outcome in zip(subreddits, outcomes):
+        if isinstance(outcome, Exception):
+            subreddit_status[name] = listing_error(outcome)
+            continue
+
+        listing, cached = outcome
+        cache_hits += cached
+        kept = 0
+        hidden = 0
+        for post in listing:
+            if post.get("over_18") and not show_nsfw:
+                hidden += 1
+                continue
+            # Crossposts and reposts of the same link count once
+            link = post["url"] if "reddit.com" not in post["url"] else None
+            if post["id"] in seen_ids or (link and link in seen_urls):
+                duplicates += 1
+                continue
+            seen_ids.add(post["id"])
+            if link:
+                seen_urls.add(link)
+            posts.append(post)
+            kept += 1
+
+        nsfw_filtered += hidden
+        subreddit_status[name] = {"status": "ok", "posts": kept, "cached": bool(cached)}
+        if hidden:
+            subreddit_status[name]["nsfw_filtered"] = hidden
+
+    if listing_type == "new":
+        posts.sort(key=lambda p: -p["created_utc"])
+    else:
+        posts.sort(key=lambda p: -p["score"])
+
+    failed = [name for name, status in subreddit_status.items() if status["status"] != "ok"]
+    return {
+        "feed_id": feed_id,
+        "feed_name": config.get("profile_name"),
+        "listing_type": listing_type,
+        "posts": posts,
+        "subreddit_status": subreddit_status,
+        "summary": {
+            "subreddits": len(subreddits),
+            "succeeded": len(subreddits) - len(failed),
+            "failed": len(failed),
+            "total_posts": len(posts),
+            "duplicates_removed": duplicates,
+            "nsfw_filtered": nsfw_filtered,
+            "cache_hits": cache_hits,
+            "partial": any(status["status"] == "skipped" for status in subreddit_status.values())
+        }
+    }
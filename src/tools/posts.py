@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, Literal, List
+from typing import Optional, Dict, Any, Literal, List, Tuple
 import praw
 from prawcore import (
     NotFound,
@@ -10,6 +10,8 @@ from prawcore import (
 )
 from fastmcp import Context
 from ..models import SubredditPostsResult, RedditPost, SubredditInfo
+from ..catalog import get_subreddit_catalog
+from ..progress import ProgressReporter
 
 
 def fetch_subreddit_posts(
@@ -151,12 +153,46 @@ def fetch_subreddit_posts(
         }
 
 
+def _screen_subreddit_names(names: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Check names against the subreddit catalog before calling Reddit.
+
+    Indexed names get their canonical casing. Unindexed names are always
+    kept, since the catalog only covers indexed communities and a close
+    match (r/Python3 vs r/Python) may be a real subreddit; names that
+    closely resemble an indexed one get did-you-mean suggestions instead.
+    Does nothing until the catalog has been loaded.
+
+    Returns:
+        Tuple of (names to fetch, {unindexed name: suggested indexed names})
+    """
+    catalog = get_subreddit_catalog()
+    if not catalog.is_loaded:
+        return names, {}
+
+    kept = []
+    suggestions = {}
+    for name in names:
+        entry = catalog.lookup(name)
+        if entry:
+            kept.append(entry["name"])
+            continue
+
+        kept.append(name)
+        close = catalog.suggest(name)
+        if close:
+            suggestions[name] = close
+
+    return kept, suggestions
+
+
 async def fetch_multiple_subreddits(
     subreddit_names: List[str],
     reddit: praw.Reddit,
     listing_type: Literal["hot", "new", "top", "rising"] = "hot",
     time_filter: Optional[Literal["all", "year", "month", "week", "day"]] = None,
     limit_per_subreddit: int = 5,
+    validate_names: bool = True,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """
@@ -168,6 +204,8 @@ async def fetch_multiple_subreddits(
         listing_type: Type of listing to fetch
         time_filter: Time filter for top posts
         limit_per_subreddit: Maximum posts per subreddit (max 25)
+        validate_names: Check names against the subreddit catalog (canonical
+            casing, did-you-mean hints for names close to indexed ones)
         ctx: FastMCP context (auto-injected by decorator)
 
     Returns:
@@ -181,6 +219,13 @@ async def fetch_multiple_subreddits(
         
         # Clean subreddit names and join with +
         clean_names = [name.replace("r/", "").replace("/r/", "").strip() for name in subreddit_names]
+
+        # Canonical casing and hints for likely misspellings (nothing is dropped)
+        requested_names = clean_names
+        suggestions = {}
+        if validate_names:
+            clean_names, suggestions = _screen_subreddit_names(clean_names)
+
         multi_subreddit_str = "+".join(clean_names)
         
         # Get combined subreddit
@@ -205,6 +250,7 @@ async def fetch_multiple_subreddits(
             # Parse posts and group by subreddit
             posts_by_subreddit = {}
             processed_subreddits = set()
+            progress = ProgressReporter(ctx, total=len(clean_names))
 
             for submission in submissions:
                 subreddit_name = submission.subreddit.display_name
@@ -212,12 +258,7 @@ async def fetch_multiple_subreddits(
                 # Report progress when encountering a new subreddit
                 if subreddit_name not in processed_subreddits:
                     processed_subreddits.add(subreddit_name)
-                    if ctx:
-                        await ctx.report_progress(
-                            progress=len(processed_subreddits),
-                            total=len(clean_names),
-                            message=f"Fetching r/{subreddit_name}"
-                        )
+                    progress.update(len(processed_subreddits), f"Fetching r/{subreddit_name}")
 
                 if subreddit_name not in posts_by_subreddit:
                     posts_by_subreddit[subreddit_name] = []
@@ -235,22 +276,33 @@ async def fetch_multiple_subreddits(
                         "permalink": f"https://reddit.com{submission.permalink}"
                     })
             
+            await progress.finish(
+                progress=len(processed_subreddits),
+                message=f"Fetched {len(processed_subreddits)} subreddits"
+            )
+
             found_names = list(posts_by_subreddit.keys())
             missing_names = [name for name in clean_names
                            if name.lower() not in [k.lower() for k in found_names]]
+            failure_reasons = {}
+            for name in missing_names:
+                reason = "No posts returned (may be private, banned, empty, or misspelled)"
+                if name in suggestions:
+                    reason += " - did you mean " + ", ".join(f"r/{s}" for s in suggestions[name]) + "?"
+                failure_reasons[name] = reason
 
-            return {
-                "subreddits_requested": clean_names,
+            result = {
+                "subreddits_requested": requested_names,
                 "subreddits_found": found_names,
                 "subreddits_failed": missing_names,
-                "failure_reasons": {
-                    name: "No posts returned (may be private, banned, empty, or misspelled)"
-                    for name in missing_names
-                } if missing_names else {},
+                "failure_reasons": failure_reasons,
                 "posts_by_subreddit": posts_by_subreddit,
                 "total_posts": sum(len(posts) for posts in posts_by_subreddit.values()),
-                "success_rate": f"{len(found_names)}/{len(clean_names)}"
+                "success_rate": f"{len(found_names)}/{len(requested_names)}"
             }
+            if suggestions:
+                result["did_you_mean"] = suggestions
+            return result
 
         except TooManyRequests as e:
             return {
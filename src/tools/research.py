@@ -0,0 +1,294 @@
+"""Server-side research pipeline: discover → fetch → select → comments."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Literal, Optional, Union
+
+import praw
+from praw.models import Comment as PrawComment
+from fastmcp import Context
+
+from ..deadline import soft_deadline, wait_until
+from ..listings import get_listing, listing_error
+from ..progress import ProgressReporter
+from .discover import discover_subreddits
+
+# Per-depth budgets: how wide to search and how much Reddit/wall-clock time to spend
+RESEARCH_DEPTHS: Dict[str, Dict[str, Any]] = {
+    "quick": {
+        "subreddits": 3, "posts_per_subreddit": 10, "top_posts": 5,
+        "comments_per_post": 5, "max_reddit_calls": 10, "time_budget_seconds": 20
+    },
+    "standard": {
+        "subreddits": 6, "posts_per_subreddit": 15, "top_posts": 10,
+        "comments_per_post": 8, "max_reddit_calls": 20, "time_budget_seconds": 40
+    },
+    "deep": {
+        "subreddits": 10, "posts_per_subreddit": 25, "top_posts": 20,
+        "comments_per_post": 12, "max_reddit_calls": 35, "time_budget_seconds": 90
+    }
+}
+RESEARCH_CONCURRENCY = 6
+RESEARCH_MIN_CONFIDENCE = 0.3      # Discovery results below this are dropped (unless nothing passes)
+COMMENT_WEIGHT = 2.0               # Engagement = score + COMMENT_WEIGHT * num_comments
+MAX_POSTS_PER_SUBREDDIT_SHARE = 0.5  # No subreddit supplies more than half the selected posts
+BODY_PREVIEW_CHARS = 500
+
+
+def engagement(post: Dict[str, Any]) -> float:
+    """Engagement score used to pick posts worth reading comments for."""
+    return post.get("score", 0) + COMMENT_WEIGHT * post.get("num_comments", 0)
+
+
+def select_posts(posts: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """
+    Top posts by engagement, capped per subreddit so one community can't crowd out the rest.
+    """
+    per_subreddit_cap = max(1, int(count * MAX_POSTS_PER_SUBREDDIT_SHARE))
+    taken: Dict[str, int] = {}
+    selected = []
+    overflow = []
+    for post in sorted(posts, key=engagement, reverse=True):
+        sub = post["subreddit"].lower()
+        if taken.get(sub, 0) < per_subreddit_cap:
+            taken[sub] = taken.get(sub, 0) + 1
+            selected.append(post)
+        else:
+            overflow.append(post)
+        if len(selected) == count:
+            return selected
+    # Fill up from capped subreddits when the others run out
+    return selected + overflow[:count - len(selected)]
+
+
+def fetch_top_comments(reddit: praw.Reddit, post_id: str, limit: int) -> Dict[str, Any]:
+    """
+    Fetch a post's body and its top-level comments by score (blocking, one Reddit call).
+    """
+    submission = reddit.submission(id=post_id)
+    submission.comment_sort = "top"
+    submission.comment_limit = limit
+    submission.comments.replace_more(limit=0)
+
+    comments = []
+    for comment in submission.comments:
+        if not isinstance(comment, PrawComment) and not hasattr(comment, "body"):
+            continue
+        if len(comments) >= limit:
+            break
+        comments.append({
+            "id": comment.id,
+            "author": str(comment.author) if comment.author else "[deleted]",
+            "score": comment.score,
+            "body": _preview(comment.body),
+            "permalink": f"https://reddit.com{comment.permalink}"
+        })
+    comments.sort(key=lambda c: c["score"], reverse=True)
+    return {"selftext": _preview(submission.selftext or ""), "comments": comments}
+
+
+def _preview(text: str) -> str:
+    if len(text) <= BODY_PREVIEW_CHARS:
+        return text
+    return text[:BODY_PREVIEW_CHARS].rstrip() + "…"
+
+
+async def research(
+    topic: str,
+    reddit: praw.Reddit,
+    depth: Literal["quick", "standard", "deep"] = "standard",
+    queries: Optional[Union[List[str], str]] = None,
+    time_filter: Literal["all", "year", "month", "week", "day"] = "year",
+    include_nsfw: bool = False,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Research a topic end to end and return a citation-ready corpus.
+
+    Runs batch discovery, fetches the top listings of the best-matching
+    subreddits concurrently (through the shared listing cache), picks the
+    most engaging posts and fetches their top comments concurrently - all
+    within the depth's Reddit call and time budgets. Work that doesn't fit
+    the budget is skipped and reported, never waited for.
+
+    Args:
+        topic: What to research
+        reddit: Configured Reddit client
+        depth: quick, standard or deep (sets breadth and budgets)
+        queries: Extra discovery queries alongside the topic
+        time_filter: Time window for top posts
+        include_nsfw: Whether to include NSFW communities and posts
+        ctx: FastMCP context (auto-injected by decorator)
+
+    Returns:
+        Dictionary with subreddits, posts (with top comments, permalinks
+        and scores) and a summary of calls, time and anything skipped
+    """
+    if depth not in RESEARCH_DEPTHS:
+        return {
+            "error": f"Unknown depth '{depth}'",
+            "suggestion": f"Use one of: {', '.join(RESEARCH_DEPTHS)}"
+        }
+    if not topic or not topic.strip():
+        return {"error": "topic is required", "suggestion": "Describe what to research, e.g. 'home espresso machines'"}
+
+    budget = RESEARCH_DEPTHS[depth]
+    started = time.monotonic()
+    # The depth's time budget, or the operation deadline if that comes first
+    deadline = soft_deadline(budget["time_budget_seconds"])
+    calls = {"reddit": 0, "cache_hits": 0}
+    skipped: Dict[str, Any] = {}
+    progress = ProgressReporter(ctx, total=4)
+
+    # 1. Discovery (vector index, no Reddit calls)
+    extra = [queries] if isinstance(queries, str) else list(queries or [])
+    all_queries = list(dict.fromkeys([topic.strip()] + [q.strip() for q in extra if q and q.strip()]))
+    progress.update(0, "Discovering communities")
+    if len(all_queries) == 1:
+        discovery = await discover_subreddits(
+            query=all_queries[0], limit=budget["subreddits"] * 2, include_nsfw=include_nsfw
+        )
+    else:
+        discovery = await discover_subreddits(
+            queries=all_queries, merge=True, limit=budget["subreddits"] * 2, include_nsfw=include_nsfw
+        )
+    if "error" in discovery:
+        return discovery
+
+    candidates = discovery.get("subreddits", [])
+    confident = [s for s in candidates if s.get("confidence", 0) >= RESEARCH_MIN_CONFIDENCE]
+    communities = (confident or candidates)[:budget["subreddits"]]
+    if not communities:
+        return {
+            "error": f"No communities found for '{topic}'",
+            "suggestion": "Try a broader or differently worded topic"
+        }
+
+    # 2. Fan-out listing fetches
+    progress.update(1, f"Fetching posts from {len(communities)} communities")
+    semaphore = asyncio.Semaphore(RESEARCH_CONCURRENCY)
+
+    def reserve_call() -> bool:
+        if calls["reddit"] >= budget["max_reddit_calls"]:
+            return False
+        calls["reddit"] += 1
+        return True
+
+    async def fetch_listing_for(name: str):
+        async with semaphore:
+            return await get_listing(reddit, name, "top", time_filter, budget["posts_per_subreddit"])
+
+    listing_tasks: Dict[str, asyncio.Task] = {}
+    comment_tasks: Dict[str, asyncio.Task] = {}
+    try:
+        for community in communities:
+            # Listing reads may be cache hits; reserve a call anyway and refund hits below
+            if not reserve_call():
+                skipped.setdefault("subreddits_over_call_budget", []).append(community["name"])
+                continue
+            listing_tasks[community["name"]] = asyncio.create_task(fetch_listing_for(community["name"]))
+
+        subreddit_status: Dict[str, Dict[str, Any]] = {}
+        posts: List[Dict[str, Any]] = []
+        await wait_until(listing_tasks.values(), deadline)
+        for name, task in listing_tasks.items():
+            if not task.done():
+                task.cancel()
+                subreddit_status[name] = {"status": "skipped", "error": "Time budget exhausted"}
+                continue
+            if task.exception() is not None:
+                subreddit_status[name] = listing_error(task.exception())
+                continue
+            listing, cached = task.result()
+            if cached:
+                calls["reddit"] -= 1
+                calls["cache_hits"] += 1
+            kept = [p for p in listing if include_nsfw or not p.get("over_18")]
+            posts.extend(kept)
+            subreddit_status[name] = {"status": "ok", "posts": len(kept), "cached": bool(cached)}
+
+        # 3. Pick the most engaging posts (deduplicated across crossposts)
+        progress.update(2, "Selecting top posts")
+        unique = list({post["id"]: post for post in posts}.values())
+        selected = select_posts(unique, budget["top_posts"])
+
+        # 4. Concurrent comment fetches within the remaining budget
+        progress.update(3, f"Reading comments on {len(selected)} posts")
+
+        async def fetch_comments_for(post: Dict[str, Any]):
+            async with semaphore:
+                return await asyncio.to_thread(fetch_top_comments, reddit, post["id"], budget["comments_per_post"])
+
+        for post in selected:
+            if not reserve_call():
+                skipped.setdefault("posts_over_call_budget", []).append(post["id"])
+                continue
+            comment_tasks[post["id"]] = asyncio.create_task(fetch_comments_for(post))
+
+        await wait_until(comment_tasks.values(), deadline)
+        corpus = []
+        for post in selected:
+            entry = {
+                "id": post["id"],
+                "title": post["title"],
+                "subreddit": post["subreddit"],
+                "author": post["author"],
+                "score": post["score"],
+                "num_comments": post["num_comments"],
+                "engagement": engagement(post),
+                "created_utc": post["created_utc"],
+                "permalink": post["permalink"],
+                "url": post["url"],
+                "comments": []
+            }
+            task = comment_tasks.get(post["id"])
+            if task is None:
+                # Over the call budget (already listed in skipped)
+                corpus.append(entry)
+                continue
+            if not task.done():
+                task.cancel()
+                skipped.setdefault("posts_over_time_budget", []).append(post["id"])
+            elif task.exception() is not None:
+                entry["comments_error"] = listing_error(task.exception())["error"]
+            else:
+                entry.update(task.result())
+            corpus.append(entry)
+
+        elapsed = time.monotonic() - started
+        await progress.finish(message=f"Research complete: {len(corpus)} posts")
+
+        confidence_by_name = {c["name"]: c.get("confidence") for c in communities}
+        return {
+            "topic": topic,
+            "depth": depth,
+            "subreddits": [
+                {
+                    "name": c["name"],
+                    "confidence": confidence_by_name[c["name"]],
+                    "subscribers": c.get("subscribers"),
+                    "url": c.get("url"),
+                    **{k: v for k, v in subreddit_status.get(c["name"], {"status": "skipped"}).items() if k != "cached"}
+                }
+                for c in communities
+            ],
+            "posts": corpus,
+            "summary": {
+                "queries": all_queries,
+                "subreddits_searched": sum(1 for s in subreddit_status.values() if s["status"] == "ok"),
+                "posts_considered": len(unique),
+                "posts_selected": len(corpus),
+                "comments_collected": sum(len(p["comments"]) for p in corpus),
+                "reddit_calls": calls["reddit"],
+                "cache_hits": calls["cache_hits"],
+                "elapsed_seconds": round(elapsed, 2),
+                "budget": budget,
+                "budget_exhausted": bool(skipped),
+                "skipped": skipped
+            }
+        }
+    finally:
+        # Cancelled or failed midway: stop the fetches still in flight
+        for task in [*listing_tasks.values(), *comment_tasks.values()]:
+            if not task.done():
+                task.cancel()
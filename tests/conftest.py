@@ -0,0 +1,20 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.shared_cache import MemoryBackend, reset_cache_backend
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache_backend():
+    """Give every test an empty in-memory cache backend."""
+    reset_cache_backend(MemoryBackend())
+    yield
+    reset_cache_backend()
@@ -0,0 +1,141 @@
+"""
+Tests for per-user admission control and fair queuing.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import serve
+from src.admission import (
+    AdmissionController, AdmissionRejected, get_admission_controller, parse_user_weights,
+    reset_admission_controller
+)
+from src.operations import get_operation
+
+
+async def run_jobs(controller, jobs, hold=0.02):
+    """Run (user, cost) jobs, returning users in the order they were admitted."""
+    order = []
+
+    async def job(user, cost):
+        async with controller.admit(user, cost):
+            order.append(user)
+            await asyncio.sleep(hold)
+
+    await asyncio.gather(*(job(user, cost) for user, cost in jobs))
+    return order
+
+
+class TestAdmissionController:
+
+    async def test_per_user_concurrency_limit(self):
+        controller = AdmissionController(max_concurrency=10, user_concurrency=2, user_queue=10)
+        peak = {"running": 0, "max": 0}
+
+        async def job():
+            async with controller.admit("alice"):
+                peak["running"] += 1
+                peak["max"] = max(peak["max"], peak["running"])
+                await asyncio.sleep(0.02)
+                peak["running"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(6)))
+        assert peak["max"] == 2
+        assert controller.stats()["active"] == 0
+
+    async def test_burst_does_not_starve_other_users(self):
+        controller = AdmissionController(max_concurrency=1, user_concurrency=1, user_queue=20)
+        jobs = [("burst", 1)] * 6 + [("bob", 1), ("carol", 1)]
+        order = await run_jobs(controller, jobs)
+
+        # bob and carol arrive after the whole burst but are served within the first few slots
+        assert order.index("bob") <= 2
+        assert order.index("carol") <= 3
+
+    async def test_weights_and_costs_shift_the_share(self):
+        controller = AdmissionController(
+            max_concurrency=1, user_concurrency=1, user_queue=20, user_weights={"heavy": 3}
+        )
+        jobs = [("heavy", 1)] * 6 + [("light", 1)] * 6
+        order = await run_jobs(controller, jobs, hold=0.005)
+        assert order[:8].count("heavy") > order[:8].count("light")
+
+        controller = AdmissionController(max_concurrency=1, user_concurrency=1, user_queue=20)
+        jobs = [("research", 10)] * 2 + [("fetch", 1)] * 6
+        order = await run_jobs(controller, jobs, hold=0.005)
+        assert order[:4].count("fetch") >= 3
+
+    async def test_full_queue_rejected_with_retry_after(self):
+        controller = AdmissionController(max_concurrency=1, user_concurrency=1, user_queue=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.admit("alice"):
+                await release.wait()
+
+        running = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(controller.acquire("alice"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire("alice")
+        assert exc.value.retry_after >= 1
+
+        release.set()
+        await running
+        await queued
+        controller.release("alice", 0.0)
+        assert controller.stats() == {**controller.stats(), "active": 0, "queued": 0, "rejected": 1}
+
+    async def test_wait_timeout_rejects_and_frees_queue_position(self):
+        controller = AdmissionController(max_concurrency=1, user_concurrency=1, user_queue=5)
+        await controller.acquire("alice")
+
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("bob", timeout=0.02)
+        assert controller.stats()["queued"] == 0
+
+        controller.release("alice", 0.0)
+        await asyncio.wait_for(controller.acquire("bob"), timeout=1)
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        controller = AdmissionController(max_concurrency=1, user_concurrency=1)
+        await controller.acquire("alice")
+        waiter = asyncio.create_task(controller.acquire("bob"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        controller.release("alice", 0.0)
+        assert controller.stats()["active"] == 0
+        assert controller.stats()["queued"] == 0
+
+
+class TestAdmissionConfig:
+
+    def test_parse_user_weights(self):
+        assert parse_user_weights("a=2, b=0.5,bad,c=-1,d=x") == {"a": 2.0, "b": 0.5}
+
+    def test_only_reddit_operations_are_admitted(self):
+        assert get_operation("research").reddit_cost == 10
+        assert get_operation("fetch_comments").reddit_cost == 1
+        assert get_operation("discover_subreddits").reddit_cost == 0
+        assert get_operation("query_corpus").reddit_cost == 0
+
+    def test_limits_are_split_across_workers(self, monkeypatch):
+        monkeypatch.setattr(serve, "WORKER_COUNT", 4)
+        reset_admission_controller()
+        try:
+            controller = get_admission_controller()
+            assert controller.max_concurrency == 2      # 8 slots across 4 workers
+            assert controller.user_concurrency == 1     # Never below one per worker
+            assert controller.user_queue == 2
+        finally:
+            reset_admission_controller()
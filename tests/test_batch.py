@@ -0,0 +1,185 @@
+"""
+Tests for multi-operation batch execution.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.batch import BatchError, resolve_path, run_batch, validate_steps
+
+
+POSTS = {
+    "posts_by_subreddit": {
+        "espresso": [{"id": "a", "score": 5}, {"id": "b", "score": 3}],
+        "coffee": [{"id": "c", "score": 9}]
+    }
+}
+
+
+class FakeRunner:
+    """Scripted operations recording calls and peak concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.calls = []
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, operation_id, parameters):
+        self.calls.append((operation_id, parameters))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+
+        if operation_id == "discover_subreddits":
+            return {"success": True, "data": {"subreddits": [{"name": "espresso"}, {"name": "coffee"}]}}
+        if operation_id == "fetch_multiple":
+            return {"success": True, "data": POSTS}
+        if operation_id == "fetch_comments":
+            if parameters["submission_id"] == "b":
+                return {"success": False, "error": "Submission not found"}
+            return {"success": True, "data": {"id": parameters["submission_id"], "comments": []}}
+        return {"success": False, "error": f"Unknown operation: {operation_id}"}
+
+
+PIPELINE = [
+    {"id": "discover", "operation": "discover_subreddits", "parameters": {"query": "coffee"}},
+    {
+        "id": "posts", "operation": "fetch_multiple", "return_data": False,
+        "parameters": {"subreddit_names": {"$ref": "discover.subreddits[*].name"}}
+    },
+    {
+        "id": "comments", "operation": "fetch_comments",
+        "for_each": {"submission_id": {"$ref": "posts.posts_by_subreddit.*[*].id", "limit": 2}},
+        "parameters": {"comment_limit": 10}
+    }
+]
+
+
+class TestResolvePath:
+
+    def test_keys_indexes_and_wildcards(self):
+        assert resolve_path(POSTS, "posts_by_subreddit.espresso[0].id") == "a"
+        assert resolve_path(POSTS, "posts_by_subreddit.*[*].id") == ["a", "b", "c"]
+        assert resolve_path(POSTS, "posts_by_subreddit.*[*].id[1:]") == ["b", "c"]
+        assert resolve_path({"s": [{"n": 1}, {"n": 2}]}, "s[*].n") == [1, 2]
+        assert resolve_path(POSTS, "") is POSTS
+
+    def test_missing_key_raises(self):
+        with pytest.raises(KeyError):
+            resolve_path(POSTS, "posts_by_subreddit.tea")
+
+
+class TestValidateSteps:
+
+    def test_dependencies_from_references(self):
+        deps = validate_steps(PIPELINE)
+        assert deps == {"discover": set(), "posts": {"discover"}, "comments": {"posts"}}
+
+    @pytest.mark.parametrize("steps", [
+        [],
+        [{"id": "a"}],
+        [{"id": "a", "operation": "x"}, {"id": "a", "operation": "x"}],
+        [{"id": "a", "operation": "x", "parameters": {"v": {"$ref": "missing.data"}}}],
+        [{"id": "a", "operation": "x", "depends_on": ["b"]}, {"id": "b", "operation": "x", "depends_on": ["a"]}],
+    ])
+    def test_invalid_batches_rejected(self, steps):
+        with pytest.raises(BatchError):
+            validate_steps(steps)
+
+    def test_unknown_operation_rejected(self):
+        with pytest.raises(BatchError):
+            validate_steps([{"id": "a", "operation": "nope"}], known_operations={"fetch_posts"})
+
+
+class TestRunBatch:
+
+    async def test_pipeline_in_one_call(self):
+        runner = FakeRunner()
+        result = await run_batch(PIPELINE, runner)
+
+        assert runner.calls[1] == ("fetch_multiple", {"subreddit_names": ["espresso", "coffee"]})
+        comments = result["results"]["comments"]
+        assert comments["success"] is True
+        assert [item["submission_id"] for item in comments["items"]] == ["a", "b"]
+        assert comments["items"][1]["error"] == "Submission not found"
+        assert comments["data"] == [{"id": "a", "comments": []}]
+        assert "data" not in result["results"]["posts"]
+        assert result["summary"]["succeeded"] == 3
+
+    async def test_independent_steps_run_concurrently(self):
+        runner = FakeRunner(delay=0.05)
+        steps = [{"id": f"s{i}", "operation": "discover_subreddits", "parameters": {}} for i in range(3)]
+        await run_batch(steps, runner)
+        assert runner.peak == 3
+
+    async def test_concurrency_cap(self):
+        runner = FakeRunner(delay=0.02)
+        steps = [{"id": f"s{i}", "operation": "discover_subreddits", "parameters": {}} for i in range(6)]
+        await run_batch(steps, runner, max_concurrency=2)
+        assert runner.peak == 2
+
+    async def test_failed_dependency_skips_dependents(self):
+        steps = [
+            {"id": "bad", "operation": "nope"},
+            {"id": "after", "operation": "fetch_multiple", "parameters": {"x": {"$ref": "bad.data"}}},
+            {"id": "independent", "operation": "discover_subreddits"}
+        ]
+        result = await run_batch(steps, FakeRunner())
+
+        assert result["results"]["after"]["skipped"] is True
+        assert result["results"]["independent"]["success"] is True
+        assert result["summary"] == {**result["summary"], "succeeded": 1, "failed": 1, "skipped": 1}
+
+    async def test_unresolvable_reference_is_step_error(self):
+        steps = [
+            {"id": "discover", "operation": "discover_subreddits"},
+            {"id": "posts", "operation": "fetch_multiple", "parameters": {"x": {"$ref": "discover.nothing"}}}
+        ]
+        result = await run_batch(steps, FakeRunner())
+        assert "Could not resolve reference" in result["results"]["posts"]["error"]
+
+    async def test_malformed_slice_is_step_error(self):
+        steps = [
+            {"id": "discover", "operation": "discover_subreddits"},
+            {"id": "posts", "operation": "fetch_multiple",
+             "parameters": {"subreddit_names": {"$ref": "discover.subreddits[x:y].name"}}}
+        ]
+        result = await run_batch(steps, FakeRunner())
+        assert result["results"]["discover"]["success"] is True
+        assert "Invalid slice [x:y]" in result["results"]["posts"]["error"]
+
+    async def test_non_numeric_limit_is_step_error(self):
+        steps = [
+            {"id": "discover", "operation": "discover_subreddits"},
+            {"id": "posts", "operation": "fetch_multiple",
+             "parameters": {"subreddit_names": {"$ref": "discover.subreddits[*].name", "limit": "five"}}}
+        ]
+        result = await run_batch(steps, FakeRunner())
+        assert result["results"]["discover"]["success"] is True
+        assert "Invalid limit 'five'" in result["results"]["posts"]["error"]
+
+    async def test_oversized_for_each_is_flagged(self, monkeypatch):
+        monkeypatch.setattr("src.batch.BATCH_MAX_FOR_EACH", 2)
+        steps = [
+            {"id": "posts", "operation": "fetch_multiple"},
+            {"id": "comments", "operation": "fetch_comments",
+             "for_each": {"submission_id": {"$ref": "posts.posts_by_subreddit.*[*].id"}}}
+        ]
+        result = await run_batch(steps, FakeRunner())
+        comments = result["results"]["comments"]
+        assert len(comments["items"]) == 2
+        assert comments["truncated"] is True
+        assert comments["for_each_count"] == 3
+
+    async def test_invalid_batch_returns_error_dict(self):
+        result = await run_batch([{"id": "a"}], FakeRunner())
+        assert "error" in result and "suggestion" in result
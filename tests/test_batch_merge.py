@@ -0,0 +1,85 @@
+"""
+Tests for merged (fused) batch discovery output.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import reset_subreddit_catalog
+from src.tools import discover as discover_module
+from src.tools.discover import discover_subreddits, OverfetchEstimator
+
+
+RESULTS_BY_QUERY = {
+    "espresso": [("espresso", 0.15), ("coffee", 0.3), ("barista", 0.5)],
+    "latte art": [("barista", 0.2), ("latteart", 0.25), ("coffee", 0.6)],
+}
+
+
+def _query(query_texts, n_results, where=None, include=None):
+    rows = RESULTS_BY_QUERY[query_texts[0]]
+    return {
+        'metadatas': [[{'name': name, 'subscribers': 50000, 'nsfw': False} for name, _ in rows]],
+        'distances': [[distance for _, distance in rows]]
+    }
+
+
+@pytest.fixture
+def mock_collection(monkeypatch):
+    reset_subreddit_catalog()
+    monkeypatch.setattr(discover_module, '_overfetch', OverfetchEstimator())
+    collection = Mock()
+    collection.query.side_effect = _query
+    monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+    monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+    yield collection
+    reset_subreddit_catalog()
+
+
+class TestBatchMerge:
+
+    async def test_rrf_merge_dedupes_and_records_queries(self, mock_collection):
+        result = await discover_subreddits(queries=["espresso", "latte art"], merge=True, limit=10)
+
+        assert result['merged'] is True
+        assert mock_collection.query.call_count == 2
+        names = [s['name'] for s in result['subreddits']]
+        assert sorted(names) == ['barista', 'coffee', 'espresso', 'latteart']
+
+        by_name = {s['name']: s for s in result['subreddits']}
+        assert by_name['coffee']['matched_queries'] == ["espresso", "latte art"]
+        assert by_name['espresso']['matched_queries'] == ["espresso"]
+        # Found by both queries, so fused above single-query matches
+        assert set(names[:2]) == {'coffee', 'barista'}
+
+    async def test_duplicate_keeps_best_confidence(self, mock_collection):
+        result = await discover_subreddits(queries=["espresso", "latte art"], merge=True)
+        barista = next(s for s in result['subreddits'] if s['name'] == 'barista')
+        assert barista['distance'] == 0.2
+
+    async def test_max_confidence_strategy(self, mock_collection):
+        result = await discover_subreddits(
+            queries=["espresso", "latte art"], merge=True, merge_strategy="max_confidence"
+        )
+        confidences = [s['confidence'] for s in result['subreddits']]
+        assert confidences == sorted(confidences, reverse=True)
+        assert result['subreddits'][0]['name'] == 'espresso'
+
+    async def test_limit_caps_merged_list_with_cursor(self, mock_collection):
+        result = await discover_subreddits(queries=["espresso", "latte art"], merge=True, limit=2)
+        assert result['summary']['total_found'] == 4
+        assert len(result['subreddits']) == 2
+
+        rest = await discover_subreddits(cursor=result['cursor'], limit=10)
+        assert len(rest['subreddits']) == 2
+        assert mock_collection.query.call_count == 2
+
+    async def test_unknown_strategy(self, mock_collection):
+        result = await discover_subreddits(queries=["espresso"], merge=True, merge_strategy="vote")
+        assert "error" in result
+        mock_collection.query.assert_not_called()
@@ -0,0 +1,69 @@
+"""
+Tests for the bounded TTL cache.
+"""
+
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+
+    def test_get_and_expiry(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_per_entry_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=5, clock=clock)
+
+        cache.set("short", 1, ttl_seconds=1)
+        cache.set("long", 2)
+        clock.now = 2.0
+
+        assert "short" not in cache
+        assert "long" in cache
+
+    def test_lru_eviction(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")          # 'b' is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expired_entries_evicted_first(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=2, ttl_seconds=60, clock=clock)
+
+        cache.set("old", 1, ttl_seconds=1)
+        cache.set("keep", 2)
+        clock.now = 5.0
+        cache.set("new", 3)
+
+        assert cache.get("keep") == 2
+        assert cache.get("new") == 3
@@ -0,0 +1,143 @@
+"""
+Tests for the exact-name subreddit catalog and bulk validation.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, AsyncMock
+from fastmcp import Context
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import SubredditCatalog, get_subreddit_catalog, reset_subreddit_catalog
+from src.tools.discover import validate_subreddit, validate_subreddits
+from src.tools.posts import fetch_multiple_subreddits
+
+
+CATALOG_METADATAS = [
+    {'name': 'Python', 'subscribers': 1200000, 'nsfw': False, 'url': 'https://reddit.com/r/Python'},
+    {'name': 'learnpython', 'subscribers': 800000, 'nsfw': False},
+    {'name': 'MachineLearning', 'subscribers': 2900000, 'nsfw': False},
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalog():
+    """Each test starts with an unloaded catalog."""
+    reset_subreddit_catalog()
+    yield
+    reset_subreddit_catalog()
+
+
+@pytest.fixture
+def mock_collection(monkeypatch):
+    """Collection whose /get pages contain the catalog metadata."""
+    collection = Mock()
+    collection.get.return_value = {'metadatas': CATALOG_METADATAS}
+    collection.query.return_value = {'metadatas': [[]], 'distances': [[]]}
+
+    monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+    monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+    return collection
+
+
+class TestSubredditCatalog:
+
+    def test_refresh_pages_through_collection(self):
+        """Refresh keeps requesting pages until a short page arrives."""
+        collection = Mock()
+        collection.get.side_effect = [
+            {'metadatas': CATALOG_METADATAS[:2]},
+            {'metadatas': CATALOG_METADATAS[2:]},
+        ]
+        catalog = SubredditCatalog(page_size=2)
+
+        assert catalog.refresh(collection) is True
+        assert len(catalog) == 3
+        assert collection.get.call_args_list[1][1]['offset'] == 2
+
+    def test_lookup_is_case_insensitive(self):
+        catalog = SubredditCatalog()
+        catalog.load(CATALOG_METADATAS)
+
+        assert catalog.lookup('python')['name'] == 'Python'
+        assert catalog.lookup('r/MACHINELEARNING')['subscribers'] == 2900000
+        assert catalog.lookup('rust') is None
+
+    def test_suggest_close_names(self):
+        catalog = SubredditCatalog()
+        catalog.load(CATALOG_METADATAS)
+
+        assert 'learnpython' in catalog.suggest('learnpyton')
+
+    def test_failed_refresh_backs_off(self):
+        """A failing proxy is not retried on every call."""
+        collection = Mock()
+        collection.get.side_effect = ConnectionError("proxy down")
+        catalog = SubredditCatalog()
+
+        assert catalog.refresh(collection) is False
+        assert catalog.last_error == "proxy down"
+        assert not catalog.needs_refresh()
+
+
+class TestValidateWithCatalog:
+
+    def test_validate_subreddit_uses_catalog(self, mock_collection):
+        """Exact names are found even when semantic search would miss them."""
+        result = validate_subreddit('learnpython')
+
+        assert result['valid'] is True
+        assert result['subscribers'] == 800000
+        mock_collection.query.assert_not_called()
+
+    async def test_validate_subreddits_bulk(self, mock_collection):
+        result = await validate_subreddits(names=['python', 'r/MachineLearning', 'learnpyton'])
+
+        assert result['valid'] == ['Python', 'MachineLearning']
+        assert result['invalid'] == ['learnpyton']
+        assert result['results']['learnpyton']['did_you_mean'] == ['learnpython']
+        assert result['summary']['source'] == 'catalog'
+        mock_collection.query.assert_not_called()
+
+    async def test_validate_subreddits_falls_back_without_catalog(self, monkeypatch):
+        """Without a catalog, names are checked with semantic lookups."""
+        collection = Mock()
+        collection.get.side_effect = ConnectionError("no /get")
+        collection.query.return_value = {
+            'metadatas': [[{'name': 'Python', 'subscribers': 1200000, 'nsfw': False}]],
+            'distances': [[0.1]]
+        }
+        monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+        monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+
+        result = await validate_subreddits(names='["python"]')
+
+        assert result['valid'] == ['Python']
+        assert result['summary']['source'] == 'vector_search'
+
+
+class TestFetchMultipleScreening:
+
+    async def test_close_names_are_fetched_with_hints(self):
+        get_subreddit_catalog().load(CATALOG_METADATAS)
+        mock_reddit = Mock()
+        mock_multi = Mock()
+        mock_multi.hot.return_value = []
+        mock_reddit.subreddit.return_value = mock_multi
+
+        ctx = Mock(spec=Context)
+        ctx.report_progress = AsyncMock()
+        result = await fetch_multiple_subreddits(
+            subreddit_names=['python', 'learnpyton', 'somethingunindexed'],
+            reddit=mock_reddit,
+            ctx=ctx
+        )
+
+        # Canonical casing for indexed names; unindexed names are still fetched
+        mock_reddit.subreddit.assert_called_once_with('Python+learnpyton+somethingunindexed')
+        assert result['did_you_mean'] == {'learnpyton': ['learnpython']}
+        assert 'learnpyton' in result['subreddits_failed']
+        assert 'r/learnpython' in result['failure_reasons']['learnpyton']
@@ -275,8 +275,10 @@ class TestDiscoverSubredditsProgress:
 
         result = await discover_subreddits(query="python", ctx=mock_context)
 
-        # Verify progress was reported at least 3 times (once per result)
-        assert mock_context.report_progress.call_count >= 3
+        # Progress is throttled: the first and final updates are always sent
+        assert mock_context.report_progress.call_count >= 2
+        last_call = mock_context.report_progress.call_args_list[-1]
+        assert last_call[1]['progress'] == last_call[1]['total'] == 3
 
         # Verify progress parameters
         first_call = mock_context.report_progress.call_args_list[0]
@@ -343,8 +345,10 @@ class TestFetchMultipleProgress:
             ctx=mock_context
         )
 
-        # Verify progress was reported at least 3 times (once per subreddit)
-        assert mock_context.report_progress.call_count >= 3
+        # Progress is throttled, but the final update covers every subreddit
+        assert mock_context.report_progress.call_count >= 2
+        last_call = mock_context.report_progress.call_args_list[-1]
+        assert last_call[1]['progress'] == 3
 
 
 class TestFetchCommentsProgress:
@@ -397,8 +401,11 @@ class TestFetchCommentsProgress:
             ctx=mock_context
         )
 
-        # Verify progress was reported at least 6 times (5 comments + 1 completion)
-        assert mock_context.report_progress.call_count >= 6
+        # Progress is throttled, but the completion update is always sent
+        assert mock_context.report_progress.call_count >= 2
+        last_call = mock_context.report_progress.call_args_list[-1]
+        assert last_call[1]['progress'] == 5
+        assert "Completed" in last_call[1]['message']
 
 
 class TestSearchConfig:
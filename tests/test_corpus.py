@@ -0,0 +1,216 @@
+"""
+Tests for the per-session research corpus and query_corpus.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import corpus as corpus_module
+from src import serve
+from src.corpus import (
+    CorpusStore, SessionCorpus, extract_records, get_corpus_store, reset_corpus_store, session_key
+)
+from src.shared_cache import MemoryBackend, SharedCache
+from src.tools.corpus import query_corpus
+
+
+def post(post_id, subreddit="espresso", score=10, created=1700000000.0, title="A post", **extra):
+    return {
+        "id": post_id, "title": title, "author": "someone", "subreddit": subreddit,
+        "score": score, "num_comments": 3, "created_utc": created,
+        "url": f"https://reddit.com/r/{subreddit}/comments/{post_id}/",
+        "permalink": f"https://reddit.com/r/{subreddit}/comments/{post_id}/",
+        **extra
+    }
+
+
+def comment(comment_id, body="nice", score=1, replies=None):
+    return {
+        "id": comment_id, "body": body, "author": "commenter", "score": score,
+        "created_utc": 1700000500.0, "depth": 0, "replies": replies or []
+    }
+
+
+def make_ctx(session_id):
+    ctx = Mock()
+    ctx.session_id = session_id
+    return ctx
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    reset_corpus_store()
+    yield
+    reset_corpus_store()
+
+
+class TestExtractRecords:
+
+    def test_fetch_multiple_takes_subreddit_from_grouping(self):
+        data = {"posts_by_subreddit": {"coffee": [{k: v for k, v in post("a").items() if k != "subreddit"}]}}
+        records = list(extract_records("fetch_multiple", data))
+        assert records[0]["fullname"] == "t3_a"
+        assert records[0]["subreddit"] == "coffee"
+
+    def test_fetch_comments_flattens_tree(self):
+        data = {
+            "submission": {**post("p"), "permalink": None, "selftext": "body"},
+            "comments": [comment("c1", replies=[comment("c2")])]
+        }
+        records = list(extract_records("fetch_comments", data))
+
+        assert [r["fullname"] for r in records] == ["t3_p", "t1_c1", "t1_c2"]
+        assert records[0]["permalink"] == "https://reddit.com/comments/p/"
+        assert records[2]["post_id"] == "p"
+        assert records[2]["subreddit"] == "espresso"
+        assert records[2]["permalink"] == "https://reddit.com/comments/p/_/c2/"
+
+    def test_operations_without_content_yield_nothing(self):
+        assert list(extract_records("list_feeds", {"feeds": []})) == []
+        assert list(extract_records("fetch_posts", None)) == []
+
+
+class TestSessionCorpus:
+
+    def test_dedupes_by_fullname_keeping_earlier_fields(self):
+        corpus = SessionCorpus()
+        corpus.add(extract_records("fetch_comments", {"submission": post("p", selftext="full text"), "comments": []}))
+        corpus.add(extract_records("fetch_posts", {"posts": [post("p", score=99)]}))
+
+        records = corpus.records()
+        assert len(records) == 1
+        assert records[0]["score"] == 99
+        assert records[0]["text"] == "full text"
+
+    def test_record_and_byte_caps_evict_oldest(self):
+        corpus = SessionCorpus(max_records=2)
+        corpus.add(extract_records("fetch_posts", {"posts": [post("a"), post("b"), post("c")]}))
+        assert [r["id"] for r in corpus.records()] == ["b", "c"]
+
+        corpus = SessionCorpus(max_bytes=1000)
+        corpus.add(extract_records("fetch_posts", {"posts": [post(f"p{i}", selftext="x" * 300) for i in range(5)]}))
+        assert corpus.bytes <= 1000
+        assert corpus.stats()["evicted"] > 0
+        assert corpus.records()[-1]["id"] == "p4"
+
+    def test_sessions_expire(self):
+        now = [0.0]
+        store = CorpusStore(ttl_seconds=10)
+        store._sessions._clock = lambda: now[0]
+        store.ingest("s", "fetch_posts", {"posts": [post("a")]})
+
+        now[0] = 5.0
+        assert store.get("s") is not None  # Use extends the lifetime
+        now[0] = 12.0
+        assert store.get("s") is not None
+        now[0] = 30.0
+        assert store.get("s") is None
+
+
+class TestQueryCorpus:
+
+    def fill(self, ctx):
+        get_corpus_store().ingest("local:one", "fetch_multiple", {"posts_by_subreddit": {
+            "espresso": [post("a", score=50, title="Best grinder under $200"), post("b", score=5, created=1600000000.0)],
+            "Coffee": [post("c", subreddit="Coffee", score=20, title="Grinder burr sizes")]
+        }})
+        get_corpus_store().ingest("local:one", "fetch_comments", {
+            "submission": post("a", score=50, title="Best grinder under $200"),
+            "comments": [comment("x", body="The grinder matters most", score=40)]
+        })
+
+    def test_filters_and_sorts_without_reddit(self):
+        ctx = make_ctx("one")
+        self.fill(ctx)
+
+        result = query_corpus(keyword="GRINDER", ctx=ctx)
+        assert [r["fullname"] for r in result["records"]] == ["t3_a", "t1_x", "t3_c"]
+
+        result = query_corpus(kind="post", subreddit=["coffee"], ctx=ctx)
+        assert [r["id"] for r in result["records"]] == ["c"]
+
+        result = query_corpus(min_score=30, ctx=ctx)
+        assert {r["id"] for r in result["records"]} == {"a", "x"}
+
+        result = query_corpus(until="2021-01-01", ctx=ctx)
+        assert [r["id"] for r in result["records"]] == ["b"]
+
+        result = query_corpus(post_id="a", sort="new", ctx=ctx)
+        assert [r["id"] for r in result["records"]] == ["x", "a"]
+
+    def test_pagination(self):
+        ctx = make_ctx("one")
+        self.fill(ctx)
+
+        first = query_corpus(limit=2, ctx=ctx)
+        second = query_corpus(limit=2, offset=first["next_offset"], ctx=ctx)
+
+        assert first["total"] == 4 and first["next_offset"] == 2
+        assert second["next_offset"] is None
+        assert len({r["fullname"] for r in first["records"] + second["records"]}) == 4
+
+    def test_sessions_are_isolated(self):
+        self.fill(make_ctx("one"))
+        result = query_corpus(ctx=make_ctx("two"))
+        assert result["total"] == 0
+        assert "hint" in result
+
+    def test_invalid_date(self):
+        result = query_corpus(since="last tuesday", ctx=make_ctx("one"))
+        assert "error" in result
+
+
+class TestMultiWorkerCorpus:
+
+    def test_shared_store_is_seen_by_other_workers(self):
+        backend = MemoryBackend()
+        worker_a = CorpusStore(shared=SharedCache("corpus", 60, backend=backend))
+        worker_b = CorpusStore(shared=SharedCache("corpus", 60, backend=backend))
+
+        worker_a.ingest("client:default", "fetch_posts", {"posts": [post("a")]})
+        worker_b.ingest("client:default", "fetch_posts", {"posts": [post("b"), post("a", score=99)]})
+
+        corpus = worker_a.get("client:default")
+        assert [r["id"] for r in corpus.records()] == ["b", "a"]
+        assert corpus.records()[1]["score"] == 99
+        assert worker_a.get("other:default") is None
+
+    def test_stateless_workers_key_by_client(self, monkeypatch):
+        monkeypatch.setattr(serve, "WORKER_COUNT", 4)
+        reset_corpus_store()
+
+        assert session_key(make_ctx("request-1")) == session_key(make_ctx("request-2")) == "local:default"
+        get_corpus_store().ingest(session_key(make_ctx("request-1")), "fetch_posts", {"posts": [post("a")]})
+        result = query_corpus(ctx=make_ctx("request-2"))
+        assert [r["id"] for r in result["records"]] == ["a"]
+
+    def test_shared_corpus_is_chunked_and_reads_write_nothing(self, monkeypatch):
+        monkeypatch.setattr(corpus_module, "CORPUS_CHUNK_RECORDS", 2)
+        backend = MemoryBackend()
+        store = CorpusStore(shared=SharedCache("corpus", 60, backend=backend))
+
+        store.ingest("client:default", "fetch_posts", {"posts": [post("a"), post("b"), post("c")]})
+        store.ingest("client:default", "fetch_posts", {"posts": [post("d")]})   # Fills the second chunk
+        index = SharedCache("corpus", 60, backend=backend).get("client:default:index")
+        assert [count for _, count, _ in index["chunks"]] == [2, 2]
+
+        backend.set = Mock(side_effect=AssertionError("read wrote to the cache"))
+        corpus = store.get("client:default")
+        assert [r["id"] for r in corpus.records()] == ["a", "b", "c", "d"]
+
+    def test_shared_corpus_drops_oldest_chunks_past_the_cap(self, monkeypatch):
+        monkeypatch.setattr(corpus_module, "CORPUS_CHUNK_RECORDS", 2)
+        monkeypatch.setattr(corpus_module, "CORPUS_MAX_RECORDS", 4)
+        store = CorpusStore(shared=SharedCache("corpus", 60, backend=MemoryBackend()))
+
+        for ids in (["a", "b"], ["c", "d"], ["e"]):
+            store.ingest("s", "fetch_posts", {"posts": [post(i) for i in ids]})
+
+        corpus = store.get("s")
+        assert [r["id"] for r in corpus.records()] == ["c", "d", "e"]
+        assert corpus.stats()["evicted"] == 2
@@ -0,0 +1,152 @@
+"""
+Tests for per-operation deadlines and their propagation to outbound calls.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+import time
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.deadline import (
+    MIN_CALL_TIMEOUT,
+    DeadlineExceeded,
+    DeadlineRequestor,
+    call_timeout,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+)
+from src.listings import clear_listing_cache, get_listing
+from src.operations import OPERATION_MAX_TIMEOUT_SECONDS, get_operation
+from src.tools import feed as feed_module
+from src.tools.feed import fetch_feed_posts
+
+
+class FakeSession:
+    """requests.Session stand-in recording the timeouts it is given."""
+
+    def __init__(self):
+        self.headers = {}
+        self.timeouts = []
+
+    def request(self, *args, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        return Mock(status_code=200)
+
+
+class TestDeadline:
+
+    def test_call_timeout_clamped_to_remaining_time(self):
+        assert call_timeout(10) == 10  # No deadline
+        with deadline_scope(2):
+            assert 1.5 < call_timeout(10) <= 2
+            assert call_timeout(1) == 1
+        with deadline_scope(0.01) as deadline:
+            assert call_timeout(10) == MIN_CALL_TIMEOUT
+            time.sleep(0.02)
+            assert deadline.expired
+            with pytest.raises(DeadlineExceeded):
+                call_timeout(10)
+
+    def test_cancel_stops_further_calls(self):
+        with deadline_scope(60) as deadline:
+            check_deadline()
+            deadline.cancel()
+            with pytest.raises(DeadlineExceeded, match="cancelled"):
+                check_deadline()
+        assert current_deadline() is None
+
+    def test_nested_scope_never_outlives_parent(self):
+        with deadline_scope(1):
+            with deadline_scope(60) as inner:
+                assert inner.remaining() <= 1
+
+    async def test_deadline_follows_work_into_threads(self):
+        with deadline_scope(5) as deadline:
+            seen = await asyncio.to_thread(current_deadline)
+        assert seen is deadline
+
+    def test_requestor_clamps_and_refuses(self):
+        session = FakeSession()
+        requestor = DeadlineRequestor(session=session, user_agent="deadline tests")
+
+        requestor.request("GET", "https://oauth.reddit.com/hot")
+        with deadline_scope(3) as deadline:
+            requestor.request("GET", "https://oauth.reddit.com/hot")
+            deadline.cancel()
+            with pytest.raises(DeadlineExceeded):
+                requestor.request("GET", "https://oauth.reddit.com/hot")
+
+        assert session.timeouts[0] == requestor.timeout
+        assert session.timeouts[1] <= 3
+        assert len(session.timeouts) == 2
+
+
+class TestOperationDeadlines:
+
+    def test_defaults_and_caller_override(self):
+        spec = get_operation("research")
+        assert spec.schema["parameters"]["timeout_seconds"]["default"] == spec.timeout_seconds
+        assert spec.deadline_seconds() == spec.timeout_seconds
+        assert spec.deadline_seconds("5") == 5
+        assert spec.deadline_seconds(10_000) == OPERATION_MAX_TIMEOUT_SECONDS
+        with pytest.raises(ValueError):
+            spec.deadline_seconds(0)
+        with pytest.raises(ValueError):
+            spec.deadline_seconds("soon")
+
+    async def test_feed_posts_return_partial_results_at_deadline(self, monkeypatch):
+        clear_listing_cache()
+        config = {"profile_name": "Coffee", "subreddits": ["fast", "slow"], "show_nsfw": False}
+
+        async def fake_get_feed_config(feed_id, ctx=None):
+            return config
+
+        def fake_fetch_listing(reddit, name, listing_type, time_filter, limit):
+            if name == "slow":
+                time.sleep(0.5)
+            return [{
+                "id": f"{name}1", "title": "t", "author": "a", "subreddit": name, "score": 1,
+                "num_comments": 0, "created_utc": 1.0, "url": f"https://reddit.com/r/{name}/1",
+                "permalink": f"https://reddit.com/r/{name}/1", "over_18": False
+            }]
+
+        monkeypatch.setattr(feed_module, "get_feed_config", fake_get_feed_config)
+        monkeypatch.setattr("src.listings.fetch_listing", fake_fetch_listing)
+
+        started = time.monotonic()
+        with deadline_scope(0.2):
+            result = await fetch_feed_posts("f1", reddit=Mock())
+
+        assert time.monotonic() - started < 0.4
+        assert [p["id"] for p in result["posts"]] == ["fast1"]
+        assert result["subreddit_status"]["slow"]["status"] == "skipped"
+        assert result["summary"]["partial"] is True
+        clear_listing_cache()
+
+    async def test_waiter_refetches_when_shared_fetch_runs_out_of_time(self, monkeypatch):
+        clear_listing_cache()
+        calls = []
+
+        def fake_fetch_listing(reddit, name, listing_type, time_filter, limit):
+            calls.append(name)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                raise DeadlineExceeded("Deadline of 0.05s exceeded")
+            return []
+
+        monkeypatch.setattr("src.listings.fetch_listing", fake_fetch_listing)
+
+        first = asyncio.create_task(get_listing(Mock(), "coffee"))
+        await asyncio.sleep(0.01)
+        posts, cached = await get_listing(Mock(), "coffee")
+
+        assert posts == [] and len(calls) == 2
+        with pytest.raises(DeadlineExceeded):
+            await first
+        clear_listing_cache()
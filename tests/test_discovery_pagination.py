@@ -0,0 +1,93 @@
+"""
+Tests for cursor-based pagination of discovery results.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import reset_subreddit_catalog
+from src.tools import discover as discover_module
+from src.tools.discover import discover_subreddits, OverfetchEstimator
+
+
+@pytest.fixture
+def mock_collection(monkeypatch):
+    """Collection returning 25 results with increasing distance."""
+    reset_subreddit_catalog()
+    monkeypatch.setattr(discover_module, '_overfetch', OverfetchEstimator())
+    collection = Mock()
+    collection.query.return_value = {
+        'metadatas': [[
+            {'name': f'sub{i:02d}', 'subscribers': 50000, 'nsfw': False}
+            for i in range(25)
+        ]],
+        'distances': [[0.2 + i * 0.04 for i in range(25)]]
+    }
+    monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+    monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+    yield collection
+    reset_subreddit_catalog()
+
+
+class TestDiscoveryPagination:
+
+    async def test_pages_served_without_new_vector_query(self, mock_collection):
+        first = await discover_subreddits(query="test", limit=10)
+        assert first['summary']['has_more'] is True
+        assert first['cursor']
+
+        second = await discover_subreddits(cursor=first['cursor'], limit=10)
+        third = await discover_subreddits(cursor=second['cursor'], limit=10)
+
+        assert mock_collection.query.call_count == 1
+        names = [s['name'] for page in (first, second, third) for s in page['subreddits']]
+        assert names == [f'sub{i:02d}' for i in range(25)]
+        assert second['summary']['offset'] == 10
+        assert third['cursor'] is None
+        assert third['summary']['has_more'] is False
+
+    async def test_cursor_pages_top_up_when_candidates_run_out(self, monkeypatch):
+        """One query for the first page; the stored list grows only when a page reaches its end."""
+        reset_subreddit_catalog()
+        monkeypatch.setattr(discover_module, '_overfetch', OverfetchEstimator())
+        collection = Mock()
+
+        def query(query_texts, n_results, **kwargs):
+            return {
+                'metadatas': [[
+                    {'name': f'big{i:02d}', 'subscribers': 50000, 'nsfw': False}
+                    for i in range(min(n_results, 60))
+                ]],
+                'distances': [[0.2 + i * 0.01 for i in range(min(n_results, 60))]]
+            }
+
+        collection.query.side_effect = query
+        monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+        monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+
+        first = await discover_subreddits(query="big", limit=5)
+        assert collection.query.call_count == 1
+        second = await discover_subreddits(cursor=first['cursor'], limit=5)
+        assert collection.query.call_count == 1     # Served from the stored over-fetch
+
+        third = await discover_subreddits(cursor=second['cursor'], limit=50)
+        assert collection.query.call_count == 2
+        assert collection.query.call_args[1]['n_results'] == 100
+        names = [s['name'] for page in (first, second, third) for s in page['subreddits']]
+        assert names == [f'big{i:02d}' for i in range(60)]
+        assert third['cursor'] is None
+        reset_subreddit_catalog()
+
+    async def test_no_cursor_when_everything_fits(self, mock_collection):
+        result = await discover_subreddits(query="test", limit=50)
+        assert result['cursor'] is None
+
+    async def test_unknown_cursor(self, mock_collection):
+        result = await discover_subreddits(cursor="nope.10")
+        assert "error" in result
+        assert result['subreddits'] == []
@@ -0,0 +1,107 @@
+"""
+Tests for the per-user feed and feed-config cache.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+import httpx
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tools import feed as feed_module
+from src.tools.feed import clear_feed_cache, delete_feed, get_feed, get_feed_config, update_feed
+
+
+class FakeFeedAPI:
+    """Feed API stub with ETag support."""
+
+    def __init__(self):
+        self.version = 1
+        self.requests = []
+
+    def etag(self):
+        return f'"v{self.version}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "PUT":
+            self.version += 1
+            return httpx.Response(200, json={"id": "f1", "name": "renamed"}, headers={"ETag": self.etag()})
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"deleted": True})
+        if request.headers.get("if-none-match") == self.etag():
+            return httpx.Response(304)
+        body = {"id": "f1", "version": self.version}
+        if request.url.path.endswith("/config"):
+            body = {"feed_id": "f1", "subreddits": ["python"], "version": self.version}
+        return httpx.Response(200, json=body, headers={"ETag": self.etag()})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    clear_feed_cache()
+    fake = FakeFeedAPI()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    user = SimpleNamespace(client_id="user-a", token="t")
+    monkeypatch.setattr(feed_module, "get_feed_client", lambda: client)
+    monkeypatch.setattr(feed_module, "get_auth_headers", lambda: {"Authorization": "Bearer t"})
+    monkeypatch.setattr(feed_module, "get_access_token", lambda: user)
+    fake.user = user
+    yield fake
+    clear_feed_cache()
+
+
+class TestFeedCache:
+
+    async def test_fresh_reads_served_from_memory(self, api):
+        first = await get_feed("f1")
+        second = await get_feed("f1")
+        assert first == second == {"id": "f1", "version": 1}
+        assert len(api.requests) == 1
+
+    async def test_stale_entry_revalidated_with_etag(self, api, monkeypatch):
+        monkeypatch.setattr(feed_module, "FEED_CACHE_FRESH_SECONDS", 0)
+        await get_feed("f1")
+        result = await get_feed("f1")
+
+        assert result == {"id": "f1", "version": 1}
+        assert api.requests[1].headers["if-none-match"] == '"v1"'
+
+    async def test_cache_isolated_per_user(self, api):
+        await get_feed_config("f1")
+        api.user.client_id = "user-b"
+        await get_feed_config("f1")
+        assert len(api.requests) == 2
+
+    async def test_update_writes_through_and_drops_config(self, api):
+        await get_feed("f1")
+        await get_feed_config("f1")
+
+        await update_feed("f1", name="renamed")
+        assert await get_feed("f1") == {"id": "f1", "name": "renamed"}
+        assert len(api.requests) == 3  # the updated document came from the PUT response
+
+        config = await get_feed_config("f1")
+        assert config["version"] == 2
+        assert len(api.requests) == 4
+
+    async def test_delete_invalidates(self, api):
+        await get_feed("f1")
+        await delete_feed("f1")
+        await get_feed("f1")
+        assert [r.method for r in api.requests] == ["GET", "DELETE", "GET"]
+
+    async def test_no_cache_without_user(self, api, monkeypatch):
+        monkeypatch.setattr(feed_module, "get_access_token", lambda: None)
+        await get_feed("f1")
+        await get_feed("f1")
+        assert len(api.requests) == 2
+
+    async def test_cached_copy_not_shared(self, api):
+        first = await get_feed("f1")
+        first["version"] = 99
+        assert (await get_feed("f1"))["version"] == 1
@@ -0,0 +1,128 @@
+"""
+Tests for the shared, pooled Feed API client.
+"""
+
+import pytest
+import sys
+import os
+
+import httpx
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tools import feed as feed_module
+from src.tools.feed import (
+    close_feed_client,
+    feed_timeout,
+    get_feed,
+    get_feed_client,
+    list_feeds,
+    start_feed_client,
+)
+
+
+@pytest.fixture
+async def shared_client():
+    await close_feed_client()
+    yield
+    await close_feed_client()
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Route the shared client through a mock transport and record requests."""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.endswith("/feeds"):
+            return httpx.Response(200, json={"feeds": [], "total": 0})
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(feed_module, "get_feed_client", lambda: client)
+    monkeypatch.setattr(feed_module, "get_auth_headers", lambda: {"Authorization": "Bearer t"})
+    return requests_seen
+
+
+class TestFeedClient:
+
+    async def test_client_is_shared_and_pooled(self, shared_client):
+        first = get_feed_client()
+        assert get_feed_client() is first
+        assert first.timeout.connect == feed_module.FEED_API_CONNECT_TIMEOUT
+
+    async def test_lifecycle_hooks(self, shared_client):
+        await start_feed_client()
+        client = get_feed_client()
+        await close_feed_client()
+        assert client.is_closed
+        assert get_feed_client() is not client
+
+    def test_per_operation_timeouts(self):
+        assert feed_timeout("get_feed").read == feed_module.FEED_API_TIMEOUTS["get_feed"]
+        assert feed_timeout("unknown").read == 30.0
+
+    async def test_operations_use_shared_client(self, mock_api):
+        assert await get_feed("abc") == {"id": "abc"}
+        assert await list_feeds() == {"feeds": [], "total": 0}
+
+        assert len(mock_api) == 2
+        assert all(r.headers["authorization"] == "Bearer t" for r in mock_api)
+        assert mock_api[0].extensions["timeout"]["read"] == feed_module.FEED_API_TIMEOUTS["get_feed"]
+
+
+@pytest.fixture
+def paged_api(monkeypatch):
+    """Feed API with 230 feeds served in pages."""
+    feeds = [{"id": f"f{i}", "name": f"Feed {i}", "analysis": {"keywords": ["x"]}} for i in range(230)]
+    offsets_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets_seen.append(offset)
+        return httpx.Response(200, json={
+            "feeds": feeds[offset:offset + limit], "total": len(feeds), "limit": limit, "offset": offset
+        })
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(feed_module, "get_feed_client", lambda: client)
+    monkeypatch.setattr(feed_module, "get_auth_headers", lambda: {"Authorization": "Bearer t"})
+    return offsets_seen
+
+
+class TestListFeedsAll:
+
+    async def test_all_fetches_every_page(self, paged_api):
+        result = await list_feeds(fetch_all=True)
+        assert [f["id"] for f in result["feeds"]] == [f"f{i}" for i in range(230)]
+        assert result["pages_fetched"] == 3
+        assert sorted(paged_api) == [0, 100, 200]
+
+    async def test_feeds_without_id_are_not_collapsed(self, monkeypatch):
+        feeds = [{"id": "f0"}, {"name": "draft a"}, {"name": "draft b"}, {"id": "f0"}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            limit = int(request.url.params["limit"])
+            offset = int(request.url.params["offset"])
+            return httpx.Response(200, json={
+                "feeds": feeds[offset:offset + 2], "total": len(feeds), "limit": 2, "offset": offset
+            })
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(feed_module, "get_feed_client", lambda: client)
+        monkeypatch.setattr(feed_module, "get_auth_headers", lambda: {"Authorization": "Bearer t"})
+
+        result = await list_feeds(fetch_all=True)
+        assert result["feeds"] == [{"id": "f0"}, {"name": "draft a"}, {"name": "draft b"}]
+
+    async def test_fields_projection(self, paged_api):
+        result = await list_feeds(limit=2, fields="name")
+        assert result["feeds"] == [{"id": "f0", "name": "Feed 0"}, {"id": "f1", "name": "Feed 1"}]
+
+    async def test_single_page_by_default(self, paged_api):
+        result = await list_feeds(limit=10, offset=20)
+        assert len(result["feeds"]) == 10
+        assert paged_api == [20]
@@ -0,0 +1,152 @@
+"""
+Tests for the shared listing cache and feed-driven post retrieval.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+from prawcore import NotFound
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.listings import clear_listing_cache, get_listing
+from src.tools import feed as feed_module
+from src.tools.feed import fetch_feed_posts
+
+
+def make_submission(post_id, subreddit, score=10, over_18=False, url=None, created=1000.0):
+    submission = Mock()
+    submission.id = post_id
+    submission.title = f"Post {post_id}"
+    submission.author = "someone"
+    submission.subreddit.display_name = subreddit
+    submission.score = score
+    submission.num_comments = 1
+    submission.created_utc = created
+    submission.url = url or f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/"
+    submission.permalink = f"/r/{subreddit}/comments/{post_id}/"
+    submission.over_18 = over_18
+    return submission
+
+
+class FakeReddit:
+    """Reddit stub serving scripted listings and counting fetches."""
+
+    def __init__(self, listings, delay=0.0):
+        self.listings = listings
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def subreddit(self, name):
+        listing = self.listings.get(name)
+
+        def hot(limit):
+            with self.lock:
+                self.calls.append(name)
+            if self.delay:
+                time.sleep(self.delay)
+            if listing is None:
+                raise NotFound(Mock(status_code=404))
+            return listing[:limit]
+
+        sub = Mock()
+        sub.hot.side_effect = hot
+        sub.new.side_effect = hot
+        return sub
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_listing_cache()
+    yield
+    clear_listing_cache()
+
+
+@pytest.fixture
+def feed_config(monkeypatch):
+    config = {"profile_id": "f1", "profile_name": "Coffee", "subreddits": [], "show_nsfw": False}
+
+    async def fake_get_feed_config(feed_id, ctx=None):
+        return config
+
+    monkeypatch.setattr(feed_module, "get_feed_config", fake_get_feed_config)
+    return config
+
+
+class TestListingCache:
+
+    async def test_second_read_is_cached(self):
+        reddit = FakeReddit({"coffee": [make_submission("a", "coffee")]})
+        first, cached_first = await get_listing(reddit, "coffee")
+        second, cached_second = await get_listing(reddit, "Coffee")
+
+        assert first == second
+        assert (cached_first, cached_second) == (False, True)
+        assert reddit.calls == ["coffee"]
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        reddit = FakeReddit({"coffee": [make_submission("a", "coffee")]}, delay=0.05)
+        results = await asyncio.gather(*[get_listing(reddit, "coffee") for _ in range(5)])
+
+        assert reddit.calls == ["coffee"]
+        assert all(posts == results[0][0] for posts, _ in results)
+
+
+class TestFetchFeedPosts:
+
+    async def test_merges_dedupes_and_reports_status(self, feed_config):
+        feed_config["subreddits"] = ["espresso", "coffee", "gone"]
+        shared_link = "https://example.com/grinder-review"
+        reddit = FakeReddit({
+            "espresso": [make_submission("a", "espresso", score=50), make_submission("b", "espresso", url=shared_link)],
+            "coffee": [make_submission("a", "coffee", score=50), make_submission("c", "coffee", score=90, url=shared_link)],
+        })
+
+        result = await fetch_feed_posts("f1", reddit=reddit)
+
+        assert [p["id"] for p in result["posts"]] == ["a", "b"]
+        assert result["summary"]["duplicates_removed"] == 2
+        assert result["subreddit_status"]["gone"]["status_code"] == 404
+        assert result["subreddit_status"]["espresso"] == {"status": "ok", "posts": 2, "cached": False}
+        assert result["summary"]["failed"] == 1
+
+    async def test_respects_show_nsfw(self, feed_config):
+        feed_config["subreddits"] = ["coffee"]
+        reddit = FakeReddit({"coffee": [make_submission("a", "coffee"), make_submission("b", "coffee", over_18=True)]})
+
+        hidden = await fetch_feed_posts("f1", reddit=reddit)
+        assert [p["id"] for p in hidden["posts"]] == ["a"]
+        assert hidden["summary"]["nsfw_filtered"] == 1
+
+        feed_config["show_nsfw"] = True
+        shown = await fetch_feed_posts("f1", reddit=reddit)
+        assert len(shown["posts"]) == 2
+        assert shown["summary"]["cache_hits"] == 1
+        assert len(reddit.calls) == 1
+
+    async def test_no_subreddit_cap(self, feed_config):
+        feed_config["subreddits"] = [f"sub{i}" for i in range(30)]
+        reddit = FakeReddit({name: [make_submission(name, name)] for name in feed_config["subreddits"]})
+
+        result = await fetch_feed_posts("f1", reddit=reddit, limit_per_subreddit=1)
+        assert result["summary"]["succeeded"] == 30
+        assert len(result["posts"]) == 30
+
+    async def test_config_error_passed_through(self, monkeypatch):
+        async def missing(feed_id, ctx=None):
+            return {"error": f"Feed not found: {feed_id}"}
+
+        monkeypatch.setattr(feed_module, "get_feed_config", missing)
+        result = await fetch_feed_posts("nope", reddit=FakeReddit({}))
+        assert result["error"] == "Feed not found: nope"
+
+    async def test_invalid_listing_type(self, feed_config):
+        result = await fetch_feed_posts("f1", reddit=FakeReddit({}), listing_type="best")
+        assert "error" in result
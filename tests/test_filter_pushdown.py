@@ -0,0 +1,137 @@
+"""
+Tests for metadata filter pushdown and adaptive over-fetch in discovery.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import reset_subreddit_catalog
+from src.tools.discover import (
+    discover_subreddits,
+    build_where_clause,
+    OverfetchEstimator,
+    SearchConfig,
+)
+import src.tools.discover as discover_module
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch):
+    """Fresh catalog and over-fetch estimator for every test."""
+    reset_subreddit_catalog()
+    monkeypatch.setattr(discover_module, '_overfetch', OverfetchEstimator())
+    yield
+    reset_subreddit_catalog()
+
+
+def _patch_collection(monkeypatch, collection):
+    monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+    monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+
+
+def _vector_response(count, subscribers=50000, distance=0.5):
+    return {
+        'metadatas': [[
+            {'name': f'sub{i}', 'subscribers': subscribers, 'nsfw': False}
+            for i in range(count)
+        ]],
+        'distances': [[distance] * count]
+    }
+
+
+class TestWhereClause:
+
+    def test_nsfw_and_max_subscribers_stay_client_side(self):
+        # Chroma drops records missing the field; those count as SFW with 0 subscribers
+        assert build_where_clause() is None
+        assert build_where_clause(include_nsfw=True, max_subscribers=5000) is None
+        assert build_where_clause(min_subscribers=0) is None
+
+    def test_min_subscribers_pushed_down(self):
+        assert build_where_clause(min_subscribers=1000, max_subscribers=5000) == {
+            "subscribers": {"$gte": 1000}
+        }
+
+
+class TestOverfetchEstimator:
+
+    def test_starts_at_search_multiplier(self):
+        config = SearchConfig()
+        assert OverfetchEstimator().factor(0.0, config) == config.SEARCH_MULTIPLIER
+
+    def test_learns_from_keep_rate(self):
+        config = SearchConfig()
+        estimator = OverfetchEstimator()
+
+        estimator.observe(0.0, fetched=100, kept=100)
+        assert estimator.factor(0.0, config) == config.OVERFETCH_SAFETY_MARGIN
+
+        estimator.observe(0.7, fetched=100, kept=20)
+        assert estimator.factor(0.7, config) == pytest.approx(config.OVERFETCH_SAFETY_MARGIN / 0.2)
+
+
+class TestPushdown:
+
+    async def test_filters_and_fields_sent_to_proxy(self, monkeypatch):
+        collection = Mock()
+        collection.query.return_value = _vector_response(3)
+        _patch_collection(monkeypatch, collection)
+
+        await discover_subreddits(query="indie games", limit=10, min_subscribers=1000)
+
+        kwargs = collection.query.call_args[1]
+        assert kwargs['where'] == {"subscribers": {"$gte": 1000}}
+        assert kwargs['include'] == ["metadatas", "distances"]
+        assert kwargs['n_results'] == 30
+
+    async def test_records_without_nsfw_metadata_are_kept(self, monkeypatch):
+        collection = Mock()
+        collection.query.return_value = {
+            'metadatas': [[
+                {'name': 'untagged', 'subscribers': 20000},
+                {'name': 'adult', 'subscribers': 20000, 'nsfw': True},
+            ]],
+            'distances': [[0.5, 0.5]]
+        }
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="test")
+
+        assert collection.query.call_args[1]['where'] is None
+        assert [s['name'] for s in result['subreddits']] == ['untagged']
+
+    async def test_client_side_filter_when_proxy_ignores_where(self, monkeypatch):
+        collection = Mock()
+        collection.query.return_value = {
+            'metadatas': [[
+                {'name': 'big', 'subscribers': 5000000, 'nsfw': False},
+                {'name': 'small', 'subscribers': 20000, 'nsfw': False},
+            ]],
+            'distances': [[0.5, 0.5]]
+        }
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="test", max_subscribers=100000)
+
+        assert [s['name'] for s in result['subreddits']] == ['small']
+
+    async def test_short_page_is_topped_up(self, monkeypatch):
+        """A full but heavily filtered page triggers one larger query."""
+        collection = Mock()
+        # First page: 30 results, all far below min_confidence; then a good page
+        collection.query.side_effect = [
+            _vector_response(30, distance=1.9),
+            _vector_response(60, distance=0.3),
+        ]
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="test", limit=10, min_confidence=0.5)
+
+        assert collection.query.call_count == 2
+        assert collection.query.call_args_list[1][1]['n_results'] == 100
+        assert len(result['subreddits']) == 10
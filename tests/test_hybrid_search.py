@@ -0,0 +1,124 @@
+"""
+Tests for the lexical subreddit index and hybrid (RRF) discovery.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import get_subreddit_catalog, reset_subreddit_catalog
+from src.lexical import LexicalIndex, name_terms
+from src.tools.discover import discover_subreddits
+
+
+ENTRIES = [
+    {'name': 'MachineLearning', 'subscribers': 2900000, 'nsfw': False,
+     'url': 'https://reddit.com/r/MachineLearning', 'description': 'Machine learning research and news'},
+    {'name': 'learnpython', 'subscribers': 800000, 'nsfw': False,
+     'url': 'https://reddit.com/r/learnpython', 'description': 'Subreddit for posting questions about Python'},
+    {'name': 'Python', 'subscribers': 1200000, 'nsfw': False,
+     'url': 'https://reddit.com/r/Python', 'description': 'News about the programming language Python'},
+    {'name': 'rust', 'subscribers': 300000, 'nsfw': False,
+     'url': 'https://reddit.com/r/rust', 'description': 'The Rust programming language'},
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalog():
+    reset_subreddit_catalog()
+    yield
+    reset_subreddit_catalog()
+
+
+def _patch_collection(monkeypatch, collection):
+    monkeypatch.setattr('src.tools.discover.get_chroma_client', lambda: Mock())
+    monkeypatch.setattr('src.tools.discover.get_collection', lambda name, client: collection)
+
+
+class TestLexicalIndex:
+
+    def test_name_terms_include_parts_and_acronym(self):
+        assert name_terms('MachineLearning') == ['machinelearning', 'machine', 'learning', 'ml']
+        assert name_terms('rust') == ['rust']
+
+    def test_exact_name_ranks_first(self):
+        index = LexicalIndex(ENTRIES)
+        hits = index.search('python')
+
+        assert hits[0]['entry']['name'] == 'Python'
+        assert hits[0]['exact'] is True
+        assert 'learnpython' in [h['entry']['name'] for h in hits]
+
+    def test_acronym_match(self):
+        index = LexicalIndex(ENTRIES)
+        hits = index.search('ML')
+
+        assert hits[0]['entry']['name'] == 'MachineLearning'
+
+    def test_no_match(self):
+        assert LexicalIndex(ENTRIES).search('gardening') == []
+
+
+class TestHybridDiscovery:
+
+    async def test_exact_name_missing_from_vector_results_is_fused_in(self, monkeypatch):
+        """An exact name the embedding misses still comes back first."""
+        get_subreddit_catalog().load(ENTRIES)
+        collection = Mock()
+        collection.query.return_value = {
+            'metadatas': [[{'name': 'rust', 'subscribers': 300000, 'nsfw': False}]],
+            'distances': [[0.9]]
+        }
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="python", limit=5)
+
+        names = [s['name'] for s in result['subreddits']]
+        assert names[0] == 'Python'
+        assert result['subreddits'][0]['confidence'] >= 0.95
+        assert result['subreddits'][0]['match_sources'] == ['lexical']
+        assert 'rust' in names
+        assert result['summary']['search_mode'] == 'hybrid'
+
+    async def test_results_found_by_both_are_merged(self, monkeypatch):
+        get_subreddit_catalog().load(ENTRIES)
+        collection = Mock()
+        collection.query.return_value = {
+            'metadatas': [[{'name': 'Python', 'subscribers': 1200000, 'nsfw': False}]],
+            'distances': [[0.6]]
+        }
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="python", limit=5)
+
+        top = result['subreddits'][0]
+        assert top['name'] == 'Python'
+        assert top['match_sources'] == ['semantic', 'lexical']
+        assert top['distance'] == 0.6
+        assert len([s for s in result['subreddits'] if s['name'] == 'Python']) == 1
+
+    async def test_lexical_only_when_vector_service_down(self, monkeypatch):
+        get_subreddit_catalog().load(ENTRIES)
+        collection = Mock()
+        collection.query.side_effect = ConnectionError("Failed to query vector database: timeout")
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="rust programming", limit=5)
+
+        assert "error" not in result
+        assert result['subreddits'][0]['name'] == 'rust'
+        assert result['summary']['search_mode'] == 'lexical'
+
+    async def test_vector_failure_without_lexical_hits_is_error(self, monkeypatch):
+        get_subreddit_catalog().load(ENTRIES)
+        collection = Mock()
+        collection.query.side_effect = ConnectionError("timeout")
+        _patch_collection(monkeypatch, collection)
+
+        result = await discover_subreddits(query="gardening", limit=5)
+
+        assert "error" in result
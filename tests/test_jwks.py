@@ -0,0 +1,147 @@
+"""
+Tests for the kid-indexed JWKS key store.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+from authlib.jose import JsonWebKey
+from fastmcp.server.auth.providers.jwt import RSAKeyPair
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auth.jwks import JWKSKeyStore, token_kid
+
+
+def jwk_for(kid):
+    return dict(
+        JsonWebKey.import_key(RSAKeyPair.generate().public_key, {"kty": "RSA"}).as_dict(), kid=kid
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeJWKS:
+    """JWKS endpoint stub counting fetches, optionally slow."""
+
+    def __init__(self, *kids, delay=0.0):
+        self.keys = [jwk_for(kid) for kid in kids]
+        self.delay = delay
+        self.fetches = 0
+
+    async def __call__(self, uri):
+        self.fetches += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {"keys": list(self.keys)}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_store(endpoint, clock, **kwargs):
+    return JWKSKeyStore("https://example.com/jwks", fetch=endpoint, clock=clock, **kwargs)
+
+
+class TestJWKSKeyStore:
+
+    async def test_known_kid_served_from_memory(self, clock):
+        endpoint = FakeJWKS("k1")
+        store = make_store(endpoint, clock)
+        await store.refresh()
+
+        for _ in range(10):
+            assert await store.get_key("k1") is not None
+        assert endpoint.fetches == 1
+
+    async def test_concurrent_unknown_kid_fetches_once(self, clock):
+        endpoint = FakeJWKS("k1", delay=0.02)
+        store = make_store(endpoint, clock)
+        await store.refresh()
+        endpoint.keys.append(jwk_for("k2"))
+        clock.now += 60
+
+        keys = await asyncio.gather(*[store.get_key("k2") for _ in range(20)])
+
+        assert all(key is keys[0] for key in keys)
+        assert endpoint.fetches == 2
+        assert store.version == 2
+
+    async def test_unknown_kid_refetch_is_rate_limited(self, clock):
+        endpoint = FakeJWKS("k1")
+        store = make_store(endpoint, clock, min_refresh_interval=30)
+        await store.refresh()
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                await store.get_key("bogus")
+        assert endpoint.fetches == 1
+
+        clock.now += 31
+        with pytest.raises(ValueError):
+            await store.get_key("bogus")
+        assert endpoint.fetches == 2
+
+    async def test_stale_key_set_refreshes_without_blocking(self, clock):
+        endpoint = FakeJWKS("k1", delay=0.05)
+        store = make_store(endpoint, clock, refresh_seconds=100)
+        await store.refresh()
+        clock.now += 200
+
+        assert store.stale
+        assert await store.get_key("k1") is not None
+        assert store.stale  # Refresh scheduled, not awaited
+        await asyncio.sleep(0.1)
+        assert endpoint.fetches == 2
+        assert not store.stale
+
+    async def test_stale_key_set_schedules_one_refresh(self, clock):
+        endpoint = FakeJWKS("k1", delay=0.05)
+        store = make_store(endpoint, clock, refresh_seconds=100)
+        await store.refresh()
+        clock.now += 200
+
+        for _ in range(10):
+            await store.get_key("k1")
+        pending = store._pending_refresh
+        assert pending is not None and not pending.done()
+
+        await store.stop()
+        assert pending.cancelled()
+        assert store._pending_refresh is None
+
+    async def test_failed_refresh_keeps_keys(self, clock):
+        endpoint = FakeJWKS("k1")
+        store = make_store(endpoint, clock)
+        await store.refresh()
+
+        async def broken(uri):
+            raise ConnectionError("down")
+
+        store._fetch = broken
+        assert await store.refresh() is False
+        assert store.has_key("k1")
+
+    async def test_start_prefetches_and_stop(self, clock):
+        endpoint = FakeJWKS("k1")
+        store = make_store(endpoint, clock)
+        await store.start()
+        assert store.running and store.has_key("k1")
+        await store.stop()
+        assert not store.running
+
+    def test_token_kid(self):
+        token = RSAKeyPair.generate().create_token(subject="u", kid="abc")
+        assert token_kid(token) == "abc"
+        assert token_kid("not-a-jwt") is None
@@ -0,0 +1,116 @@
+"""
+Tests for the verified-token cache in MultiIssuerJWTVerifier.
+"""
+
+import pytest
+import sys
+import os
+
+from authlib.jose import JsonWebKey, JsonWebToken
+from fastmcp.server.auth.providers.jwt import RSAKeyPair
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auth.multi_issuer_verifier import MultiIssuerJWTVerifier
+
+ISSUER = "https://auth.example.com"
+AUDIENCE = "reddit-research-mcp"
+
+
+@pytest.fixture
+def key_pair():
+    return RSAKeyPair.generate()
+
+
+def jwks_for(**keys):
+    """JWKS document publishing the given key pairs under their kids."""
+    return {"keys": [
+        dict(JsonWebKey.import_key(pair.public_key, {"kty": "RSA"}).as_dict(), kid=kid, use="sig")
+        for kid, pair in keys.items()
+    ]}
+
+
+@pytest.fixture
+def jwks(key_pair):
+    """Mutable JWKS served to the verifier, with a fetch counter."""
+    return {"document": jwks_for(k1=key_pair), "fetches": 0}
+
+
+@pytest.fixture
+def verifier(jwks):
+    verifier = MultiIssuerJWTVerifier(
+        issuers=[ISSUER, "https://other.example.com"],
+        jwks_uri="https://auth.example.com/.well-known/jwks.json",
+        audience=AUDIENCE,
+        required_scopes=["read"],
+    )
+    verifier.jwt = JsonWebToken(["RS256"])
+
+    async def fetch(uri):
+        jwks["fetches"] += 1
+        return jwks["document"]
+
+    verifier.key_store._fetch = fetch
+    verifier.key_store.min_refresh_interval = 0
+    verifier.key_lookups = 0
+    get_key = verifier.key_store.get_key
+
+    async def counting_get_key(kid):
+        verifier.key_lookups += 1
+        return await get_key(kid)
+
+    verifier.key_store.get_key = counting_get_key
+    return verifier
+
+
+def make_token(key_pair, **kwargs):
+    kwargs.setdefault("issuer", ISSUER)
+    kwargs.setdefault("audience", AUDIENCE)
+    kwargs.setdefault("scopes", ["read"])
+    return key_pair.create_token(subject="user-1", kid="k1", **kwargs)
+
+
+class TestTokenCache:
+
+    async def test_repeat_token_skips_verification(self, verifier, key_pair):
+        token = make_token(key_pair)
+
+        first = await verifier.load_access_token(token)
+        second = await verifier.load_access_token(token)
+
+        assert first is not None and first.client_id == "user-1"
+        assert second is first
+        assert verifier.key_lookups == 1
+
+    async def test_policy_rejection_is_cached(self, verifier, key_pair):
+        token = make_token(key_pair, scopes=["write"])
+
+        assert await verifier.load_access_token(token) is None
+        assert await verifier.load_access_token(token) is None
+        assert verifier.key_lookups == 1
+
+    async def test_bad_signature_not_cached(self, verifier):
+        token = make_token(RSAKeyPair.generate())
+
+        assert await verifier.load_access_token(token) is None
+        assert await verifier.load_access_token(token) is None
+        assert verifier.key_lookups == 2
+
+    async def test_token_near_expiry_not_cached(self, verifier, key_pair):
+        token = make_token(key_pair, expires_in_seconds=5)
+
+        assert await verifier.load_access_token(token) is not None
+        assert await verifier.load_access_token(token) is not None
+        assert verifier.key_lookups == 2
+
+    async def test_key_rotation_evicts_entries(self, verifier, key_pair, jwks):
+        token = make_token(key_pair)
+        assert await verifier.load_access_token(token) is not None
+
+        # JWKS refresh drops the signing key
+        jwks["document"] = jwks_for(k2=RSAKeyPair.generate())
+        await verifier.key_store.refresh()
+
+        assert await verifier.load_access_token(token) is None
+        assert len(verifier._token_cache) == 0
@@ -0,0 +1,100 @@
+"""
+Tests for the operation registry shared by the three tool layers.
+"""
+
+import json
+import pytest
+import sys
+import os
+from typing import List, Literal, Optional, Union
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.operations import (
+    OPERATION_DOCS,
+    OPERATIONS,
+    build_parameters,
+    describe_type,
+    get_operation,
+)
+
+
+class TestOperationRegistry:
+
+    def test_every_documented_operation_is_registered(self):
+        assert set(OPERATION_DOCS) == set(OPERATIONS)
+
+    def test_dispatch_data_from_signatures(self):
+        assert get_operation("fetch_feed_posts").needs_reddit
+        assert get_operation("fetch_feed_posts").is_async
+        assert not get_operation("related_subreddits").is_async
+        assert not get_operation("discover_subreddits").needs_reddit
+        assert get_operation("nope") is None
+
+    def test_schema_derived_from_signature(self):
+        params = get_operation("fetch_posts").schema["parameters"]
+        assert "reddit" not in params and "ctx" not in params
+        assert params["subreddit_name"]["required"] is True
+        assert params["limit"] == {
+            "type": "integer", "required": False, "default": 25,
+            "description": "Number of posts to fetch", "range": [1, 100]
+        }
+        assert params["listing_type"]["options"] == ["hot", "new", "top", "rising"]
+
+    def test_internal_parameters_hidden(self):
+        assert "config" not in get_operation("discover_subreddits").schema["parameters"]
+
+    def test_required_one_of_replaces_required(self):
+        query = get_operation("discover_subreddits").schema["parameters"]["query"]
+        assert query["required_one_of"] == ["query", "queries"]
+        assert "required" not in query
+
+    def test_example_variants_prebuilt(self):
+        spec = get_operation("fetch_comments")
+        assert spec.get_schema(True) == spec.schema
+        assert spec.get_schema(False)["examples"] == []
+        assert len(spec.get_schema(True)["examples"]) == 2
+        assert spec.get_schema_json(True) is spec.get_schema_json(True)
+        assert json.loads(spec.get_schema_json(True)) == spec.schema
+        assert json.loads(spec.get_schema_json(False)) == spec.schema_without_examples
+
+    def test_returned_schema_is_a_copy(self):
+        spec = get_operation("fetch_comments")
+        schema = spec.get_schema(True)
+        schema["parameters"]["submission_id"]["description"] = "changed"
+        schema["examples"].clear()
+
+        assert spec.schema["parameters"]["submission_id"]["description"] != "changed"
+        assert len(spec.get_schema(True)["examples"]) == 2
+
+
+class TestSchemaDerivation:
+
+    def test_describe_type(self):
+        assert describe_type(Optional[int]) == {"type": "integer"}
+        assert describe_type(Literal["a", "b"]) == {"type": "enum", "options": ["a", "b"]}
+        assert describe_type(Optional[List[str]]) == {"type": "array[string]"}
+        assert describe_type(Union[List[str], str]) == {"type": "array[string] or string"}
+
+    def test_docstring_args_used_as_fallback(self):
+        def op(name: str, count: int = 3, ctx=None):
+            """
+            Do something.
+
+            Args:
+                name: Thing to act on
+                count: How many times,
+                    at most ten
+            """
+
+        params = build_parameters(op, {})
+        assert params["name"]["description"] == "Thing to act on"
+        assert params["count"]["description"] == "How many times, at most ten"
+
+    def test_override_for_unknown_parameter_rejected(self):
+        def op(name: str):
+            """Do something."""
+
+        with pytest.raises(ValueError):
+            build_parameters(op, {"nmae": {"description": "typo"}})
@@ -0,0 +1,138 @@
+"""
+Tests for background prefetch of active feeds' listings.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import prefetch
+from src.listings import clear_listing_cache, get_listing
+from src.prefetch import FeedPrefetcher
+from src.shared_cache import SharedCache
+
+
+class FakeReddit:
+    """Reddit stub returning one post per listing and recording fetches."""
+
+    def __init__(self, remaining=None):
+        self.calls = []
+        self.auth = Mock()
+        self.auth.limits = {"remaining": remaining}
+
+    def subreddit(self, name):
+        def listing(kind):
+            def fetch(limit, **kwargs):
+                self.calls.append((name, kind))
+                submission = Mock()
+                submission.id = f"{name}-{kind}"
+                submission.title = "t"
+                submission.author = "a"
+                submission.subreddit.display_name = name
+                submission.score = 1
+                submission.num_comments = 0
+                submission.created_utc = 0.0
+                submission.url = f"https://www.reddit.com/r/{name}/"
+                submission.permalink = f"/r/{name}/"
+                submission.over_18 = False
+                return [submission]
+            return fetch
+
+        sub = Mock()
+        sub.hot.side_effect = listing("hot")
+        sub.new.side_effect = listing("new")
+        return sub
+
+
+async def no_sleep(seconds):
+    no_sleep.total += seconds
+no_sleep.total = 0.0
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_listing_cache()
+    no_sleep.total = 0.0
+    yield
+    clear_listing_cache()
+
+
+class TestFeedPrefetcher:
+
+    def test_union_ordered_by_popularity(self):
+        prefetcher = FeedPrefetcher()
+        prefetcher.register_feed("f1", ["coffee", "espresso"])
+        prefetcher.register_feed("f2", ["Coffee", "tea"])
+        prefetcher.register_feed("f3", ["coffee"])
+
+        active = prefetcher.active_subreddits()
+        assert active[0] == "coffee"
+        assert sorted(active) == ["coffee", "espresso", "tea"]
+
+    def test_feed_without_subreddits_unregisters(self):
+        prefetcher = FeedPrefetcher()
+        prefetcher.register_feed("f1", ["coffee"])
+        prefetcher.register_feed("f1", [])
+        assert prefetcher.active_subreddits() == []
+
+    def test_registrations_are_shared_between_workers(self, monkeypatch):
+        shared = SharedCache("prefetch_feeds", ttl_seconds=3600)
+        monkeypatch.setattr(prefetch, "worker_count", lambda: 3)
+        primary, secondary = FeedPrefetcher(shared=shared), FeedPrefetcher(shared=shared)
+
+        monkeypatch.setattr(prefetch, "worker_id", lambda: 2)
+        secondary.register_feed("f1", ["coffee"])
+        secondary.register_feed("f2", ["tea"])
+        monkeypatch.setattr(prefetch, "worker_id", lambda: 0)
+        primary.register_feed("f3", ["espresso"])
+        assert sorted(primary.active_subreddits()) == ["coffee", "espresso", "tea"]
+
+        # A feed emptied through another worker drops out too
+        monkeypatch.setattr(prefetch, "worker_id", lambda: 1)
+        FeedPrefetcher(shared=shared).register_feed("f2", [])
+        assert sorted(primary.active_subreddits()) == ["coffee", "espresso"]
+
+    async def test_cycle_fetches_each_subreddit_once_and_warms_cache(self):
+        prefetcher = FeedPrefetcher(quota_share=1.0)
+        prefetcher.register_feed("f1", ["coffee", "espresso"])
+        prefetcher.register_feed("f2", ["coffee"])
+        reddit = FakeReddit()
+
+        fetched = await prefetcher.run_cycle(reddit, sleep=no_sleep)
+        assert fetched == 4
+        assert sorted(reddit.calls) == [
+            ("coffee", "hot"), ("coffee", "new"), ("espresso", "hot"), ("espresso", "new")
+        ]
+
+        posts, cached = await get_listing(reddit, "coffee", "hot")
+        assert cached is True
+        assert len(reddit.calls) == 4
+
+        # Nothing due right after a refresh
+        assert await prefetcher.run_cycle(reddit, sleep=no_sleep) == 0
+
+    async def test_cycle_respects_quota_share(self):
+        prefetcher = FeedPrefetcher(interval_seconds=60, quota_share=0.03, requests_per_minute=100)
+        prefetcher.register_feed("f1", [f"sub{i}" for i in range(10)])
+        reddit = FakeReddit()
+
+        assert prefetcher.cycle_budget() == 3
+        assert await prefetcher.run_cycle(reddit, sleep=no_sleep) == 3
+        # Fetches are spaced evenly across the minute
+        assert no_sleep.total == pytest.approx(2 * 60 / 3)
+
+    async def test_pauses_when_reddit_quota_low(self):
+        prefetcher = FeedPrefetcher(quota_share=1.0)
+        prefetcher.register_feed("f1", ["coffee"])
+        assert await prefetcher.run_cycle(FakeReddit(remaining=5), sleep=no_sleep) == 0
+
+    async def test_start_and_stop(self):
+        prefetcher = FeedPrefetcher(interval_seconds=3600)
+        prefetcher.start(FakeReddit())
+        assert prefetcher.running
+        await prefetcher.stop()
+        assert not prefetcher.running
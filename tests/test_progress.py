@@ -0,0 +1,106 @@
+"""
+Tests for the throttled ProgressReporter helper.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+from unittest.mock import Mock, AsyncMock
+from fastmcp import Context
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.progress import ProgressReporter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def mock_context():
+    ctx = Mock(spec=Context)
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+class TestProgressReporter:
+
+    async def test_throttles_by_interval(self, mock_context):
+        """Updates inside the minimum interval are coalesced."""
+        clock = FakeClock()
+        reporter = ProgressReporter(mock_context, total=100, min_interval=1.0, min_percent=0.0, clock=clock)
+
+        for i in range(1, 51):
+            reporter.update(i, f"item {i}")
+        await reporter.finish()
+
+        # First update plus the final one
+        assert mock_context.report_progress.call_count == 2
+        final = mock_context.report_progress.call_args_list[-1][1]
+        assert final['progress'] == 100
+        assert final['total'] == 100
+
+    async def test_throttles_by_percent(self, mock_context):
+        """Updates that advance less than min_percent are dropped."""
+        clock = FakeClock()
+        reporter = ProgressReporter(mock_context, total=100, min_interval=0.0, min_percent=10.0, clock=clock)
+
+        for i in range(1, 101):
+            clock.now += 1.0
+            reporter.update(i)
+            await asyncio.sleep(0)
+        await reporter.finish()
+
+        sent = [c[1]['progress'] for c in mock_context.report_progress.call_args_list]
+        assert sent[0] == 1
+        assert sent[-1] == 100
+        assert len(sent) <= 12
+
+    async def test_update_does_not_block_on_slow_client(self, mock_context):
+        """A slow client never stalls update(); pending updates coalesce."""
+        release = asyncio.Event()
+
+        async def slow_report(**kwargs):
+            await release.wait()
+
+        mock_context.report_progress = AsyncMock(side_effect=slow_report)
+        clock = FakeClock()
+        reporter = ProgressReporter(mock_context, total=10, min_interval=0.0, min_percent=0.0, clock=clock)
+
+        reporter.update(1)
+        await asyncio.sleep(0)  # Sender is now blocked on the client
+        for i in range(2, 11):
+            reporter.update(i)
+
+        release.set()
+        await reporter.finish(message="done")
+
+        sent = [c[1]['progress'] for c in mock_context.report_progress.call_args_list]
+        # First send, one coalesced send for everything queued behind it, final
+        assert sent == [1, 10, 10]
+
+    async def test_report_errors_are_swallowed(self, mock_context):
+        """A failing client must not break the work being reported on."""
+        mock_context.report_progress = AsyncMock(side_effect=RuntimeError("gone"))
+        reporter = ProgressReporter(mock_context, total=3)
+
+        reporter.update(1)
+        await reporter.finish()
+
+        assert mock_context.report_progress.call_count == 2
+
+    async def test_no_context_is_noop(self):
+        """Reporter without a context does nothing."""
+        reporter = ProgressReporter(None, total=3)
+        reporter.update(1)
+        await reporter.finish()
+        assert reporter.sent_count == 0
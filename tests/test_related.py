@@ -0,0 +1,133 @@
+"""
+Tests for the precomputed related-subreddit graph.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import related as related_module
+from src.related import RelatedGraph, build_related_graph, fetch_embeddings, reset_related_graph
+from src.tools.discover import related_subreddits
+
+
+ENTRIES = [
+    {"name": "Python", "subscribers": 1200000, "nsfw": False},
+    {"name": "learnpython", "subscribers": 800000, "nsfw": False},
+    {"name": "django", "subscribers": 120000, "nsfw": False},
+    {"name": "Cooking", "subscribers": 3000000, "nsfw": False},
+    {"name": "spicyrecipes", "subscribers": 5000, "nsfw": True},
+]
+
+EMBEDDINGS = [
+    [1.0, 0.1, 0.0],
+    [0.9, 0.2, 0.0],
+    [0.7, 0.3, 0.1],
+    [0.0, 0.1, 1.0],
+    [0.1, 0.0, 0.9],
+]
+
+
+@pytest.fixture
+def graph():
+    return build_related_graph(ENTRIES, EMBEDDINGS, k=3)
+
+
+@pytest.fixture
+def loaded_graph(graph, tmp_path, monkeypatch):
+    path = tmp_path / "graph.bin"
+    graph.save(str(path))
+    reset_related_graph()
+    monkeypatch.setattr(related_module, "RELATED_GRAPH_PATH", str(path))
+    yield
+    reset_related_graph()
+
+
+class TestRelatedGraph:
+
+    def test_neighbours_ordered_by_similarity(self, graph):
+        related = graph.related("python", k=3, include_nsfw=True)
+        names = [r["name"] for r in related]
+        assert names[:2] == ["learnpython", "django"]
+        assert "Python" not in names
+        similarities = [r["similarity"] for r in related]
+        assert similarities == sorted(similarities, reverse=True)
+
+    def test_nsfw_filtered_by_default(self, graph):
+        names = [r["name"] for r in graph.related("Cooking", k=3)]
+        assert "spicyrecipes" not in names
+        names = [r["name"] for r in graph.related("Cooking", k=3, include_nsfw=True)]
+        assert names[0] == "spicyrecipes"
+
+    def test_unknown_name(self, graph):
+        assert graph.related("nope") is None
+
+    def test_save_load_roundtrip(self, graph, tmp_path):
+        path = tmp_path / "graph.bin"
+        graph.save(str(path))
+        loaded = RelatedGraph.load(str(path))
+
+        assert loaded.names == graph.names
+        assert loaded.k == graph.k
+        assert loaded.related("django", include_nsfw=True) == graph.related("django", include_nsfw=True)
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"not a graph")
+        with pytest.raises(ValueError):
+            RelatedGraph.load(str(path))
+
+    def test_fetch_embeddings_pages(self):
+        collection = Mock()
+        collection.get.side_effect = [
+            {"metadatas": ENTRIES[:2], "embeddings": EMBEDDINGS[:2]},
+            {"metadatas": ENTRIES[2:3], "embeddings": EMBEDDINGS[2:3]},
+        ]
+        entries, embeddings = fetch_embeddings(collection, page_size=2)
+        assert [e["name"] for e in entries] == ["Python", "learnpython", "django"]
+        assert len(embeddings) == 3
+
+
+    def test_cli_refuses_large_build_without_numpy(self, monkeypatch, tmp_path):
+        collection = Mock()
+        collection.get.return_value = {
+            "metadatas": [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+            "embeddings": [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+        }
+        monkeypatch.setattr("src.chroma_client.get_collection", lambda name: collection)
+        monkeypatch.setattr(related_module, "numpy_available", lambda: False)
+        monkeypatch.setattr(related_module, "PURE_PYTHON_MAX_SUBREDDITS", 2)
+        out = tmp_path / "graph.bin"
+
+        with pytest.raises(SystemExit) as exit_info:
+            related_module.main(["--out", str(out)])
+        assert exit_info.value.code == 2
+        assert not out.exists()
+
+        related_module.main(["--out", str(out), "--allow-pure-python"])
+        assert len(RelatedGraph.load(str(out))) == 3
+
+
+class TestRelatedSubredditsOperation:
+
+    def test_lookup_from_loaded_graph(self, loaded_graph):
+        result = related_subreddits("r/PYTHON", k=2)
+        assert result["subreddit"] == "Python"
+        assert [r["name"] for r in result["related"]] == ["learnpython", "django"]
+        assert result["summary"]["source"] == "precomputed_graph"
+
+    def test_unknown_seed(self, loaded_graph):
+        result = related_subreddits("nonexistent")
+        assert "error" in result
+
+    def test_graph_missing(self, tmp_path, monkeypatch):
+        reset_related_graph()
+        monkeypatch.setattr(related_module, "RELATED_GRAPH_PATH", str(tmp_path / "missing.bin"))
+        result = related_subreddits("Python")
+        assert "error" in result
+        assert "discover_subreddits" in result["suggestion"]
+        reset_related_graph()
@@ -0,0 +1,181 @@
+"""
+Tests for the server-side research pipeline.
+"""
+
+import importlib
+import pytest
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.listings import clear_listing_cache
+from src.tools.research import RESEARCH_DEPTHS, research, select_posts
+
+# The package re-exports the research function under the module's name
+research_module = importlib.import_module("src.tools.research")
+
+
+def make_submission(post_id, subreddit, score, num_comments=0, over_18=False):
+    submission = Mock()
+    submission.id = post_id
+    submission.title = f"Post {post_id}"
+    submission.author = "someone"
+    submission.subreddit.display_name = subreddit
+    submission.score = score
+    submission.num_comments = num_comments
+    submission.created_utc = 1000.0
+    submission.url = f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/"
+    submission.permalink = f"/r/{subreddit}/comments/{post_id}/"
+    submission.over_18 = over_18
+    return submission
+
+
+def make_comment(comment_id, score):
+    comment = Mock(spec=["id", "author", "score", "body", "permalink"])
+    comment.id = comment_id
+    comment.author = "commenter"
+    comment.score = score
+    comment.body = "x" * 600 if score > 50 else "short"
+    comment.permalink = f"/comments/{comment_id}/"
+    return comment
+
+
+class FakeForest(list):
+    """Comment forest stand-in."""
+
+    def replace_more(self, limit=None):
+        return []
+
+
+class FakeReddit:
+    """Reddit stub with scripted top listings and comments, counting calls."""
+
+    def __init__(self, listings, comment_delay=0.0):
+        self.listings = listings
+        self.comment_delay = comment_delay
+        self.listing_calls = []
+        self.comment_calls = []
+        self.lock = threading.Lock()
+
+    def subreddit(self, name):
+        def top(time_filter, limit):
+            with self.lock:
+                self.listing_calls.append(name)
+            return self.listings[name][:limit]
+
+        sub = Mock()
+        sub.top.side_effect = top
+        return sub
+
+    def submission(self, id):
+        with self.lock:
+            self.comment_calls.append(id)
+        if self.comment_delay:
+            time.sleep(self.comment_delay)
+        submission = Mock()
+        submission.selftext = "body"
+        submission.comments = FakeForest([make_comment(f"{id}-c1", 5), make_comment(f"{id}-c2", 90)])
+        return submission
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_listing_cache()
+    yield
+    clear_listing_cache()
+
+
+@pytest.fixture
+def discovery(monkeypatch):
+    calls = []
+    subreddits = [
+        {"name": "espresso", "confidence": 0.9, "subscribers": 100, "url": "https://reddit.com/r/espresso"},
+        {"name": "coffee", "confidence": 0.8, "subscribers": 200, "url": "https://reddit.com/r/coffee"},
+        {"name": "tea", "confidence": 0.1, "subscribers": 300, "url": "https://reddit.com/r/tea"},
+    ]
+
+    async def fake_discover(**kwargs):
+        calls.append(kwargs)
+        return {"subreddits": subreddits}
+
+    monkeypatch.setattr(research_module, "discover_subreddits", fake_discover)
+    return calls
+
+
+LISTINGS = {
+    "espresso": [make_submission(f"e{i}", "espresso", score=100 - i, num_comments=i) for i in range(10)],
+    "coffee": [
+        make_submission("c0", "coffee", score=500, num_comments=50),
+        make_submission("c1", "coffee", score=1, over_18=True),
+    ],
+}
+
+
+class TestSelectPosts:
+
+    def test_caps_posts_per_subreddit(self):
+        posts = [{"id": f"a{i}", "subreddit": "a", "score": 100, "num_comments": 0} for i in range(6)]
+        posts.append({"id": "b", "subreddit": "b", "score": 1, "num_comments": 0})
+        selected = select_posts(posts, 4)
+        assert [p["id"] for p in selected] == ["a0", "a1", "b", "a2"]
+
+
+class TestResearch:
+
+    async def test_pipeline_returns_citation_ready_corpus(self, discovery):
+        reddit = FakeReddit(LISTINGS)
+        result = await research("home espresso", reddit=reddit, depth="quick")
+
+        assert [s["name"] for s in result["subreddits"]] == ["espresso", "coffee"]
+        posts = result["posts"]
+        assert len(posts) == RESEARCH_DEPTHS["quick"]["top_posts"]
+        assert posts[0]["id"] == "c0"
+        assert "c1" not in [p["id"] for p in posts]  # NSFW filtered
+        assert posts[0]["permalink"] == "https://reddit.com/r/coffee/comments/c0/"
+        assert [c["score"] for c in posts[0]["comments"]] == [90, 5]
+        assert posts[0]["comments"][0]["body"].endswith("…")
+        assert result["summary"]["reddit_calls"] == 2 + len(posts)
+        assert result["summary"]["budget_exhausted"] is False
+
+    async def test_extra_queries_use_merged_batch_discovery(self, discovery):
+        await research("espresso", reddit=FakeReddit(LISTINGS), depth="quick", queries=["latte art"])
+        assert discovery[0]["queries"] == ["espresso", "latte art"]
+        assert discovery[0]["merge"] is True
+
+    async def test_cached_listings_are_not_counted(self, discovery):
+        reddit = FakeReddit(LISTINGS)
+        await research("espresso", reddit=reddit, depth="quick")
+        second = await research("espresso", reddit=reddit, depth="quick")
+
+        assert len(reddit.listing_calls) == 2
+        assert second["summary"]["cache_hits"] == 2
+
+    async def test_call_budget_limits_comment_fetches(self, discovery, monkeypatch):
+        monkeypatch.setitem(RESEARCH_DEPTHS, "quick", {**RESEARCH_DEPTHS["quick"], "max_reddit_calls": 4})
+        reddit = FakeReddit(LISTINGS)
+        result = await research("espresso", reddit=reddit, depth="quick")
+
+        assert len(reddit.comment_calls) == 2
+        assert len(result["summary"]["skipped"]["posts_over_call_budget"]) == 3
+        assert result["summary"]["budget_exhausted"] is True
+
+    async def test_time_budget_returns_partial_results(self, discovery, monkeypatch):
+        monkeypatch.setitem(RESEARCH_DEPTHS, "quick", {**RESEARCH_DEPTHS["quick"], "time_budget_seconds": 0.1})
+        reddit = FakeReddit(LISTINGS, comment_delay=0.5)
+
+        started = time.monotonic()
+        result = await research("espresso", reddit=reddit, depth="quick")
+
+        assert time.monotonic() - started < 0.4
+        assert len(result["posts"]) == 5
+        assert all(post["comments"] == [] for post in result["posts"])
+        assert len(result["summary"]["skipped"]["posts_over_time_budget"]) == 5
+
+    async def test_invalid_depth(self):
+        result = await research("espresso", reddit=FakeReddit({}), depth="bottomless")
+        assert "error" in result
@@ -0,0 +1,210 @@
+"""
+Tests for the circuit breaker, latency tracking and the resilient proxy client.
+"""
+
+import sys
+import os
+import time
+import threading
+
+import pytest
+import requests
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.resilience import CircuitBreaker, LatencyTracker
+from src.chroma_client import ChromaProxyClient
+from src.deadline import DeadlineExceeded, deadline_scope
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self._body = body or {}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+
+class FakeSession:
+    """Session stub returning a scripted response after an optional delay."""
+
+    def __init__(self, response=None, delay=0.0, error=None):
+        self.response = response or FakeResponse(body={"ids": [[]]})
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, json=None, timeout=None):
+        with self.lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def make_client(sessions, hedging=False):
+    client = ChromaProxyClient(
+        proxy_urls=[f"http://replica{i}" for i in range(len(sessions))],
+        hedging=hedging
+    )
+    for replica, session in zip(client.replicas, sessions):
+        replica.session = session
+    return client
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold_and_probes_after_cooldown(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, open_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+        clock.now = 10
+        assert breaker.allow_request()       # the single half-open probe
+        assert not breaker.allow_request()   # no second probe while it runs
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, open_seconds=5, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+
+    def test_released_probe_can_be_claimed_again(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, open_seconds=5, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5
+        assert breaker.allow_request()
+        breaker.release_probe()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+
+
+class TestLatencyTracker:
+
+    def test_percentile_and_ewma(self):
+        tracker = LatencyTracker(alpha=0.5)
+        for value in range(1, 101):
+            tracker.record(value / 100)
+
+        assert tracker.percentile(95) == pytest.approx(0.95, abs=0.011)
+        assert 0.9 < tracker.ewma <= 1.0
+
+
+class TestResilientProxyClient:
+
+    def test_fails_fast_while_circuit_open(self):
+        session = FakeSession(error=requests.exceptions.ConnectTimeout("timeout"))
+        client = make_client([session])
+        client.replicas[0].breaker.failure_threshold = 2
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                client.query(["python"])
+        assert session.calls == 2
+
+        with pytest.raises(ConnectionError, match="circuit open"):
+            client.query(["python"])
+        assert session.calls == 2
+
+    def test_probe_not_leaked_by_errors_outside_the_replica(self):
+        clock = FakeClock()
+        session = FakeSession(error=RuntimeError("bug"))
+        client = make_client([session])
+        breaker = client.replicas[0].breaker
+        breaker._clock = clock
+        breaker.record_failure()
+        breaker._state = CircuitBreaker.OPEN
+        clock.now = breaker.open_seconds
+
+        # Deadline already spent: nothing is claimed
+        with deadline_scope(0.001):
+            time.sleep(0.01)
+            with pytest.raises(DeadlineExceeded):
+                client.query(["python"])
+        assert not breaker._probe_in_flight
+
+        # Unexpected error while sending: the probe is given back
+        with pytest.raises(RuntimeError):
+            client.query(["python"])
+        assert session.calls == 1
+        assert breaker.allow_request()
+
+    def test_fails_over_to_next_replica(self):
+        down = FakeSession(error=requests.exceptions.ConnectionError("refused"))
+        up = FakeSession(response=FakeResponse(body={"ids": [["t3_abc"]]}))
+        client = make_client([down, up])
+        client._ordered_replicas = lambda: list(client.replicas)
+
+        assert client.query(["python"]) == {"ids": [["t3_abc"]]}
+        assert down.calls == 1 and up.calls == 1
+
+    def test_server_errors_count_as_failures(self):
+        session = FakeSession(response=FakeResponse(status_code=503))
+        client = make_client([session])
+
+        with pytest.raises(ConnectionError, match="HTTP 503"):
+            client.query(["python"])
+        assert client.replicas[0].breaker._failures == 1
+
+    def test_hedged_request_returns_faster_replica(self):
+        slow = FakeSession(response=FakeResponse(body={"from": "slow"}), delay=0.5)
+        fast = FakeSession(response=FakeResponse(body={"from": "fast"}))
+        client = make_client([slow, fast], hedging=True)
+        client._ordered_replicas = lambda: list(client.replicas)
+        client.hedge_delay = lambda: 0.02
+
+        start = time.monotonic()
+        assert client.query(["python"]) == {"from": "fast"}
+        assert time.monotonic() - start < 0.4
+        assert slow.calls == 1 and fast.calls == 1
+
+    def test_no_hedge_when_primary_is_fast(self):
+        primary = FakeSession(response=FakeResponse(body={"from": "primary"}))
+        backup = FakeSession()
+        client = make_client([primary, backup], hedging=True)
+        client._ordered_replicas = lambda: list(client.replicas)
+
+        assert client.query(["python"]) == {"from": "primary"}
+        assert backup.calls == 0
+
+    def test_replica_order_prefers_low_latency(self):
+        client = make_client([FakeSession(), FakeSession()])
+        client.replicas[0].latency.record(1.0)
+        client.replicas[1].latency.record(0.01)
+
+        first = [client._ordered_replicas()[0].url for _ in range(200)]
+        assert first.count("http://replica1") > 150
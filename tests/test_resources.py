@@ -0,0 +1,85 @@
+"""
+Tests for the cached reddit://server-info resource.
+"""
+
+import json
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.resources import RateLimitSnapshot, ServerInfoDocument, register_resources
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingAuth:
+    """reddit.auth stand-in counting reads of the rate limit headers."""
+
+    def __init__(self, remaining):
+        self.remaining = remaining
+        self.reads = 0
+
+    @property
+    def limits(self):
+        self.reads += 1
+        return {"remaining": self.remaining, "used": 10, "reset_timestamp": 1700000000}
+
+
+def make_reddit(remaining=90):
+    reddit = Mock()
+    reddit.auth = CountingAuth(remaining)
+    return reddit
+
+
+class TestServerInfoDocument:
+
+    def test_document_includes_live_rate_limit(self):
+        document = ServerInfoDocument(RateLimitSnapshot(make_reddit(remaining=42)))
+        info = json.loads(document.render())
+
+        assert info["name"] == "Reddit Research MCP Server"
+        assert info["rate_limiting"]["current_status"]["requests_remaining"] == 42
+        assert "fetch_feed_posts" in info["capabilities"]["available_operations"]
+
+    def test_snapshot_refreshed_periodically(self):
+        reddit = make_reddit(remaining=42)
+        clock = FakeClock()
+        document = ServerInfoDocument(RateLimitSnapshot(reddit, refresh_seconds=5, clock=clock))
+
+        first = document.render()
+        reddit.auth.remaining = 41
+        assert document.render() is first
+        assert reddit.auth.reads == 1
+
+        clock.now += 5
+        assert json.loads(document.render())["rate_limiting"]["current_status"]["requests_remaining"] == 41
+        assert reddit.auth.reads == 2
+
+    def test_unchanged_snapshot_reuses_rendered_text(self):
+        clock = FakeClock()
+        document = ServerInfoDocument(RateLimitSnapshot(make_reddit(), refresh_seconds=5, clock=clock))
+        first = document.render()
+        clock.now += 10
+        assert document.render() is first
+
+    def test_missing_client_falls_back(self):
+        document = ServerInfoDocument(RateLimitSnapshot(None))
+        status = json.loads(document.render())["rate_limiting"]["current_status"]
+        assert status["status"] == "Rate limits tracked automatically by PRAW"
+
+    def test_registered_resource_serves_json(self):
+        mcp = Mock()
+        registered = {}
+        mcp.resource.side_effect = lambda uri, **kwargs: (lambda fn: registered.setdefault(uri, fn))
+        register_resources(mcp, make_reddit())
+
+        assert json.loads(registered["reddit://server-info"]())["version"] == "0.4.0"
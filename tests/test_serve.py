@@ -0,0 +1,85 @@
+"""
+Tests for transport selection and pre-forked HTTP workers.
+"""
+
+import pytest
+import signal
+import time
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import serve
+from src.serve import parse_args, prefork, resolve_workers
+
+
+class TestServeOptions:
+
+    def test_defaults_to_stdio(self):
+        args = parse_args([], env={})
+        assert args.transport == "stdio"
+        assert (args.host, args.port, args.workers) == ("127.0.0.1", 8000, 1)
+        assert (args.keepalive, args.backlog) == (5, 2048)
+
+    def test_env_and_flags(self):
+        env = {"MCP_TRANSPORT": "http", "PORT": "9000", "MCP_WORKERS": "3", "MCP_KEEPALIVE_SECONDS": "15"}
+        args = parse_args([], env=env)
+        assert (args.transport, args.port, args.workers, args.keepalive) == ("http", 9000, 3, 15)
+
+        args = parse_args(["--port", "7000", "--workers", "2", "--host", "0.0.0.0"], env=env)
+        assert (args.host, args.port, args.workers) == ("0.0.0.0", 7000, 2)
+
+    def test_workers(self):
+        assert resolve_workers("auto") == (os.cpu_count() or 1)
+        with pytest.raises(ValueError):
+            resolve_workers("0")
+        assert parse_args(["--transport", "sse", "--workers", "4"], env={}).workers == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+class TestPrefork:
+
+    def test_workers_run_and_crashes_are_restarted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(serve, "WORKER_RESTART_DELAY", 0)
+
+        def target(worker_id):
+            marker = tmp_path / f"worker-{worker_id}"
+            if worker_id == 1 and not marker.exists():
+                marker.write_text("crashed")
+                raise RuntimeError("boom")
+            marker.write_text(f"{worker_id}:{serve.is_primary_worker()}")
+
+        # The crash was recovered from, so the supervisor still exits cleanly
+        assert prefork(target, 3) == 0
+        assert (tmp_path / "worker-0").read_text() == "0:True"
+        assert (tmp_path / "worker-1").read_text() == "1:False"
+        assert (tmp_path / "worker-2").read_text() == "2:False"
+
+    @pytest.mark.parametrize("exit_code, status", [(None, 0), (3, 1)])
+    def test_failures_during_shutdown(self, exit_code, status):
+        def target(worker_id):
+            if worker_id == 1 and exit_code is not None:
+                signal.signal(signal.SIGTERM, lambda signum, frame: os._exit(exit_code))
+            if worker_id == 0:
+                # Ask the supervisor to shut down once both workers are up
+                time.sleep(0.3)
+                os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(10)
+
+        assert prefork(target, 2) == status
+
+    def test_workers_ignoring_sigterm_are_killed_after_timeout(self, monkeypatch):
+        monkeypatch.setattr(serve, "WORKER_SHUTDOWN_TIMEOUT", 0.5)
+
+        def target(worker_id):
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            if worker_id == 0:
+                time.sleep(0.3)
+                os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(30)
+
+        started = time.monotonic()
+        assert prefork(target, 2) == 1      # Killed workers count as a failed shutdown
+        assert time.monotonic() - started < 10
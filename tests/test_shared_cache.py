@@ -0,0 +1,291 @@
+"""
+Tests for the pluggable shared cache backends.
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import SubredditCatalog
+from src.shared_cache import (
+    CacheBackend,
+    MemoryBackend,
+    RedisBackend,
+    SharedCache,
+    SQLiteBackend,
+    create_cache_backend,
+    decode_value,
+    encode_value,
+    reset_cache_backend,
+)
+from src.tools.comments import fetch_submission_with_comments
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Dict-backed stand-in for a redis.Redis client."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+        self.expiry[key] = px
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+    def unlink(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class TestSerialization:
+
+    def test_round_trip_and_compression(self):
+        small = {"id": "abc", "score": 3, "tags": ["a", None], "text": "héllo"}
+        assert decode_value(encode_value(small)) == small
+        assert encode_value(small)[:1] == b"\x00"
+
+        large = {"posts": [{"title": "same title " * 5, "score": i} for i in range(200)]}
+        data = encode_value(large)
+        assert data[:1] == b"\x01"
+        assert len(data) < len(repr(large)) / 5
+        assert decode_value(data) == large
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            decode_value(b"\x07{}")
+
+
+class TestCacheBackend:
+
+    def test_incomplete_backend_fails_on_creation(self):
+        class GetOnly(CacheBackend):
+            def get(self, namespace, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnly()
+
+
+class TestMemoryBackend:
+
+    def test_ttl_namespaces_and_byte_eviction(self):
+        clock = FakeClock()
+        backend = MemoryBackend(max_bytes=100, clock=clock)
+        backend.set("a", "k1", b"x" * 40, ttl_seconds=10)
+        backend.set("b", "k1", b"y" * 40, ttl_seconds=60)
+        assert backend.get("a", "k1") == b"x" * 40
+        assert backend.get("b", "k1") == b"y" * 40
+
+        # Over 100 bytes: the least recently used entry goes
+        backend.get("a", "k1")
+        backend.set("a", "k2", b"z" * 40, ttl_seconds=60)
+        assert backend.get("b", "k1") is None
+        assert backend.stats()["bytes"] == 80
+
+        clock.now += 11
+        assert backend.get("a", "k1") is None
+        backend.clear("a")
+        assert backend.stats()["entries"] == 0
+
+
+class TestSQLiteBackend:
+
+    def test_shared_between_workers_with_ttl(self, tmp_path):
+        clock = FakeClock()
+        path = str(tmp_path / "cache.sqlite3")
+        worker_a = SharedCache("listings", 60, backend=SQLiteBackend(path, clock=clock, flush_seconds=0))
+        worker_b = SharedCache("listings", 60, backend=SQLiteBackend(path, clock=clock, flush_seconds=0))
+
+        worker_a.set(("python", "hot", None), {"posts": [{"id": "p1"}]})
+        assert worker_b.get(("python", "hot", None)) == {"posts": [{"id": "p1"}]}
+        assert worker_b.hits == 1
+
+        clock.now += 61
+        assert worker_b.get(("python", "hot", None)) is None
+
+    def test_evicts_least_recently_used_past_max_bytes(self, tmp_path):
+        clock = FakeClock()
+        backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"), max_bytes=250, clock=clock, flush_seconds=0)
+        for i in range(5):
+            clock.now += 1
+            backend.set("ns", f"k{i}", b"v" * 100, ttl_seconds=60)
+        clock.now += 1
+        backend.get("ns", "k0")
+        backend.flush()
+        backend.evict()
+
+        assert backend.stats()["bytes"] <= 250
+        assert backend.get("ns", "k0") is not None
+        assert backend.get("ns", "k1") is None
+
+
+class TestSharedCache:
+
+    def test_redis_keys_expiry_and_namespace_clear(self):
+        client = FakeRedis()
+        backend = RedisBackend(prefix="test", client=client)
+        feeds = SharedCache("feeds", 30, backend=backend)
+        listings = SharedCache("listings", 300, backend=backend)
+
+        feeds.set(("client", "feed", "f1"), {"data": 1})
+        listings.set(("python", "hot", None), {"posts": []})
+        assert client.expiry['test:feeds:["client","feed","f1"]'] == 30_000
+        assert feeds.get(("client", "feed", "f1")) == {"data": 1}
+
+        feeds.clear()
+        assert feeds.get(("client", "feed", "f1")) is None
+        assert listings.get(("python", "hot", None)) == {"posts": []}
+
+    def test_failing_backend_is_a_miss_and_bypassed(self):
+        backend = MemoryBackend()
+        backend.get = Mock(side_effect=ConnectionError("down"))
+        cache = SharedCache("listings", 60, backend=backend)
+
+        assert cache.get("k", default="fallback") == "fallback"
+        assert cache.get("k") is None
+        assert backend.get.call_count == 1
+        assert cache.stats()["errors"] == 1
+
+    def test_unserializable_and_oversized_values_are_skipped(self):
+        cache = SharedCache("misc", 60, backend=MemoryBackend())
+        cache.set("obj", {"value": object()})
+        assert cache.get("obj") is None
+
+    def test_unknown_backend_falls_back_to_memory(self):
+        assert create_cache_backend("unknown").name == "memory"
+
+
+class TestCommentCache:
+
+    async def test_repeat_fetch_served_from_cache(self):
+        submission = Mock(
+            id="abc123", title="t", selftext="", score=1, upvote_ratio=1.0,
+            num_comments=0, created_utc=1.0, url="https://reddit.com/abc123"
+        )
+        submission.author.__str__ = Mock(return_value="op")
+        submission.subreddit.display_name = "python"
+        submission.comments.__iter__ = Mock(side_effect=lambda: iter([]))
+        reddit = Mock()
+        reddit.submission.return_value = submission
+
+        first = await fetch_submission_with_comments(reddit, submission_id="abc123")
+        second = await fetch_submission_with_comments(
+            reddit, url="https://www.reddit.com/r/python/comments/abc123/title/"
+        )
+
+        assert second == first
+        assert reddit.submission.call_count == 1
+
+
+class TestPersistentCache:
+
+    def test_entries_survive_restart_and_keep_their_expiry(self, tmp_path):
+        clock = FakeClock()
+        path = str(tmp_path / "cache.sqlite3")
+        before = SQLiteBackend(path, clock=clock)
+        before.set("comments", "short", b"a", ttl_seconds=10)
+        before.set("subreddit_metadata", "long", b"b", ttl_seconds=3600)
+        before.close()
+
+        clock.now += 60
+        after = SQLiteBackend(path, clock=clock)
+        assert after.get("comments", "short") is None
+        assert after.get("subreddit_metadata", "long") == b"b"
+        assert after.stats()["entries"] == 1   # Expired entry purged on open
+        after.close()
+
+    def test_writes_are_batched(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = SQLiteBackend(path, flush_seconds=60, batch_size=3)
+        reader = SQLiteBackend(path, flush_seconds=0)
+
+        writer.set("listings", "k1", b"1", ttl_seconds=60)
+        writer.set("listings", "k2", b"2", ttl_seconds=60)
+        assert writer.get("listings", "k1") == b"1"     # Visible in-process at once
+        assert reader.get("listings", "k1") is None     # Not yet committed
+
+        writer.set("listings", "k3", b"3", ttl_seconds=60)   # Batch full: writer thread flushes
+        for _ in range(100):
+            if reader.get("listings", "k3") is not None:
+                break
+            time.sleep(0.01)
+        assert [reader.get("listings", k) for k in ("k1", "k2", "k3")] == [b"1", b"2", b"3"]
+
+        writer.delete("listings", "k1")                  # Invalidations are immediate
+        assert reader.get("listings", "k1") is None
+        writer.close()
+        reader.close()
+
+    def test_delete_during_flush_is_not_undone(self, tmp_path, monkeypatch):
+        backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"), flush_seconds=60)
+        backend.set("feeds", "user:feed", b"stale", ttl_seconds=60)
+
+        # Hold the flush after it has taken the batch, before it commits
+        batch_taken, release = threading.Event(), threading.Event()
+        connection = backend._connection
+
+        class PausingConnection:
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, *args):
+                if sql == "BEGIN IMMEDIATE":
+                    batch_taken.set()
+                    release.wait(5)
+                return self.conn.execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(self.conn, name)
+
+        monkeypatch.setattr(backend, "_connection", lambda: PausingConnection(connection()))
+        flusher = threading.Thread(target=backend.flush)
+        flusher.start()
+        assert batch_taken.wait(5)
+        deleter = threading.Thread(target=backend.delete, args=("feeds", "user:feed"))
+        deleter.start()
+        time.sleep(0.05)
+        release.set()
+        flusher.join(5)
+        deleter.join(5)
+
+        assert backend.get("feeds", "user:feed") is None
+        monkeypatch.undo()
+        backend.close()
+
+    def test_catalog_starts_warm_after_restart(self, tmp_path):
+        reset_cache_backend(SQLiteBackend(str(tmp_path / "cache.sqlite3")))
+        collection = Mock()
+        collection.name = "subreddits"
+        collection.get.return_value = {"metadatas": [{"name": "Python", "subscribers": 10}], "documents": None}
+        assert SubredditCatalog().refresh(collection) is True
+
+        reset_cache_backend(SQLiteBackend(str(tmp_path / "cache.sqlite3")))
+        restarted = SubredditCatalog()
+        assert restarted.load_snapshot("subreddits") is True
+        assert restarted.lookup("python")["subscribers"] == 10
+        assert not restarted.needs_refresh()
+        assert collection.get.call_count == 1